@@ -13,7 +13,9 @@ from youtrack_cli.commands.users import (
     permissions,
     show_users_verbose_help,
     users,
+    users_bulk,
     users_groups,
+    users_profile,
     users_roles,
     users_teams,
     users_update,
@@ -423,7 +425,7 @@ class TestUpdateUserCommand:
 
         # Assertions
         assert result.exit_code == 0
-        mock_manager.get_user.assert_called_once_with("testuser")
+        mock_manager.get_user_profile.assert_called_once_with("testuser")
         mock_manager.display_user_details.assert_called_once()
 
     @patch("youtrack_cli.managers.users.UserManager")
@@ -666,3 +668,78 @@ class TestTeamsCommand:
         # Assertions
         assert result.exit_code == 1
         assert "❌ Error getting user teams: Network timeout" in result.output
+
+
+class TestProfileCommand:
+    """Test cases for users profile command."""
+
+    def test_profile_requires_users_or_all(self, runner):
+        """Test that profile needs USER_IDS or --all."""
+        result = runner.invoke(users_profile, [], obj={"config": {}})
+
+        assert result.exit_code == 2
+        assert "Give one or more USER_IDS or use --all" in result.output
+
+    @patch("youtrack_cli.managers.users.UserManager")
+    @patch("youtrack_cli.auth.AuthManager")
+    @patch("asyncio.run")
+    def test_profile_all_csv(self, mock_asyncio, mock_auth, mock_manager_class, runner):
+        """Test access review export of all users as CSV."""
+        mock_manager = MagicMock()
+        mock_manager_class.return_value = mock_manager
+        profiles = [{"login": "jane"}]
+        mock_asyncio.return_value = {"status": "success", "data": {"profiles": profiles, "errors": []}}
+
+        result = runner.invoke(users_profile, ["--all", "--format", "csv"], obj={"config": {}})
+
+        assert result.exit_code == 0
+        mock_manager.get_user_profiles.assert_called_once_with(
+            None, include_permissions=False, max_concurrent=8, query=None
+        )
+        assert mock_manager.write_profiles_csv.call_args[0][1] == profiles
+
+    @patch("youtrack_cli.managers.users.UserManager")
+    @patch("youtrack_cli.auth.AuthManager")
+    @patch("asyncio.run")
+    def test_profile_failures_exit_nonzero(self, mock_asyncio, mock_auth, mock_manager_class, runner):
+        """Test that users that could not be profiled fail the command."""
+        mock_manager_class.return_value = MagicMock()
+        mock_asyncio.return_value = {
+            "status": "success",
+            "data": {"profiles": [], "errors": [{"user": "ghost", "error": "User not found"}]},
+        }
+
+        result = runner.invoke(users_profile, ["ghost", "--format", "json"], obj={"config": {}})
+
+        assert result.exit_code == 1
+        assert "[]" in result.output
+
+
+class TestBulkCommand:
+    """Test cases for users bulk command."""
+
+    @patch("youtrack_cli.auth.AuthManager")
+    def test_bulk_reports_failures(self, mock_auth, runner, tmp_path):
+        """Test that failed operations are reported and fail the command."""
+        from unittest.mock import AsyncMock
+
+        from youtrack_cli.managers.users import UserManager
+
+        source = tmp_path / "ops.csv"
+        source.write_text("user,action,target\njane,ban,\njohn,fly,\n")
+        report = tmp_path / "report.csv"
+        results = [{"row": 2, "user": "jane", "action": "ban", "target": "", "status": "ok", "error": ""}]
+
+        with patch.object(
+            UserManager,
+            "apply_user_operations",
+            new_callable=AsyncMock,
+            return_value={"status": "success", "data": {"succeeded": 1, "results": results}},
+        ):
+            result = runner.invoke(users_bulk, [str(source), "--report", str(report)], obj={"config": {}})
+
+        assert result.exit_code == 1
+        assert "Applied 1 of 2 operation(s)" in result.output
+        lines = report.read_text().splitlines()
+        assert lines[1] == "2,jane,ban,,ok,"
+        assert lines[2].startswith("3,john,fly,,invalid,")
@@ -76,3 +76,58 @@ def mock_dotenv_loading():
         patch("youtrack_cli.config.load_dotenv") as mock_config_load_dotenv,
     ):
         yield mock_auth_load_dotenv, mock_config_load_dotenv
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_global_cache():
+    """Give each test a fresh process-wide cache.
+
+    Services memoize lookup indexes (link types, tags) in the global cache, so
+    an entry left behind by one test would otherwise satisfy another test's
+    lookup without the request it expects.
+    """
+    import youtrack_cli.cache as cache_module
+
+    cache_module._cache = None
+    yield
+    cache_module._cache = None
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_project_schemas(tmp_path):
+    """Give each test an empty project schema store outside the real home directory."""
+    import youtrack_cli.services.project_schema as schema_module
+
+    schema_module._store = schema_module.ProjectSchemaStore(cache_dir=tmp_path / "schemas")
+    yield
+    schema_module._store = None
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_endpoint_resolver(tmp_path):
+    """Give each test a resolver with no remembered endpoints outside the real home directory."""
+    import youtrack_cli.endpoint_resolver as resolver_module
+
+    resolver_module._resolver = resolver_module.EndpointResolver(cache_dir=tmp_path / "endpoints")
+    yield
+    resolver_module._resolver = None
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_session_store(tmp_path):
+    """Give each test an empty verified-session record outside the real home directory."""
+    import youtrack_cli.session as session_module
+
+    session_module._store = session_module.SessionStore(path=tmp_path / "session.json")
+    yield
+    session_module._store = None
+
+
+@pytest.fixture(scope="function", autouse=True)
+def isolate_index_cache(tmp_path):
+    """Give each test an empty lookup index cache outside the real home directory."""
+    import youtrack_cli.index_cache as index_module
+
+    index_module._cache = index_module.IndexCache(cache_dir=tmp_path / "indexes")
+    yield
+    index_module._cache = None
@@ -8,6 +8,7 @@ import pytest
 from youtrack_cli.auth import AuthManager
 from youtrack_cli.exceptions import YouTrackError
 from youtrack_cli.managers.issues import IssueManager
+from youtrack_cli.services.project_schema import ProjectSchema
 
 
 @pytest.fixture
@@ -55,10 +56,11 @@ def issue_manager(auth_manager):
             "delete_attachment",
             "list_links",
             "move_issue",
+            "count_issues",
         ]:
             setattr(manager.issue_service, method_name, AsyncMock())
 
-        for method_name in ["get_project", "get_project_custom_fields", "discover_state_field"]:
+        for method_name in ["get_project", "get_project_custom_fields", "get_project_schema", "discover_state_field"]:
             setattr(manager.project_service, method_name, AsyncMock())
 
         return manager
@@ -144,6 +146,106 @@ class TestIssueManagerRetrieval:
         issue_manager.issue_service.get_issue.assert_called_once_with("TEST-123")
         assert result == expected_result
 
+    @pytest.mark.asyncio
+    async def test_get_issues_batches_readable_ids_into_one_query(self, issue_manager):
+        """Several readable IDs resolve through a single `issue id:` search."""
+        issue_manager.issue_service.search_issues.return_value = {
+            "status": "success",
+            "data": [{"idReadable": "TEST-2"}, {"idReadable": "TEST-1"}],
+        }
+
+        result = await issue_manager.get_issues(["TEST-1", "TEST-2", "TEST-1"])
+
+        assert result["status"] == "success"
+        assert [i["idReadable"] for i in result["data"]] == ["TEST-1", "TEST-2"]
+        assert result["missing"] == []
+        issue_manager.issue_service.search_issues.assert_called_once()
+        kwargs = issue_manager.issue_service.search_issues.call_args[1]
+        assert kwargs["query"] == "issue id: TEST-1, TEST-2"
+        assert "idReadable" in kwargs["fields"]
+        issue_manager.issue_service.get_issue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_issues_chunks_large_requests(self, issue_manager):
+        """500 IDs with the default chunk size take 5 search requests."""
+        ids = [f"TEST-{i}" for i in range(500)]
+
+        async def fake_search(query, fields=None, top=None, skip=None, custom_fields=None):
+            chunk = query.removeprefix("issue id: ").split(", ")
+            return {"status": "success", "data": [{"idReadable": i} for i in chunk]}
+
+        issue_manager.issue_service.search_issues = AsyncMock(side_effect=fake_search)
+
+        result = await issue_manager.get_issues(ids)
+
+        assert result["count"] == 500
+        assert issue_manager.issue_service.search_issues.call_count == 5
+        issue_manager.issue_service.get_issue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_issues_falls_back_to_single_get_for_misses(self, issue_manager):
+        """IDs the batch query did not return are fetched individually."""
+        issue_manager.issue_service.search_issues.return_value = {
+            "status": "success",
+            "data": [{"idReadable": "TEST-1"}],
+        }
+
+        async def fake_get(issue_id, fields=None):
+            if issue_id == "2-17":
+                return {"status": "success", "data": {"id": "2-17", "idReadable": "TEST-17"}}
+            return {"status": "error", "message": f"{issue_id} not found"}
+
+        issue_manager.issue_service.get_issue = AsyncMock(side_effect=fake_get)
+
+        result = await issue_manager.get_issues(["TEST-1", "2-17", "TEST-404"])
+
+        assert [i.get("idReadable") for i in result["data"]] == ["TEST-1", "TEST-17"]
+        assert result["missing"] == ["TEST-404"]
+        assert "TEST-404" in result["errors"]
+        assert issue_manager.issue_service.get_issue.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_issues_all_missing_is_error(self, issue_manager):
+        """When nothing could be fetched the result is an error."""
+        issue_manager.issue_service.search_issues.return_value = {"status": "success", "data": []}
+        issue_manager.issue_service.get_issue.return_value = {"status": "error", "message": "not found"}
+
+        result = await issue_manager.get_issues(["TEST-1"])
+
+        assert result["status"] == "error"
+        assert result["missing"] == ["TEST-1"]
+
+    @pytest.mark.asyncio
+    async def test_apply_command_chunks_issues(self, issue_manager):
+        """5,000 issues with the default chunk size take 50 command requests."""
+        ids = [f"TEST-{i}" for i in range(5000)]
+        issue_manager.issue_service.apply_command = AsyncMock(return_value={"status": "success"})
+
+        result = await issue_manager.apply_command("State Fixed", ids)
+
+        assert result["status"] == "success"
+        assert len(result["applied"]) == 5000
+        assert result["requests"] == 50
+        assert issue_manager.issue_service.apply_command.call_count == 50
+
+    @pytest.mark.asyncio
+    async def test_apply_command_falls_back_per_issue(self, issue_manager):
+        """A rejected chunk is retried per issue to attribute the failure."""
+
+        async def fake_apply(query, issue_ids, comment=None, silent=False):
+            if "TEST-2" in issue_ids:
+                return {"status": "error", "message": "Unknown value"}
+            return {"status": "success"}
+
+        issue_manager.issue_service.apply_command = AsyncMock(side_effect=fake_apply)
+
+        result = await issue_manager.apply_command("Priority Urgent", ["TEST-1", "TEST-2", "TEST-3"])
+
+        assert result["status"] == "partial"
+        assert result["applied"] == ["TEST-1", "TEST-3"]
+        assert result["errors"] == {"TEST-2": "Unknown value"}
+        assert result["requests"] == 4
+
     @pytest.mark.asyncio
     async def test_search_issues_basic(self, issue_manager, sample_issue):
         """Test basic issue search."""
@@ -223,6 +325,81 @@ class TestIssueManagerRetrieval:
         query = issue_manager.issue_service.search_issues.call_args[1]["query"]
         assert "#Unresolved" in query
 
+    @pytest.mark.asyncio
+    async def test_write_issues_streams_csv_and_json(self, issue_manager):
+        """CSV and JSON exports are written page by page and match the buffered output."""
+        import io
+        import json
+
+        issues = [
+            {
+                "idReadable": f"P-{i}",
+                "summary": f"Issue {i}",
+                "project": {"name": "Proj"},
+                "customFields": [{"name": "State", "value": {"name": "Open"}}],
+            }
+            for i in range(150)
+        ]
+        pages = [{"status": "success", "data": issues[:100]}, {"status": "success", "data": issues[100:]}]
+
+        issue_manager.issue_service.search_issues = AsyncMock(side_effect=list(pages))
+        csv_stream = io.StringIO()
+        assert await issue_manager.write_issues(csv_stream, "csv", page_size=100) == 150
+        assert csv_stream.getvalue() == issue_manager._format_issues_as_csv(issues)
+
+        issue_manager.issue_service.search_issues = AsyncMock(side_effect=list(pages))
+        json_stream = io.StringIO()
+        assert await issue_manager.write_issues(json_stream, "json", page_size=100) == 150
+        assert json.loads(json_stream.getvalue()) == issues
+
+    @pytest.mark.asyncio
+    async def test_write_issues_json_closed_after_late_page_failure(self, issue_manager):
+        """A failed later page ends the stream but the JSON array stays well-formed."""
+        import io
+        import json
+
+        page1 = {"status": "success", "data": [{"idReadable": f"P-{i}"} for i in range(10)]}
+        issue_manager.issue_service.search_issues = AsyncMock(
+            side_effect=[page1, {"status": "error", "message": "boom"}]
+        )
+        stream = io.StringIO()
+
+        assert await issue_manager.write_issues(stream, "json", page_size=10) == 10
+        assert len(json.loads(stream.getvalue())) == 10
+
+    def test_issue_page_source_fetches_one_page_per_request(self, issue_manager):
+        """The lazy page source asks the server for one display page at a time."""
+        issue_manager.issue_service.search_issues = AsyncMock(
+            return_value={"status": "success", "data": [{"idReadable": f"P-{i}"} for i in range(20)]}
+        )
+
+        with issue_manager.issue_page_source(project_id="P", state="open", page_size=20) as source:
+            page = source.get_page(1)
+
+        assert len(page) == 20
+        first_call = issue_manager.issue_service.search_issues.call_args_list[0][1]
+        assert first_call["top"] == 20
+        assert first_call["skip"] == 0
+        assert first_call["query"].startswith("project: P #Unresolved")
+
+    def test_issue_page_source_error_raises(self, issue_manager):
+        """A failed page fetch raises instead of showing an empty table."""
+        issue_manager.issue_service.search_issues = AsyncMock(return_value={"status": "error", "message": "boom"})
+
+        with issue_manager.issue_page_source(page_size=10, format_output=None) as source:
+            with pytest.raises(YouTrackError):
+                source.get_page(1)
+
+    def test_format_issues_for_display_renders_first_page_only(self, issue_manager):
+        """Paginated table output only builds rows for the visible page."""
+        issues = [{"idReadable": f"P-{i}", "summary": "s"} for i in range(120)]
+
+        with patch.object(issue_manager, "_format_issues_as_table", return_value="table\n") as render:
+            output = issue_manager._format_issues_for_display(issues, "table")
+
+        assert len(render.call_args[0][0]) == 50
+        assert "Showing 1-50 of 120 issues" in output
+
     @pytest.mark.asyncio
     async def test_search_issues_error_on_first_page_surfaces(self, issue_manager):
         """A failure on the first page is returned as an error, not swallowed."""
@@ -325,6 +502,40 @@ class TestIssueManagerRetrieval:
         assert "summary" in fields  # resolved to the actual minimal field list
         assert "customFields" not in fields  # minimal carries no customFields
 
+    @pytest.mark.asyncio
+    async def test_search_issues_table_projects_fields(self, issue_manager):
+        """Table output fetches only the columns it renders, not full customFields."""
+        issue_manager.issue_service.search_issues.return_value = {"status": "success", "data": []}
+
+        await issue_manager.search_issues("", format_output="table")
+
+        kwargs = issue_manager.issue_service.search_issues.call_args[1]
+        assert "description" not in kwargs["fields"]
+        assert "Priority" in kwargs["custom_fields"]
+        assert "Type" not in kwargs["custom_fields"]
+
+    @pytest.mark.asyncio
+    async def test_search_issues_json_keeps_default_fields(self, issue_manager):
+        """JSON output is not projected; the service default field set applies."""
+        issue_manager.issue_service.search_issues.return_value = {"status": "success", "data": []}
+
+        await issue_manager.search_issues("", format_output="json")
+
+        kwargs = issue_manager.issue_service.search_issues.call_args[1]
+        assert kwargs["fields"] is None
+        assert kwargs["custom_fields"] is None
+
+    @pytest.mark.asyncio
+    async def test_search_issues_explicit_fields_win_over_projection(self, issue_manager):
+        """Caller-specified fields are never replaced by the projection."""
+        issue_manager.issue_service.search_issues.return_value = {"status": "success", "data": []}
+
+        await issue_manager.search_issues("", fields="id,summary", format_output="table")
+
+        kwargs = issue_manager.issue_service.search_issues.call_args[1]
+        assert kwargs["fields"] == "id,summary"
+        assert kwargs["custom_fields"] is None
+
     @pytest.mark.asyncio
     async def test_list_issues_clientside_fallback_warns_when_capped(self, issue_manager):
         """#728: when state is filtered client-side (no project) and --top caps the
@@ -376,6 +587,38 @@ class TestIssueManagerRetrieval:
         assert "Workflow State" not in query
         assert [i["idReadable"] for i in result["data"]] == ["PROJ-1"]
 
+    @pytest.mark.asyncio
+    async def test_count_issues_uses_count_endpoint(self, issue_manager):
+        """Filters are folded into one query and counted server-side."""
+        issue_manager.issue_service.count_issues.return_value = {"status": "success", "data": {"count": 12}}
+
+        result = await issue_manager.count_issues(project_id="TEST", state="open", assignee="jdoe")
+
+        query = issue_manager.issue_service.count_issues.call_args[0][0]
+        assert query == "project: TEST #Unresolved Assignee: jdoe"
+        assert result == {"status": "success", "data": {"count": 12, "query": query}}
+        issue_manager.issue_service.search_issues.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_issues_clientside_state_counts_stream(self, issue_manager):
+        """A state that can't be queried server-side is counted from streamed issues."""
+        issue_manager.project_service.discover_state_field.return_value = {
+            "status": "success",
+            "data": {"field_name": "Workflow State"},
+        }
+        issue_manager.issue_service.search_issues.return_value = {
+            "status": "success",
+            "data": [
+                self._issue_with_state("PROJ-1", "In Progress", field_name="Workflow State"),
+                self._issue_with_state("PROJ-2", "Done", field_name="Workflow State"),
+            ],
+        }
+
+        result = await issue_manager.count_issues(project_id="TEST", state="In Progress")
+
+        assert result["data"]["count"] == 1
+        issue_manager.issue_service.count_issues.assert_not_called()
+
 
 class TestIssueManagerUpdate:
     """Test issue update functionality."""
@@ -697,13 +940,8 @@ class TestIssueManagerUtilities:
 
     def test_get_custom_field_value(self, issue_manager, sample_issue):
         """Test extracting custom field values."""
-        with patch("youtrack_cli.managers.issues.CustomFieldManager") as mock_cfm:
-            mock_cfm.extract_field_value.return_value = "High"
-
-            result = issue_manager._get_custom_field_value(sample_issue, "Priority")
-
-            mock_cfm.extract_field_value.assert_called_once_with(sample_issue["customFields"], "Priority")
-            assert result == "High"
+        assert issue_manager._get_custom_field_value(sample_issue, "Priority") == "High"
+        assert issue_manager._get_custom_field_value(sample_issue, "Missing") is None
 
     def test_get_assignee_name_from_regular_field(self, issue_manager, sample_issue):
         """Test getting assignee name from regular field."""
@@ -935,14 +1173,19 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_field_exists_valid_value(self, issue_manager):
         """Test validation when field exists and value is valid."""
         # Mock project custom fields response
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {
-                    "name": "Priority",
-                    "bundle": {"values": [{"name": "Critical"}, {"name": "High"}, {"name": "Normal"}, {"name": "Low"}]},
-                }
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {
+                        "name": "Priority",
+                        "bundle": {
+                            "values": [{"name": "Critical"}, {"name": "High"}, {"name": "Normal"}, {"name": "Low"}]
+                        },
+                    }
+                ],
+            ),
         }
 
         result = await issue_manager._validate_custom_field_value("project-123", "Priority", "High")
@@ -954,14 +1197,19 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_field_exists_invalid_value(self, issue_manager):
         """Test validation when field exists but value is invalid."""
         # Mock project custom fields response
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {
-                    "name": "Priority",
-                    "bundle": {"values": [{"name": "Critical"}, {"name": "High"}, {"name": "Normal"}, {"name": "Low"}]},
-                }
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {
+                        "name": "Priority",
+                        "bundle": {
+                            "values": [{"name": "Critical"}, {"name": "High"}, {"name": "Normal"}, {"name": "Low"}]
+                        },
+                    }
+                ],
+            ),
         }
 
         result = await issue_manager._validate_custom_field_value("project-123", "Priority", "Invalid")
@@ -971,16 +1219,37 @@ class TestIssueManagerCustomFieldValidation:
         assert "not a valid Priority" in result["message"]
         assert "Critical, High, Normal, Low" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_validate_custom_field_value_refreshes_stale_schema(self, issue_manager):
+        """A value missing from a cached snapshot is checked again against a fresh schema."""
+
+        def priority_schema(values, fetched_at=None):
+            field = {"name": "Priority", "bundle": {"values": [{"name": name} for name in values]}}
+            return {"status": "success", "data": ProjectSchema("project-123", [field], fetched_at=fetched_at)}
+
+        issue_manager.project_service.get_project_schema.side_effect = [
+            priority_schema(["Normal"], fetched_at=0),
+            priority_schema(["Normal", "Urgent"]),
+        ]
+
+        result = await issue_manager._validate_custom_field_value("project-123", "Priority", "Urgent")
+
+        assert result["valid"] is True
+        issue_manager.project_service.get_project_schema.assert_called_with("project-123", force_refresh=True)
+
     @pytest.mark.asyncio
     async def test_validate_custom_field_value_field_not_exists_with_field_names(self, issue_manager):
         """Test validation when field doesn't exist but other field names are available."""
         # Mock project custom fields response with other fields but not the requested one
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {"name": "Priority", "bundle": {"values": [{"name": "High"}]}},
-                {"name": "Assignee", "bundle": {"values": []}},
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {"name": "Priority", "bundle": {"values": [{"name": "High"}]}},
+                    {"name": "Assignee", "bundle": {"values": []}},
+                ],
+            ),
         }
 
         # Mock heuristics method to return None (field not found)
@@ -995,14 +1264,17 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_critical_field_no_field_names(self, issue_manager):
         """Test validation when critical field validation fails due to missing field names."""
         # Mock project custom fields response with no field names available
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {
-                    "name": None,  # No field name available
-                    "bundle": {"values": [{"name": "High"}]},
-                }
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {
+                        "name": None,  # No field name available
+                        "bundle": {"values": [{"name": "High"}]},
+                    }
+                ],
+            ),
         }
 
         # Mock heuristics method to return None (field not found)
@@ -1018,14 +1290,17 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_non_critical_field_no_field_names(self, issue_manager):
         """Test validation when non-critical field validation with missing field names fails open."""
         # Mock project custom fields response with no field names available
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {
-                    "name": None,  # No field name available
-                    "bundle": {"values": [{"name": "High"}]},
-                }
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {
+                        "name": None,  # No field name available
+                        "bundle": {"values": [{"name": "High"}]},
+                    }
+                ],
+            ),
         }
 
         with patch("youtrack_cli.managers.issues.logger") as mock_logger:
@@ -1042,7 +1317,7 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_api_failure(self, issue_manager):
         """Test validation when API call fails."""
         # Mock API failure
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "error",
             "message": "API Error",
         }
@@ -1060,14 +1335,17 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_field_no_bundle_values(self, issue_manager):
         """Test validation when field exists but has no bundle values (text field)."""
         # Mock project custom fields response with field but no bundle values
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [
-                {
-                    "name": "Description",
-                    "bundle": {"values": []},  # No values - likely a text field
-                }
-            ],
+            "data": ProjectSchema(
+                "project-123",
+                [
+                    {
+                        "name": "Description",
+                        "bundle": {"values": []},  # No values - likely a text field
+                    }
+                ],
+            ),
         }
 
         result = await issue_manager._validate_custom_field_value("project-123", "Description", "Any text value")
@@ -1081,9 +1359,9 @@ class TestIssueManagerCustomFieldValidation:
         critical_fields = ["Type", "Priority", "State", "Status"]
 
         # Mock project custom fields response with no field names available
-        issue_manager.project_service.get_project_custom_fields.return_value = {
+        issue_manager.project_service.get_project_schema.return_value = {
             "status": "success",
-            "data": [{"name": None}],
+            "data": ProjectSchema("project-123", [{"name": None}]),
         }
 
         with patch.object(issue_manager, "_find_field_by_heuristics", return_value=None):
@@ -1097,7 +1375,7 @@ class TestIssueManagerCustomFieldValidation:
     async def test_validate_custom_field_value_exception_handling(self, issue_manager):
         """Test validation handles exceptions gracefully."""
         # Mock an exception during API call
-        issue_manager.project_service.get_project_custom_fields.side_effect = Exception("Test exception")
+        issue_manager.project_service.get_project_schema.side_effect = Exception("Test exception")
 
         with patch("youtrack_cli.managers.issues.logger") as mock_logger:
             result = await issue_manager._validate_custom_field_value("project-123", "Priority", "High")
@@ -6,6 +6,7 @@ import pytest
 
 from youtrack_cli.auth import AuthManager
 from youtrack_cli.managers.projects import ProjectManager
+from youtrack_cli.user_directory import USER_DIRECTORY_FIELDS
 
 
 @pytest.fixture
@@ -36,7 +37,7 @@ class TestProjectManagerUserResolution:
 
             assert user_id == "2-1"
             assert error is None
-            mock_get_user.assert_called_once_with("admin", fields="id,login")
+            mock_get_user.assert_called_once_with("admin", fields=USER_DIRECTORY_FIELDS)
 
     @pytest.mark.asyncio
     async def test_resolve_user_id_with_invalid_username(self, project_manager):
@@ -48,7 +49,7 @@ class TestProjectManagerUserResolution:
 
             assert user_id == "nonexistent"
             assert error == "User 'nonexistent' not found"
-            mock_get_user.assert_called_once_with("nonexistent", fields="id,login")
+            mock_get_user.assert_called_once_with("nonexistent", fields=USER_DIRECTORY_FIELDS)
 
     @pytest.mark.asyncio
     async def test_resolve_user_id_with_valid_user_id_digits_and_dash(self, project_manager):
@@ -62,7 +63,7 @@ class TestProjectManagerUserResolution:
 
             assert user_id == "2-1"
             assert error is None
-            mock_get_user.assert_called_once_with("2-1", fields="id,login")
+            mock_get_user.assert_called_once_with("2-1", fields=USER_DIRECTORY_FIELDS)
 
     @pytest.mark.asyncio
     async def test_resolve_user_id_with_system_user_guest(self, project_manager):
@@ -76,22 +77,34 @@ class TestProjectManagerUserResolution:
 
             assert user_id == "guest"
             assert error is None
-            mock_get_user.assert_called_once_with("guest", fields="id,login")
+            mock_get_user.assert_called_once_with("guest", fields=USER_DIRECTORY_FIELDS)
 
     @pytest.mark.asyncio
     async def test_resolve_user_id_with_presumed_user_id_that_does_not_exist(self, project_manager):
-        """Test resolving what looks like a user ID but doesn't exist, falls back to username resolution."""
+        """Test resolving what looks like a user ID but doesn't exist."""
         with patch.object(project_manager.user_manager, "get_user", new_callable=AsyncMock) as mock_get_user:
-            # First call (validating presumed user ID) fails
-            # Second call (username resolution) also fails
             mock_get_user.return_value = {"status": "error", "message": "User not found"}
 
             user_id, error = await project_manager._resolve_user_id("99-99")
 
             assert user_id == "99-99"
             assert error == "User '99-99' not found"
-            # Should be called twice: once for ID validation, once for username resolution
-            assert mock_get_user.call_count == 2
+            # IDs and logins are looked up the same way, so one request suffices
+            assert mock_get_user.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_resolve_user_id_reuses_directory(self, project_manager):
+        """Test that a user resolved once is not requested again, by login or ID."""
+        mock_user_data = {"id": "2-1", "login": "admin", "email": "admin@example.com"}
+
+        with patch.object(project_manager.user_manager, "get_user", new_callable=AsyncMock) as mock_get_user:
+            mock_get_user.return_value = {"status": "success", "data": mock_user_data}
+
+            references = ("admin", "Admin", "2-1", "admin@example.com")
+            results = [await project_manager._resolve_user_id(reference) for reference in references]
+
+            assert results == [("2-1", None)] * 4
+            mock_get_user.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_resolve_user_id_with_user_missing_id_field(self, project_manager):
@@ -139,7 +152,7 @@ class TestProjectManagerUserResolution:
 
                 assert user_id == input_value
                 assert error is None
-                mock_get_user.assert_called_with(input_value, fields="id,login")
+                mock_get_user.assert_called_with(input_value, fields=USER_DIRECTORY_FIELDS)
 
 
 class TestProjectManagerCreateProjectWithUserResolution:
@@ -257,3 +270,43 @@ class TestProjectManagerUpdateProjectWithUserResolution:
             assert result["status"] == "error"
             assert "Failed to resolve leader" in result["message"]
             assert "User 'nonexistent' not found" in result["message"]
+
+
+class TestProjectManagerListProjectsPagination:
+    """Test paging through all projects."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_all_projects_and_filters_archived_after(self, project_manager):
+        """Archived projects are dropped after paging so page lengths decide when to stop."""
+        projects = [{"id": f"0-{i}", "archived": i % 3 == 0} for i in range(5)]
+
+        async def list_projects(fields, top, skip, show_archived):
+            return {"status": "success", "data": projects[skip : skip + top]}
+
+        project_manager.project_service.list_projects = AsyncMock(side_effect=list_projects)
+
+        result = await project_manager.list_projects(fields="id,archived", page_size=2, use_pagination=True)
+
+        assert result["status"] == "success"
+        assert [p["id"] for p in result["data"]] == ["0-1", "0-2", "0-4"]
+        assert result["pagination"]["total_results"] == 5
+        calls = project_manager.project_service.list_projects.await_args_list
+        assert all(c.kwargs["show_archived"] is True for c in calls)
+        assert calls[0].kwargs == {"fields": "id,archived", "top": 2, "skip": 0, "show_archived": True}
+
+    @pytest.mark.asyncio
+    async def test_page_error_is_returned(self, project_manager):
+        """A failing page turns into an error result."""
+        project_manager.project_service.list_projects = AsyncMock(
+            side_effect=[
+                {"status": "success", "data": [{"id": "0-1"}, {"id": "0-2"}]},
+                {"status": "error", "message": "Forbidden"},
+                {"status": "success", "data": []},
+                {"status": "success", "data": []},
+                {"status": "success", "data": []},
+            ]
+        )
+
+        result = await project_manager.list_projects(page_size=2, use_pagination=True)
+
+        assert result == {"status": "error", "message": "Forbidden"}
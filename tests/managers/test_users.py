@@ -1,11 +1,12 @@
 """Tests for UserManager."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from youtrack_cli.auth import AuthManager
-from youtrack_cli.managers.users import UserManager
+from youtrack_cli.managers.users import USER_PROFILE_PAGE_SIZE, UserManager, UserOperation
 
 
 @pytest.fixture
@@ -48,6 +49,7 @@ def user_manager(auth_manager):
             "remove_user_from_team",
             "change_user_password",
             "get_user_permissions",
+            "get_user_profile",
         ]:
             setattr(manager.user_service, method_name, AsyncMock())
 
@@ -178,6 +180,182 @@ class TestUserManagerGetUser:
         assert result == expected_result
 
 
+class TestUserManagerProfiles:
+    """Test composite and bulk user profiles."""
+
+    @pytest.mark.asyncio
+    async def test_get_user_profiles_by_id_keeps_order_and_errors(self, user_manager):
+        """Profiles come back in input order; failures are reported per user."""
+
+        async def get_profile(user_id, include_permissions):
+            if user_id == "ghost":
+                return {"status": "error", "message": "User not found"}
+            return {"status": "success", "data": {"login": user_id}}
+
+        user_manager.user_service.get_user_profile.side_effect = get_profile
+
+        result = await user_manager.get_user_profiles(["b", "ghost", "a"], max_concurrent=2)
+
+        assert [profile["login"] for profile in result["data"]["profiles"]] == ["b", "a"]
+        assert result["data"]["errors"] == [{"user": "ghost", "error": "User not found"}]
+
+    @pytest.mark.asyncio
+    async def test_get_user_profiles_all_users_pages_listing(self, user_manager):
+        """All users are read page by page with profile fields and no per-user requests."""
+        full_page = [{"id": f"1-{i}", "login": f"user{i}"} for i in range(USER_PROFILE_PAGE_SIZE)]
+        user_manager.user_service.list_users.side_effect = [
+            {"status": "success", "data": full_page},
+            {"status": "success", "data": [{"id": "2-1", "login": "last", "groups": [{"name": "devs"}]}]},
+        ]
+
+        result = await user_manager.get_user_profiles()
+
+        assert user_manager.user_service.list_users.call_args_list[1].kwargs["skip"] == USER_PROFILE_PAGE_SIZE
+        assert len(result["data"]["profiles"]) == USER_PROFILE_PAGE_SIZE + 1
+        assert result["data"]["profiles"][-1]["groups"] == [{"name": "devs"}]
+        user_manager.user_service.get_user_profile.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_profiles_all_users_with_permissions(self, user_manager):
+        """With --all and permissions, only permissions are requested per user."""
+        user_manager.user_service.list_users.return_value = {
+            "status": "success",
+            "data": [{"login": "jane"}, {"fullName": "No login or ID"}],
+        }
+        user_manager.user_service.get_user_permissions.return_value = {"status": "success", "data": [{"name": "R"}]}
+
+        result = await user_manager.get_user_profiles(include_permissions=True)
+
+        user_manager.user_service.get_user_permissions.assert_called_once_with("jane")
+        assert result["data"]["profiles"] == [
+            {"login": "jane", "groups": [], "roles": [], "teams": [], "permissions": [{"name": "R"}]}
+        ]
+
+    def test_write_profiles_csv(self, user_manager):
+        """Profiles are written one row per user with joined memberships."""
+        import io
+
+        stream = io.StringIO()
+        profile = {"login": "jane", "fullName": "Jane", "groups": [{"name": "a"}, {"name": "b"}], "roles": []}
+
+        assert user_manager.write_profiles_csv(stream, [profile]) == 1
+        assert stream.getvalue().splitlines()[1] == "jane,Jane,,False,False,a; b,,"
+
+
+class TestUserManagerBulkOperations:
+    """Test file-driven bulk user administration."""
+
+    def test_parse_user_operations_csv(self, user_manager):
+        """Rows are validated and numbered as in the file."""
+        import io
+
+        stream = io.StringIO(
+            "user,action,target\njane,ban,\njohn,add-to-group,developers\n,ban,\njack,promote,\njill,assign-role,\n"
+        )
+
+        operations, errors = user_manager.parse_user_operations(stream, "csv")
+
+        assert operations == [
+            UserOperation(row=2, user="jane", action="ban"),
+            UserOperation(row=3, user="john", action="add-to-group", target="developers"),
+        ]
+        assert [(error["row"], error["error"]) for error in errors] == [
+            (4, "Missing user"),
+            (5, "Unknown action 'promote'"),
+            (6, "Action 'assign-role' needs a target"),
+        ]
+
+    def test_parse_user_operations_json_requires_array(self, user_manager):
+        """JSON input must be an array of objects."""
+        import io
+
+        with pytest.raises(ValueError, match="array of objects"):
+            user_manager.parse_user_operations(io.StringIO('{"user": "jane"}'), "json")
+
+    @pytest.mark.asyncio
+    async def test_apply_user_operations_uses_resolved_ring_ids(self, user_manager):
+        """Users are resolved once and bans pass the known ringId."""
+        users = {
+            "jane": {"id": "1-1", "login": "jane", "ringId": "ring-1"},
+            "john": {"id": "1-2", "login": "john", "ringId": "ring-2"},
+            "ghost": None,
+        }
+        user_manager.directory.resolve_many = AsyncMock(return_value=users)
+        user_manager.directory.invalidate = MagicMock()
+        user_manager.user_service.ban_user.return_value = {"status": "success"}
+        user_manager.user_service.add_user_to_group.return_value = {"status": "error", "message": "Group not found"}
+        operations = [
+            UserOperation(row=2, user="jane", action="ban"),
+            UserOperation(row=3, user="john", action="add-to-group", target="nope"),
+            UserOperation(row=4, user="ghost", action="ban"),
+        ]
+
+        result = await user_manager.apply_user_operations(operations, max_concurrent=2)
+
+        user_manager.directory.resolve_many.assert_awaited_once_with(["jane", "john", "ghost"])
+        user_manager.user_service.ban_user.assert_called_once_with("1-1", ring_id="ring-1")
+        user_manager.user_service.add_user_to_group.assert_called_once_with("1-2", "nope")
+        user_manager.directory.invalidate.assert_called_once()
+        data = result["data"]
+        assert (data["total"], data["succeeded"], data["failed"]) == (3, 1, 2)
+        assert [(row["row"], row["status"], row["error"]) for row in data["results"]] == [
+            (2, "ok", ""),
+            (3, "failed", "Group not found"),
+            (4, "failed", "User 'ghost' not found"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_apply_user_operations_orders_by_resolved_user(self, user_manager):
+        """Operations naming one user by login and email run in file order."""
+        jane = {"id": "1-1", "login": "jane", "ringId": "ring-1"}
+        user_manager.directory.resolve_many = AsyncMock(return_value={"jane": jane, "jane@example.com": jane})
+        user_manager.directory.invalidate = MagicMock()
+        calls = []
+
+        def record(name, delay):
+            async def call(*args, **kwargs):
+                calls.append(f"{name}:start")
+                await asyncio.sleep(delay)
+                calls.append(f"{name}:end")
+                return {"status": "success"}
+
+            return call
+
+        user_manager.user_service.ban_user.side_effect = record("ban", 0.02)
+        user_manager.user_service.unban_user.side_effect = record("unban", 0)
+        operations = [
+            UserOperation(row=2, user="jane", action="ban"),
+            UserOperation(row=3, user="jane@example.com", action="unban"),
+        ]
+
+        result = await user_manager.apply_user_operations(operations, max_concurrent=4)
+
+        assert calls == ["ban:start", "ban:end", "unban:start", "unban:end"]
+        assert result["data"]["succeeded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_apply_user_operations_dry_run(self, user_manager):
+        """A dry run resolves users without changing anything."""
+        user_manager.directory.resolve_many = AsyncMock(return_value={"jane": {"id": "1-1", "login": "jane"}})
+
+        result = await user_manager.apply_user_operations(
+            [UserOperation(row=1, user="jane", action="ban")], dry_run=True
+        )
+
+        user_manager.user_service.ban_user.assert_not_called()
+        assert result["data"]["succeeded"] == 1
+
+    def test_write_operation_results(self, user_manager):
+        """Results are written one CSV row per operation."""
+        import io
+
+        stream = io.StringIO()
+        results = [{"row": 2, "user": "jane", "action": "ban", "target": "", "status": "ok", "error": ""}]
+
+        assert user_manager.write_operation_results(stream, results) == 1
+        assert stream.getvalue().splitlines() == ["row,user,action,target,status,error", "2,jane,ban,,ok,"]
+
+
 class TestUserManagerCreateUser:
     """Test user creation functionality."""
 
@@ -1,18 +1,22 @@
 """Tests for IssueService."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+import youtrack_cli.cache as cache_module
 from youtrack_cli.auth import AuthManager
-from youtrack_cli.services.issues import IssueService
+from youtrack_cli.services.issues import TAG_INDEX_TTL, IssueService
 
 
 @pytest.fixture
 def auth_manager():
     """Create a mock auth manager."""
     mock_auth = MagicMock(spec=AuthManager)
+    mock_auth.load_credentials.return_value = MagicMock(base_url="https://youtrack.example.com/", token="token")
     return mock_auth
 
 
@@ -210,6 +214,79 @@ class TestIssueServiceRetrieval:
             expected_params = {"query": "state: Open", "fields": "id,summary", "$top": "10", "$skip": "5"}
             mock_request.assert_called_once_with("GET", "issues", params=expected_params)
 
+    @pytest.mark.asyncio
+    async def test_search_issues_with_custom_field_filter(self, issue_service, mock_response):
+        """Test that a custom field filter is sent as repeated customFields params."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"data": []}
+
+            await issue_service.search_issues(query="", fields="id", custom_fields=("State", "Priority"))
+
+            params = mock_request.call_args[1]["params"]
+            assert params["customFields"] == ["State", "Priority"]
+
+    @pytest.mark.asyncio
+    async def test_count_issues(self, issue_service, mock_response):
+        """Test counting issues through the count endpoint."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": {"count": 42, "$type": "IssueCountResponse"}}
+
+            result = await issue_service.count_issues("project: TEST #Unresolved")
+
+            mock_request.assert_called_once_with(
+                "POST",
+                "issuesGetter/count",
+                params={"fields": "count"},
+                json_data={"query": "project: TEST #Unresolved"},
+            )
+            assert result == {"status": "success", "data": {"count": 42}}
+
+    @pytest.mark.asyncio
+    async def test_count_issues_polls_until_ready(self, issue_service, mock_response):
+        """Test that a count of -1 is polled again with backoff."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+            patch("youtrack_cli.services.issues.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.side_effect = [
+                {"status": "success", "data": {"count": -1}},
+                {"status": "success", "data": {"count": -1}},
+                {"status": "success", "data": {"count": 7}},
+            ]
+
+            result = await issue_service.count_issues("project: TEST")
+
+            assert result["data"]["count"] == 7
+            assert mock_request.call_count == 3
+            assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_count_issues_times_out(self, issue_service, mock_response):
+        """Test that a count that never becomes ready returns an error."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+            patch("youtrack_cli.services.issues.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": {"count": -1}}
+
+            result = await issue_service.count_issues("project: TEST", timeout=0)
+
+            assert result["status"] == "error"
+            assert "Timed out" in result["message"]
+            assert mock_request.call_count == 1
+
 
 class TestIssueServiceUpdate:
     """Test issue update functionality."""
@@ -484,6 +561,29 @@ class TestIssueServiceMove:
             assert result["status"] == "success"
 
 
+class TestIssueServiceCommands:
+    """Test command application."""
+
+    @pytest.mark.asyncio
+    async def test_apply_command_to_many_issues(self, issue_service, mock_response):
+        """One request carries the command and every target issue."""
+        with patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+
+            result = await issue_service.apply_command("State Fixed", ["TEST-1", "2-5"], silent=True)
+
+            mock_request.assert_called_once_with(
+                "POST",
+                "commands",
+                json_data={
+                    "query": "State Fixed",
+                    "issues": [{"idReadable": "TEST-1"}, {"id": "2-5"}],
+                    "silent": True,
+                },
+            )
+            assert result["status"] == "success"
+
+
 class TestIssueServiceTags:
     """Test tag-related functionality."""
 
@@ -575,6 +675,55 @@ class TestIssueServiceTags:
             mock_request.assert_called_once_with("POST", "tags", json_data={"name": "new-tag"})
             mock_handle.assert_called_once_with(mock_response, success_codes=[200, 201])
 
+    @pytest.mark.asyncio
+    async def test_tag_index_shared_and_invalidated_by_create_tag(self, issue_service, mock_response):
+        """Tag lookups share one listing until create_tag invalidates it."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.side_effect = [
+                {"status": "success", "data": [{"id": "10-1", "name": "urgent"}]},  # tag listing
+                {"status": "success"},  # add_tag
+                {"status": "success"},  # remove_tag
+                {"status": "success", "data": {"id": "10-2", "name": "release"}},  # create_tag
+                {"status": "success", "data": [{"id": "10-1", "name": "urgent"}, {"id": "10-2", "name": "release"}]},
+            ]
+
+            await issue_service.add_tag("TEST-1", "urgent")
+            await issue_service.remove_tag("TEST-2", "urgent")
+            await issue_service.create_tag("release")
+            result = await issue_service.find_tag_by_name("release")
+
+            tag_listings = [call for call in mock_request.call_args_list if call.args[:2] == ("GET", "tags")]
+            assert len(tag_listings) == 2
+            assert result["data"]["id"] == "10-2"
+
+    @pytest.mark.asyncio
+    async def test_tag_index_persists_across_invocations(self, auth_manager, mock_response):
+        """A tag index built by one invocation serves the next until it expires."""
+        first, second = IssueService(auth_manager), IssueService(auth_manager)
+        with (
+            patch.object(first, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(first, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": [{"id": "10-1", "name": "urgent"}]}
+            await first.find_tag_by_name("urgent")
+
+        cache_module._cache = None  # a new process starts with an empty in-memory cache
+        with patch.object(second, "_make_request", new_callable=AsyncMock) as mock_request:
+            result = await second.find_tag_by_name("urgent")
+
+            mock_request.assert_not_called()
+            assert result["data"]["id"] == "10-1"
+
+            cache_module._cache = None
+            with patch("youtrack_cli.index_cache.time.time", return_value=time.time() + TAG_INDEX_TTL):
+                index = await second._load_index("tags", TAG_INDEX_TTL)
+            assert index is None
+
 
 class TestIssueServiceComments:
     """Test comment-related functionality."""
@@ -775,6 +924,222 @@ class TestIssueServiceLinks:
 
             mock_request.assert_called_once_with("GET", "issues/TEST-1/links", params={"fields": "id,linkType"})
 
+    @pytest.mark.asyncio
+    async def test_create_link_reuses_link_type_index(self, issue_service, mock_response):
+        """Link types are listed once and shared by later link operations."""
+        link_types = {
+            "status": "success",
+            "data": [
+                {
+                    "id": "51-2",
+                    "name": "Depend",
+                    "directed": True,
+                    "sourceToTarget": "depends on",
+                    "targetToSource": "is required for",
+                },
+                {"id": "51-0", "name": "Relates", "directed": False},
+            ],
+        }
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "list_link_types", new_callable=AsyncMock) as mock_types,
+        ):
+            mock_request.return_value = mock_response
+            mock_types.return_value = link_types
+
+            for link_type in ("depends on", "is required for", "Relates"):
+                result = await issue_service.create_link("1-1", "1-2", link_type)
+                assert result["status"] == "success"
+            await issue_service.delete_link("1-1", "1-2", "Depend")
+
+            mock_types.assert_called_once()
+            posted = [call.args[1] for call in mock_request.call_args_list if call.args[0] == "POST"]
+            assert posted == [
+                "issues/1-1/links/51-2s/issues",
+                "issues/1-1/links/51-2t/issues",
+                "issues/1-1/links/51-0/issues",
+            ]
+            mock_request.assert_any_call("DELETE", "issues/1-1/links/51-2s/issues/1-2")
+
+    @pytest.mark.asyncio
+    async def test_unknown_link_type_refreshes_index_once(self, issue_service, mock_response):
+        """A name missing from the cached index triggers a single re-read."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+            patch.object(issue_service, "list_link_types", new_callable=AsyncMock) as mock_types,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": {}}
+            mock_types.return_value = {"status": "success", "data": [{"id": "51-0", "name": "Relates"}]}
+
+            await issue_service.create_link("1-1", "1-2", "Relates")
+            result = await issue_service.create_link("1-1", "1-2", "Duplicates")
+
+            assert result["status"] == "error"
+            assert "Duplicates" in result["message"]
+            assert mock_types.call_count == 2
+            mock_request.assert_called_once_with("POST", "issues/1-1/links/51-0/issues", json_data={"id": "1-2"})
+
+
+class TestIssueServiceActivities:
+    """Test activity stream functionality."""
+
+    @staticmethod
+    def _activity_pages(histories, page_size=2):
+        """Fake activitiesPage: cursors are "<issue>:<offset>" positions into each history."""
+        calls = []
+
+        async def get_activities_page(issue_id, categories=None, fields=None, cursor=None, top=100):
+            calls.append((issue_id, cursor))
+            history = histories[issue_id]
+            start = int(cursor.split(":")[1]) if cursor else 0
+            activities = history[start : start + page_size]
+            end = start + len(activities)
+            return {
+                "status": "success",
+                "data": {"activities": activities, "afterCursor": f"{issue_id}:{end}", "hasAfter": end < len(history)},
+            }
+
+        return get_activities_page, calls
+
+    @pytest.mark.asyncio
+    async def test_get_activities_page(self, issue_service, mock_response):
+        """Test that categories and cursor are passed to activitiesPage."""
+        with (
+            patch.object(issue_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(issue_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": {"activities": []}}
+
+            await issue_service.get_activities_page(
+                "TEST-1", categories=["CustomFieldCategory"], fields="id,timestamp", cursor="abc", top=50
+            )
+
+            mock_request.assert_called_once_with(
+                "GET",
+                "issues/TEST-1/activitiesPage",
+                params={
+                    "fields": "afterCursor,hasAfter,activities(id,timestamp)",
+                    "$top": "50",
+                    "categories": "CustomFieldCategory",
+                    "cursor": "abc",
+                },
+            )
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_follows_cursors(self, issue_service):
+        """Every page of every issue is streamed, oldest first per issue."""
+        histories = {"A-1": [{"id": f"a{n}"} for n in range(5)], "A-2": [{"id": "b0"}]}
+        fake_page, calls = self._activity_pages(histories)
+
+        with patch.object(issue_service, "get_activities_page", side_effect=fake_page):
+            pairs = [pair async for pair in issue_service.stream_activities(["A-1", "A-2", "A-1"], max_concurrent=2)]
+
+        assert [a["id"] for issue_id, a in pairs if issue_id == "A-1"] == ["a0", "a1", "a2", "a3", "a4"]
+        assert [a["id"] for issue_id, a in pairs if issue_id == "A-2"] == ["b0"]
+        assert sorted(calls, key=lambda call: (call[0], call[1] or "")) == [
+            ("A-1", None),
+            ("A-1", "A-1:2"),
+            ("A-1", "A-1:4"),
+            ("A-2", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_cache_fetches_only_new(self, issue_service, tmp_path):
+        """A second run resumes from the cached cursor and still yields the full history."""
+        from youtrack_cli.activity_cache import ActivityCache
+
+        issue_service.auth_manager.load_credentials.return_value = MagicMock(base_url="https://yt.example.com")
+        cache = ActivityCache(tmp_path)
+        histories = {"A-1": [{"id": "a0"}, {"id": "a1"}, {"id": "a2"}]}
+        fake_page, calls = self._activity_pages(histories)
+
+        with patch.object(issue_service, "get_activities_page", side_effect=fake_page):
+            first = [a["id"] async for _, a in issue_service.stream_activities(["A-1"], cache=cache)]
+            histories["A-1"].append({"id": "a3"})
+            calls.clear()
+            second = [a["id"] async for _, a in issue_service.stream_activities(["A-1"], cache=cache)]
+
+        assert first == ["a0", "a1", "a2"]
+        assert second == ["a0", "a1", "a2", "a3"]
+        assert calls == [("A-1", "A-1:3")]
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_prunes_unused_entries(self, issue_service, tmp_path):
+        """Entries not read within max_age are removed before streaming."""
+        import os
+
+        from youtrack_cli.activity_cache import ActivityCache, CachedActivities
+
+        issue_service.auth_manager.load_credentials.return_value = MagicMock(base_url="https://yt.example.com")
+        cache = ActivityCache(tmp_path, max_age=60)
+        cache.save("old-scope", "A-9", CachedActivities("A-9:1", [{"id": "z0"}]))
+        stale = next(tmp_path.glob("old-scope/*.json"))
+        os.utime(stale, (0, 0))
+        fake_page, _calls = self._activity_pages({"A-1": [{"id": "a0"}]})
+
+        with patch.object(issue_service, "get_activities_page", side_effect=fake_page):
+            pairs = [pair async for pair in issue_service.stream_activities(["A-1"], cache=cache)]
+
+        assert pairs == [("A-1", {"id": "a0"})]
+        assert not (tmp_path / "old-scope").exists()
+        assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_runs_fixed_workers(self, issue_service):
+        """No more than max_concurrent issues are in flight at once."""
+        histories = {f"A-{n}": [{"id": f"a{n}"}] for n in range(10)}
+        fake_page, _calls = self._activity_pages(histories)
+        in_flight = []
+        peak = []
+
+        async def get_activities_page(issue_id, *args, **kwargs):
+            in_flight.append(issue_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(issue_id)
+            return await fake_page(issue_id, *args, **kwargs)
+
+        with patch.object(issue_service, "get_activities_page", side_effect=get_activities_page):
+            pairs = [pair async for pair in issue_service.stream_activities(list(histories), max_concurrent=3)]
+
+        assert len(pairs) == 10
+        assert max(peak) == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_records_errors(self, issue_service):
+        """A failing issue is reported in errors without stopping the others."""
+        histories = {"A-1": [{"id": "a0"}]}
+        fake_page, _calls = self._activity_pages(histories)
+
+        async def get_activities_page(issue_id, *args, **kwargs):
+            if issue_id == "A-2":
+                return {"status": "error", "message": "Issue not found"}
+            return await fake_page(issue_id, *args, **kwargs)
+
+        errors = {}
+        with patch.object(issue_service, "get_activities_page", side_effect=get_activities_page):
+            pairs = [pair async for pair in issue_service.stream_activities(["A-1", "A-2"], errors=errors)]
+
+        assert pairs == [("A-1", {"id": "a0"})]
+        assert errors == {"A-2": "Issue not found"}
+
+    @pytest.mark.asyncio
+    async def test_stream_activities_early_exit_cancels_fetches(self, issue_service):
+        """Stopping the consumer early cancels outstanding fetches."""
+        histories = {f"A-{n}": [{"id": f"a{n}-{m}"} for m in range(10)] for n in range(20)}
+        fake_page, calls = self._activity_pages(histories, page_size=1)
+
+        with patch.object(issue_service, "get_activities_page", side_effect=fake_page):
+            stream = issue_service.stream_activities(list(histories), max_concurrent=2)
+            async for _ in stream:
+                break
+            await stream.aclose()
+
+        assert len(calls) < 200
+
 
 class TestIssueServiceCustomFields:
     """Test custom field functionality."""
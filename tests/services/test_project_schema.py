@@ -0,0 +1,194 @@
+"""Tests for project schema snapshots."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from youtrack_cli.services.project_schema import (
+    PROJECT_SCHEMA_FIELDS,
+    ProjectSchema,
+    ProjectSchemaStore,
+    get_project_schema_store,
+)
+from youtrack_cli.services.projects import ProjectService
+
+BASE_URL = "https://yt.example.com/"
+
+FIELDS = [
+    {
+        "id": "92-1",
+        "$type": "EnumProjectCustomField",
+        "field": {"id": "58-1", "name": "Priority", "fieldType": {"id": "enum[1]", "$type": "FieldType"}},
+        "bundle": {"id": "67-1", "values": [{"id": "68-1", "name": "High", "$type": "EnumBundleElement"}]},
+    },
+    {
+        "id": "92-2",
+        "$type": "StateProjectCustomField",
+        "field": {"id": "58-2", "name": "Stage", "fieldType": {"id": "state[1]", "$type": "FieldType"}},
+        "bundle": {"id": "67-2", "values": [{"id": "68-2", "name": "Develop", "$type": "StateBundleElement"}]},
+    },
+    {
+        "id": "92-3",
+        "$type": "MultiUserProjectCustomField",
+        "field": {"id": "58-3", "name": "Reviewers", "fieldType": {"id": "user[*]", "$type": "FieldType"}},
+    },
+]
+
+
+@pytest.fixture
+def auth_manager():
+    auth = MagicMock()
+    auth.load_credentials.return_value = MagicMock(base_url=BASE_URL)
+    return auth
+
+
+@pytest.fixture
+def project_service(auth_manager):
+    service = ProjectService(auth_manager)
+    service._make_request = AsyncMock()
+    service._handle_response = AsyncMock(return_value={"status": "success", "data": list(FIELDS)})
+    return service
+
+
+@pytest.mark.unit
+class TestProjectSchema:
+    """Test indexing of a schema snapshot."""
+
+    def test_fields_are_indexed_by_name_and_id(self):
+        schema = ProjectSchema("DEMO", FIELDS)
+
+        assert schema.get("priority")["id"] == "92-1"
+        assert schema.get("92-3")["name"] == "Reviewers"
+        assert schema.get("Missing") is None
+        assert schema.field_names() == ["Priority", "Stage", "Reviewers"]
+
+    def test_state_field_by_well_known_name(self):
+        assert ProjectSchema("DEMO", FIELDS).state_field()["name"] == "Stage"
+        assert ProjectSchema("DEMO", FIELDS[:1]).state_field() is None
+
+    def test_version_follows_content(self):
+        assert ProjectSchema("DEMO", FIELDS).version == ProjectSchema("DEMO", list(FIELDS)).version
+        assert ProjectSchema("DEMO", FIELDS).version != ProjectSchema("DEMO", FIELDS[:2]).version
+
+    def test_round_trip_rejects_tampered_content(self):
+        data = ProjectSchema("DEMO", FIELDS).to_dict()
+        assert ProjectSchema.from_dict(data).version == data["version"]
+
+        data["fields"] = data["fields"][:1]
+        with pytest.raises(ValueError):
+            ProjectSchema.from_dict(data)
+
+
+@pytest.mark.unit
+class TestProjectSchemaStore:
+    """Test persistence of schema snapshots."""
+
+    def test_persisted_snapshot_is_reused(self, tmp_path):
+        ProjectSchemaStore(cache_dir=tmp_path).set(BASE_URL, ProjectSchema("DEMO", FIELDS))
+
+        schema = ProjectSchemaStore(cache_dir=tmp_path).get(BASE_URL, "DEMO")
+
+        assert schema is not None
+        assert schema.get("Stage")["id"] == "92-2"
+
+    def test_stale_snapshot_is_not_returned(self, tmp_path):
+        store = ProjectSchemaStore(cache_dir=tmp_path)
+        store.set(BASE_URL, ProjectSchema("DEMO", FIELDS, fetched_at=time.time() - 2 * store.ttl))
+
+        assert store.get(BASE_URL, "DEMO") is None
+
+    def test_unreadable_snapshot_is_ignored(self, tmp_path):
+        store = ProjectSchemaStore(cache_dir=tmp_path)
+        store.set(BASE_URL, ProjectSchema("DEMO", FIELDS))
+        path = next(tmp_path.glob("*.json"))
+        data = json.loads(path.read_text())
+        data["version"] = "0" * 16
+        path.write_text(json.dumps(data))
+
+        assert ProjectSchemaStore(cache_dir=tmp_path).get(BASE_URL, "DEMO") is None
+
+    def test_unknown_instance_is_kept_in_memory_only(self, tmp_path):
+        store = ProjectSchemaStore(cache_dir=tmp_path)
+        base_url = MagicMock()
+
+        store.set(base_url, ProjectSchema("DEMO", FIELDS))
+
+        assert store.get(base_url, "DEMO") is not None
+        assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.unit
+class TestProjectServiceSchema:
+    """Test schema-backed discovery in ProjectService."""
+
+    @pytest.mark.asyncio
+    async def test_schema_is_fetched_once(self, project_service):
+        first = await project_service.get_project_schema("DEMO")
+        second = await project_service.get_project_schema("DEMO")
+
+        assert first["data"] is second["data"]
+        project_service._make_request.assert_awaited_once_with(
+            "GET", "admin/projects/DEMO/customFields", params={"fields": PROJECT_SCHEMA_FIELDS}
+        )
+
+    @pytest.mark.asyncio
+    async def test_discovery_paths_share_one_request(self, project_service):
+        state = await project_service.discover_state_field("DEMO")
+        priority = await project_service.discover_custom_field("DEMO", "priority")
+        details = await project_service.get_custom_field_details("DEMO", "92-3")
+
+        assert state["data"]["field_name"] == "Stage"
+        assert state["data"]["bundle_type"] == "StateBundleElement"
+        assert priority["data"]["field_id"] == "92-1"
+        assert priority["data"]["bundle_element_type"] == "EnumBundleElement"
+        assert details["data"]["field"]["name"] == "Reviewers"
+        project_service._make_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_field_refreshes_cached_snapshot_once(self, project_service):
+        await project_service.get_project_schema("DEMO")
+        attached = {"id": "92-4", "$type": "TextProjectCustomField", "field": {"id": "58-4", "name": "Notes"}}
+        project_service._handle_response.return_value = {"status": "success", "data": [*FIELDS, attached]}
+
+        found = await project_service.discover_custom_field("DEMO", "Notes")
+        missing = await project_service.discover_custom_field("DEMO", "Nope")
+
+        assert found["data"]["field_id"] == "92-4"
+        assert missing["status"] == "error"
+        assert "Notes" in missing["available_fields"]
+        assert project_service._make_request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_default_custom_field_listing_uses_snapshot(self, project_service):
+        await project_service.get_project_schema("DEMO")
+
+        result = await project_service.get_project_custom_fields("DEMO")
+
+        assert result["data"][0] == {
+            "id": "92-1",
+            "$type": "EnumProjectCustomField",
+            "field": {"name": "Priority", "fieldType": {"id": "enum[1]", "$type": "FieldType"}},
+        }
+        assert [field["field"]["name"] for field in result["data"]] == ["Priority", "Stage", "Reviewers"]
+        project_service._make_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_attach_invalidates_snapshot(self, project_service):
+        await project_service.get_project_schema("DEMO")
+        project_service._handle_response.return_value = {"status": "success", "data": {"id": "92-4"}}
+
+        await project_service.attach_custom_field("DEMO", "58-4")
+
+        assert get_project_schema_store().get(BASE_URL, "DEMO") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_is_returned(self, project_service):
+        project_service._handle_response.return_value = {"status": "error", "message": "Forbidden"}
+
+        with patch("youtrack_cli.services.projects.ProjectSchema") as schema_cls:
+            result = await project_service.discover_state_field("DEMO")
+
+        assert result == {"status": "error", "message": "Forbidden"}
+        schema_cls.assert_not_called()
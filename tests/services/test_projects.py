@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from youtrack_cli.auth import AuthManager
+from youtrack_cli.services.project_schema import PROJECT_SCHEMA_FIELDS
 from youtrack_cli.services.projects import ProjectService
 
 
@@ -509,10 +510,25 @@ class TestProjectServiceCustomFields:
 
             result = await project_service.get_project_custom_fields("TEST")
 
-            expected_params = {"fields": "id,field(name,fieldType),canBeEmpty,isPublic,ordinal"}
+            expected_params = {"fields": PROJECT_SCHEMA_FIELDS}
             mock_request.assert_called_once_with("GET", "admin/projects/TEST/customFields", params=expected_params)
             mock_handle.assert_called_once_with(mock_response)
-            assert result["status"] == "success"
+            assert result == {"status": "success", "data": []}
+
+    @pytest.mark.asyncio
+    async def test_get_project_custom_fields_with_fields(self, project_service, mock_response):
+        """A custom field selection is requested directly, with the field name added."""
+        with (
+            patch.object(project_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(project_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success", "data": []}
+
+            await project_service.get_project_custom_fields("TEST", fields="id,isPublic")
+
+            expected_params = {"fields": "id,isPublic,field(name)"}
+            mock_request.assert_called_once_with("GET", "admin/projects/TEST/customFields", params=expected_params)
 
     @pytest.mark.asyncio
     async def test_attach_custom_field(self, project_service, mock_response):
@@ -576,7 +592,7 @@ class TestProjectServiceCustomFields:
                 "message": "Error getting project custom fields: Network error",
             }
 
-            result = await project_service.get_project_custom_fields("TEST")
+            result = await project_service.get_project_custom_fields("TEST", fields="id")
 
             mock_error.assert_called_once_with("Error getting project custom fields: Network error")
             assert result["status"] == "error"
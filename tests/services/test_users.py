@@ -6,7 +6,7 @@ import httpx
 import pytest
 
 from youtrack_cli.auth import AuthManager
-from youtrack_cli.services.users import UserService
+from youtrack_cli.services.users import USER_PROFILE_FIELDS, UserService
 
 
 @pytest.fixture
@@ -442,6 +442,23 @@ class TestUserServiceBanUnban:
             mock_handle.assert_called_once_with(mock_response)
             assert result["status"] == "success"
 
+    @pytest.mark.asyncio
+    async def test_ban_user_with_known_ring_id(self, user_service, mock_response):
+        """Test that a known ringId skips the user lookup."""
+        with (
+            patch.object(user_service, "get_user", new_callable=AsyncMock) as mock_get_user,
+            patch.object(user_service, "_make_request", new_callable=AsyncMock) as mock_request,
+            patch.object(user_service, "_handle_response", new_callable=AsyncMock) as mock_handle,
+        ):
+            mock_request.return_value = mock_response
+            mock_handle.return_value = {"status": "success"}
+
+            result = await user_service.ban_user("user-1", ring_id="ring-123")
+
+            mock_get_user.assert_not_called()
+            mock_request.assert_called_once_with("POST", "../hub/api/rest/users/ring-123", json_data={"banned": True})
+            assert result["status"] == "success"
+
     @pytest.mark.asyncio
     async def test_unban_user(self, user_service, mock_response):
         """Test unbanning a user."""
@@ -762,6 +779,55 @@ class TestUserServiceTeams:
             assert result["status"] == "error"
 
 
+class TestUserServiceProfile:
+    """Test composite user profile functionality."""
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_single_request(self, user_service):
+        """Groups, roles and teams come from one nested-fields request."""
+        user = {"id": "user-1", "login": "testuser", "groups": [{"name": "devs"}], "projectTeams": [{"name": "Team"}]}
+        with (
+            patch.object(user_service, "get_user", new_callable=AsyncMock) as mock_get_user,
+            patch.object(user_service, "get_user_permissions", new_callable=AsyncMock) as mock_permissions,
+        ):
+            mock_get_user.return_value = {"status": "success", "data": user}
+
+            result = await user_service.get_user_profile("testuser")
+
+            mock_get_user.assert_called_once_with("testuser", fields=USER_PROFILE_FIELDS)
+            mock_permissions.assert_not_called()
+            assert result["status"] == "success"
+            assert result["data"]["groups"] == [{"name": "devs"}]
+            assert result["data"]["roles"] == []
+            assert result["data"]["teams"] == [{"name": "Team"}]
+            assert "permissions" not in result["data"]
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_with_permissions(self, user_service):
+        """Permissions are fetched alongside the user and attached to the profile."""
+        with (
+            patch.object(user_service, "get_user", new_callable=AsyncMock) as mock_get_user,
+            patch.object(user_service, "get_user_permissions", new_callable=AsyncMock) as mock_permissions,
+        ):
+            mock_get_user.return_value = {"status": "success", "data": {"id": "user-1", "login": "testuser"}}
+            mock_permissions.return_value = {"status": "success", "data": [{"name": "Read Issue"}]}
+
+            result = await user_service.get_user_profile("testuser", include_permissions=True, project_id="PRJ")
+
+            mock_permissions.assert_called_once_with("testuser", "PRJ")
+            assert result["data"]["permissions"] == [{"name": "Read Issue"}]
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_user_error(self, user_service):
+        """A failed user lookup is returned as is."""
+        with patch.object(user_service, "get_user", new_callable=AsyncMock) as mock_get_user:
+            mock_get_user.return_value = {"status": "error", "message": "User not found"}
+
+            result = await user_service.get_user_profile("ghost")
+
+            assert result == {"status": "error", "message": "User not found"}
+
+
 class TestUserServicePasswordAndPermissions:
     """Test password and permission functionality."""
 
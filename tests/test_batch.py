@@ -16,6 +16,7 @@ from youtrack_cli.batch import (
     BatchOperationManager,
     BatchOperationResult,
     BatchValidationError,
+    build_update_commands,
     generate_template_files,
 )
 
@@ -333,6 +334,98 @@ class TestBatchOperationManager:
         assert result.failed == 0
         assert len(result.errors) == 0
 
+    @pytest.mark.asyncio
+    async def test_batch_update_issues_adds_tags(self, batch_manager):
+        """A tags column is applied with add_tag after the field update, and a failing tag fails the row."""
+        items = [
+            BatchIssueUpdate(issue_id="TEST-1", state="Done", tags="release, hotfix"),
+            BatchIssueUpdate(issue_id="TEST-2", tags="missing"),
+        ]
+        batch_manager.issue_manager.update_issue = AsyncMock(return_value={"status": "success"})
+        batch_manager.issue_manager.add_tag = AsyncMock(
+            side_effect=[
+                {"status": "success"},
+                {"status": "success"},
+                {"status": "error", "message": "Tag 'missing' not found"},
+            ]
+        )
+
+        result = await batch_manager.batch_update_issues(items)
+
+        assert [call.args for call in batch_manager.issue_manager.add_tag.call_args_list] == [
+            ("TEST-1", "release"),
+            ("TEST-1", "hotfix"),
+            ("TEST-2", "missing"),
+        ]
+        assert "tags" not in (batch_manager.issue_manager.update_issue.call_args_list[0].kwargs["custom_fields"] or {})
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.errors[0]["error"] == "Tag 'missing' not found"
+
+    def test_build_update_commands(self):
+        """Rows become one command per changed field, with multi-word values braced."""
+        item = BatchIssueUpdate(
+            issue_id="TEST-1", state="In Progress", assignee="jdoe", tags="release, hotfix", **{"Fix versions": "1.2"}
+        )
+
+        assert build_update_commands(item) == [
+            "State {In Progress}",
+            "Assignee jdoe",
+            "{Fix versions} 1.2",
+            "tag release",
+            "tag hotfix",
+        ]
+        assert build_update_commands(BatchIssueUpdate(issue_id="TEST-1", summary="New")) is None
+
+    @pytest.mark.asyncio
+    async def test_batch_update_issues_bulk_groups_identical_changes(self, batch_manager):
+        """Identical changes are applied with one command call across all their issues."""
+        items = [BatchIssueUpdate(issue_id=f"TEST-{i}", state="Fixed") for i in range(1, 251)]
+        items[0] = BatchIssueUpdate(issue_id="TEST-1", state="Fixed", tags="release")
+        items.append(BatchIssueUpdate(issue_id="TEST-999", summary="Needs a field update"))
+
+        async def apply_command(command, issue_ids, **kwargs):
+            errors = {"TEST-7": "Workflow rejected the change"} if command == "State Fixed" else {}
+            return {"status": "partial" if errors else "success", "message": "", "errors": errors}
+
+        batch_manager.issue_manager.apply_command = AsyncMock(side_effect=apply_command)
+        batch_manager.issue_manager.update_issue = AsyncMock(return_value={"status": "success"})
+
+        result = await batch_manager.batch_update_issues_bulk(items)
+
+        commands = [call.args[0] for call in batch_manager.issue_manager.apply_command.call_args_list]
+        assert commands == ["State Fixed", "tag release"]
+        first_call = batch_manager.issue_manager.apply_command.call_args_list[0]
+        assert len(first_call.args[1]) == 250
+        batch_manager.issue_manager.update_issue.assert_called_once()
+        assert result.total_items == 251
+        assert result.successful == 250
+        assert result.failed == 1
+        assert result.errors[0]["item_index"] == 6
+        assert "Workflow rejected" in result.errors[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_batch_update_issues_bulk_counts_every_row_once(self, batch_manager):
+        """Rows without changes fail, and a field update with tags is counted once."""
+        items = [
+            BatchIssueUpdate(issue_id="TEST-1", summary="Renamed", tags="release"),
+            BatchIssueUpdate(issue_id="TEST-2"),
+            BatchIssueUpdate(issue_id="TEST-3", state="Fixed"),
+        ]
+        batch_manager.issue_manager.apply_command = AsyncMock(return_value={"status": "success", "errors": {}})
+        batch_manager.issue_manager.update_issue = AsyncMock(return_value={"status": "success"})
+
+        result = await batch_manager.batch_update_issues_bulk(items)
+
+        commands = [call.args[0] for call in batch_manager.issue_manager.apply_command.call_args_list]
+        assert commands == ["tag release", "State Fixed"]
+        batch_manager.issue_manager.update_issue.assert_called_once()
+        assert result.successful + result.failed == result.total_items == 3
+        assert result.failed == 1
+        assert result.errors == [
+            {"item_index": 1, "item_data": items[1].model_dump(), "error": "No fields to update"},
+        ]
+
     @pytest.mark.asyncio
     async def test_rollback_created_issues(self, batch_manager):
         """Test rollback functionality."""
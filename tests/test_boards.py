@@ -3,9 +3,11 @@
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from rich.table import Table
 
 from youtrack_cli.auth import AuthConfig
 from youtrack_cli.boards import BoardManager
+from youtrack_cli.sprint_cache import SprintSnapshotCache
 
 
 @pytest.fixture
@@ -224,3 +226,152 @@ class TestBoardManager:
 
             assert result["status"] == "error"
             assert "Connection error" in result["message"]
+
+
+SNAPSHOT_BOARD = {
+    "id": "108-2",
+    "name": "Team Board",
+    "currentSprint": {"id": "109-7", "name": "Sprint 7", "start": 1767225600000, "finish": 1768435200000},
+    "sprints": [{"id": "109-6", "name": "Sprint 6", "archived": True}, {"id": "109-7", "name": "Sprint 7"}],
+    "columnSettings": {
+        "field": {"name": "State"},
+        "columns": [
+            {"id": "c1", "presentation": "Open", "fieldValues": [{"name": "Open"}, {"name": "Reopened"}]},
+            {"id": "c2", "presentation": "Done", "fieldValues": [{"name": "Fixed"}]},
+        ],
+    },
+    "swimlaneSettings": {
+        "$type": "AttributeBasedSwimlaneSettings",
+        "enabled": True,
+        "field": {"name": "Priority"},
+        "values": [{"name": "Critical"}, {"name": "Normal"}],
+    },
+}
+
+
+def json_response(data):
+    """Mock a JSON response as returned by the client manager."""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = data
+    response.text = '{"mock": "response"}'
+    response.headers = {"content-type": "application/json"}
+    return response
+
+
+@pytest.fixture
+def snapshot_client():
+    """Client manager answering the board request and one issues query per column."""
+
+    async def make_request(method, url, headers=None, params=None, **kwargs):
+        if url.endswith("/api/agiles/108-2"):
+            return json_response(SNAPSHOT_BOARD)
+        if "Fixed" in params["query"]:
+            return json_response([])
+        return json_response(
+            [
+                {
+                    "idReadable": "DEMO-1",
+                    "summary": "Broken login",
+                    "customFields": [
+                        {"name": "Priority", "value": {"name": "Critical"}},
+                        {"name": "Assignee", "value": {"login": "jdoe", "fullName": "Jane Doe"}},
+                    ],
+                },
+                {"idReadable": "DEMO-2", "summary": "Typo", "customFields": [{"name": "Priority", "value": None}]},
+            ]
+        )
+
+    client_manager = Mock()
+    client_manager.make_request = AsyncMock(side_effect=make_request)
+    with patch("youtrack_cli.boards.get_client_manager", return_value=client_manager):
+        yield client_manager
+
+
+@pytest.fixture
+def sprint_cache_home(tmp_path):
+    """Keep the sprint snapshot cache out of the real home directory."""
+    with patch("youtrack_cli.json_cache.Path.home", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.mark.unit
+class TestBoardSnapshot:
+    """Test board snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_queries_each_column(self, board_manager, snapshot_client, sprint_cache_home):
+        result = await board_manager.get_board_snapshot("108-2")
+
+        assert result["status"] == "success"
+        snapshot = result["snapshot"]
+        assert snapshot["sprint"]["name"] == "Sprint 7"
+        assert snapshot["swimlane_field"] == "Priority"
+        assert [column["name"] for column in snapshot["columns"]] == ["Open", "Done"]
+        open_issues = snapshot["columns"][0]["issues"]
+        assert open_issues[0] == {
+            "id": "DEMO-1",
+            "summary": "Broken login",
+            "fields": {"Priority": "Critical", "Assignee": "Jane Doe"},
+        }
+        assert open_issues[1]["fields"] == {"Priority": None}
+
+        assert snapshot_client.make_request.await_count == 3
+        calls = snapshot_client.make_request.await_args_list
+        params = next(call.kwargs["params"] for call in calls if call.args[1].endswith("/issues"))
+        assert params["query"] == "Board {Team Board}: {Sprint 7} {State}: {Open}, {Reopened}"
+        assert params["customFields"] == ["Assignee", "Priority"]
+        assert params["$top"] == 50
+
+    @pytest.mark.asyncio
+    async def test_archived_sprint_is_cached(self, board_manager, snapshot_client, sprint_cache_home):
+        first = await board_manager.get_board_snapshot("108-2", sprint="Sprint 6")
+        second = await board_manager.get_board_snapshot("108-2", sprint="109-6")
+
+        assert first["snapshot"]["cached"] is False
+        assert second["snapshot"]["cached"] is True
+        assert second["snapshot"]["columns"] == first["snapshot"]["columns"]
+        # The second snapshot only needed the board request
+        assert snapshot_client.make_request.await_count == 4
+        assert SprintSnapshotCache().clear() == 1
+
+    @pytest.mark.asyncio
+    async def test_current_sprint_is_not_cached(self, board_manager, snapshot_client, sprint_cache_home):
+        await board_manager.get_board_snapshot("108-2")
+        await board_manager.get_board_snapshot("108-2")
+
+        assert snapshot_client.make_request.await_count == 6
+        assert not (sprint_cache_home / ".config" / "youtrack-cli" / "sprints").exists()
+
+    @pytest.mark.asyncio
+    async def test_full_column_is_marked_truncated(self, board_manager, snapshot_client, sprint_cache_home):
+        result = await board_manager.get_board_snapshot("108-2", limit=2)
+
+        assert [column["truncated"] for column in result["snapshot"]["columns"]] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_unknown_sprint(self, board_manager, snapshot_client, sprint_cache_home):
+        result = await board_manager.get_board_snapshot("108-2", sprint="Sprint 99")
+
+        assert result["status"] == "error"
+        assert "Sprint 99" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_not_authenticated(self, mock_auth_manager):
+        mock_auth_manager.load_credentials.return_value = None
+
+        result = await BoardManager(mock_auth_manager).get_board_snapshot("108-2")
+
+        assert result == {"status": "error", "message": "Not authenticated"}
+
+    @pytest.mark.asyncio
+    async def test_display_renders_swimlanes(self, board_manager, snapshot_client, sprint_cache_home):
+        result = await board_manager.get_board_snapshot("108-2")
+        board_manager.console = Mock()
+
+        board_manager.display_board_snapshot(result["snapshot"])
+
+        printed = [call.args[0] for call in board_manager.console.print.call_args_list]
+        tables = [item for item in printed if isinstance(item, Table)]
+        assert [table.title for table in tables] == ["Critical", "No Priority"]
+        assert [column.header for column in tables[0].columns] == ["Open (1)", "Done (0)"]
@@ -0,0 +1,129 @@
+"""Tests for endpoint fallback resolution."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from youtrack_cli.endpoint_resolver import EndpointResolver
+
+BASE_URL = "https://yt.example.com"
+
+CANDIDATES = [
+    ("fields", f"{BASE_URL}/api/a?fields=x"),
+    ("plain", f"{BASE_URL}/api/a"),
+    ("legacy", f"{BASE_URL}/rest/a"),
+]
+
+
+def make_attempt(working, delays=None, errors=None):
+    """Build an attempt coroutine that succeeds only for URLs in ``working``."""
+    calls = []
+
+    async def attempt(url):
+        calls.append(url)
+        await asyncio.sleep((delays or {}).get(url, 0))
+        if url in (errors or {}):
+            raise errors[url]
+        return f"result:{url}" if url in working else None
+
+    attempt.calls = calls
+    return attempt
+
+
+@pytest.mark.unit
+class TestEndpointResolver:
+    """Test racing, ordering and remembering of endpoint candidates."""
+
+    @pytest.mark.asyncio
+    async def test_race_prefers_earlier_candidate_that_works(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        # The less preferred candidate answers first but must not win
+        attempt = make_attempt(
+            {CANDIDATES[1][1], CANDIDATES[2][1]}, delays={CANDIDATES[1][1]: 0.05, CANDIDATES[2][1]: 0}
+        )
+
+        pattern, result = await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt)
+
+        assert pattern == "plain"
+        assert result == f"result:{CANDIDATES[1][1]}"
+        assert len(attempt.calls) == 3
+        assert resolver.remembered(BASE_URL, "thing") == "plain"
+
+    @pytest.mark.asyncio
+    async def test_in_order_stops_at_first_working_candidate(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        attempt = make_attempt({CANDIDATES[1][1], CANDIDATES[2][1]})
+
+        pattern, _ = await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt, race=False)
+
+        assert pattern == "plain"
+        assert attempt.calls == [CANDIDATES[0][1], CANDIDATES[1][1]]
+
+    @pytest.mark.asyncio
+    async def test_remembered_pattern_is_tried_alone(self, tmp_path):
+        EndpointResolver(cache_dir=tmp_path).remember(BASE_URL, "thing", "legacy")
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        attempt = make_attempt({CANDIDATES[0][1], CANDIDATES[2][1]})
+
+        pattern, _ = await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt)
+
+        assert pattern == "legacy"
+        assert attempt.calls == [CANDIDATES[2][1]]
+
+    @pytest.mark.asyncio
+    async def test_remembered_pattern_that_stops_working_is_replaced(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        resolver.remember(BASE_URL, "thing", "legacy")
+        attempt = make_attempt({CANDIDATES[1][1]})
+
+        pattern, _ = await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt, race=False)
+
+        assert pattern == "plain"
+        assert attempt.calls == [CANDIDATES[2][1], CANDIDATES[0][1], CANDIDATES[1][1]]
+        assert EndpointResolver(cache_dir=tmp_path).remembered(BASE_URL, "thing") == "plain"
+
+    @pytest.mark.asyncio
+    async def test_no_working_candidate_forgets_pattern(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        resolver.remember(BASE_URL, "thing", "plain")
+
+        assert await resolver.resolve(BASE_URL, "thing", CANDIDATES, make_attempt(set())) is None
+        assert resolver.remembered(BASE_URL, "thing") is None
+
+    @pytest.mark.asyncio
+    async def test_most_preferred_error_is_raised(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        attempt = make_attempt(
+            set(),
+            delays={CANDIDATES[0][1]: 0.05},
+            errors={CANDIDATES[0][1]: PermissionError("first"), CANDIDATES[2][1]: RuntimeError("last")},
+        )
+
+        with pytest.raises(PermissionError, match="first"):
+            await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt)
+
+    @pytest.mark.asyncio
+    async def test_error_behind_winner_is_ignored(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        attempt = make_attempt({CANDIDATES[0][1]}, errors={CANDIDATES[1][1]: RuntimeError("boom")})
+
+        pattern, _ = await resolver.resolve(BASE_URL, "thing", CANDIDATES, attempt)
+
+        assert pattern == "fields"
+
+    def test_unknown_instance_is_kept_in_memory_only(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        base_url = MagicMock()
+
+        resolver.remember(base_url, "thing", "plain")
+
+        assert resolver.remembered(base_url, "thing") == "plain"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unreadable_patterns_are_ignored(self, tmp_path):
+        resolver = EndpointResolver(cache_dir=tmp_path)
+        resolver.remember(BASE_URL, "thing", "plain")
+        next(tmp_path.glob("*.json")).write_text("{not json")
+
+        assert EndpointResolver(cache_dir=tmp_path).remembered(BASE_URL, "thing") is None
@@ -375,3 +375,42 @@ class TestFieldSelection:
         assert "description" not in excluded_fields
         assert "attachments(name,size,url)" not in excluded_fields
         assert len(excluded_fields) < len(full_fields)
+
+
+class TestIssueFieldProjection:
+    """Test output-driven issue field projection."""
+
+    def test_table_projection_only_requests_shown_custom_fields(self):
+        """Table output requests just the custom fields its columns render."""
+        projection = FieldSelector().project_issue_fields("table")
+
+        assert projection is not None
+        assert "idReadable" in projection.fields
+        assert "summary" in projection.fields
+        assert "description" not in projection.fields
+        assert set(projection.custom_fields) == {"State", "Status", "Stage", "Workflow State", "Priority", "Assignee"}
+        assert "Type" not in projection.custom_fields
+
+    def test_csv_projection_includes_type_and_project(self):
+        """CSV renders Type and Project, so both are part of its projection."""
+        projection = FieldSelector().project_issue_fields("csv")
+
+        assert projection is not None
+        assert "Type" in projection.custom_fields
+        assert "project(name,shortName)" in projection.fields
+
+    def test_explicit_columns_narrow_projection(self):
+        """Projecting only ID/Summary skips the customFields expansion entirely."""
+        projection = FieldSelector().project_issue_fields("table", columns=["ID", "Summary"])
+
+        assert projection is not None
+        assert projection.fields == "id,idReadable,summary"
+        assert projection.custom_fields == ()
+
+    def test_raw_formats_are_not_projected(self):
+        """JSON emits the raw issue, so it keeps the caller's field selection."""
+        assert FieldSelector().project_issue_fields("json") is None
+
+    def test_unknown_column_disables_projection(self):
+        """An unknown column can't be projected safely."""
+        assert FieldSelector().project_issue_fields("table", columns=["ID", "Sprint"]) is None
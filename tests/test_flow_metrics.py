@@ -0,0 +1,152 @@
+"""Tests for the columnar flow metrics engine."""
+
+from datetime import date
+
+import pytest
+
+from youtrack_cli.flow_metrics import (
+    MS_PER_DAY,
+    TransitionTable,
+    daily_burn_series,
+    histogram,
+    percentile,
+    summarize_durations,
+)
+
+DAY = MS_PER_DAY
+T0 = 1_735_689_600_000  # 2025-01-01 (Wednesday)
+
+
+def _state_change(timestamp, removed, added, field="State"):
+    return {
+        "timestamp": timestamp,
+        "field": {"name": field},
+        "removed": [{"name": removed}] if removed else [],
+        "added": [{"name": added}] if added else [],
+    }
+
+
+@pytest.fixture
+def table():
+    """Two resolved issues and one open issue with Open -> In Progress -> Review -> Done histories."""
+    table = TransitionTable()
+    table.add_issue("A-1", T0, T0 + 10 * DAY)
+    table.add_issue("A-2", T0, T0 + 4 * DAY)
+    table.add_issue("A-3", T0, None)
+    # Added out of order on purpose; compute() sorts by issue and time
+    table.add_activity("A-1", _state_change(T0 + 8 * DAY, "Review", "Done"))
+    table.add_activity("A-1", _state_change(T0 + 2 * DAY, "Open", "In Progress"))
+    table.add_activity("A-1", _state_change(T0 + 5 * DAY, "In Progress", "Review"))
+    table.add_activity("A-2", _state_change(T0 + 1 * DAY, "Open", "In Progress"))
+    table.add_activity("A-2", _state_change(T0 + 4 * DAY, "In Progress", "Done"))
+    table.add_activity("A-3", _state_change(T0 + 3 * DAY, "Open", "Review"))
+    return table
+
+
+@pytest.mark.unit
+class TestTransitionTable:
+    """Test aggregation over state transitions."""
+
+    def test_lead_and_cycle_time(self, table):
+        """Lead time runs from creation, cycle time from the first state change."""
+        metrics = table.compute()
+
+        assert metrics["issues"] == 3
+        assert metrics["resolved_issues"] == 2
+        assert metrics["transitions"] == 6
+        assert metrics["lead_time"]["count"] == 2
+        assert metrics["lead_time"]["mean_days"] == 7.0
+        assert metrics["cycle_time"]["p50_days"] == 5.5  # A-1: 8 days, A-2: 3 days
+        assert metrics["cycle_time"]["max_days"] == 8.0
+
+    def test_start_states_pick_first_entry(self, table):
+        """Cycle time can start at the first entry into a named state."""
+        metrics = table.compute(start_states=["Review"])
+
+        assert metrics["cycle_time"]["count"] == 1  # A-2 never entered Review
+        assert metrics["cycle_time"]["max_days"] == 5.0
+
+    def test_time_in_state_counts_completed_stays(self, table):
+        """Initial and intermediate stays are measured; the current state is not."""
+        by_state = {row["state"]: row for row in table.compute()["time_in_state"]}
+
+        assert by_state["Open"]["count"] == 3
+        assert by_state["Open"]["total_days"] == 6.0  # 2 + 1 + 3
+        assert by_state["In Progress"]["total_days"] == 6.0  # 3 + 3
+        assert by_state["Review"]["total_days"] == 3.0  # A-3 is still in Review
+        assert "Done" not in by_state
+
+    def test_weekly_trend_groups_by_resolution_week(self, table):
+        """Resolved issues are grouped by the Monday of their resolution week."""
+        weekly = table.compute()["weekly"]
+
+        assert weekly == [
+            {"week": "2024-12-30", "resolved": 1, "lead_time_p50_days": 4.0, "cycle_time_p50_days": 3.0},
+            {"week": "2025-01-06", "resolved": 1, "lead_time_p50_days": 10.0, "cycle_time_p50_days": 8.0},
+        ]
+
+    def test_ignores_other_fields_and_unknown_issues(self):
+        """Only state field changes of registered issues become transitions."""
+        table = TransitionTable()
+        table.add_issue("A-1", T0, None)
+
+        assert not table.add_activity("A-1", _state_change(T0, "Low", "High", field="Priority"))
+        assert table.add_activity("A-1", _state_change(T0, "Open", "Fixed", field="Status"))
+        table.add_activity("B-1", _state_change(T0, "Open", "Fixed"))
+
+        assert len(table) == 1
+
+    def test_empty_table(self):
+        """An empty table yields zeroed metrics."""
+        metrics = TransitionTable().compute()
+
+        assert metrics["lead_time"]["count"] == 0
+        assert metrics["time_in_state"] == []
+        assert metrics["weekly"] == []
+
+
+@pytest.mark.unit
+class TestDistributionHelpers:
+    """Test percentile and histogram helpers."""
+
+    def test_percentile_interpolates(self):
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+        assert percentile([5], 95) == 5
+        assert percentile([], 50) == 0.0
+
+    def test_histogram_buckets(self):
+        counts = {row["bucket"]: row["count"] for row in histogram([0, DAY // 2, 2 * DAY, 100 * DAY])}
+
+        assert counts["<1d"] == 2
+        assert counts["2-3d"] == 1
+        assert counts["≥89d"] == 1
+        assert sum(counts.values()) == 4
+
+    def test_summarize_durations(self):
+        summary = summarize_durations([DAY, 3 * DAY])
+
+        assert summary["count"] == 2
+        assert summary["mean_days"] == 2.0
+        assert summary["max_days"] == 3.0
+
+
+@pytest.mark.unit
+class TestDailyBurnSeries:
+    """Test the daily burnup/burndown series."""
+
+    def test_running_totals(self):
+        """Issues created or resolved before the window count from the first day."""
+        created = [T0 - 5 * DAY, T0, T0 + DAY + 1, T0 + 9 * DAY]
+        resolved = [T0 - DAY, 0, T0 + 2 * DAY, 0]
+
+        series = daily_burn_series(created, resolved, date(2025, 1, 1), date(2025, 1, 3))
+
+        assert [(row["date"], row["scope"], row["completed"], row["remaining"]) for row in series] == [
+            ("2025-01-01", 2, 1, 1),
+            ("2025-01-02", 3, 1, 2),
+            ("2025-01-03", 3, 2, 1),
+        ]
+        assert [row["ideal"] for row in series] == [1.0, 0.5, 0.0]
+
+    def test_empty_window(self):
+        assert daily_burn_series([T0], [0], date(2025, 1, 3), date(2025, 1, 1)) == []
@@ -0,0 +1,167 @@
+"""Tests for the issue link graph crawler."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from rich.tree import Tree
+
+from youtrack_cli.issue_graph import IssueGraphCrawler, IssueGraphEdge, find_cycles
+from youtrack_cli.trees import create_issue_graph_tree
+
+
+def _issue(issue_id, links=()):
+    return {
+        "idReadable": issue_id,
+        "summary": f"Summary of {issue_id}",
+        "customFields": [{"name": "State", "value": {"name": "Open"}}],
+        "links": [
+            {
+                "direction": direction,
+                "linkType": {"name": link_type},
+                "issues": [{"idReadable": target, "summary": f"Summary of {target}"} for target in targets],
+            }
+            for direction, link_type, targets in links
+        ],
+    }
+
+
+# A depends on B and C, B depends on D, D depends on A (cycle), C relates to E.
+ISSUES = {
+    "A-1": _issue("A-1", [("OUTWARD", "Depend", ["A-2", "A-3"]), ("INWARD", "Depend", ["A-4"])]),
+    "A-2": _issue("A-2", [("INWARD", "Depend", ["A-1"]), ("OUTWARD", "Depend", ["A-4"])]),
+    "A-3": _issue("A-3", [("INWARD", "Depend", ["A-1"]), ("BOTH", "Relates", ["A-5"])]),
+    "A-4": _issue("A-4", [("INWARD", "Depend", ["A-2"]), ("OUTWARD", "Depend", ["A-1"])]),
+    "A-5": _issue("A-5", [("BOTH", "Relates", ["A-3"])]),
+}
+
+
+def _manager():
+    manager = MagicMock()
+
+    async def get_issues_with_links(issue_ids, **kwargs):
+        # Internal IDs ``2-<n>`` stand for ``A-<n>``
+        by_id = {**ISSUES, **{f"2-{key[2:]}": {**issue, "id": f"2-{key[2:]}"} for key, issue in ISSUES.items()}}
+        found = [by_id[issue_id] for issue_id in issue_ids if issue_id in by_id]
+        missing = [issue_id for issue_id in issue_ids if issue_id not in by_id]
+        return {
+            "status": "success" if found else "error",
+            "data": found,
+            "missing": missing,
+            "message": "No issues found",
+            "requests": 1,
+        }
+
+    manager.get_issues_with_links = AsyncMock(side_effect=get_issues_with_links)
+    return manager
+
+
+@pytest.mark.unit
+class TestIssueGraphCrawler:
+    """Test breadth-first crawling of issue links."""
+
+    @pytest.mark.asyncio
+    async def test_crawl_fetches_one_batch_per_level(self):
+        """Each depth level is fetched once, with every frontier issue in one call."""
+        manager = _manager()
+        graph = await IssueGraphCrawler(manager, max_depth=2).crawl(["a-1"])
+
+        assert set(graph.nodes) == {"A-1", "A-2", "A-3", "A-4", "A-5"}
+        assert manager.get_issues_with_links.await_count == 2
+        first, second = manager.get_issues_with_links.await_args_list
+        assert first.args[0] == ["A-1"]
+        assert sorted(second.args[0]) == ["A-2", "A-3", "A-4"]
+        assert graph.nodes["A-5"].depth == 2
+        assert graph.nodes["A-5"].expanded is False
+
+    @pytest.mark.asyncio
+    async def test_crawl_memoizes_and_dedupes_edges(self):
+        """Links seen from both ends produce a single edge."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=3).crawl(["A-1"])
+
+        keys = [(edge.source, edge.target, edge.link_type) for edge in graph.edges]
+        assert len(keys) == len(set(keys))
+        assert ("A-1", "A-2", "Depend") in keys
+        assert ("A-4", "A-1", "Depend") in keys
+        relates = [edge for edge in graph.edges if edge.link_type == "Relates"]
+        assert len(relates) == 1
+        assert relates[0].directed is False
+
+    @pytest.mark.asyncio
+    async def test_crawl_detects_cycles(self):
+        """A dependency loop is reported as a closed path."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=3).crawl(["A-1"])
+
+        assert len(graph.cycles) == 1
+        cycle = graph.cycles[0]
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {"A-1", "A-2", "A-4"}
+
+    @pytest.mark.asyncio
+    async def test_crawl_link_type_filter(self):
+        """Only links of the requested types are followed."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=3, link_types=["relates"]).crawl(["A-3"])
+
+        assert set(graph.nodes) == {"A-3", "A-5"}
+
+    @pytest.mark.asyncio
+    async def test_crawl_depth_zero_and_max_issues(self):
+        """Depth zero fetches only the roots; max_issues stops expansion."""
+        manager = _manager()
+        graph = await IssueGraphCrawler(manager, max_depth=0).crawl(["A-1"])
+        assert set(graph.nodes) == {"A-1"}
+        assert graph.edges == []
+
+        graph = await IssueGraphCrawler(_manager(), max_depth=3, max_issues=2).crawl(["A-1"])
+        assert len(graph.nodes) == 2
+        assert graph.truncated is True
+        assert all(edge.source in graph.nodes and edge.target in graph.nodes for edge in graph.edges)
+
+    @pytest.mark.asyncio
+    async def test_crawl_internal_root_id(self):
+        """A root given by internal ID is expanded under its readable ID."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=1).crawl(["2-1"])
+
+        assert graph.roots == ["A-1"]
+        assert set(graph.nodes) == {"A-1", "A-2", "A-3", "A-4"}
+        assert graph.nodes["A-1"].expanded is True
+
+    @pytest.mark.asyncio
+    async def test_crawl_counts_requests(self):
+        """The request count adds up the calls each level made."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=2).crawl(["A-1"])
+
+        assert graph.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_missing_root_raises(self):
+        """A root that cannot be fetched is an error."""
+        with pytest.raises(ValueError):
+            await IssueGraphCrawler(_manager()).crawl(["Z-9"])
+
+    @pytest.mark.asyncio
+    async def test_outputs(self):
+        """The graph renders as JSON, DOT and a Rich tree."""
+        graph = await IssueGraphCrawler(_manager(), max_depth=3).crawl(["A-1"])
+
+        data = json.loads(graph.to_json())
+        assert data["roots"] == ["A-1"]
+        assert len(data["nodes"]) == 5
+
+        dot = graph.to_dot()
+        assert dot.startswith("digraph issues {")
+        assert '"A-1" -> "A-2"' in dot
+        assert "color=red" in dot
+        assert "dir=none" in dot
+
+        assert isinstance(create_issue_graph_tree(graph), Tree)
+
+
+@pytest.mark.unit
+def test_find_cycles_ignores_undirected_edges():
+    """Undirected links never form cycles on their own."""
+    edges = [
+        IssueGraphEdge("X-1", "X-2", "Relates", directed=False),
+        IssueGraphEdge("X-2", "X-3", "Depend"),
+    ]
+    assert find_cycles(["X-1", "X-2", "X-3"], edges) == []
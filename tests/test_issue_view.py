@@ -0,0 +1,76 @@
+"""Tests for the indexed issue view."""
+
+from unittest.mock import patch
+
+import pytest
+
+from youtrack_cli.custom_field_manager import CustomFieldManager
+from youtrack_cli.issue_view import IssueView
+from youtrack_cli.performance_benchmark import make_synthetic_issues
+
+
+@pytest.mark.unit
+class TestIssueView:
+    """Test IssueView lookups."""
+
+    def test_field_matches_extract_field_value(self):
+        """Display values match CustomFieldManager for every field shape."""
+        issue = {
+            "customFields": [
+                {"name": "Priority", "value": {"name": "High"}},
+                {"name": "Assignee", "value": {"login": "jdoe", "fullName": "John Doe"}},
+                {"name": "Estimation", "value": {"minutes": 90, "presentation": "1h 30m"}},
+                {"name": "Fix versions", "value": [{"name": "1.0"}, {"name": "1.1"}]},
+                {"name": "Points", "value": 3},
+                {"name": "Empty", "value": None},
+                {"name": "Priority", "value": {"name": "Duplicate is ignored"}},
+            ]
+        }
+        view = IssueView(issue)
+
+        for name in ("Priority", "Assignee", "Estimation", "Fix versions", "Points", "Empty", "Missing"):
+            expected = CustomFieldManager.extract_field_value(issue["customFields"], name)
+            assert view.field(name) == (str(expected) if expected is not None else None)
+
+    def test_custom_fields_scanned_once(self):
+        """Repeated lookups reuse the index and the extracted values."""
+        issue = make_synthetic_issues(1)[0]
+        view = IssueView(issue)
+
+        extract = CustomFieldManager._extract_dict_value
+        with patch.object(CustomFieldManager, "_extract_dict_value", wraps=extract) as spy:
+            for _ in range(3):
+                assert view.state == "Open"
+                assert view.field("Priority") == "Critical"
+
+        assert spy.call_count == 2
+
+    def test_state_tries_common_names_in_order(self):
+        """State prefers State, then Status, Stage and Workflow State."""
+        issue = {
+            "customFields": [
+                {"name": "Workflow State", "value": {"name": "Review"}},
+                {"name": "Status", "value": {"name": "Open"}},
+                {"name": "State", "value": None},
+            ]
+        }
+        assert IssueView(issue).state == "Open"
+        assert IssueView({"customFields": []}).state == ""
+
+    def test_reads_through_to_issue(self):
+        """Top-level keys are readable through the view."""
+        issue = {"id": "2-1", "summary": "Hello", "project": {"shortName": "DEMO"}}
+        view = IssueView(issue)
+
+        assert view.get("summary") == "Hello"
+        assert view["project"]["shortName"] == "DEMO"
+        assert "id" in view
+        assert view.id == "2-1"
+        assert view.project_name == "DEMO"
+        assert IssueView.of(view) is view
+
+    def test_malformed_custom_fields_are_skipped(self):
+        """Entries that are not named dicts do not break the index."""
+        issue = {"customFields": ["junk", {"value": "no name"}, {"name": "Type", "value": {"name": "Bug"}}]}
+        assert IssueView(issue).field("Type") == "Bug"
+        assert not hasattr(IssueView(issue), "__dict__")
@@ -0,0 +1,184 @@
+"""Tests for the issue query watcher."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from youtrack_cli.issue_watch import IssueChangeEvent, IssueWatcher
+
+
+class FakeIssueService:
+    """In-memory search backend: issues with ``bug`` set match the watched query.
+
+    A query holding only a sort clause returns every issue.
+    """
+
+    def __init__(self):
+        self.issues = {}
+        self.calls = []
+
+    def put(self, issue_id, updated, bug=True):
+        self.issues[issue_id] = {"idReadable": issue_id, "updated": updated, "bug": bug}
+
+    async def search_issues(self, query, fields=None, top=None, skip=None):
+        self.calls.append(query)
+        if query.startswith("sort by"):
+            issues = list(self.issues.values())
+        else:
+            issues = [issue for issue in self.issues.values() if issue["bug"]]
+        if "sort by: updated desc" in query:
+            issues.sort(key=lambda issue: issue["updated"], reverse=True)
+        skip = skip or 0
+        return {"status": "success", "data": [dict(issue) for issue in issues[skip : skip + top]]}
+
+
+@pytest.fixture
+def service():
+    service = FakeIssueService()
+    service.put("A-1", 100)
+    service.put("A-2", 200)
+    service.put("A-3", 150, bug=False)
+    return service
+
+
+def _events(events):
+    return [(event.event, event.id) for event in events]
+
+
+@pytest.mark.unit
+class TestIssueWatcher:
+    """Test delta polling of a watched query."""
+
+    @pytest.mark.asyncio
+    async def test_start_records_watermark_without_events(self, service):
+        """The initial fetch sets the watermark and reports nothing by default."""
+        watcher = IssueWatcher(service, "type: Bug")
+
+        assert await watcher.start() == []
+        assert watcher.known == {"A-1": 100, "A-2": 200}
+        assert watcher.watermark == 200
+
+    @pytest.mark.asyncio
+    async def test_start_can_emit_existing(self, service):
+        """emit_existing reports every matching issue as new."""
+        watcher = IssueWatcher(service, "type: Bug")
+
+        assert _events(await watcher.start(emit_existing=True)) == [("new", "A-1"), ("new", "A-2")]
+
+    @pytest.mark.asyncio
+    async def test_poll_reports_new_updated_and_left(self, service):
+        """Changes since the watermark become new, updated and left-query events."""
+        watcher = IssueWatcher(service, "type: Bug")
+        await watcher.start()
+
+        service.put("A-1", 300)
+        service.put("A-4", 310)
+        service.put("A-2", 320, bug=False)
+        events = await watcher.poll()
+
+        assert _events(events) == [("updated", "A-1"), ("new", "A-4"), ("left-query", "A-2")]
+        assert watcher.known == {"A-1": 300, "A-4": 310}
+        assert watcher.watermark == 310
+        assert await watcher.poll() == []
+
+    @pytest.mark.asyncio
+    async def test_poll_stops_paging_at_watermark(self, service):
+        """Only pages holding issues newer than the watermark are requested."""
+        for number in range(10, 60):
+            service.put(f"A-{number}", number)
+        watcher = IssueWatcher(service, "type: Bug", page_size=5)
+        await watcher.start()
+        service.calls.clear()
+
+        service.put("A-10", 500)
+        events = await watcher.poll()
+
+        assert _events(events) == [("updated", "A-10")]
+        # One page of the query and one page of recently updated issues
+        assert len(service.calls) == 2
+        assert all(call.endswith("sort by: updated desc") for call in service.calls)
+
+    @pytest.mark.asyncio
+    async def test_unrelated_changes_do_not_leave(self, service):
+        """Issues outside the query that change are ignored."""
+        watcher = IssueWatcher(service, "type: Bug")
+        await watcher.start()
+
+        service.put("A-3", 400, bug=False)
+
+        assert await watcher.poll() == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("known_count", [10, 500])
+    async def test_left_query_check_cost_does_not_grow_with_known_issues(self, service, known_count):
+        """Finding issues that left takes the same requests however many issues match."""
+        for number in range(10, 10 + known_count):
+            service.put(f"A-{number}", number)
+        watcher = IssueWatcher(service, "type: Bug")
+        await watcher.start()
+        service.calls.clear()
+
+        service.put("A-3", 1400, bug=False)
+        service.put("A-15", 1410, bug=False)
+        events = await watcher.poll()
+
+        assert _events(events) == [("left-query", "A-15")]
+        assert service.calls == ["sort by: updated desc", "type: Bug sort by: updated desc"]
+
+    def test_interval_backs_off_when_idle(self, service):
+        """Idle polls grow the interval up to the maximum; a change resets it."""
+        watcher = IssueWatcher(service, "type: Bug", interval=10, max_interval=35, backoff=2)
+
+        assert [watcher.adjust_interval(False) for _ in range(3)] == [20, 35, 35]
+        assert watcher.adjust_interval(True) == 10
+
+    @pytest.mark.asyncio
+    async def test_watch_survives_failed_poll(self, service):
+        """A failing poll is treated as idle instead of ending the watch."""
+        watcher = IssueWatcher(service, "type: Bug", interval=1, max_interval=8)
+        polls = [RuntimeError("connection reset"), [IssueChangeEvent("new", "A-9", 1, {})]]
+
+        async def poll():
+            result = polls.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with (
+            patch.object(watcher, "poll", side_effect=poll),
+            patch("youtrack_cli.issue_watch.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            events = [event async for event in watcher.watch(max_polls=2)]
+
+        assert _events(events) == [("new", "A-9")]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+        assert watcher.interval == 1
+
+    def test_fields_always_include_keys(self, service):
+        """idReadable and updated are added to custom field selections."""
+        assert IssueWatcher(service, "x", fields="id,summary").fields == "id,summary,idReadable,updated"
+
+
+@pytest.mark.unit
+def test_issues_watch_command_emits_ndjson(service):
+    """The watch command prints one JSON object per event."""
+    from youtrack_cli.main import main
+
+    with patch("youtrack_cli.managers.issues.IssueService", return_value=service):
+        result = CliRunner().invoke(main, ["issues", "watch", "-q", "type: Bug", "--emit-existing", "--max-polls", "0"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    assert [(line["event"], line["id"]) for line in lines] == [("new", "A-1"), ("new", "A-2")]
+
+
+@pytest.mark.unit
+def test_issues_watch_requires_query_or_project():
+    """Watching without a query or project is a usage error."""
+    from youtrack_cli.main import main
+
+    result = CliRunner().invoke(main, ["issues", "watch"])
+
+    assert result.exit_code == 2
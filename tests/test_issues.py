@@ -1414,6 +1414,46 @@ class TestIssuesCLI:
         # The actual data is written to stdout.
         assert "PROJ-123" in result.stdout
 
+    def test_issues_list_csv_streams_to_output_file(self, tmp_path):
+        """`issues list --format csv --all --output` writes rows as they are streamed."""
+        import csv
+
+        from youtrack_cli.main import main
+
+        async def fake_stream(self, **kwargs):
+            for i in range(3):
+                yield {"idReadable": f"PROJ-{i}", "summary": f"[bug] issue {i}"}
+
+        output = tmp_path / "issues.csv"
+        runner = CliRunner()
+        with patch("youtrack_cli.managers.issues.IssueManager.stream_list_issues", fake_stream):
+            result = runner.invoke(
+                main, ["issues", "list", "-p", "PROJ", "--all", "--format", "csv", "--output", str(output)]
+            )
+
+        assert result.exit_code == 0, result.output
+        rows = list(csv.reader(output.open(newline="")))
+        assert rows[0][:2] == ["ID", "Summary"]
+        assert [row[1] for row in rows[1:]] == ["[bug] issue 0", "[bug] issue 1", "[bug] issue 2"]
+
+    def test_issues_list_cursor_page_honours_output_file(self, tmp_path):
+        """`issues list --after-cursor --output` writes the buffered page to the file."""
+        import json as json_mod
+
+        from youtrack_cli.main import main
+
+        output = tmp_path / "page.json"
+        runner = CliRunner()
+        with patch("youtrack_cli.managers.issues.IssueManager.list_issues", new_callable=AsyncMock) as mock_list:
+            mock_list.return_value = {"status": "success", "data": [{"idReadable": "PROJ-1"}], "count": 1}
+            result = runner.invoke(
+                main, ["issues", "list", "--after-cursor", "abc", "--format", "json", "--output", str(output)]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert json_mod.loads(output.read_text()) == [{"idReadable": "PROJ-1"}]
+        assert "PROJ-1" not in result.stdout
+
     def test_issues_list_json_output_is_valid_json(self):
         """`issues list --format json` must preserve [bracket] content verbatim (issue #756).
 
@@ -1542,6 +1582,23 @@ class TestIssuesCLI:
             assert result.exit_code == 0
             assert "searching issues" in result.output.lower()
 
+    def test_issues_count_command(self):
+        """Test the issues count CLI command prints the bare count."""
+        from youtrack_cli.main import main
+
+        runner = CliRunner()
+
+        with patch("youtrack_cli.managers.issues.IssueManager.count_issues", new_callable=AsyncMock) as mock_count:
+            mock_count.return_value = {"status": "success", "data": {"count": 17, "query": "project: PROJ #Unresolved"}}
+
+            result = runner.invoke(main, ["issues", "count", "-p", "PROJ", "-s", "open"])
+            json_result = runner.invoke(main, ["issues", "count", "-p", "PROJ", "-s", "open", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert result.output == "17\n"
+        assert json.loads(json_result.output) == {"count": 17, "query": "project: PROJ #Unresolved"}
+        mock_count.assert_awaited_with(project_id="PROJ", query=None, state="open", assignee=None)
+
     def test_issues_assign_command(self):
         """Test the issues assign CLI command."""
         from youtrack_cli.main import main
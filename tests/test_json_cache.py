@@ -0,0 +1,59 @@
+"""Tests for the shared JSON file cache helpers."""
+
+import stat
+
+import pytest
+
+from youtrack_cli.json_cache import JsonFileCache, cache_key, read_json, write_json
+
+
+class ExampleCache(JsonFileCache):
+    directory = "example"
+    description = "example cache entry"
+
+
+@pytest.mark.unit
+class TestJsonCache:
+    """Test reading, writing and clearing cached JSON files."""
+
+    def test_write_then_read(self, tmp_path):
+        path = tmp_path / "nested" / "entry.json"
+
+        write_json(path, {"a": 1}, "entry")
+
+        assert read_json(path, "entry") == {"a": 1}
+        assert not path.with_suffix(".tmp").exists()
+
+    def test_missing_and_unreadable_files_are_none(self, tmp_path):
+        path = tmp_path / "entry.json"
+        assert read_json(path, "entry") is None
+
+        path.write_text("{not json")
+        assert read_json(path, "entry") is None
+
+    def test_parse_errors_are_treated_as_missing(self, tmp_path):
+        path = tmp_path / "entry.json"
+        write_json(path, {"a": 1}, "entry")
+
+        assert read_json(path, "entry", lambda data: data["missing"]) is None
+
+    def test_private_files_are_owner_only(self, tmp_path):
+        path = tmp_path / "entry.json"
+
+        write_json(path, {}, "entry", private=True)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_cache_key_is_stable(self):
+        assert cache_key("a", "b") == cache_key("a", "b")
+        assert cache_key("a", "b") != cache_key("a\nb", "")
+        assert len(cache_key("a")) == 16
+
+    def test_file_cache_clear(self, tmp_path):
+        cache = ExampleCache(tmp_path)
+        cache._write(cache._path(cache.scope("one")), {})
+        cache._write(cache._path(cache.scope("two")), {})
+
+        assert cache.clear() == 2
+        assert cache.clear() == 0
+        assert list(tmp_path.iterdir()) == []
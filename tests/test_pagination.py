@@ -1,13 +1,23 @@
 """Tests for pagination functionality."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from rich.console import Console
 from rich.table import Table
 
-from youtrack_cli.pagination import PaginatedTableDisplay, create_paginated_display
-from youtrack_cli.utils import PaginationConfig, PaginationType, paginate_results
+from youtrack_cli.exceptions import YouTrackError
+from youtrack_cli.pagination import LazyPageSource, PaginatedTableDisplay, create_paginated_display
+from youtrack_cli.utils import (
+    PaginationConfig,
+    PaginationType,
+    fetch_offset_pages,
+    iter_offset_pages,
+    paginate_projects,
+    paginate_results,
+)
 
 
 @pytest.mark.unit
@@ -242,6 +252,133 @@ class TestPaginatedTableDisplay:
         assert action == "quit"
 
 
+def _fake_fetcher(total, calls):
+    async def fetch(offset, limit):
+        calls.append((offset, limit))
+        items = [{"id": i} for i in range(offset, min(offset + limit, total))]
+        return items, offset + limit < total
+
+    return fetch
+
+
+@pytest.mark.unit
+class TestLazyPageSource:
+    """Test the server-backed page source."""
+
+    def test_fetches_on_demand_and_prefetches_next(self):
+        """Serving a page fetches only that page and requests the next in the background."""
+        calls = []
+        with LazyPageSource(_fake_fetcher(1000, calls), page_size=10) as source:
+            assert source.get_page(1) == [{"id": i} for i in range(10)]
+            assert source.total_items is None
+            assert source.get_page(2)[0] == {"id": 10}
+            assert source.fetch_count == 3
+
+        assert calls[:2] == [(0, 10), (10, 10)]
+
+    def test_visited_pages_are_cached_in_lru(self):
+        """Going back to a recent page does not refetch it; old pages are evicted."""
+        calls = []
+        with LazyPageSource(_fake_fetcher(1000, calls), page_size=10, cache_pages=2, prefetch=False) as source:
+            source.get_page(1)
+            source.get_page(2)
+            source.get_page(1)
+            assert calls == [(0, 10), (10, 10)]
+            source.get_page(3)
+            source.get_page(1)
+            assert calls == [(0, 10), (10, 10), (20, 10)]
+            source.get_page(2)
+            assert calls[-1] == (10, 10)
+
+    def test_short_page_marks_the_end(self):
+        """A short page fixes the total and stops further fetches."""
+        calls = []
+        with LazyPageSource(_fake_fetcher(25, calls), page_size=10) as source:
+            source.get_page(3)
+            assert source.total_items == 25
+            assert source.total_pages == 3
+            assert source.has_page(4) is False
+            assert source.get_page(4) == []
+
+    def test_max_items_caps_fetches(self):
+        """The last page is trimmed to max_items."""
+        calls = []
+        with LazyPageSource(_fake_fetcher(1000, calls), page_size=10, max_items=15, prefetch=False) as source:
+            assert len(source.get_page(2)) == 5
+            assert calls == [(10, 5)]
+            assert source.has_page(3) is False
+
+    def test_fetch_errors_propagate(self):
+        """A failed fetch surfaces to the caller and can be retried."""
+        attempts = []
+
+        async def fetch(offset, limit):
+            attempts.append(offset)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return [{"id": offset}], False
+
+        with LazyPageSource(fetch, page_size=10) as source:
+            with pytest.raises(RuntimeError):
+                source.get_page(1)
+            assert source.get_page(1) == [{"id": 0}]
+
+    def test_close_cancels_prefetch_and_closes_loop_client(self):
+        """Closing stops an unfinished prefetch and closes the client bound to the loop."""
+        cancelled = []
+        started = threading.Event()
+
+        async def fetch(offset, limit):
+            if offset == 0:
+                return [{"id": i} for i in range(limit)], True
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(offset)
+                raise
+            return [], False
+
+        manager = Mock()
+        manager.close_loop_client = AsyncMock()
+        with patch("youtrack_cli.pagination.get_client_manager", return_value=manager):
+            source = LazyPageSource(fetch, page_size=10)
+            source.get_page(1)
+            assert started.wait(timeout=5)
+            source.close()
+
+        assert cancelled == [10]
+        manager.close_loop_client.assert_awaited_once()
+
+    @patch("builtins.input")
+    def test_display_page_source_renders_only_visible_pages(self, mock_input):
+        """Navigating a lazy source builds tables for the shown pages only."""
+        mock_input.side_effect = ["n", "q"]
+        console = Mock(spec=Console)
+        table_builder = Mock(return_value=Mock(spec=Table))
+        calls = []
+
+        with LazyPageSource(_fake_fetcher(10_000, calls), page_size=5) as source:
+            PaginatedTableDisplay(console).display_page_source(source, table_builder, "Test")
+
+        assert [call[0][0][0]["id"] for call in table_builder.call_args_list] == [0, 5]
+        assert len(calls) <= 3
+        info = [str(call[0][0]) for call in console.print.call_args_list if "showing items" in str(call[0][0])]
+        assert "more available" in info[0]
+
+    @patch("builtins.input")
+    def test_display_page_source_jump_past_end(self, mock_input):
+        """Jumping beyond the data returns to the last page that existed."""
+        mock_input.side_effect = ["50", "q"]
+        console = Mock(spec=Console)
+        table_builder = Mock(return_value=Mock(spec=Table))
+
+        with LazyPageSource(_fake_fetcher(12, []), page_size=5, prefetch=False) as source:
+            PaginatedTableDisplay(console).display_page_source(source, table_builder, "Test")
+
+        assert [call[0][0][0]["id"] for call in table_builder.call_args_list] == [0, 0]
+
+
 @pytest.mark.unit
 class TestCreatePaginatedDisplay:
     """Test the factory function."""
@@ -482,3 +619,95 @@ class TestPaginateResults:
                 before_cursor="cursor2",
                 use_cursor_pagination=True,
             )
+
+
+@pytest.mark.asyncio
+class TestOffsetPrefetch:
+    """Test speculative prefetching of offset pages."""
+
+    async def test_pages_after_first_are_fetched_concurrently(self):
+        """Following pages are requested together once the first page is full."""
+        items = list(range(7))
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(skip, top):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return items[skip : skip + top]
+
+        results = await fetch_offset_pages(fetch_page, page_size=2, prefetch_pages=3)
+
+        assert results == items
+        assert peak == 3
+
+    async def test_short_first_page_skips_prefetch(self):
+        """A listing that fits one page costs one request."""
+        fetch_page = AsyncMock(return_value=[1])
+
+        assert await fetch_offset_pages(fetch_page, page_size=2, prefetch_pages=4) == [1]
+        fetch_page.assert_awaited_once_with(0, 2)
+
+    async def test_prefetch_respects_max_results(self):
+        """No page starts beyond max_results and the last one is trimmed."""
+        fetch_page = AsyncMock(side_effect=lambda skip, top: list(range(skip, skip + top)))
+
+        results = await fetch_offset_pages(fetch_page, page_size=4, max_results=10, prefetch_pages=8)
+
+        assert results == list(range(10))
+        assert [c.args for c in fetch_page.await_args_list] == [(0, 4), (4, 4), (8, 2)]
+
+    async def test_error_cancels_speculative_pages(self):
+        """A failing page propagates and leaves no requests running."""
+        started = []
+
+        async def fetch_page(skip, top):
+            started.append(skip)
+            if skip == 2:
+                raise YouTrackError("boom")
+            if skip > 2:
+                await asyncio.sleep(10)
+            return [skip, skip + 1]
+
+        with pytest.raises(YouTrackError, match="boom"):
+            await fetch_offset_pages(fetch_page, page_size=2, prefetch_pages=3)
+
+        assert started == [0, 2, 4, 6]
+
+    async def test_stopping_early_cancels_speculative_pages(self):
+        """A consumer that stops reading cancels the pages still in flight."""
+        cancelled = []
+
+        async def fetch_page(skip, top):
+            if skip >= 4:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(skip)
+                    raise
+            return [skip, skip + 1]
+
+        pages = iter_offset_pages(fetch_page, page_size=2, prefetch_pages=3)
+        assert [await anext(pages), await anext(pages)] == [[0, 1], [2, 3]]
+        await pages.aclose()
+
+        assert sorted(cancelled) == [4, 6]
+
+    async def test_paginate_projects_prefetches(self):
+        """The project wrapper reads offset pages ahead and keeps them in order."""
+        projects = [{"id": i} for i in range(7)]
+
+        async def fake_request(**kwargs):
+            skip, top = int(kwargs["params"]["$skip"]), int(kwargs["params"]["$top"])
+            return Mock(json=Mock(return_value=projects[skip : skip + top]))
+
+        with patch("youtrack_cli.utils.make_request", side_effect=fake_request) as mock_request:
+            result = await paginate_projects("/api/admin/projects", page_size=2)
+
+        assert result["results"] == projects
+        assert result["has_before"] is True
+        skips = [int(c.kwargs["params"]["$skip"]) for c in mock_request.call_args_list]
+        assert skips[: 1 + PaginationConfig.DEFAULT_PREFETCH_PAGES] == [0, 2, 4, 6, 8]
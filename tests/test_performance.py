@@ -14,7 +14,12 @@ from youtrack_cli.performance import (
     get_performance_monitor,
     performance_timer,
 )
-from youtrack_cli.performance_benchmark import FieldSelectionBenchmark, run_benchmark
+from youtrack_cli.performance_benchmark import (
+    FieldSelectionBenchmark,
+    benchmark_issue_formatting,
+    benchmark_table_rendering,
+    run_benchmark,
+)
 
 
 @pytest.mark.unit
@@ -604,3 +609,25 @@ class TestRunBenchmark:
             mock_benchmark_cls.assert_called_once_with(mock_auth_manager)
             mock_benchmark.benchmark_profile_performance.assert_called_once_with(project_id="TEST", sample_size=25)
             mock_benchmark.print_benchmark_report.assert_called_once()
+
+
+@pytest.mark.unit
+def test_benchmark_issue_formatting():
+    """The formatting micro-benchmark times both variants over identical output."""
+    results = benchmark_issue_formatting(issue_count=200, iterations=1)
+
+    assert results["issues"] == 200
+    assert results["scan_seconds"] > 0
+    assert results["view_seconds"] > 0
+    assert results["speedup"] > 0
+
+
+@pytest.mark.unit
+def test_benchmark_table_rendering():
+    """The rendering micro-benchmark times Rich and plain output of the same table."""
+    results = benchmark_table_rendering(row_count=100)
+
+    assert results["rows"] == 100
+    assert results["rich_seconds"] > 0
+    assert results["plain_seconds"] > 0
+    assert results["speedup"] > 0
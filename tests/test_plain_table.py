@@ -0,0 +1,101 @@
+"""Tests for the plain table renderer."""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from youtrack_cli.plain_table import PLAIN_TABLE_ROW_THRESHOLD, print_table, write_plain_table
+
+
+def _table(rows):
+    table = Table(title="Things")
+    table.add_column("ID")
+    table.add_column("Status")
+    table.add_column("Summary")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+@pytest.mark.unit
+class TestWritePlainTable:
+    """Test write_plain_table."""
+
+    def test_columns_are_aligned(self):
+        """Every column starts at the same offset on every line."""
+        stream = io.StringIO()
+        count = write_plain_table(stream, ["ID", "Name", "Note"], [["A-1", "x", "first"], ["A-10", "longer", "y"]])
+
+        lines = stream.getvalue().splitlines()
+        assert count == 2
+        assert lines[0] == "ID    Name    Note"
+        assert lines[1] == "----  ------  -----"
+        assert lines[2] == "A-1   x       first"
+        assert lines[3] == "A-10  longer  y"
+
+    def test_widths_come_from_sample_and_are_capped(self):
+        """Rows past the sample are cut to the sampled width; the last column is never cut."""
+        stream = io.StringIO()
+        rows = [["abcdefgh", "tail"], ["b", "tail"], ["much-longer", "a very long last column"]]
+        write_plain_table(stream, ["Key", "V"], rows, sample_size=2, max_column_width=5)
+
+        lines = stream.getvalue().splitlines()
+        assert lines[2] == "abcd…  tail"
+        assert lines[-1] == "much…  a very long last column"
+
+    def test_rows_are_streamed_from_iterator(self):
+        """A generator of rows is consumed lazily and fully."""
+        consumed = []
+
+        def rows():
+            for i in range(1200):
+                consumed.append(i)
+                yield [str(i), "x"]
+
+        stream = io.StringIO()
+        assert write_plain_table(stream, ["N", "X"], rows(), sample_size=10) == 1200
+        assert len(consumed) == 1200
+
+
+@pytest.mark.unit
+class TestPrintTable:
+    """Test renderer selection."""
+
+    def test_non_terminal_uses_plain_output(self):
+        """Output that is not a terminal skips Rich layout and strips markup."""
+        buffer = io.StringIO()
+        console = Console(file=buffer, force_terminal=False)
+        table = _table([("A-1", Text("Open", style="green"), "[bug] crash"), ("A-2", "[red]Closed[/red]", "ok")])
+
+        print_table(console, table)
+
+        lines = buffer.getvalue().splitlines()
+        assert lines[0] == "Things"
+        assert lines[1].split() == ["ID", "Status", "Summary"]
+        assert lines[3] == "A-1  Open    [bug] crash"
+        assert lines[4] == "A-2  Closed  ok"
+        assert "│" not in buffer.getvalue() and "┃" not in buffer.getvalue()
+
+    def test_terminal_uses_rich_for_small_tables(self):
+        """Small tables on a terminal still go through Rich."""
+        console = Mock(spec=Console)
+        console.is_terminal = True
+        table = _table([("A-1", "Open", "x")])
+
+        print_table(console, table)
+
+        console.print.assert_called_once_with(table)
+
+    def test_large_tables_use_plain_output_on_terminal(self):
+        """Tables past the row threshold are rendered plain even on a terminal."""
+        buffer = io.StringIO()
+        console = Console(file=buffer, force_terminal=True)
+        table = _table([(f"A-{i}", "Open", "x") for i in range(PLAIN_TABLE_ROW_THRESHOLD + 1)])
+
+        print_table(console, table)
+
+        assert len(buffer.getvalue().splitlines()) == PLAIN_TABLE_ROW_THRESHOLD + 4
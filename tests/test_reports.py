@@ -1,11 +1,12 @@
 """Tests for the reports module."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from youtrack_cli.auth import AuthConfig
+from youtrack_cli.exceptions import YouTrackError
 from youtrack_cli.main import main
 from youtrack_cli.reports import ReportManager
 
@@ -32,36 +33,17 @@ class TestReportManager:
 
     @pytest.mark.asyncio
     async def test_generate_burndown_report_success(self, report_manager, auth_manager):
-        """Test successful burndown report generation."""
-        mock_issues = [
-            {
-                "id": "1",
-                "summary": "Test Issue 1",
-                "resolved": 1234567890,
-                "created": 1234567000,
-                "state": {"name": "Done"},
-                "spent": {"value": 120},  # 2 hours in minutes
-            },
-            {
-                "id": "2",
-                "summary": "Test Issue 2",
-                "resolved": None,
-                "created": 1234567000,
-                "state": {"name": "In Progress"},
-                "spent": {"value": 60},  # 1 hour in minutes
-            },
-        ]
-
-        with patch("youtrack_cli.reports.get_client_manager") as mock_get_client:
-            mock_client_manager = Mock()
-            mock_response = Mock()
-            mock_response.json.return_value = mock_issues
+        """Test successful burndown report generation from issue counts."""
+        counts = {
+            "project: TEST Fix versions: sprint-1 created: 2024-01-01 .. 2024-01-31": 4,
+            "project: TEST Fix versions: sprint-1 created: 2024-01-01 .. 2024-01-31 #Resolved": 1,
+        }
 
-            async def mock_make_request(*args, **kwargs):
-                return mock_response
+        async def mock_count(query):
+            return {"status": "success", "data": {"count": counts[query]}}
 
-            mock_client_manager.make_request = mock_make_request
-            mock_get_client.return_value = mock_client_manager
+        with patch("youtrack_cli.reports.IssueService") as mock_service_class:
+            mock_service_class.return_value.count_issues = AsyncMock(side_effect=mock_count)
 
             result = await report_manager.generate_burndown_report(
                 project_id="TEST",
@@ -73,11 +55,11 @@ class TestReportManager:
             assert result["status"] == "success"
             assert result["data"]["project"] == "TEST"
             assert result["data"]["sprint"] == "sprint-1"
-            assert result["data"]["total_issues"] == 2
+            assert result["data"]["total_issues"] == 4
             assert result["data"]["resolved_issues"] == 1
-            assert result["data"]["remaining_issues"] == 1
-            assert result["data"]["completion_rate"] == 50.0
-            assert result["data"]["total_effort_hours"] == 3.0  # (120 + 60) / 60
+            assert result["data"]["remaining_issues"] == 3
+            assert result["data"]["completion_rate"] == 25.0
+            assert mock_service_class.return_value.count_issues.await_count == 2
 
     @pytest.mark.asyncio
     async def test_generate_burndown_report_no_auth(self, report_manager):
@@ -92,61 +74,173 @@ class TestReportManager:
     @pytest.mark.asyncio
     async def test_generate_burndown_report_http_error(self, report_manager, auth_manager):
         """Test burndown report generation with HTTP error."""
-        with patch("youtrack_cli.reports.get_client_manager") as mock_get_client:
-            mock_client_manager = Mock()
+        with patch("youtrack_cli.reports.IssueService") as mock_service_class:
+            mock_service_class.return_value.count_issues = AsyncMock(side_effect=Exception("Connection failed"))
+
+            result = await report_manager.generate_burndown_report("TEST")
 
-            async def mock_make_request(*args, **kwargs):
-                raise Exception("Connection failed")
+            assert result["status"] == "error"
+            assert "Unexpected error" in result["message"]
 
-            mock_client_manager.make_request = mock_make_request
-            mock_get_client.return_value = mock_client_manager
+    @pytest.mark.asyncio
+    async def test_generate_burndown_report_count_error(self, report_manager, auth_manager):
+        """Test that a failed count is reported as an error."""
+        with patch("youtrack_cli.reports.IssueService") as mock_service_class:
+            mock_service_class.return_value.count_issues = AsyncMock(
+                return_value={"status": "error", "message": "Timed out after 30s waiting for YouTrack to count issues"}
+            )
 
             result = await report_manager.generate_burndown_report("TEST")
 
             assert result["status"] == "error"
-            assert "Unexpected error" in result["message"]
+            assert "Timed out" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_generate_burndown_report_daily_series(self, report_manager, auth_manager):
+        """Test that include_series streams issue timestamps into a daily series."""
+        day = 86_400_000
+        t0 = 1_704_067_200_000  # 2024-01-01
+        issues = [
+            {"created": t0 - day, "resolved": t0 + day},
+            {"created": t0, "resolved": None},
+            {"created": t0 + 2 * day, "resolved": t0 + 2 * day},
+        ]
+
+        async def mock_stream(**kwargs):
+            for issue in issues:
+                yield issue
+
+        with (
+            patch("youtrack_cli.reports.IssueService") as mock_service_class,
+            patch("youtrack_cli.managers.issues.IssueManager") as mock_manager_class,
+        ):
+            mock_service_class.return_value.count_issues = AsyncMock(
+                return_value={"status": "success", "data": {"count": 3}}
+            )
+            mock_manager_class.return_value.stream_list_issues = mock_stream
+
+            result = await report_manager.generate_burndown_report(
+                "TEST", start_date="2024-01-01", end_date="2024-01-03", include_series=True
+            )
+
+        assert result["status"] == "success"
+        assert [(row["scope"], row["completed"], row["remaining"]) for row in result["data"]["series"]] == [
+            (2, 0, 2),
+            (2, 1, 1),
+            (3, 2, 1),
+        ]
 
     @pytest.mark.asyncio
-    async def test_generate_velocity_report_success(self, report_manager, auth_manager):
-        """Test successful velocity report generation."""
+    async def test_generate_burndown_report_invalid_date(self, report_manager, auth_manager):
+        """Test that a malformed date is reported before any request is made."""
+        result = await report_manager.generate_burndown_report("TEST", start_date="2024-13-01", end_date="2024-01-31")
+
+        assert result["status"] == "error"
+        assert "Invalid date" in result["message"]
+
+    def test_write_burndown_csv(self, report_manager):
+        """Test CSV output of the daily series."""
+        import io
+
+        stream = io.StringIO()
+        rows = report_manager.write_burndown_csv(
+            stream, {"series": [{"date": "2024-01-01", "scope": 2, "completed": 0, "remaining": 2, "ideal": 2.0}]}
+        )
+
+        assert rows == 1
+        assert stream.getvalue().splitlines() == ["date,scope,completed,remaining,ideal", "2024-01-01,2,0,2,2.0"]
+
+    @pytest.fixture
+    def velocity_project(self):
+        """Mock the project versions request of the velocity report."""
         mock_project_data = {
             "id": "TEST",
             "name": "Test Project",
             "versions": [
-                {"id": "v1", "name": "Sprint 1", "releaseDate": "2024-01-15"},
-                {"id": "v2", "name": "Sprint 2", "releaseDate": "2024-01-30"},
+                {"id": "v1", "name": "Sprint 1", "released": True, "releaseDate": 1705276800000},
+                {"id": "v2", "name": "Sprint 2", "released": False, "releaseDate": 1706572800000},
+            ],
+        }
+        with patch("youtrack_cli.reports.get_client_manager") as mock_get_client:
+            mock_get_client.return_value.make_request = AsyncMock(return_value=Mock(json=lambda: mock_project_data))
+            yield mock_get_client
+
+    @staticmethod
+    def _velocity_issue(versions, resolved, minutes):
+        return {
+            "id": "x",
+            "resolved": resolved,
+            "customFields": [
+                {"name": "Fix versions", "value": [{"name": name} for name in versions]},
+                {"name": "Spent time", "value": {"minutes": minutes} if minutes else None},
             ],
         }
 
-        mock_sprint_issues = [
-            {"id": "1", "resolved": 1234567890, "spent": {"value": 120}},
-            {"id": "2", "resolved": None, "spent": {"value": 60}},
+    @pytest.mark.asyncio
+    async def test_generate_velocity_report_success(self, report_manager, velocity_project, tmp_path):
+        """Test that all sprints are fetched with one paged query and bucketed by version."""
+        issues = [
+            self._velocity_issue(["Sprint 1"], 1234567890, 120),
+            self._velocity_issue(["Sprint 1", "Sprint 2"], None, 60),
+            self._velocity_issue(["Sprint 2"], 1234567890, 180),
         ]
 
-        with patch("youtrack_cli.reports.get_client_manager") as mock_get_client:
-            mock_client_manager = Mock()
-            mock_responses = [
-                Mock(json=lambda: mock_project_data),  # Project response
-                Mock(json=lambda: mock_sprint_issues),  # Sprint 1 issues
-                Mock(json=lambda: mock_sprint_issues),  # Sprint 2 issues
-            ]
+        async def mock_search(query, fields, top, skip, custom_fields):
+            return {"status": "success", "data": issues[skip : skip + 2]}
 
-            response_iter = iter(mock_responses)
+        with (
+            patch("youtrack_cli.reports.IssueService") as mock_service_class,
+            patch("youtrack_cli.reports.VELOCITY_PAGE_SIZE", 2),
+            patch("youtrack_cli.json_cache.Path.home", return_value=tmp_path),
+        ):
+            search = mock_service_class.return_value.search_issues = AsyncMock(side_effect=mock_search)
 
-            async def mock_make_request(*args, **kwargs):
-                return next(response_iter)
+            result = await report_manager.generate_velocity_report("TEST", sprints=2)
 
-            mock_client_manager.make_request = mock_make_request
-            mock_get_client.return_value = mock_client_manager
+        assert result["status"] == "success"
+        data = result["data"]
+        assert data["sprints_analyzed"] == 2
+        assert [(s["name"], s["total_issues"], s["resolved_issues"]) for s in data["sprints"]] == [
+            ("Sprint 2", 2, 1),
+            ("Sprint 1", 2, 1),
+        ]
+        assert data["average_issues_per_sprint"] == 1.0
+        assert data["average_effort_per_sprint"] == 3.5
+        assert search.await_count == 2
+        assert search.await_args.kwargs["query"] == "project: TEST Fix versions: {Sprint 2}, {Sprint 1}"
 
-            result = await report_manager.generate_velocity_report("TEST", sprints=2)
+    @pytest.mark.asyncio
+    async def test_generate_velocity_report_caches_released_sprints(self, report_manager, velocity_project, tmp_path):
+        """Test that released sprints are read from the cache on the next run."""
+        issues = [self._velocity_issue(["Sprint 1"], 1234567890, 120), self._velocity_issue(["Sprint 2"], None, 0)]
+
+        with (
+            patch("youtrack_cli.reports.IssueService") as mock_service_class,
+            patch("youtrack_cli.json_cache.Path.home", return_value=tmp_path),
+        ):
+            search = mock_service_class.return_value.search_issues = AsyncMock(
+                return_value={"status": "success", "data": issues}
+            )
 
-            assert result["status"] == "success"
-            assert result["data"]["project"] == "TEST"
-            assert result["data"]["sprints_analyzed"] == 2
-            assert len(result["data"]["sprints"]) == 2
-            assert result["data"]["average_issues_per_sprint"] == 1.0
-            assert result["data"]["average_effort_per_sprint"] == 3.0
+            first = await report_manager.generate_velocity_report("TEST", sprints=2)
+            second = await report_manager.generate_velocity_report("TEST", sprints=2)
+
+        assert first["data"] == second["data"]
+        assert search.await_args_list[1].kwargs["query"] == "project: TEST Fix versions: {Sprint 2}"
+        assert list((tmp_path / ".config" / "youtrack-cli" / "velocity").glob("*.json"))
+
+    @pytest.mark.asyncio
+    async def test_generate_velocity_report_search_error(self, report_manager, velocity_project):
+        """Test that a failed issue search is reported as an error."""
+        with patch("youtrack_cli.reports.IssueService") as mock_service_class:
+            mock_service_class.return_value.search_issues = AsyncMock(
+                return_value={"status": "error", "message": "Bad query"}
+            )
+
+            result = await report_manager.generate_velocity_report("TEST", use_cache=False)
+
+        assert result["status"] == "error"
+        assert "Bad query" in result["message"]
 
     @pytest.mark.asyncio
     async def test_generate_velocity_report_no_auth(self, report_manager):
@@ -158,6 +252,80 @@ class TestReportManager:
         assert result["status"] == "error"
         assert "Not authenticated" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_generate_cycle_time_report(self, report_manager, tmp_path):
+        """Test cycle time report built from resolved issues and their state history."""
+        day = 86_400_000
+        t0 = 1_735_689_600_000
+        issues = [
+            {"idReadable": "TEST-1", "created": t0, "resolved": t0 + 10 * day},
+            {"idReadable": "TEST-2", "created": t0, "resolved": t0 + 4 * day},
+        ]
+        activities = [
+            ("TEST-1", {"timestamp": t0 + 2 * day, "field": {"name": "State"}, "added": [{"name": "In Progress"}]}),
+            ("TEST-2", {"timestamp": t0 + day, "field": {"name": "State"}, "added": [{"name": "In Progress"}]}),
+            ("TEST-2", {"timestamp": t0 + day, "field": {"name": "Priority"}, "added": [{"name": "High"}]}),
+        ]
+
+        async def stream_list_issues(**kwargs):
+            for issue in issues:
+                yield issue
+
+        async def stream_activities(issue_ids, **kwargs):
+            assert issue_ids == ["TEST-1", "TEST-2"]
+            assert kwargs["categories"] == ["CustomFieldCategory"]
+            for pair in activities:
+                yield pair
+
+        with patch("youtrack_cli.managers.issues.IssueManager") as mock_manager_class:
+            manager = mock_manager_class.return_value
+            manager.stream_list_issues = MagicMock(side_effect=stream_list_issues)
+            manager.issue_service.stream_activities = MagicMock(side_effect=stream_activities)
+
+            result = await report_manager.generate_cycle_time_report(
+                "TEST", start_date="2025-01-01", end_date="2025-03-31", use_cache=False
+            )
+
+        assert result["status"] == "success"
+        data = result["data"]
+        assert data["period"] == "2025-01-01 to 2025-03-31"
+        assert data["lead_time"]["p50_days"] == 7.0
+        assert data["cycle_time"]["max_days"] == 8.0
+        assert data["transitions"] == 2
+        query = manager.stream_list_issues.call_args.kwargs["query"]
+        assert query == "project: TEST #Resolved resolved date: 2025-01-01 .. 2025-03-31"
+        assert manager.issue_service.stream_activities.call_args.kwargs["cache"] is None
+
+        with patch("rich.console.Console.print") as mock_print:
+            report_manager.display_cycle_time_report(data)
+            mock_print.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_cycle_time_report_fetch_error(self, report_manager):
+        """Test that a failed issue search is reported as an error."""
+
+        async def stream_list_issues(**kwargs):
+            raise YouTrackError("Bad query")
+            yield
+
+        with patch("youtrack_cli.managers.issues.IssueManager") as mock_manager_class:
+            mock_manager_class.return_value.stream_list_issues = MagicMock(side_effect=stream_list_issues)
+
+            result = await report_manager.generate_cycle_time_report("TEST")
+
+        assert result["status"] == "error"
+        assert "Bad query" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_generate_cycle_time_report_invalid_start_date(self, report_manager):
+        """Test that an invalid start date is reported before any request."""
+        with patch("youtrack_cli.managers.issues.IssueManager") as mock_manager_class:
+            result = await report_manager.generate_cycle_time_report("TEST", start_date="01/02/2025")
+
+        assert result["status"] == "error"
+        assert "Invalid start date" in result["message"]
+        mock_manager_class.assert_not_called()
+
     def test_display_burndown_report(self, report_manager, capsys):
         """Test burndown report display."""
         burndown_data = {
@@ -168,7 +336,6 @@ class TestReportManager:
             "resolved_issues": 7,
             "remaining_issues": 3,
             "completion_rate": 70.0,
-            "total_effort_hours": 15.5,
         }
 
         with patch("rich.console.Console.print") as mock_print:
@@ -259,7 +426,6 @@ class TestReportsCommands:
                 "resolved_issues": 7,
                 "remaining_issues": 3,
                 "completion_rate": 70.0,
-                "total_effort_hours": 15.5,
             },
         }
 
@@ -269,6 +435,24 @@ class TestReportsCommands:
             assert result.exit_code == 0
             mock_asyncio.assert_called_once()
 
+    @patch("youtrack_cli.main.ReportManager")
+    @patch("youtrack_cli.main.AuthManager")
+    @patch("youtrack_cli.main.ConfigManager")
+    def test_burndown_command_csv(self, mock_config, mock_auth, mock_report):
+        """Test that --format csv requests the daily series and writes it as CSV."""
+        mock_auth.return_value.get_current_user_sync.return_value = "test_user"
+        mock_report_instance = mock_report.return_value
+        mock_report_instance.generate_burndown_report = AsyncMock(
+            return_value={"status": "success", "data": {"project": "TEST", "series": []}}
+        )
+
+        result = self.runner.invoke(main, ["burndown", "TEST", "--format", "csv"])
+
+        assert result.exit_code == 0
+        assert mock_report_instance.generate_burndown_report.await_args.kwargs["include_series"] is True
+        mock_report_instance.write_burndown_csv.assert_called_once()
+        mock_report_instance.display_burndown_report.assert_not_called()
+
     @patch("youtrack_cli.main.ReportManager")
     @patch("youtrack_cli.main.AuthManager")
     @patch("youtrack_cli.main.ConfigManager")
@@ -297,6 +481,15 @@ class TestReportsCommands:
             assert result.exit_code == 0
             mock_asyncio.assert_called_once()
 
+    def test_cycle_time_rejects_invalid_start_date(self):
+        """An unparseable --start-date is a usage error, not a server query."""
+        with patch("asyncio.run") as mock_asyncio:
+            result = self.runner.invoke(main, ["reports", "cycle-time", "TEST", "--start-date", "2025-13-01"])
+
+        assert result.exit_code == 2
+        assert "not a valid date" in result.output
+        mock_asyncio.assert_not_called()
+
     def test_reports_group_help(self):
         """Test reports group help command."""
         result = self.runner.invoke(main, ["reports", "--help"])
@@ -305,6 +498,7 @@ class TestReportsCommands:
         assert "Generate cross-entity reports" in result.output
         assert "burndown" in result.output
         assert "velocity" in result.output
+        assert "cycle-time" in result.output
 
     def test_burndown_command_help(self):
         """Test burndown command help."""
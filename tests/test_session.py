@@ -0,0 +1,167 @@
+"""Tests for the verified-session record."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from youtrack_cli.auth import AuthConfig, AuthManager
+from youtrack_cli.client import HTTPClientManager
+from youtrack_cli.exceptions import AuthenticationError
+from youtrack_cli.session import SessionStore, get_session_store, token_fingerprint
+
+BASE_URL = "https://example.youtrack.cloud"
+TOKEN = "test-token-123"
+
+
+@pytest.fixture
+def auth_manager():
+    manager = AuthManager()
+    manager.load_credentials = MagicMock(return_value=AuthConfig(base_url=BASE_URL, token=TOKEN))
+    return manager
+
+
+def users_me_response(status_code=200):
+    """Build the response of ``GET users/me`` with ``status_code``."""
+    response = MagicMock()
+    response.json.return_value = {"login": "testuser", "fullName": "Test User", "email": "test@example.com"}
+    if status_code == 200:
+        response.raise_for_status.return_value = None
+    else:
+        response.status_code = status_code
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Unauthorized", request=MagicMock(), response=response
+        )
+    return response
+
+
+@pytest.mark.unit
+class TestSessionStore:
+    """Test recording and expiry of verified sessions."""
+
+    def test_fingerprint_hides_token(self):
+        fingerprint = token_fingerprint(BASE_URL, TOKEN)
+
+        assert TOKEN not in fingerprint
+        assert fingerprint == token_fingerprint(f"{BASE_URL}/", TOKEN)
+        assert fingerprint != token_fingerprint(BASE_URL, "other-token")
+
+    def test_record_is_persisted_without_token(self, tmp_path):
+        path = tmp_path / "session.json"
+        SessionStore(path=path, ttl=60).record(BASE_URL, TOKEN, "testuser")
+
+        session = SessionStore(path=path, ttl=60).get(BASE_URL, TOKEN)
+
+        assert session is not None
+        assert session.username == "testuser"
+        assert TOKEN not in path.read_text()
+        assert SessionStore(path=path, ttl=60).get(BASE_URL, "other-token") is None
+
+    def test_record_expires_after_ttl(self, tmp_path):
+        store = SessionStore(path=tmp_path / "session.json", ttl=60)
+        store.record(BASE_URL, TOKEN)
+        store._sessions[token_fingerprint(BASE_URL, TOKEN)].verified_at = time.time() - 61
+
+        assert store.get(BASE_URL, TOKEN) is None
+
+    def test_ttl_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("YOUTRACK_SESSION_TTL", "0")
+        store = SessionStore(path=tmp_path / "session.json")
+
+        assert store.record(BASE_URL, TOKEN) is None
+        assert store.get(BASE_URL, TOKEN) is None
+
+    def test_invalidate_discards_records(self, tmp_path):
+        path = tmp_path / "session.json"
+        store = SessionStore(path=path, ttl=60)
+        store.record(BASE_URL, TOKEN)
+
+        store.invalidate()
+
+        assert store.get(BASE_URL, TOKEN) is None
+        assert not path.exists()
+
+    def test_unreadable_record_is_ignored(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text(json.dumps({"abc": {"unexpected": 1}}))
+
+        assert SessionStore(path=path, ttl=60).get(BASE_URL, TOKEN) is None
+
+
+@pytest.mark.unit
+class TestVerifySession:
+    """Test that verification is reused across commands and dropped on 401."""
+
+    @pytest.mark.asyncio
+    async def test_recent_verification_skips_request(self, auth_manager):
+        response = users_me_response()
+        with patch("httpx.AsyncClient") as mock_client:
+            get = mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=response)
+
+            first = await auth_manager.verify_session()
+            second = await auth_manager.verify_session()
+
+        assert first.username == second.username == "testuser"
+        assert second.email == "test@example.com"
+        get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_force_asks_server(self, auth_manager):
+        response = users_me_response()
+        with patch("httpx.AsyncClient") as mock_client:
+            get = mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=response)
+
+            await auth_manager.verify_session()
+            await auth_manager.verify_session(force=True)
+
+        assert get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_invalidates_record(self, auth_manager):
+        get_session_store().record(BASE_URL, "old-token")
+        response = users_me_response(status_code=401)
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=response)
+
+            result = await auth_manager.verify_session()
+
+        assert result.status == "error"
+        assert get_session_store().get(BASE_URL, "old-token") is None
+
+    @pytest.mark.asyncio
+    async def test_not_authenticated(self):
+        manager = AuthManager()
+        manager.load_credentials = MagicMock(return_value=None)
+
+        result = await manager.verify_session()
+
+        assert result.status == "error"
+
+    def test_clear_credentials_invalidates_record(self, tmp_path):
+        get_session_store().record(BASE_URL, TOKEN)
+        manager = AuthManager(str(tmp_path / ".env"))
+        manager.credential_manager = MagicMock()
+
+        with patch("youtrack_cli.auth.reset_client_manager_sync"):
+            manager.clear_credentials()
+
+        assert get_session_store().get(BASE_URL, TOKEN) is None
+
+    @pytest.mark.asyncio
+    async def test_api_401_invalidates_record(self):
+        get_session_store().record(BASE_URL, TOKEN)
+        manager = HTTPClientManager()
+        response = MagicMock(status_code=401)
+        client = MagicMock()
+        client.request = AsyncMock(return_value=response)
+        client_context = MagicMock()
+        client_context.__aenter__ = AsyncMock(return_value=client)
+        client_context.__aexit__ = AsyncMock(return_value=None)
+
+        with patch.object(manager, "get_client", return_value=client_context):
+            with pytest.raises(AuthenticationError):
+                await manager.make_request("GET", f"{BASE_URL}/api/agiles", attempt_token_refresh=False)
+
+        assert get_session_store().get(BASE_URL, TOKEN) is None
@@ -0,0 +1,62 @@
+"""Tests for the incremental CSV and JSON writers."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from youtrack_cli.stream_writers import CSVStreamWriter, JSONArrayWriter, write_stream
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.unit
+class TestJSONArrayWriter:
+    """Test JSONArrayWriter."""
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_matches_json_dumps(self, indent):
+        """Output is identical to dumping the whole list at once."""
+        items = [{"id": "A-1", "summary": "[bug] x\ny", "tags": []}, {"id": "A-2", "nested": {"a": [1, 2]}}]
+        stream = io.StringIO()
+        with JSONArrayWriter(stream, indent=indent) as writer:
+            for item in items:
+                writer.write(item)
+
+        assert stream.getvalue() == json.dumps(items, indent=indent) + "\n"
+        assert writer.count == 2
+
+    def test_empty_array_is_well_formed(self):
+        """No elements still produces a valid (empty) array."""
+        stream = io.StringIO()
+        with JSONArrayWriter(stream):
+            pass
+        assert json.loads(stream.getvalue()) == []
+
+    def test_closes_array_on_error(self):
+        """An exception mid-stream still leaves parseable JSON behind."""
+        stream = io.StringIO()
+        with pytest.raises(RuntimeError), JSONArrayWriter(stream) as writer:
+            writer.write({"id": 1})
+            raise RuntimeError("boom")
+        assert json.loads(stream.getvalue()) == [{"id": 1}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_write_stream_to_csv():
+    """Rows are written header first, one per streamed item."""
+    stream = io.StringIO()
+    with CSVStreamWriter(stream, ["ID", "Summary"]) as writer:
+        count = await write_stream(_agen([("A-1", "one, two"), ("A-2", 'say "hi"')]), writer.write)
+
+    assert count == 2
+    assert list(csv.reader(io.StringIO(stream.getvalue()))) == [
+        ["ID", "Summary"],
+        ["A-1", "one, two"],
+        ["A-2", 'say "hi"'],
+    ]
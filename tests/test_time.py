@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from youtrack_cli.auth import AuthConfig
+from youtrack_cli.exceptions import YouTrackError
 from youtrack_cli.time import TimeManager
 
 
@@ -165,6 +166,75 @@ class TestTimeManager:
             assert result["data"]["total_minutes"] == 180
             assert result["data"]["total_hours"] == 3.0
 
+    @pytest.mark.asyncio
+    async def test_get_time_entries_follows_all_pages(self, time_manager):
+        """Test that work items are paged with $skip/$top until a short page."""
+        items = [{"id": str(number), "duration": {"minutes": 1}} for number in range(11)]
+        requested = []
+
+        async def mock_make_request(method, url, params, headers):
+            skip, top = int(params["$skip"]), int(params["$top"])
+            requested.append(skip)
+            return Mock(status_code=200, text="[]", json=lambda: items[skip : skip + top])
+
+        with patch("youtrack_cli.time.get_client_manager") as mock_get_client_manager:
+            mock_get_client_manager.return_value.make_request = mock_make_request
+            entries = [entry async for entry in time_manager.iter_time_entries(page_size=3, prefetch=2)]
+
+        assert [entry["id"] for entry in entries] == [str(number) for number in range(11)]
+        # Pages past the end may already be in flight when the short page arrives
+        assert sorted(requested)[:4] == [0, 3, 6, 9]
+
+    @pytest.mark.asyncio
+    async def test_get_time_entries_page_error(self, time_manager):
+        """Test that a failing page makes the whole request fail."""
+        responses = [
+            Mock(status_code=200, text="[]", json=lambda: [{"id": "1"}, {"id": "2"}]),
+            Mock(status_code=500, text="Internal error"),
+        ]
+
+        async def mock_make_request(method, url, params, headers):
+            return responses[min(int(params["$skip"]) // 2, 1)]
+
+        with patch("youtrack_cli.time.get_client_manager") as mock_get_client_manager:
+            mock_get_client_manager.return_value.make_request = mock_make_request
+            entries = []
+            with pytest.raises(YouTrackError, match="Internal error"):
+                async for entry in time_manager.iter_time_entries(page_size=2):
+                    entries.append(entry)
+
+        assert len(entries) == 2
+
+    def test_aggregate_time_data_by_user_and_week(self, time_manager):
+        """Test grouping by several keys at once."""
+        monday = 1704067200000  # 2024-01-01
+        day = 86_400_000
+        time_entries = [
+            {"duration": {"minutes": 60}, "author": {"fullName": "User A"}, "date": monday},
+            {"duration": {"minutes": 30}, "author": {"fullName": "User A"}, "date": monday + 6 * day},
+            {"duration": {"minutes": 45}, "author": {"fullName": "User A"}, "date": monday + 7 * day},
+            {"duration": {"minutes": 15}, "author": {"fullName": "User B"}, "date": monday},
+        ]
+
+        result = time_manager._aggregate_time_data(time_entries, "user,week")
+
+        assert result["total_minutes"] == 150
+        assert result["groups"]["User A / 2024-01-01"]["minutes"] == 90
+        assert result["groups"]["User A / 2024-01-01"]["keys"] == {"user": "User A", "week": "2024-01-01"}
+        assert result["groups"]["User A / 2024-01-08"]["entries"] == 1
+        assert result["groups"]["User B / 2024-01-01"]["minutes"] == 15
+
+    def test_aggregate_time_data_by_project_and_type(self, time_manager):
+        """Test grouping by project and work type."""
+        time_entries = [
+            {"duration": {"minutes": 60}, "issue": {"project": {"shortName": "WEB"}}, "type": {"name": "Dev"}},
+            {"duration": {"minutes": 30}, "issue": {"project": {"shortName": "WEB"}}, "type": None},
+        ]
+
+        groups = time_manager._aggregate_time_data(time_entries, ["project", "type"])["groups"]
+
+        assert set(groups) == {"WEB / Dev", "WEB / No type"}
+
     def test_parse_duration_valid_formats(self, time_manager):
         """Test parsing various valid duration formats."""
         test_cases = [
@@ -528,3 +598,134 @@ class TestTimeCommands:
                 clean_output = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
                 assert "📋 Listing time entries..." in clean_output
                 assert "📊 Total entries: 0" in clean_output
+
+
+@pytest.mark.unit
+def test_summary_command_rejects_unknown_group():
+    """Test that --group-by only accepts known keys."""
+    from click.testing import CliRunner
+
+    from youtrack_cli.commands.time_tracking import summary
+
+    result = CliRunner().invoke(summary, ["--group-by", "user,planet"], obj={"config": None})
+
+    assert result.exit_code == 2
+    assert "not a valid grouping" in result.output
+
+
+@pytest.mark.unit
+class TestBulkTimeImport:
+    """Test bulk time logging from CSV and JSON."""
+
+    CSV = (
+        "issue_id,duration,date,description,work_type\n"
+        "WEB-1,2h,2024-01-01,Review,development\n"
+        "WEB-2,soon,,,\n"
+        "API-3,30m,,,Testing\n"
+        ",1h,,,\n"
+        "WEB-4,1h,someday,,\n"
+        "WEB-5,1h 30m,,,Meetings\n"
+    )
+
+    def test_parse_time_import_validates_rows(self, time_manager):
+        """Test that invalid durations, dates and missing IDs are reported per row."""
+        import io
+
+        rows, errors = time_manager.parse_time_import(io.StringIO(self.CSV), "csv")
+
+        assert [(row.row, row.issue_id, row.minutes) for row in rows] == [
+            (2, "WEB-1", 120),
+            (4, "API-3", 30),
+            (7, "WEB-5", 90),
+        ]
+        assert rows[0].work_type == "development"
+        assert [(error["row"], error["error"]) for error in errors] == [
+            (3, "Invalid duration format: soon"),
+            (5, "Missing issue_id"),
+            (6, "Invalid date: someday"),
+        ]
+
+    def test_parse_time_import_json(self, time_manager):
+        """Test that JSON input is an array of objects numbered from 1."""
+        import io
+
+        rows, errors = time_manager.parse_time_import(
+            io.StringIO('[{"issue_id": "WEB-1", "duration": "1h"}, "oops"]'), "json"
+        )
+
+        assert [row.issue_id for row in rows] == ["WEB-1"]
+        assert errors[0]["row"] == 2
+
+        with pytest.raises(ValueError, match="array"):
+            time_manager.parse_time_import(io.StringIO('{"issue_id": "WEB-1"}'), "json")
+
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_resolves_work_types_once_per_project(self, time_manager):
+        """Test that work types are fetched once per project and failures are kept per row."""
+        import io
+
+        rows, _ = time_manager.parse_time_import(io.StringIO(self.CSV), "csv")
+        requests = []
+
+        async def mock_make_request(method, url, headers, params=None, json_data=None):
+            requests.append((method, url))
+            if url.endswith("/workItemTypes"):
+                project = url.split("/projects/")[1].split("/")[0]
+                types = {"WEB": [{"id": "t1", "name": "Development"}], "API": [{"id": "t2", "name": "Testing"}]}
+                return Mock(status_code=200, json=lambda: types[project])
+            if "/issues/API-3/" in url:
+                return Mock(status_code=403, text="Forbidden")
+            return Mock(status_code=200, json=lambda: {"id": "wi"})
+
+        with patch("youtrack_cli.time.get_client_manager") as mock_get_client_manager:
+            mock_get_client_manager.return_value.make_request = mock_make_request
+            result = await time_manager.log_time_bulk(rows + rows[:1], max_concurrent=2)
+
+        data = result["data"]
+        assert result["status"] == "success"
+        assert (data["total"], data["logged"], data["failed"]) == (4, 2, 2)
+        assert [(error["row"], error["error"]) for error in data["errors"]] == [
+            (4, "Failed to log time (HTTP 403): Forbidden"),
+            (7, "Invalid work type 'Meetings'"),
+        ]
+        type_requests = [url for method, url in requests if url.endswith("/workItemTypes")]
+        assert len(type_requests) == 2
+        assert sum(1 for method, _ in requests if method == "POST") == 3
+
+    @pytest.mark.asyncio
+    async def test_log_time_bulk_dry_run(self, time_manager):
+        """Test that a dry run posts nothing."""
+        from youtrack_cli.time import TimeImportRow
+
+        with patch("youtrack_cli.time.get_client_manager") as mock_get_client_manager:
+            mock_get_client_manager.return_value.make_request = AsyncMock()
+            result = await time_manager.log_time_bulk([TimeImportRow(2, "WEB-1", "1h", 60)], dry_run=True)
+
+        assert result["data"]["logged"] == 1
+        mock_get_client_manager.return_value.make_request.assert_not_awaited()
+
+    def test_import_command_writes_error_report(self, mock_auth_manager, tmp_path):
+        """Test that the import command exits non-zero and writes failed rows."""
+        from click.testing import CliRunner
+
+        from youtrack_cli.commands.time_tracking import import_time
+
+        source = tmp_path / "timesheet.csv"
+        source.write_text("issue_id,duration\nWEB-1,1h\nWEB-2,never\n", encoding="utf-8")
+        report = tmp_path / "failed.csv"
+
+        with (
+            patch("youtrack_cli.commands.time_tracking.AuthManager", return_value=mock_auth_manager),
+            patch("youtrack_cli.time.get_client_manager") as mock_get_client_manager,
+        ):
+            mock_get_client_manager.return_value.make_request = AsyncMock(
+                return_value=Mock(status_code=201, json=lambda: {"id": "wi"})
+            )
+            result = CliRunner().invoke(import_time, [str(source), "--errors", str(report)], obj={"config": None})
+
+        assert result.exit_code == 1
+        assert "Logged 1 of 2" in result.output
+        assert report.read_text(encoding="utf-8").splitlines() == [
+            "row,issue_id,duration,error",
+            "3,WEB-2,never,Invalid duration format: never",
+        ]
@@ -249,6 +249,20 @@ class TestProjectHierarchyTree:
         tree = create_project_hierarchy_tree(projects)
 
         assert isinstance(tree, Tree)
+        assert len(tree.children) == 1
+        assert len(tree.children[0].children) == 2
+
+    def test_create_project_hierarchy_tree_unlisted_parent(self):
+        """Test that a project whose parent was not listed is shown at the root."""
+        projects = [
+            {"id": "0-1", "shortName": "ONE", "name": "One", "parent": {"id": "0-0"}},
+            {"id": "0-2", "shortName": "TWO", "name": "Two", "parent": {"id": "0-1"}, "leader": None},
+        ]
+
+        tree = create_project_hierarchy_tree(projects)
+
+        assert len(tree.children) == 1
+        assert len(tree.children[0].children) == 1
 
     def test_create_project_hierarchy_tree_empty(self):
         """Test creating a project hierarchy with no projects."""
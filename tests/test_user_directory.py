@@ -0,0 +1,185 @@
+"""Tests for the cached user directory."""
+
+import json
+import stat
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from youtrack_cli.user_directory import (
+    USER_DIRECTORY_FIELDS,
+    USER_DIRECTORY_PAGE_SIZE,
+    UserDirectory,
+    complete_user_logins,
+)
+
+USERS = [
+    {"id": "1-1", "login": "admin", "fullName": "Admin", "email": "admin@example.com", "ringId": "ring-1"},
+    {"id": "1-2", "login": "Jane", "fullName": "Jane Doe", "email": "Jane@Example.com", "ringId": "ring-2"},
+    {"id": "1-3", "login": "jack", "fullName": "Jack", "email": None, "ringId": "ring-3", "banned": True},
+]
+
+
+@pytest.fixture
+def auth_manager():
+    auth = Mock()
+    auth.load_credentials.return_value = Mock(base_url="https://yt.example.com/")
+    return auth
+
+
+@pytest.fixture
+def fetch_user():
+    return AsyncMock(return_value={"status": "error", "message": "User not found"})
+
+
+@pytest.fixture
+def directory(auth_manager, fetch_user, tmp_path):
+    directory = UserDirectory(auth_manager, fetch_user=fetch_user, cache_dir=tmp_path)
+    directory.user_service.list_users = AsyncMock(return_value={"status": "success", "data": list(USERS)})
+    return directory
+
+
+@pytest.mark.unit
+class TestUserDirectory:
+    """Test loading, lookups and persistence of the user directory."""
+
+    @pytest.mark.asyncio
+    async def test_load_indexes_every_key(self, directory):
+        assert await directory.load()
+
+        directory.user_service.list_users.assert_awaited_once_with(
+            fields=USER_DIRECTORY_FIELDS, top=USER_DIRECTORY_PAGE_SIZE, skip=0
+        )
+        assert len(directory) == 3
+        for reference in ("1-2", "ring-2", "jane", "JANE", "jane@example.com"):
+            assert directory.lookup(reference)["id"] == "1-2"
+        assert directory.lookup("nobody") is None
+
+    @pytest.mark.asyncio
+    async def test_load_pages_until_short_page(self, directory):
+        full_page = [{"id": f"2-{i}", "login": f"user{i}"} for i in range(USER_DIRECTORY_PAGE_SIZE)]
+        directory.user_service.list_users.side_effect = [
+            {"status": "success", "data": full_page},
+            {"status": "success", "data": list(USERS)},
+        ]
+
+        assert await directory.load()
+
+        assert directory.user_service.list_users.await_args_list[1].kwargs["skip"] == USER_DIRECTORY_PAGE_SIZE
+        assert len(directory) == USER_DIRECTORY_PAGE_SIZE + 3
+
+    @pytest.mark.asyncio
+    async def test_load_failure_keeps_directory_cold(self, directory):
+        directory.user_service.list_users.return_value = {"status": "error", "message": "Forbidden"}
+
+        assert not await directory.load()
+        assert not directory.is_fresh
+
+    @pytest.mark.asyncio
+    async def test_persisted_directory_is_reused(self, directory, auth_manager, tmp_path):
+        await directory.load()
+
+        reloaded = UserDirectory(auth_manager, cache_dir=tmp_path)
+        reloaded.user_service.list_users = AsyncMock()
+
+        assert await reloaded.load()
+        reloaded.user_service.list_users.assert_not_awaited()
+        assert reloaded.lookup("admin@example.com")["login"] == "admin"
+
+    @pytest.mark.asyncio
+    async def test_persisted_directory_is_owner_only(self, directory, tmp_path):
+        await directory.load()
+
+        path = next(tmp_path.glob("*.json"))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    @pytest.mark.asyncio
+    async def test_stale_persisted_directory_is_ignored(self, directory, auth_manager, fetch_user, tmp_path):
+        await directory.load()
+        path = next(tmp_path.glob("*.json"))
+        data = json.loads(path.read_text())
+        data["loaded_at"] = time.time() - 2 * directory.ttl
+        path.write_text(json.dumps(data))
+
+        reloaded = UserDirectory(auth_manager, fetch_user=fetch_user, cache_dir=tmp_path)
+
+        assert await reloaded.resolve("admin") is None
+        fetch_user.assert_awaited_once_with("admin", USER_DIRECTORY_FIELDS)
+
+    @pytest.mark.asyncio
+    async def test_resolve_falls_back_to_single_lookup(self, directory, fetch_user):
+        fetch_user.return_value = {"status": "success", "data": {"id": "1-9", "login": "new"}}
+
+        assert (await directory.resolve("new"))["id"] == "1-9"
+        assert (await directory.resolve("1-9"))["login"] == "new"
+
+        fetch_user.assert_awaited_once_with("new", USER_DIRECTORY_FIELDS)
+        directory.user_service.list_users.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resolve_many_loads_directory_once(self, directory, fetch_user):
+        references = ["admin", "jane", "jack", "ring-1", "1-2", "ghost"]
+
+        resolved = await directory.resolve_many(references)
+
+        directory.user_service.list_users.assert_awaited_once()
+        fetch_user.assert_awaited_once_with("ghost", USER_DIRECTORY_FIELDS)
+        assert resolved["ring-1"]["login"] == "admin"
+        assert resolved["ghost"] is None
+
+    @pytest.mark.asyncio
+    async def test_resolve_many_few_references_skip_full_load(self, directory, fetch_user):
+        await directory.resolve_many(["a", "b"])
+
+        directory.user_service.list_users.assert_not_awaited()
+        assert fetch_user.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_skips_banned_users(self, directory):
+        await directory.load()
+
+        assert [user["login"] for user in directory.complete("J")] == ["Jane"]
+        assert [user["login"] for user in directory.complete("")] == ["admin", "Jane"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_persisted_copy(self, directory, tmp_path):
+        await directory.load()
+
+        directory.invalidate()
+
+        assert len(directory) == 0
+        assert list(tmp_path.glob("*.json")) == []
+
+    @pytest.mark.asyncio
+    async def test_without_credentials_nothing_is_persisted(self, directory, auth_manager, tmp_path):
+        auth_manager.load_credentials.return_value = None
+
+        assert await directory.load()
+        assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.unit
+class TestCompleteUserLogins:
+    """Test the shell completion callback."""
+
+    def test_completes_from_directory(self):
+        ctx = Mock()
+        ctx.find_root.return_value.params = {"config": None}
+        with (
+            patch("youtrack_cli.auth.AuthManager") as auth_cls,
+            patch.object(UserDirectory, "_load_from_disk", return_value=False),
+            patch.object(UserDirectory, "load", new_callable=AsyncMock) as load,
+            patch.object(UserDirectory, "complete", return_value=[USERS[1]]),
+        ):
+            auth_cls.return_value.load_credentials.return_value = None
+            items = complete_user_logins(ctx, None, "ja")
+
+        load.assert_awaited_once()
+        assert [(item.value, item.help) for item in items] == [("Jane", "Jane Doe")]
+
+    def test_errors_yield_no_suggestions(self):
+        ctx = Mock()
+        ctx.find_root.side_effect = RuntimeError("boom")
+
+        assert complete_user_logins(ctx, None, "a") == []
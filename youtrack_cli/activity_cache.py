@@ -0,0 +1,99 @@
+"""On-disk cache of issue activity streams for incremental fetches."""
+
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .json_cache import JsonFileCache
+from .logging import get_logger
+
+__all__ = ["ACTIVITY_CACHE_MAX_AGE", "ActivityCache", "CachedActivities"]
+
+logger = get_logger(__name__)
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+#: Seconds an entry may go unused before ``ActivityCache.prune`` removes it.
+ACTIVITY_CACHE_MAX_AGE = 30 * 24 * 3600.0
+
+
+@dataclass
+class CachedActivities:
+    """Activities already fetched for one issue and the cursor to resume from."""
+
+    cursor: str | None = None
+    activities: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ActivityCache(JsonFileCache):
+    """Persist each issue's activities together with the ``afterCursor`` of the last page.
+
+    YouTrack's ``activitiesPage`` cursors stay valid across requests, so the
+    next run can pass the stored cursor and receive only activities created
+    since. Entries are grouped by scope (server, categories and fields), one
+    JSON file per issue, under ``~/.config/youtrack-cli/activities`` by
+    default. Unreadable files are treated as missing. Reading an entry marks
+    it as used; ``prune`` drops entries unused for ``max_age`` seconds, so
+    issues that are no longer reported on do not accumulate.
+    """
+
+    directory = "activities"
+    description = "activity cache entry"
+    file_pattern = "*/*.json"
+
+    def __init__(self, cache_dir: str | Path | None = None, max_age: float = ACTIVITY_CACHE_MAX_AGE):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files; defaults to the CLI config directory
+            max_age: Seconds an entry may go unused before it is pruned
+        """
+        super().__init__(cache_dir)
+        self.max_age = max_age
+
+    def _issue_path(self, scope: str, issue_id: str) -> Path:
+        return self.cache_dir / scope / f"{_UNSAFE_FILENAME_CHARS.sub('_', issue_id)}.json"
+
+    def load(self, scope: str, issue_id: str) -> CachedActivities:
+        """Return the cached activities for an issue, or an empty entry."""
+        path = self._issue_path(scope, issue_id)
+        entry = self._read(
+            path, lambda data: CachedActivities(cursor=data.get("cursor"), activities=list(data.get("activities", [])))
+        )
+        if entry is None:
+            return CachedActivities()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def save(self, scope: str, issue_id: str, entry: CachedActivities) -> None:
+        """Write an issue's entry, replacing the previous file atomically."""
+        self._write(self._issue_path(scope, issue_id), {"cursor": entry.cursor, "activities": entry.activities})
+
+    def prune(self) -> int:
+        """Delete entries unused for ``max_age`` seconds and return how many were removed."""
+        removed = 0
+        if not self.cache_dir.exists():
+            return removed
+        cutoff = time.time() - self.max_age
+        for path in self.cache_dir.glob(self.file_pattern):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        for scope_dir in self.cache_dir.iterdir():
+            try:
+                if scope_dir.is_dir() and not any(scope_dir.iterdir()):
+                    scope_dir.rmdir()
+            except OSError:
+                pass
+        if removed:
+            logger.debug("Pruned activity cache", removed=removed, cache_dir=str(self.cache_dir))
+        return removed
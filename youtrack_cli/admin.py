@@ -1,5 +1,6 @@
 """Administrative operations for YouTrack CLI."""
 
+import asyncio
 from typing import Any
 from urllib.parse import quote
 
@@ -11,6 +12,7 @@ from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
 from .custom_field_manager import CustomFieldManager
+from .endpoint_resolver import get_endpoint_resolver
 
 __all__ = ["AdminManager"]
 
@@ -182,11 +184,11 @@ class AdminManager:
                 "/api/admin/globalSettings/notificationSettings?fields=jabberSettings,emailSettings,mailProtocol",
             ]
 
-            all_settings = {}
             permission_errors = 0
             total_endpoints = len(endpoints_to_try)
 
-            for endpoint in endpoints_to_try:
+            async def fetch_category(endpoint: str) -> tuple[str, Any] | None:
+                nonlocal permission_errors
                 try:
                     response = await client_manager.make_request(
                         "GET",
@@ -194,14 +196,17 @@ class AdminManager:
                         headers=headers,
                         timeout=10.0,
                     )
-                    category_data = response.json()
                     category_name = endpoint.split("/")[-1].split("?")[0]  # Extract category name, remove query params
-                    all_settings[category_name] = category_data
+                    return category_name, response.json()
                 except httpx.HTTPError as e:
                     if hasattr(e, "response") and e.response is not None and e.response.status_code == 403:
                         permission_errors += 1
-                    # Continue trying other endpoints
-                    continue
+                    # Other categories are still returned
+                    return None
+
+            # The categories are independent, so all of them are requested at once
+            categories = await asyncio.gather(*(fetch_category(endpoint) for endpoint in endpoints_to_try))
+            all_settings = dict(category for category in categories if category is not None)
 
             if all_settings:
                 return {"status": "success", "data": all_settings}
@@ -411,51 +416,60 @@ class AdminManager:
             "Accept": "application/json",
         }
 
-        # List of endpoints to try, in order of preference
+        # Endpoints to try, in order of preference; all are requested at once
         endpoints = [
-            "/api/admin/globalSettings/systemSettings?fields=baseUrl,isApplicationReadOnly,maxUploadFileSize,maxExportItems,allowStatisticsCollection",
-            "/api/admin/globalSettings/systemSettings",
+            (
+                "system_settings_fields",
+                "/api/admin/globalSettings/systemSettings?fields=baseUrl,isApplicationReadOnly,"
+                "maxUploadFileSize,maxExportItems,allowStatisticsCollection",
+            ),
+            ("system_settings", "/api/admin/globalSettings/systemSettings"),
         ]
 
         client_manager = get_client_manager()
-        for endpoint in endpoints:
-            try:
-                response = await client_manager.make_request(
-                    "GET",
-                    f"{credentials.base_url.rstrip('/')}{endpoint}",
-                    headers=headers,
-                    timeout=10.0,
-                )
-
-                health_info = response.json()
-                return {"status": "success", "data": health_info}
 
+        async def fetch_health(url: str) -> Any:
+            try:
+                response = await client_manager.make_request("GET", url, headers=headers, timeout=10.0)
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
-                    continue  # Try next endpoint
-                if e.response.status_code == 403:
-                    return {
-                        "status": "error",
-                        "message": "Insufficient permissions for health check. "
-                        "Requires 'Low-level Admin Read' permission.",
-                    }
-                if e.response.status_code == 401:
-                    return {
-                        "status": "error",
-                        "message": "Authentication failed. Your token may have expired. Run 'yt auth login' again.",
-                    }
-                response_text = e.response.text if hasattr(e.response, "text") else str(e)
+                    return None  # Try next endpoint
+                raise
+            return response.json()
+
+        try:
+            resolved = await get_endpoint_resolver().resolve(
+                credentials.base_url,
+                "system_health",
+                [(pattern, f"{credentials.base_url.rstrip('/')}{endpoint}") for pattern, endpoint in endpoints],
+                fetch_health,
+            )
+            if resolved is not None:
+                return {"status": "success", "data": resolved[1]}
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 403:
                 return {
                     "status": "error",
-                    "message": f"HTTP {e.response.status_code}: {response_text}",
+                    "message": "Insufficient permissions for health check. Requires 'Low-level Admin Read' permission.",
                 }
-            except httpx.RequestError as e:
+            if e.response.status_code == 401:
                 return {
                     "status": "error",
-                    "message": f"Network error: {e}. Check your YouTrack URL and network connection.",
+                    "message": "Authentication failed. Your token may have expired. Run 'yt auth login' again.",
                 }
-            except Exception as e:
-                return {"status": "error", "message": f"Unexpected error: {e}"}
+            response_text = e.response.text if hasattr(e.response, "text") else str(e)
+            return {
+                "status": "error",
+                "message": f"HTTP {e.response.status_code}: {response_text}",
+            }
+        except httpx.RequestError as e:
+            return {
+                "status": "error",
+                "message": f"Network error: {e}. Check your YouTrack URL and network connection.",
+            }
+        except Exception as e:
+            return {"status": "error", "message": f"Unexpected error: {e}"}
 
         # If all endpoints failed with 404
         return {
@@ -10,7 +10,9 @@ from rich.tree import Tree
 from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
+from .endpoint_resolver import get_endpoint_resolver
 from .pagination import create_paginated_display
+from .plain_table import print_table
 
 __all__ = [
     "ArticleManager",
@@ -799,7 +801,7 @@ class ArticleManager:
                 str(visibility_display),
             )
 
-        self.console.print(table)
+        print_table(self.console, table)
 
     def display_articles_table_paginated(
         self, articles: list[dict[str, Any]], page_size: int = 50, show_all: bool = False, start_page: int = 1
@@ -1165,46 +1167,51 @@ class ArticleManager:
 
                 metadata = metadata_response.json()
 
-                # Try to get URL from metadata first
-                possible_urls = []
-
-                # Check if metadata provides URL fields
+                # Candidate download URLs in order of preference, starting with the one from metadata
+                candidates = []
                 if "url" in metadata:
                     url_from_meta = metadata["url"]
                     if url_from_meta.startswith("/"):
-                        possible_urls.append(f"{base_url}{url_from_meta}")
+                        candidates.append(("metadata_url", f"{base_url}{url_from_meta}"))
                     else:
-                        possible_urls.append(url_from_meta)
+                        candidates.append(("metadata_url", url_from_meta))
 
                 # Add standard URL patterns for article attachments
-                possible_urls.extend(
+                candidates.extend(
                     [
-                        f"{base_url}/api/files/{attachment_id}",
-                        f"{base_url}/files/{attachment_id}",
-                        f"{base_url}/api/articles/{article_id}/attachments/{attachment_id}/download",
-                        f"{base_url}/api/articles/{article_id}/attachments/{attachment_id}/content",
+                        ("api_files", f"{base_url}/api/files/{attachment_id}"),
+                        ("files", f"{base_url}/files/{attachment_id}"),
+                        ("download", f"{base_url}/api/articles/{article_id}/attachments/{attachment_id}/download"),
+                        ("content", f"{base_url}/api/articles/{article_id}/attachments/{attachment_id}/content"),
                     ]
                 )
+                possible_urls = [url for _, url in candidates]
 
-                for url_to_try in possible_urls:
+                async def fetch_content(url_to_try: str) -> Any:
                     content_response = await client.get(url=url_to_try, headers=headers, timeout=60.0)
-
-                    if content_response.status_code == 200:
-                        # Check if we got HTML instead of actual file content
-                        content_type = content_response.headers.get("content-type", "")
-                        if "text/html" in content_type:
-                            # This is likely the login page, try next URL
-                            continue
-
-                        return {
-                            "status": "success",
-                            "message": f"Attachment downloaded successfully using {url_to_try}",
-                            "data": {
-                                "metadata": metadata,
-                                "content": content_response.content,
-                                "filename": metadata.get("name", f"attachment_{attachment_id}"),
-                            },
-                        }
+                    if content_response.status_code != 200:
+                        return None
+                    # Check if we got HTML instead of actual file content
+                    if "text/html" in content_response.headers.get("content-type", ""):
+                        # This is likely the login page, try next URL
+                        return None
+                    return url_to_try, content_response
+
+                # Downloads are tried one at a time; the pattern that works is remembered for this server
+                resolved = await get_endpoint_resolver().resolve(
+                    base_url, "article_attachment_content", candidates, fetch_content, race=False
+                )
+                if resolved is not None:
+                    url_to_try, content_response = resolved[1]
+                    return {
+                        "status": "success",
+                        "message": f"Attachment downloaded successfully using {url_to_try}",
+                        "data": {
+                            "metadata": metadata,
+                            "content": content_response.content,
+                            "filename": metadata.get("name", f"attachment_{attachment_id}"),
+                        },
+                    }
 
                 # If none worked, return error
                 return {
@@ -26,6 +26,7 @@ from .config import ConfigManager
 from .console import get_console, get_error_console
 from .models import CredentialVerificationResult
 from .security import CredentialManager, SecurityConfig, TokenManager
+from .session import get_session_store
 
 __all__ = ["AuthConfig", "AuthManager", "warn_if_insecure_url"]
 
@@ -300,6 +301,9 @@ class AuthManager:
         config_manager.unset_config("YOUTRACK_CA_BUNDLE")
         config_manager.unset_config("YOUTRACK_API_KEY")
 
+        # A verified session must not outlive the credentials it vouches for
+        get_session_store().invalidate()
+
         # Reset the client manager to pick up new SSL settings
         reset_client_manager_sync()
 
@@ -401,9 +405,7 @@ class AuthManager:
             return None
 
         try:
-            verification_result = await self.verify_credentials(
-                credentials.base_url, credentials.token, verify_ssl=True
-            )
+            verification_result = await self.verify_session()
             if verification_result.status == "success":
                 return verification_result.username
         except Exception:
@@ -413,6 +415,35 @@ class AuthManager:
         # Fallback to stored username from credentials
         return credentials.username
 
+    async def verify_session(self, force: bool = False) -> CredentialVerificationResult:
+        """Verify the stored credentials unless they were verified recently.
+
+        A successful verification is recorded for ``YOUTRACK_SESSION_TTL``
+        seconds (15 minutes by default) and answers later calls from any
+        command without a request; a 401 response discards the record.
+
+        Args:
+            force: Ask the server even if a recent verification is recorded
+
+        Returns:
+            Verification result for the stored credentials
+        """
+        credentials = self.load_credentials()
+        if not credentials:
+            return CredentialVerificationResult(status="error", message="Not authenticated")
+
+        if not force:
+            session = get_session_store().get(credentials.base_url, credentials.token)
+            if session is not None:
+                return CredentialVerificationResult(
+                    status="success",
+                    username=session.username,
+                    full_name=session.full_name,
+                    email=session.email,
+                )
+
+        return await self.verify_credentials(credentials.base_url, credentials.token)
+
     async def verify_credentials(
         self, base_url: str, token: str, verify_ssl: bool | str = True
     ) -> CredentialVerificationResult:
@@ -469,12 +500,14 @@ class AuthManager:
                 response.raise_for_status()
 
                 user_data = response.json()
-                return CredentialVerificationResult(
+                result = CredentialVerificationResult(
                     status="success",
                     username=user_data.get("login", "Unknown"),
                     full_name=user_data.get("fullName", "Unknown"),
                     email=user_data.get("email", "Unknown"),
                 )
+                get_session_store().record(base_url, token, result.username, result.full_name, result.email)
+                return result
             except httpx.ConnectError as e:
                 return CredentialVerificationResult(
                     status="error",
@@ -482,6 +515,7 @@ class AuthManager:
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 401:
+                    get_session_store().invalidate()
                     return CredentialVerificationResult(
                         status="error", message="Invalid API token. Please check your token and try again."
                     )
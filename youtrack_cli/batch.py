@@ -57,6 +57,7 @@ class BatchIssueUpdate(BaseModel):
     type: str | None = Field(None, description="New issue type")
     priority: str | None = Field(None, description="New issue priority")
     assignee: str | None = Field(None, description="New assignee username")
+    tags: str | None = Field(None, description="Comma-separated tags to add")
 
     class Config:
         """Pydantic configuration."""
@@ -86,6 +87,50 @@ class BatchValidationError(Exception):
         super().__init__(message)
 
 
+# Update fields that map onto a YouTrack command, in the order commands are built.
+_COMMAND_FIELDS = (("state", "State"), ("type", "Type"), ("priority", "Priority"), ("assignee", "Assignee"))
+_BUILT_IN_UPDATE_FIELDS = {"issue_id", "summary", "description", "state", "type", "priority", "assignee", "tags"}
+
+
+def _command_token(value: str) -> str:
+    """Quote a command word for YouTrack, which uses braces for multi-word values."""
+    return f"{{{value}}}" if any(ch.isspace() for ch in value) else value
+
+
+def build_update_commands(item: BatchIssueUpdate) -> list[str] | None:
+    """Translate a batch update row into YouTrack command strings.
+
+    Every changed field becomes its own command (``State Fixed``,
+    ``Assignee jdoe``, ``tag release``) so identical changes on different
+    rows can be grouped into one request.
+
+    Returns:
+        List of commands, or None when the row changes summary or description,
+        which commands cannot set
+    """
+    if item.summary is not None or item.description is not None:
+        return None
+
+    values = item.model_dump()
+    commands = []
+    for key, field_name in _COMMAND_FIELDS:
+        if values.get(key) is not None:
+            commands.append(f"{field_name} {_command_token(str(values[key]))}")
+    for key, value in values.items():
+        if key not in _BUILT_IN_UPDATE_FIELDS and value is not None:
+            commands.append(f"{_command_token(key)} {_command_token(str(value))}")
+    commands.extend(_tag_commands(item.tags))
+    return commands
+
+
+def _split_tags(tags: str | None) -> list[str]:
+    return [tag.strip() for tag in (tags or "").split(",") if tag.strip()]
+
+
+def _tag_commands(tags: str | None) -> list[str]:
+    return [f"tag {_command_token(tag)}" for tag in _split_tags(tags)]
+
+
 class BatchOperationManager:
     """Manager for batch operations on YouTrack issues."""
 
@@ -349,21 +394,10 @@ class BatchOperationManager:
                         )
                         if not state_field_info:
                             # Get available fields for better error message
-                            from .services.projects import ProjectService
-
-                            project_service = ProjectService(self.auth_manager)
-                            fields_result = await project_service.get_project_custom_fields(
-                                project_id, "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)"
+                            available_fields = await self.issue_manager.issue_service._available_custom_fields(
+                                project_id
                             )
 
-                            available_fields = []
-                            if fields_result["status"] == "success":
-                                available_fields = [
-                                    f.get("field", {}).get("name", "")
-                                    for f in fields_result["data"]
-                                    if f.get("field", {}).get("name")
-                                ]
-
                             errors.append(
                                 {
                                     "item_index": i,
@@ -498,7 +532,7 @@ class BatchOperationManager:
                         # Extract custom fields from item (all fields except built-in ones)
                         built_in_fields = {"project_id", "summary", "description", "type", "priority", "assignee"}
                         custom_fields = {
-                            k: v for k, v in item.dict().items() if k not in built_in_fields and v is not None
+                            k: v for k, v in item.model_dump().items() if k not in built_in_fields and v is not None
                         }
 
                         # Actually create the issue
@@ -521,7 +555,7 @@ class BatchOperationManager:
                             result.failed += 1
                             error_info = {
                                 "item_index": i,
-                                "item_data": item.dict(),
+                                "item_data": item.model_dump(),
                                 "error": create_result["message"],
                                 "api_response": create_result,
                             }
@@ -535,7 +569,7 @@ class BatchOperationManager:
                     result.failed += 1
                     error_info = {
                         "item_index": i,
-                        "item_data": item.dict(),
+                        "item_data": item.model_dump(),
                         "error": str(e),
                         "exception_type": type(e).__name__,
                     }
@@ -590,21 +624,16 @@ class BatchOperationManager:
                         # For dry run, just simulate the operation
                         await asyncio.sleep(0.01)  # Small delay to show progress
                         result.successful += 1
-                        updates = [f"{k}={v}" for k, v in item.dict().items() if v is not None and k != "issue_id"]
+                        updates = [
+                            f"{k}={v}" for k, v in item.model_dump().items() if v is not None and k != "issue_id"
+                        ]
                         logger.info(f"[DRY RUN] Would update issue {item.issue_id}: {', '.join(updates)}")
                     else:
                         # Extract custom fields from item (all fields except built-in ones)
-                        built_in_fields = {
-                            "issue_id",
-                            "summary",
-                            "description",
-                            "state",
-                            "type",
-                            "priority",
-                            "assignee",
-                        }
                         custom_fields = {
-                            k: v for k, v in item.dict().items() if k not in built_in_fields and v is not None
+                            k: v
+                            for k, v in item.model_dump().items()
+                            if k not in _BUILT_IN_UPDATE_FIELDS and v is not None
                         }
 
                         # Actually update the issue
@@ -619,6 +648,12 @@ class BatchOperationManager:
                             custom_fields=custom_fields if custom_fields else None,
                         )
 
+                        # Tags are not issue fields; add them one by one once the fields are updated
+                        for tag in _split_tags(item.tags):
+                            if update_result["status"] != "success":
+                                break
+                            update_result = await self.issue_manager.add_tag(item.issue_id, tag)
+
                         if update_result["status"] == "success":
                             result.successful += 1
                             logger.info(f"Updated issue {item.issue_id}")
@@ -626,7 +661,7 @@ class BatchOperationManager:
                             result.failed += 1
                             error_info = {
                                 "item_index": i,
-                                "item_data": item.dict(),
+                                "item_data": item.model_dump(),
                                 "error": update_result["message"],
                                 "api_response": update_result,
                             }
@@ -640,7 +675,7 @@ class BatchOperationManager:
                     result.failed += 1
                     error_info = {
                         "item_index": i,
-                        "item_data": item.dict(),
+                        "item_data": item.model_dump(),
                         "error": str(e),
                         "exception_type": type(e).__name__,
                     }
@@ -655,6 +690,126 @@ class BatchOperationManager:
         result.duration_seconds = time.time() - start_time
         return result
 
+    async def batch_update_issues_bulk(
+        self,
+        items: list[BatchIssueUpdate],
+        dry_run: bool = False,
+        continue_on_error: bool = True,
+        chunk_size: int = 100,
+        max_concurrent: int = 4,
+    ) -> BatchOperationResult:
+        """Batch update issues through YouTrack's commands endpoint.
+
+        Rows are split into single-field commands and issues receiving the
+        same command are updated together, ``chunk_size`` issues per request,
+        so closing thousands of issues takes a handful of requests. Rows that
+        change summary or description go through ``batch_update_issues``.
+        A rejected chunk is retried issue by issue so each failure is reported
+        against its own row.
+
+        Args:
+            items: List of validated issue update data
+            dry_run: If True, report the planned commands but don't execute them
+            continue_on_error: If True, keep applying commands after a failure
+            chunk_size: Maximum number of issues per command request
+            max_concurrent: Maximum concurrent command requests
+
+        Returns:
+            BatchOperationResult with operation results
+        """
+        import time
+
+        start_time = time.time()
+
+        result = BatchOperationResult(operation="update", total_items=len(items), dry_run=dry_run)
+
+        if not items:
+            return result
+
+        groups: dict[str, list[int]] = {}
+        field_updates: list[tuple[int, BatchIssueUpdate]] = []
+        item_errors: dict[int, list[str]] = {}
+        processed: set[int] = set()
+        for i, item in enumerate(items):
+            commands = build_update_commands(item)
+            if commands is None:
+                # Summary and description need a field update; the row's tags still go through commands
+                field_updates.append((i, item))
+                commands = _tag_commands(item.tags)
+            elif not commands:
+                item_errors[i] = ["No fields to update"]
+                processed.add(i)
+            for command in commands:
+                groups.setdefault(command, []).append(i)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("•"),
+            TimeElapsedColumn(),
+            console=self.console,
+            transient=False,
+        ) as progress:
+            task = progress.add_task(
+                f"{'[DRY RUN] ' if dry_run else ''}Applying {len(groups)} command(s)...",
+                total=sum(len(indices) for indices in groups.values()),
+            )
+
+            for command, indices in groups.items():
+                if item_errors and not continue_on_error:
+                    break
+                issue_ids = [items[i].issue_id for i in indices]
+                if dry_run:
+                    logger.info(f"[DRY RUN] Would apply '{command}' to {len(issue_ids)} issue(s)")
+                else:
+                    command_result = await self.issue_manager.apply_command(
+                        command, issue_ids, chunk_size=chunk_size, max_concurrent=max_concurrent
+                    )
+                    if command_result["status"] == "error" and not command_result.get("errors"):
+                        command_errors = dict.fromkeys(issue_ids, command_result["message"])
+                    else:
+                        command_errors = command_result.get("errors", {})
+                    for i in indices:
+                        error = command_errors.get(items[i].issue_id)
+                        if error:
+                            item_errors.setdefault(i, []).append(f"{command}: {error}")
+                    logger.info(
+                        f"Applied '{command}' to {len(issue_ids) - len(command_errors)} of {len(issue_ids)} issue(s)"
+                    )
+
+                processed.update(indices)
+                progress.update(task, advance=len(indices))
+
+        field_errors: dict[int, dict[str, Any]] = {}
+        if field_updates and (continue_on_error or not item_errors):
+            field_result = await self.batch_update_issues(
+                [item.model_copy(update={"tags": None}) for _, item in field_updates],
+                dry_run=dry_run,
+                continue_on_error=continue_on_error,
+            )
+            # Rows are updated in order, so the attempted ones are a prefix of field_updates
+            attempted = field_result.successful + field_result.failed
+            processed.update(i for i, _ in field_updates[:attempted])
+            for error in field_result.errors:
+                field_errors[field_updates[error["item_index"]][0]] = error
+
+        # Every row is counted once, whether it went through commands, a field update or both
+        for i in sorted(processed):
+            if i not in item_errors and i not in field_errors:
+                result.successful += 1
+                continue
+            result.failed += 1
+            error_info = dict(field_errors.get(i) or {"item_data": items[i].model_dump()})
+            error_info["item_index"] = i
+            messages: list[str] = [str(error_info["error"])] if "error" in error_info else []
+            error_info["error"] = "; ".join(messages + item_errors.get(i, []))
+            result.errors.append(error_info)
+
+        result.duration_seconds = time.time() - start_time
+        return result
+
     async def rollback_created_issues(self, issue_ids: list[str]) -> int:
         """Rollback (delete) created issues.
 
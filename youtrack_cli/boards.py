@@ -1,16 +1,48 @@
 """Board management for YouTrack CLI."""
 
+import asyncio
 from typing import Any
 
 import httpx
+from rich.markup import escape
 from rich.table import Table
 
 from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
+from .sprint_cache import SprintSnapshotCache
+from .utils import format_timestamp
 
 __all__ = ["BoardManager"]
 
+#: Board fields a snapshot needs: the current sprint, the column mapping and the swimlane settings.
+BOARD_SNAPSHOT_FIELDS = (
+    "id,name,currentSprint(id,name,goal,start,finish,archived),sprintsSettings(disableSprints),"
+    "columnSettings(field(name),columns(id,presentation,fieldValues(name))),"
+    "swimlaneSettings($type,enabled,field(name),values(name))"
+)
+SPRINT_FIELDS = "id,name,goal,start,finish,archived"
+
+#: Issue fields of a snapshot; only the custom fields named in the request are returned.
+SNAPSHOT_ISSUE_FIELDS = "idReadable,summary,customFields(name,value(name,login,fullName))"
+
+DEFAULT_SNAPSHOT_COLUMN_LIMIT = 50
+
+
+def _braced(value: str) -> str:
+    """Quote a name for the YouTrack query language."""
+    return f"{{{value}}}"
+
+
+def _field_display(value: Any) -> str | None:
+    """Render a custom field value (enum, user, or a list of them) as text."""
+    if isinstance(value, list):
+        names = [name for name in (_field_display(item) for item in value) if name]
+        return ", ".join(names) or None
+    if isinstance(value, dict):
+        return value.get("name") or value.get("fullName") or value.get("login")
+    return str(value) if value is not None else None
+
 
 class BoardManager:
     """Manages YouTrack agile boards operations."""
@@ -19,16 +51,6 @@ class BoardManager:
         self.auth_manager = auth_manager
         self.console = get_console()
 
-    async def _validate_authentication(self) -> bool:
-        """Validate authentication before making API calls."""
-        credentials = self.auth_manager.load_credentials()
-        if not credentials:
-            return False
-
-        # Basic check - if we have credentials, assume they might be valid
-        # Full validation will happen during the actual API call
-        return bool(credentials.base_url and credentials.token)
-
     def _parse_json_response(self, response: httpx.Response) -> Any:
         """Safely parse JSON response, handling empty or non-JSON responses."""
         try:
@@ -60,13 +82,6 @@ class BoardManager:
         if not credentials:
             return {"status": "error", "message": "Not authenticated"}
 
-        # Validate authentication before making the API call
-        if not await self._validate_authentication():
-            return {
-                "status": "error",
-                "message": "Authentication failed. Please check your credentials with 'yt auth login'.",
-            }
-
         url = f"{credentials.base_url.rstrip('/')}/api/agiles"
         headers = {
             "Authorization": f"Bearer {credentials.token}",
@@ -227,3 +242,196 @@ class BoardManager:
             error_msg = str(e)
             self.console.print(f"❌ Error updating board: {error_msg}", style="red")
             return {"status": "error", "message": error_msg}
+
+    async def get_board_snapshot(
+        self,
+        board_id: str,
+        sprint: str | None = None,
+        limit: int = DEFAULT_SNAPSHOT_COLUMN_LIMIT,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Fetch the contents of a board: its sprint, columns and the issues in each column.
+
+        One request reads the board with its column and swimlane settings, then
+        the issues of all columns are queried concurrently, each returning only
+        the issue ID, summary, assignee and swimlane field. Snapshots of
+        archived sprints never change and are kept on disk, so showing one
+        again costs only the board request.
+
+        Args:
+            board_id: Board ID
+            sprint: Sprint name or ID; defaults to the board's current sprint
+            limit: Maximum number of issues fetched per column
+            use_cache: Reuse and update the on-disk cache of archived sprints
+
+        Returns:
+            Dictionary with ``status`` and the ``snapshot``
+        """
+        credentials = self.auth_manager.load_credentials()
+        if not credentials:
+            return {"status": "error", "message": "Not authenticated"}
+
+        base_url = credentials.base_url.rstrip("/")
+        headers = {
+            "Authorization": f"Bearer {credentials.token}",
+            "Accept": "application/json",
+        }
+        fields = BOARD_SNAPSHOT_FIELDS
+        if sprint:
+            fields += f",sprints({SPRINT_FIELDS})"
+
+        try:
+            client_manager = get_client_manager()
+            response = await client_manager.make_request(
+                "GET", f"{base_url}/api/agiles/{board_id}", headers=headers, params={"fields": fields}
+            )
+            board = self._parse_json_response(response)
+
+            if sprint:
+                selected = next(
+                    (item for item in board.get("sprints") or [] if sprint in (item.get("id"), item.get("name"))),
+                    None,
+                )
+                if selected is None:
+                    return {"status": "error", "message": f"Sprint '{sprint}' not found on board '{board_id}'"}
+            else:
+                selected = board.get("currentSprint")
+
+            cache = SprintSnapshotCache() if use_cache else None
+            scope = SprintSnapshotCache.scope(base_url, board.get("id") or board_id)
+            archived = bool(selected and selected.get("archived") and selected.get("id"))
+            if cache and archived:
+                cached = cache.get(scope, selected["id"])
+                if cached is not None:
+                    return {"status": "success", "snapshot": {**cached, "cached": True}}
+
+            column_settings = board.get("columnSettings") or {}
+            column_field = (column_settings.get("field") or {}).get("name")
+            swimlane_settings = board.get("swimlaneSettings") or {}
+            swimlane_field = None
+            # Swimlanes by parent issue have no attribute to group by and are shown as one lane
+            if swimlane_settings.get("enabled") and swimlane_settings.get("$type") == "AttributeBasedSwimlaneSettings":
+                swimlane_field = (swimlane_settings.get("field") or {}).get("name")
+
+            board_query = f"Board {_braced(board.get('name', board_id))}"
+            if selected and selected.get("name"):
+                board_query += f": {_braced(selected['name'])}"
+            issue_params: dict[str, Any] = {
+                "fields": SNAPSHOT_ISSUE_FIELDS,
+                "$top": limit,
+                "customFields": [name for name in ("Assignee", swimlane_field) if name],
+            }
+
+            async def fetch_column(column: dict[str, Any]) -> dict[str, Any]:
+                values = [value["name"] for value in column.get("fieldValues") or [] if value.get("name")]
+                entry: dict[str, Any] = {
+                    "id": column.get("id"),
+                    "name": column.get("presentation") or ", ".join(values),
+                    "issues": [],
+                    "truncated": False,
+                }
+                if not column_field or not values:
+                    return entry
+                query = f"{board_query} {_braced(column_field)}: {', '.join(_braced(value) for value in values)}"
+                column_response = await client_manager.make_request(
+                    "GET", f"{base_url}/api/issues", headers=headers, params={**issue_params, "query": query}
+                )
+                issues = self._parse_json_response(column_response)
+                entry["issues"] = [
+                    {
+                        "id": issue.get("idReadable"),
+                        "summary": issue.get("summary", ""),
+                        "fields": {
+                            field["name"]: _field_display(field.get("value"))
+                            for field in issue.get("customFields") or []
+                            if field.get("name")
+                        },
+                    }
+                    for issue in issues
+                ]
+                entry["truncated"] = len(issues) >= limit
+                return entry
+
+            columns = await asyncio.gather(*(fetch_column(column) for column in column_settings.get("columns") or []))
+
+            snapshot = {
+                "board": {"id": board.get("id", board_id), "name": board.get("name", board_id)},
+                "sprint": selected,
+                "column_field": column_field,
+                "swimlane_field": swimlane_field,
+                "swimlanes": [value.get("name") for value in swimlane_settings.get("values") or [] if value.get("name")]
+                if swimlane_field
+                else [],
+                "columns": list(columns),
+                "cached": False,
+            }
+            if cache and archived and not any(column["truncated"] for column in columns):
+                cache.set(scope, selected["id"], snapshot)
+            return {"status": "success", "snapshot": snapshot}
+
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+            self.console.print(f"❌ Error fetching board snapshot: {error_msg}", style="red")
+            return {"status": "error", "message": error_msg}
+        except Exception as e:
+            error_msg = str(e)
+            self.console.print(f"❌ Error fetching board snapshot: {error_msg}", style="red")
+            return {"status": "error", "message": error_msg}
+
+    def display_board_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Render a board snapshot as one table per swimlane with a column per board column."""
+        board = snapshot.get("board", {})
+        sprint = snapshot.get("sprint")
+        title = f"Board: {board.get('name', 'N/A')}"
+        if sprint:
+            title += f" — {sprint.get('name', 'N/A')}"
+            if sprint.get("start") or sprint.get("finish"):
+                start = format_timestamp(sprint.get("start"))[:10]
+                finish = format_timestamp(sprint.get("finish"))[:10]
+                title += f" ({start} → {finish})"
+            if sprint.get("archived"):
+                title += " [archived]"
+        self.console.print(title, style="bold")
+        if sprint and sprint.get("goal"):
+            self.console.print(f"Goal: {sprint['goal']}", style="dim")
+
+        columns = snapshot.get("columns", [])
+        swimlane_field = snapshot.get("swimlane_field")
+        lanes: list[str | None] = [None]
+        if swimlane_field:
+            found = {issue["fields"].get(swimlane_field) for column in columns for issue in column["issues"]}
+            lanes = [lane for lane in snapshot.get("swimlanes", []) if lane in found]
+            lanes += sorted(lane for lane in found if lane and lane not in lanes)
+            if None in found:
+                lanes.append(None)
+
+        for lane in lanes:
+            if swimlane_field:
+                lane_title = lane if lane is not None else f"No {swimlane_field}"
+            else:
+                lane_title = None
+            table = Table(title=lane_title, show_lines=False)
+            cells = []
+            for column in columns:
+                issues = [
+                    issue
+                    for issue in column["issues"]
+                    if not swimlane_field or issue["fields"].get(swimlane_field) == lane
+                ]
+                count = f"{len(issues)}+" if column.get("truncated") and not swimlane_field else str(len(issues))
+                table.add_column(f"{column['name']} ({count})", style="cyan", overflow="fold")
+                lines = []
+                for issue in issues:
+                    line = f"{issue['id']} {escape(issue['summary'][:40])}"
+                    assignee = issue["fields"].get("Assignee")
+                    if assignee:
+                        line += f" [dim]@{escape(assignee)}[/dim]"
+                    lines.append(line)
+                cells.append("\n".join(lines))
+            table.add_row(*cells)
+            self.console.print(table)
+
+        if any(column.get("truncated") for column in columns):
+            self.console.print("Some columns have more issues than shown; use --limit to show more", style="yellow")
+        if snapshot.get("cached"):
+            self.console.print("Archived sprint read from the local cache", style="dim")
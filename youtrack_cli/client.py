@@ -37,6 +37,7 @@ from .exceptions import (
 )
 from .logging import get_logger, log_api_call
 from .models import CachedResponse
+from .session import get_session_store
 
 __all__ = [
     "HTTPClientManager",
@@ -189,6 +190,11 @@ class HTTPClientManager:
             await self._client.aclose()
             logger.debug("HTTP client closed")
 
+    async def close_loop_client(self) -> None:
+        """Close the HTTP client if it is bound to the running event loop."""
+        if self._client_loop is asyncio.get_running_loop():
+            await self.close()
+
     async def make_request(
         self,
         method: str,
@@ -270,6 +276,8 @@ class HTTPClientManager:
                                     headers["Authorization"] = f"Bearer {credentials.token}"
                                 # Retry the request with new token (don't count as a retry attempt)
                                 continue
+                        # The token is no longer accepted, so a recorded verification must not vouch for it
+                        get_session_store().invalidate()
                         raise AuthenticationError("Invalid credentials or token expired")
                     if response.status_code == 403:
                         raise PermissionError("access this resource")
@@ -94,6 +94,72 @@ def show_board(
         raise click.ClickException("Failed to view board") from e
 
 
+@boards.command(name="snapshot")
+@click.argument("board_id")
+@click.option("--sprint", "-s", help="Sprint name or ID (defaults to the current sprint)")
+@click.option(
+    "--limit",
+    "-l",
+    type=click.IntRange(min=1),
+    default=50,
+    show_default=True,
+    help="Maximum number of issues per column",
+)
+@click.option("--no-cache", is_flag=True, help="Fetch archived sprints again instead of reusing the local cache")
+@click.option(
+    "--format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Output format",
+)
+@click.pass_context
+def snapshot_board(
+    ctx: click.Context,
+    board_id: str,
+    sprint: str | None,
+    limit: int,
+    no_cache: bool,
+    format: str,
+) -> None:
+    """Show the issues on a board, by column and swimlane, for a sprint.
+
+    Fetches the board and the issues of all its columns concurrently, so a
+    snapshot costs one request plus one per column. Snapshots of archived
+    sprints are cached locally.
+
+    Examples:
+        # Current sprint of a board
+        yt boards snapshot 108-2
+
+        # A past sprint as JSON
+        yt boards snapshot 108-2 --sprint "Sprint 12" --format json
+    """
+    from ..boards import BoardManager
+
+    console = get_console()
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    board_manager = BoardManager(auth_manager)
+
+    print_status(f"📸 Fetching snapshot of board {board_id}...", output_format=format)
+
+    try:
+        result = asyncio.run(
+            board_manager.get_board_snapshot(board_id, sprint=sprint, limit=limit, use_cache=not no_cache)
+        )
+
+        if result["status"] == "success":
+            if format == "json":
+                console.print_json(data=result["snapshot"])
+            else:
+                board_manager.display_board_snapshot(result["snapshot"])
+        else:
+            console.print(f"❌ {result['message']}", style="red")
+            raise click.ClickException(result["message"])
+    except Exception as e:
+        console.print(f"❌ Error: {str(e)}", style="red")
+        raise click.ClickException("Failed to fetch board snapshot") from e
+
+
 @boards.command(name="view", hidden=True)
 @click.argument("board_id")
 @click.option(
@@ -8,6 +8,7 @@ and validation to ensure data integrity.
 """
 
 import asyncio
+import sys
 from pathlib import Path
 
 import click
@@ -15,6 +16,7 @@ import click
 from ..auth import AuthManager
 from ..cli_utils import AliasedGroup, validate_issue_id_format, validate_project_id_format
 from ..console import get_console, print_status
+from ..user_directory import complete_user_logins
 
 
 def _format_issues_as_csv(issues):
@@ -127,6 +129,20 @@ def _format_attachments_as_csv(attachments):
     return output.getvalue()
 
 
+def _collect_issue_ids(issue_ids: tuple[str, ...]) -> list[str]:
+    """Return issue IDs from the arguments, or from stdin (one per line) when none are given."""
+    import sys
+
+    ids = list(issue_ids)
+    if not ids and not sys.stdin.isatty():
+        ids = [line.strip() for line in sys.stdin if line.strip()]
+    if not ids:
+        raise click.ClickException(
+            "No issue IDs provided. Pass one or more IDs as arguments or pipe them via stdin (one per line)."
+        )
+    return ids
+
+
 def show_issues_verbose_help(ctx):
     """Show comprehensive help for the issues command group."""
     from rich.console import Console
@@ -300,6 +316,7 @@ def issues() -> None:
 @click.option(
     "--assignee",
     "-a",
+    shell_complete=complete_user_logins,
     help="Assignee username",
 )
 @click.option(
@@ -439,6 +456,7 @@ def create(
 @click.option(
     "--assignee",
     "-a",
+    shell_complete=complete_user_logins,
     help="Filter by assignee",
 )
 @click.option(
@@ -488,15 +506,22 @@ def create(
 )
 @click.option(
     "--format",
-    type=click.Choice(["table", "json", "ndjson"]),
+    type=click.Choice(["table", "json", "ndjson", "csv"]),
     default="table",
-    help="Output format. 'ndjson' streams one JSON issue per line as pages arrive "
-    "(bounded memory, pipe-friendly for large/whole-project fetches).",
+    help="Output format. 'csv' and 'ndjson' stream rows as pages arrive "
+    "(bounded memory, pipe-friendly for large/whole-project fetches); 'json' "
+    "streams too when combined with --all, --max-results or --output.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write csv/json/ndjson output to this file instead of stdout",
 )
 @click.option(
     "--paginated",
     is_flag=True,
-    help="Use interactive pagination for table display",
+    help="Use interactive pagination for table display. Pages are fetched from the server as you navigate.",
 )
 @click.option(
     "--display-page-size",
@@ -531,6 +556,7 @@ def list_issues(
     max_results: int | None,
     query: str | None,
     format: str,
+    output: str | None,
     paginated: bool,
     display_page_size: int,
     show_all: bool,
@@ -554,6 +580,9 @@ def list_issues(
         # List issues with JSON output for automation
         yt issues list --format json --page-size 50
 
+        # Export a whole project to CSV without buffering it in memory
+        yt issues list --project-id WEB --all --format csv --output web.csv
+
     Tip: For complex filtering, use --query with YouTrack's search syntax.
     Most users only need --project-id, --assignee, and --state options.
     """
@@ -563,6 +592,9 @@ def list_issues(
     auth_manager = AuthManager(ctx.obj.get("config"))
     issue_manager = IssueManager(auth_manager)
 
+    if output and format == "table":
+        raise click.UsageError("--output requires --format csv, json or ndjson")
+
     print_status("🔍 Fetching issues...", output_format=format)
 
     try:
@@ -577,30 +609,52 @@ def list_issues(
                 style="yellow",
             )
 
-        if format == "ndjson":
-            # Stream one JSON issue per line as pages arrive, so a large/whole-project
-            # fetch uses bounded memory and can be piped incrementally (#727).
-            import json
-
-            async def _stream_ndjson() -> int:
-                count = 0
-                async for issue in issue_manager.stream_list_issues(
-                    project_id=project_id,
-                    fields=fields,
-                    field_profile=profile,
-                    page_size=page_size,
-                    top=top,
-                    max_results=max_results,
-                    query=query,
-                    state=state,
-                    assignee=assignee,
-                ):
-                    click.echo(json.dumps(issue))
-                    count += 1
-                return count
+        # csv and ndjson always stream; json streams for large or file-bound
+        # fetches. Rows are written as pages arrive so memory stays bounded by
+        # the page size (#727). Cursor-based paging keeps the buffered path.
+        streaming = format == "ndjson" or (
+            format in ("csv", "json")
+            and not (after_cursor or before_cursor)
+            and (format == "csv" or bool(all or max_results or output))
+        )
+        if streaming:
+            stream_filters = {
+                "project_id": project_id,
+                "fields": fields,
+                "field_profile": profile,
+                "page_size": page_size,
+                "top": top,
+                "max_results": max_results,
+                "query": query,
+                "state": state,
+                "assignee": assignee,
+            }
+            if output:
+                with open(output, "w", encoding="utf-8", newline="") as stream:
+                    emitted = asyncio.run(issue_manager.write_issues(stream, format, **stream_filters))
+                print_status(f"Wrote {emitted} issues to {output}", output_format=format, style="green")
+            else:
+                emitted = asyncio.run(issue_manager.write_issues(sys.stdout, format, **stream_filters))
+                print_status(f"Streamed {emitted} issues", output_format=format, style="dim")
+            return
 
-            emitted = asyncio.run(_stream_ndjson())
-            print_status(f"Streamed {emitted} issues", output_format=format, style="dim")
+        if format == "table" and paginated and not (after_cursor or before_cursor):
+            # Fetch one display page per request as the user navigates, instead
+            # of downloading the whole result set before showing page 1.
+            source = issue_manager.issue_page_source(
+                project_id=project_id,
+                fields=fields,
+                field_profile=profile,
+                query=query,
+                state=state,
+                assignee=assignee,
+                page_size=display_page_size,
+                max_results=top if top is not None else max_results,
+            )
+            try:
+                issue_manager.display_issues_table_paginated(source, show_all=show_all, start_page=start_page)
+            finally:
+                source.close()
             return
 
         result = asyncio.run(
@@ -617,6 +671,7 @@ def list_issues(
                 query=query,
                 state=state,
                 assignee=assignee,
+                format_output=format,
             )
         )
 
@@ -646,14 +701,21 @@ def list_issues(
                                     f" [dim]prev: --before-cursor {pagination['before_cursor']}[/dim]", end=""
                                 )
                             console.print()
-            elif format == "csv":
-                # Convert issues to CSV format
-                csv_output = _format_issues_as_csv(issues)
-                console.print(csv_output)
             else:
-                import json
-
-                click.echo(json.dumps(issues, indent=2))
+                if format == "csv":
+                    # Convert issues to CSV format
+                    text = _format_issues_as_csv(issues)
+                else:
+                    import json
+
+                    text = json.dumps(issues, indent=2) + "\n"
+                if output:
+                    # Cursor-based pages are buffered, but --output still applies
+                    with open(output, "w", encoding="utf-8", newline="") as stream:
+                        stream.write(text)
+                    print_status(f"Wrote {len(issues)} issues to {output}", output_format=format, style="green")
+                else:
+                    click.echo(text, nl=False)
         else:
             console.print(f"❌ {result['message']}", style="red")
             raise click.ClickException("Failed to list issues")
@@ -687,6 +749,7 @@ def list_issues(
 @click.option(
     "--assignee",
     "-a",
+    shell_complete=complete_user_logins,
     help="New assignee username",
 )
 @click.option(
@@ -943,6 +1006,7 @@ def search(
                 before_cursor=before_cursor,
                 use_pagination=use_pagination,
                 max_results=max_results,
+                format_output=format,
             )
         )
 
@@ -976,9 +1040,174 @@ def search(
         raise click.ClickException("Failed to search issues") from e
 
 
+@issues.command()
+@click.option(
+    "--project-id",
+    "-p",
+    help="Filter by project ID",
+)
+@click.option(
+    "--state",
+    "-s",
+    help="Filter by issue state",
+)
+@click.option(
+    "--assignee",
+    "-a",
+    shell_complete=complete_user_logins,
+    help="Filter by assignee",
+)
+@click.option(
+    "--query",
+    "-q",
+    help="Advanced query filter",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format",
+)
+@click.pass_context
+def count(
+    ctx: click.Context,
+    project_id: str | None,
+    state: str | None,
+    assignee: str | None,
+    query: str | None,
+    format: str,
+) -> None:
+    """Count issues matching the filters without fetching them."""
+    from ..managers.issues import IssueManager
+
+    console = get_console()
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    issue_manager = IssueManager(auth_manager)
+
+    try:
+        result = asyncio.run(
+            issue_manager.count_issues(project_id=project_id, query=query, state=state, assignee=assignee)
+        )
+    except Exception as e:
+        console.print(f"❌ Error counting issues: {e}", style="red")
+        raise click.ClickException("Failed to count issues") from e
+
+    if result["status"] != "success":
+        console.print(f"❌ {result['message']}", style="red")
+        raise click.ClickException("Failed to count issues")
+
+    if format == "json":
+        import json
+
+        click.echo(json.dumps(result["data"], indent=2))
+    else:
+        click.echo(result["data"]["count"])
+
+
+@issues.command()
+@click.option(
+    "--query",
+    "-q",
+    help="YouTrack query to watch (without 'sort by')",
+)
+@click.option(
+    "--project-id",
+    "-p",
+    help="Filter by project ID",
+)
+@click.option(
+    "--fields",
+    "-f",
+    help="Comma-separated list of fields to include in events",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=1.0),
+    default=30.0,
+    help="Seconds between polls while changes arrive (default: 30)",
+)
+@click.option(
+    "--max-interval",
+    type=click.FloatRange(min=1.0),
+    default=300.0,
+    help="Longest wait between polls when idle (default: 300)",
+)
+@click.option(
+    "--emit-existing",
+    is_flag=True,
+    help="Emit a 'new' event for every issue that matches when the watch starts",
+)
+@click.option(
+    "--max-polls",
+    type=click.IntRange(min=0),
+    help="Stop after this many polls (default: run until interrupted)",
+)
+@click.pass_context
+def watch(
+    ctx: click.Context,
+    query: str | None,
+    project_id: str | None,
+    fields: str | None,
+    interval: float,
+    max_interval: float,
+    emit_existing: bool,
+    max_polls: int | None,
+) -> None:
+    """Watch a query and print changes as NDJSON events.
+
+    Each line is a JSON object with an ``event`` of ``new``, ``updated`` or
+    ``left-query``, the issue ``id``, its ``updated`` timestamp and the
+    ``issue`` itself. Polls fetch only issues updated since the previous
+    poll, and the interval backs off while nothing changes.
+
+    Examples:
+        # Stream changes to open bugs
+        yt issues watch -q "type: Bug #Unresolved"
+
+        # Poll a project every 10 seconds at most
+        yt issues watch -p WEB --interval 10
+    """
+    from ..client import get_client_manager
+    from ..issue_watch import IssueWatcher
+    from ..managers.issues import IssueManager
+
+    if not query and not project_id:
+        raise click.UsageError("Specify --query and/or --project-id to watch.")
+
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    issue_manager = IssueManager(auth_manager)
+    full_query = f"project: {project_id} {query or ''}".strip() if project_id else (query or "")
+    watcher = IssueWatcher(
+        issue_manager.issue_service,
+        full_query,
+        fields=fields,
+        interval=interval,
+        max_interval=max_interval,
+    )
+
+    async def run_watch() -> None:
+        # One event loop for the whole watch keeps the pooled HTTP connections
+        # alive between polls.
+        try:
+            async for event in watcher.watch(emit_existing=emit_existing, max_polls=max_polls):
+                click.echo(event.to_json())
+                sys.stdout.flush()
+        finally:
+            await get_client_manager().close()
+
+    print_status(f"👀 Watching '{full_query}' (Ctrl+C to stop)...", output_format="ndjson")
+    try:
+        asyncio.run(run_watch())
+    except KeyboardInterrupt:
+        print_status("Stopped watching.", output_format="ndjson")
+    except Exception as e:
+        print_status(f"❌ Error watching issues: {e}", output_format="ndjson", style="red")
+        raise click.ClickException("Failed to watch issues") from e
+
+
 @issues.command()
 @click.argument("issue_id")
-@click.argument("assignee")
+@click.argument("assignee", shell_complete=complete_user_logins)
 @click.pass_context
 def assign(ctx: click.Context, issue_id: str, assignee: str) -> None:
     """Assign an issue to a user.
@@ -1006,10 +1235,8 @@ def assign(ctx: click.Context, issue_id: str, assignee: str) -> None:
         try:
             credentials = auth_manager.load_credentials()
             if credentials:
-                # Try to get current user from API to ensure we have the latest info
-                verification_result = asyncio.run(
-                    auth_manager.verify_credentials(credentials.base_url, credentials.token)
-                )
+                # Ask the API unless the token was verified recently
+                verification_result = asyncio.run(auth_manager.verify_session())
                 if (
                     verification_result.status == "success"
                     and verification_result.username
@@ -1368,20 +1595,12 @@ def list_issue_comments(
         yt issues comments list ISSUE-123 ISSUE-456
         cat issues.txt | yt issues comments list
     """
-    import sys
-
     from ..comment_query import QueryError, filter_comments
     from ..managers.issues import IssueManager
 
     console = get_console()
 
-    ids = list(issue_ids)
-    if not ids and not sys.stdin.isatty():
-        ids = [line.strip() for line in sys.stdin if line.strip()]
-    if not ids:
-        raise click.ClickException(
-            "No issue IDs provided. Pass one or more IDs as arguments or pipe them via stdin (one per line)."
-        )
+    ids = _collect_issue_ids(issue_ids)
 
     auth_manager = AuthManager(ctx.obj.get("config"))
     issue_manager = IssueManager(auth_manager)
@@ -1827,7 +2046,7 @@ def types(ctx: click.Context, format: str) -> None:
 
 
 @issues.command()
-@click.argument("issue_id")
+@click.argument("issue_ids", nargs=-1)
 @click.option(
     "--format",
     type=click.Choice(["table", "panel"], case_sensitive=False),
@@ -1835,21 +2054,42 @@ def types(ctx: click.Context, format: str) -> None:
     help="Output format for issue details (table or panel)",
 )
 @click.pass_context
-def show(ctx: click.Context, issue_id: str, format: str) -> None:
-    """Show detailed information about an issue."""
+def show(ctx: click.Context, issue_ids: tuple[str, ...], format: str) -> None:
+    """Show detailed information about one or more issues.
+
+    Pass one or more issue IDs as arguments, or pipe them via stdin (one ID
+    per line). Several issues are fetched together in batched requests.
+
+    Examples:
+        yt issues show DEMO-123
+        yt issues show DEMO-123 DEMO-124
+        cat issues.txt | yt issues show
+    """
     from ..managers.issues import IssueManager
 
     console = get_console()
+    ids = _collect_issue_ids(issue_ids)
     auth_manager = AuthManager(ctx.obj.get("config"))
     issue_manager = IssueManager(auth_manager)
 
-    console.print(f"📋 Fetching issue '{issue_id}' details...", style="blue")
+    if len(ids) == 1:
+        console.print(f"📋 Fetching issue '{ids[0]}' details...", style="blue")
+    else:
+        console.print(f"📋 Fetching details for {len(ids)} issues...", style="blue")
 
     try:
-        result = asyncio.run(issue_manager.get_issue(issue_id))
+        if len(ids) == 1:
+            result = asyncio.run(issue_manager.get_issue(ids[0]))
+            issues_data = [result["data"]] if result["status"] == "success" else []
+        else:
+            result = asyncio.run(issue_manager.get_issues(ids))
+            issues_data = result.get("data", [])
 
         if result["status"] == "success":
-            issue_manager.display_issue_details(result["data"], format_type=format)
+            for issue_data in issues_data:
+                issue_manager.display_issue_details(issue_data, format_type=format)
+            for missing_id in result.get("missing", []):
+                console.print(f"⚠️  Issue '{missing_id}' not found", style="yellow")
         else:
             console.print(f"❌ {result['message']}", style="red")
             raise click.ClickException("Failed to get issue details")
@@ -1860,7 +2100,7 @@ def show(ctx: click.Context, issue_id: str, format: str) -> None:
 
 
 @issues.command()
-@click.argument("issue_id")
+@click.argument("issue_ids", nargs=-1)
 @click.option(
     "--format",
     type=click.Choice(["tree", "table"], case_sensitive=False),
@@ -1874,7 +2114,7 @@ def show(ctx: click.Context, issue_id: str, format: str) -> None:
     help="Show status indicators in tree view",
 )
 @click.pass_context
-def related(ctx: click.Context, issue_id: str, format: str, show_status: bool) -> None:
+def related(ctx: click.Context, issue_ids: tuple[str, ...], format: str, show_status: bool) -> None:
     """Show all issue relationships dynamically based on YouTrack instance configuration.
 
     This command shows all relationship types for an issue, not just dependencies.
@@ -1890,14 +2130,24 @@ def related(ctx: click.Context, issue_id: str, format: str, show_status: bool) -
 
         # Hide status indicators
         yt issues related DEMO-123 --show-status false
+
+        # Several issues at once (issues and links are fetched in batches)
+        yt issues related DEMO-123 DEMO-124
+        cat issues.txt | yt issues related
     """
     from ..managers.issues import IssueManager
     from ..trees import create_issue_relationships_tree
 
     console = get_console()
+    ids = _collect_issue_ids(issue_ids)
     auth_manager = AuthManager(ctx.obj.get("config"))
     issue_manager = IssueManager(auth_manager)
 
+    if len(ids) > 1:
+        _show_related_for_many(issue_manager, ids, format, show_status)
+        return
+
+    issue_id = ids[0]
     console.print(f"🔗 Fetching relationships for issue '{issue_id}'...", style="blue")
 
     async def get_issue_and_relationships():
@@ -1945,6 +2195,140 @@ def related(ctx: click.Context, issue_id: str, format: str, show_status: bool) -
         raise click.ClickException("Failed to get relationships") from e
 
 
+def _show_related_for_many(issue_manager, ids: list[str], format: str, show_status: bool) -> None:
+    """Display relationships for several issues from one batched issue+links fetch."""
+    from ..trees import create_issue_relationships_tree
+
+    console = get_console()
+    console.print(f"🔗 Fetching relationships for {len(ids)} issues...", style="blue")
+
+    async def get_issues_and_link_types():
+        return await asyncio.gather(issue_manager.get_issues_with_links(ids), issue_manager.list_link_types())
+
+    try:
+        issues_result, link_types_result = asyncio.run(get_issues_and_link_types())
+
+        if issues_result["status"] != "success":
+            console.print(f"❌ {issues_result['message']}", style="red")
+            raise click.ClickException("Failed to get issue details")
+
+        if link_types_result["status"] != "success":
+            console.print(f"❌ {link_types_result['message']}", style="red")
+            raise click.ClickException("Failed to get link types")
+
+        link_types_data = link_types_result["data"]
+        for issue_data in issues_result["data"]:
+            links_data = issue_data.get("links") or []
+            if format == "tree":
+                console.print(create_issue_relationships_tree(issue_data, links_data, link_types_data, show_status))
+            else:
+                console.print(f"\n[bold]{issue_data.get('idReadable', issue_data.get('id', ''))}[/bold]")
+                issue_manager.display_relationships_table(links_data, link_types_data)
+
+        for missing_id in issues_result.get("missing", []):
+            console.print(f"⚠️  Issue '{missing_id}' not found", style="yellow")
+
+    except click.ClickException:
+        raise
+    except Exception as e:
+        console.print(f"❌ Error getting relationships: {e}", style="red")
+        raise click.ClickException("Failed to get relationships") from e
+
+
+@issues.command()
+@click.argument("issue_ids", nargs=-1)
+@click.option("--depth", "-d", type=click.IntRange(0, 10), default=2, help="Number of link hops to follow")
+@click.option(
+    "--link-type",
+    "-t",
+    "link_types",
+    multiple=True,
+    help="Only follow links of this type (repeatable, e.g. -t Depend -t Subtask)",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["tree", "dot", "json"], case_sensitive=False),
+    default="tree",
+    help="Output format",
+)
+@click.option("--max-issues", type=int, default=1000, help="Stop expanding once this many issues have been seen")
+@click.option("--max-concurrent", type=int, default=10, help="Maximum concurrent requests per depth level")
+@click.option(
+    "--show-status/--no-show-status",
+    default=True,
+    help="Show status indicators in tree view",
+)
+@click.pass_context
+def graph(
+    ctx: click.Context,
+    issue_ids: tuple[str, ...],
+    depth: int,
+    link_types: tuple[str, ...],
+    format: str,
+    max_issues: int,
+    max_concurrent: int,
+    show_status: bool,
+) -> None:
+    """Walk issue links to a given depth and show the resulting graph.
+
+    Each depth level is fetched with batched requests, every issue is
+    fetched at most once, and dependency cycles are reported.
+
+    Examples:
+        # Everything within two hops of DEMO-123
+        yt issues graph DEMO-123
+
+        # Follow only dependency links, four hops deep
+        yt issues graph DEMO-123 --depth 4 --link-type Depend
+
+        # Render with Graphviz
+        yt issues graph DEMO-123 --format dot | dot -Tsvg > deps.svg
+    """
+    from ..issue_graph import IssueGraphCrawler
+    from ..managers.issues import IssueManager
+    from ..trees import create_issue_graph_tree
+
+    console = get_console()
+    ids = _collect_issue_ids(issue_ids)
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    issue_manager = IssueManager(auth_manager)
+    crawler = IssueGraphCrawler(
+        issue_manager,
+        max_depth=depth,
+        link_types=link_types or None,
+        max_issues=max_issues,
+        max_concurrent=max_concurrent,
+    )
+
+    if format == "tree":
+        console.print(f"🕸️  Crawling links from {', '.join(ids)} (depth {depth})...", style="blue")
+
+    try:
+        issue_graph = asyncio.run(crawler.crawl(ids))
+    except Exception as e:
+        console.print(f"❌ Error crawling issue links: {e}", style="red")
+        raise click.ClickException("Failed to crawl issue links") from e
+
+    if format == "json":
+        click.echo(issue_graph.to_json())
+        return
+    if format == "dot":
+        click.echo(issue_graph.to_dot())
+        return
+
+    console.print(create_issue_graph_tree(issue_graph, show_status))
+    console.print(
+        f"\n[dim]{len(issue_graph.nodes)} issues, {len(issue_graph.edges)} links, "
+        f"{issue_graph.requests} request(s)[/dim]"
+    )
+    for cycle in issue_graph.cycles:
+        console.print(f"⚠️  Cycle: {' → '.join(cycle)}", style="yellow")
+    for missing_id in issue_graph.missing:
+        console.print(f"⚠️  Issue '{missing_id}' not found", style="yellow")
+    if issue_graph.truncated:
+        console.print(f"⚠️  Stopped expanding after {max_issues} issues (raise --max-issues)", style="yellow")
+
+
 @issues.command()
 @click.option(
     "--project-id",
@@ -1957,16 +2341,65 @@ def related(ctx: click.Context, issue_id: str, format: str, show_status: bool) -
     default=50,
     help="Number of issues to fetch for benchmarking (default: 50)",
 )
+@click.option(
+    "--formatting",
+    is_flag=True,
+    help="Run the offline custom-field formatting micro-benchmark on synthetic issues instead",
+)
+@click.option(
+    "--rendering",
+    is_flag=True,
+    help="Run the offline table rendering micro-benchmark (Rich layout vs plain output) instead",
+)
+@click.option(
+    "--issue-count",
+    type=click.IntRange(1),
+    default=None,
+    help="Number of synthetic issues for --formatting (default: 20000) or --rendering (default: 10000)",
+)
 @click.pass_context
-def benchmark(ctx: click.Context, project_id: str | None, sample_size: int) -> None:
+def benchmark(
+    ctx: click.Context,
+    project_id: str | None,
+    sample_size: int,
+    formatting: bool,
+    rendering: bool,
+    issue_count: int | None,
+) -> None:
     """Benchmark field selection performance improvements.
 
     This command runs performance tests comparing minimal, standard, and full
     field selection profiles to demonstrate the optimization benefits.
+
+    With --formatting, no server is contacted: synthetic issues are formatted
+    with per-column custom field scans and with the indexed issue view, and
+    both timings are reported.
+
+    With --rendering, a synthetic issues table is printed through Rich's table
+    layout and through the plain renderer used for pipes and large tables.
     """
-    from ..performance_benchmark import run_benchmark
+    from ..performance_benchmark import (
+        benchmark_issue_formatting,
+        benchmark_table_rendering,
+        print_formatting_report,
+        print_rendering_report,
+        run_benchmark,
+    )
 
     console = get_console()
+
+    if formatting:
+        issue_count = issue_count or 20000
+        console.print(f"🚀 Formatting {issue_count} synthetic issues...", style="blue")
+        print_formatting_report(benchmark_issue_formatting(issue_count))
+        return
+
+    if rendering:
+        issue_count = issue_count or 10000
+        console.print(f"🚀 Rendering a {issue_count}-row issues table...", style="blue")
+        print_rendering_report(benchmark_table_rendering(issue_count))
+        return
+
     auth_manager = AuthManager(ctx.obj.get("config"))
 
     console.print("🚀 Starting field selection performance benchmark...", style="blue")
@@ -2124,6 +2557,17 @@ def batch_create(
     type=click.Path(path_type=Path),
     help="Save failed operations to specified file for retry",
 )
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="Apply identical changes to many issues per request through YouTrack commands",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(1, 1000),
+    default=100,
+    help="Issues per command request in --bulk mode (default: 100)",
+)
 @click.pass_context
 def batch_update(
     ctx: click.Context,
@@ -2131,12 +2575,20 @@ def batch_update(
     dry_run: bool,
     continue_on_error: bool,
     save_failed: Path | None,
+    bulk: bool,
+    chunk_size: int,
 ) -> None:
     r"""Batch update issues from CSV or JSON file.
 
     Update multiple issues at once from a properly formatted CSV or JSON file.
     The file should contain columns/fields for: issue_id (required), and any
-    combination of summary, description, state, type, priority, assignee.
+    combination of summary, description, state, type, priority, assignee and
+    tags (comma-separated tags to add).
+
+    With --bulk, each change (e.g. "State Fixed", "tag release") is applied to
+    all issues that share it through YouTrack's commands endpoint, 100 issues
+    per request by default. Rows that change summary or description are still
+    updated one issue at a time.
 
     Examples:
         # Update issues from CSV file
@@ -2147,6 +2599,9 @@ def batch_update(
 
         # Update with error handling
         yt issues batch update --file updates.csv --save-failed failed.csv
+
+        # Close thousands of issues with a handful of requests
+        yt issues batch update --file release.csv --bulk
     """
     from ..batch import BatchOperationManager, BatchValidationError
 
@@ -2157,8 +2612,13 @@ def batch_update(
     console.print(f"🔍 Validating batch update file: {file_path}", style="blue")
 
     async def run_batch_update():
-        # Validate the input file with API compatibility checking
-        validated_items = await batch_manager.validate_file_with_api_check(file_path, "update")
+        # Validate the input file with API compatibility checking. Bulk mode
+        # skips the per-issue API check: the commands endpoint validates each
+        # issue itself and failures are reported per row.
+        if bulk:
+            validated_items = batch_manager.validate_file(file_path, "update")
+        else:
+            validated_items = await batch_manager.validate_file_with_api_check(file_path, "update")
         console.print(f"✅ Validation successful! Found {len(validated_items)} items to process.", style="green")
 
         # Perform the batch operation
@@ -2168,6 +2628,10 @@ def batch_update(
 
         # Type assertion: operation_type="update" guarantees BatchIssueUpdate list
         update_items = cast(list[BatchIssueUpdate], validated_items)
+        if bulk:
+            return await batch_manager.batch_update_issues_bulk(
+                update_items, dry_run=dry_run, continue_on_error=continue_on_error, chunk_size=chunk_size
+            )
         return await batch_manager.batch_update_issues(
             update_items, dry_run=dry_run, continue_on_error=continue_on_error
         )
@@ -10,6 +10,7 @@ import click
 
 from ..auth import AuthManager
 from ..console import get_console, print_status
+from ..user_directory import complete_user_logins
 
 
 def show_projects_verbose_help(ctx):
@@ -126,9 +127,9 @@ def projects() -> None:
 )
 @click.option(
     "--format",
-    type=click.Choice(["table", "json"]),
+    type=click.Choice(["table", "json", "tree"]),
     default="table",
-    help="Output format",
+    help="Output format; tree shows the project hierarchy and fetches all projects",
 )
 @click.option(
     "--page-size",
@@ -179,6 +180,12 @@ def projects_list(
     try:
         # Determine pagination settings
         use_pagination = bool(all or after_cursor or before_cursor or max_results)
+        if format == "tree":
+            # The hierarchy needs every project, but only the fields the tree shows
+            from ..trees import PROJECT_HIERARCHY_FIELDS
+
+            use_pagination = top is None
+            fields = fields or PROJECT_HIERARCHY_FIELDS
 
         result = asyncio.run(
             project_manager.list_projects(
@@ -196,7 +203,12 @@ def projects_list(
         if result["status"] == "success":
             projects = result["data"]
 
-            if format == "table":
+            if format == "tree":
+                from ..trees import create_project_hierarchy_tree
+
+                console.print(create_project_hierarchy_tree(projects))
+                console.print(f"\n[dim]Total: {result['count']} projects[/dim]")
+            elif format == "table":
                 project_manager.display_project_list(projects, format_output="table")
                 console.print(f"\n[dim]Total: {result['count']} projects[/dim]")
 
@@ -293,6 +305,7 @@ def projects_show(
 @click.option(
     "--leader",
     "-l",
+    shell_complete=complete_user_logins,
     help="Project leader username (e.g., 'admin', 'ryan') or ID (e.g., '2-3')",
 )
 @click.option(
@@ -384,6 +397,7 @@ def projects_create(
 @click.option(
     "--leader",
     "-l",
+    shell_complete=complete_user_logins,
     help="New project leader username (e.g., 'admin', 'ryan') or ID (e.g., '2-3')",
 )
 @click.option(
@@ -8,6 +8,18 @@ from ..auth import AuthManager
 from ..console import get_console, print_status
 
 
+def _validate_group_by(ctx: click.Context, param: click.Parameter, value: str) -> str:
+    from ..time import TIME_GROUP_KEYS
+
+    keys = [key.strip() for key in value.split(",") if key.strip()]
+    unknown = [key for key in keys if key not in TIME_GROUP_KEYS]
+    if not keys or unknown:
+        raise click.BadParameter(
+            f"'{value}' is not a valid grouping; choose from {', '.join(TIME_GROUP_KEYS)}, separated by commas"
+        )
+    return ",".join(keys)
+
+
 @click.group()
 def time() -> None:
     """Time tracking operations."""
@@ -106,6 +118,89 @@ def list(
         raise click.ClickException("Failed to list time entries") from e
 
 
+@time.command(name="import")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option(
+    "--format",
+    "-f",
+    "file_format",
+    type=click.Choice(["csv", "json"]),
+    help="Input format (default: from the file extension, CSV for stdin)",
+)
+@click.option(
+    "--max-concurrent",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Work items submitted at once",
+)
+@click.option("--dry-run", is_flag=True, help="Validate the file and resolve work types without logging time")
+@click.option(
+    "--errors",
+    "errors_path",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write failed rows with their error to this CSV file",
+)
+@click.pass_context
+def import_time(
+    ctx: click.Context,
+    file,
+    file_format: str | None,
+    max_concurrent: int,
+    dry_run: bool,
+    errors_path: str | None,
+) -> None:
+    """Log many work items from a CSV or JSON file.
+
+    FILE has the columns issue_id, duration, date, description and
+    work_type; only issue_id and duration are required. Use '-' to read
+    from stdin. Rows that fail validation are reported and skipped; the
+    remaining rows are submitted concurrently.
+
+    Examples:
+        # Import a timesheet export
+        yt time import timesheet.csv
+
+        # Check a file without logging anything
+        yt time import timesheet.json --dry-run
+
+        # Keep a report of rows that could not be logged
+        yt time import timesheet.csv --errors failed.csv
+    """
+    from ..time import TimeManager
+
+    console = get_console()
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    time_manager = TimeManager(auth_manager)
+
+    if file_format is None:
+        file_format = "json" if str(getattr(file, "name", "")).lower().endswith(".json") else "csv"
+
+    try:
+        rows, errors = time_manager.parse_time_import(file, file_format)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    console.print(f"⏱️  Logging {len(rows)} work item(s)...", style="blue")
+    result = asyncio.run(time_manager.log_time_bulk(rows, max_concurrent=max_concurrent, dry_run=dry_run))
+    if result["status"] != "success":
+        console.print(f"❌ {result['message']}", style="red")
+        raise click.ClickException(result["message"])
+
+    data = result["data"]
+    total = len(rows) + len(errors)
+    errors = sorted(errors + data["errors"], key=lambda error: error["row"])
+    verb = "Would log" if dry_run else "Logged"
+    console.print(f"✅ {verb} {data['logged']} of {total} work item(s)", style="green")
+    if errors:
+        console.print(f"❌ {len(errors)} row(s) failed", style="red")
+        time_manager.display_import_errors(errors)
+        if errors_path:
+            with open(errors_path, "w", newline="", encoding="utf-8") as f:
+                time_manager.write_import_errors(f, errors)
+            console.print(f"Failed rows saved to: {errors_path}", style="yellow")
+        ctx.exit(1)
+
+
 @time.command(name="work-types")
 @click.option("--issue", "-i", help="Issue ID to get project-specific work types")
 @click.option(
@@ -154,9 +249,9 @@ def work_types(
 @click.option(
     "--group-by",
     "-g",
-    type=click.Choice(["user", "issue", "type"]),
     default="user",
-    help="Group summary by",
+    callback=_validate_group_by,
+    help="Group summary by one or more of user, issue, project, type, day, week, month (e.g. 'user,week')",
 )
 @click.option(
     "--format",
@@ -30,7 +30,8 @@ def show_users_verbose_help(ctx):
     # Commands
     console.print("[bold]Commands:[/bold]")
     console.print("  list          List all users with optional filtering")
-    console.print("  show          Show detailed user information")
+    console.print("  profile       Show user profiles with groups, roles and teams")
+    console.print("  bulk          Apply ban, group, role and team changes from a file")
     console.print("")
 
     # Common Examples
@@ -88,8 +89,8 @@ def users() -> None:
     """Manage YouTrack users - list, search, and view user information.
 
     Core Commands:
-        list    List users with optional filtering
-        show    Show detailed user information (coming soon)
+        list      List users with optional filtering
+        profile   Show user profiles with groups, roles and teams
 
     Quick Start:
         # List all active users
@@ -376,7 +377,7 @@ def users_update(
         console.print(f"👤 Fetching user '{user_id}' details...", style="blue")
 
         try:
-            result = asyncio.run(user_manager.get_user(user_id))
+            result = asyncio.run(user_manager.get_user_profile(user_id))
 
             if result["status"] == "success":
                 user_manager.display_user_details(result["data"])
@@ -427,6 +428,181 @@ def users_update(
             raise click.ClickException("Failed to update user") from e
 
 
+@users.command("profile")
+@click.argument("user_ids", nargs=-1)
+@click.option("--all", "all_users", is_flag=True, help="Profile every user (narrow with --query)")
+@click.option("--query", "-q", help="Search query selecting users for --all")
+@click.option("--permissions", "include_permissions", is_flag=True, help="Include each user's permissions")
+@click.option(
+    "--format",
+    type=click.Choice(["table", "json", "csv"]),
+    default="table",
+    help="Output format",
+)
+@click.option(
+    "--max-concurrent",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Requests in flight at once",
+)
+@click.pass_context
+def users_profile(
+    ctx: click.Context,
+    user_ids: tuple[str, ...],
+    all_users: bool,
+    query: str | None,
+    include_permissions: bool,
+    format: str,
+    max_concurrent: int,
+) -> None:
+    """Show user profiles: details, groups, roles, teams and permissions.
+
+    Groups, roles and teams are fetched together with the user in one
+    request. Several users are profiled concurrently; with --all, users are
+    listed page by page with their groups, roles and teams inline.
+
+    Examples:
+        # Full profile of one user
+        yt users profile john.doe --permissions
+
+        # Access review of every user as CSV
+        yt users profile --all --format csv > access-review.csv
+
+        # Several users as JSON
+        yt users profile alice bob carol --format json
+    """
+    import json
+    import sys
+
+    from ..managers.users import UserManager
+    from ..progress import set_progress_enabled
+
+    if not user_ids and not all_users:
+        raise click.UsageError("Give one or more USER_IDS or use --all.")
+    if user_ids and all_users:
+        raise click.UsageError("USER_IDS cannot be combined with --all.")
+
+    console = get_console()
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    user_manager = UserManager(auth_manager)
+    if format != "table":
+        set_progress_enabled(False)
+
+    print_status("👤 Fetching user profiles...", output_format=format)
+
+    result = asyncio.run(
+        user_manager.get_user_profiles(
+            list(user_ids) if user_ids else None,
+            include_permissions=include_permissions,
+            max_concurrent=max_concurrent,
+            query=query,
+        )
+    )
+    if result["status"] != "success":
+        console.print(f"❌ {result['message']}", style="red")
+        raise click.ClickException("Failed to get user profiles")
+
+    profiles = result["data"]["profiles"]
+    errors = result["data"]["errors"]
+    if format == "json":
+        click.echo(json.dumps(profiles, indent=2))
+    elif format == "csv":
+        user_manager.write_profiles_csv(sys.stdout, profiles)
+    else:
+        for profile in profiles:
+            user_manager.display_user_details(profile)
+        console.print(f"[dim]Total: {len(profiles)} users[/dim]")
+
+    if errors:
+        for error in errors:
+            print_status(f"❌ {error['user']}: {error['error']}", output_format=format, style="red")
+        ctx.exit(1)
+
+
+@users.command("bulk")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option(
+    "--format",
+    "-f",
+    "file_format",
+    type=click.Choice(["csv", "json"]),
+    help="Input format (default: from the file extension, CSV for stdin)",
+)
+@click.option(
+    "--max-concurrent",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Operations executed at once",
+)
+@click.option("--dry-run", is_flag=True, help="Validate the file and resolve users without changing anything")
+@click.option(
+    "--report",
+    "report_path",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the result of every operation to this CSV file",
+)
+@click.pass_context
+def users_bulk(
+    ctx: click.Context,
+    file,
+    file_format: str | None,
+    max_concurrent: int,
+    dry_run: bool,
+    report_path: str | None,
+) -> None:
+    """Apply user administration operations from a CSV or JSON file.
+
+    FILE has the columns user, action and target. Actions are ban, unban,
+    add-to-group, remove-from-group, assign-role, remove-role, add-to-team
+    and remove-from-team; target is the group, role or team ID. Use '-' to
+    read from stdin. All users are resolved up front and the operations
+    run concurrently.
+
+    Examples:
+        # Offboard departed users
+        yt users bulk offboarding.csv
+
+        # Check a file without changing anything
+        yt users bulk new-hires.json --dry-run
+
+        # Keep a per-user report of the run
+        yt users bulk access-changes.csv --report results.csv
+    """
+    from ..managers.users import UserManager
+
+    console = get_console()
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    user_manager = UserManager(auth_manager)
+
+    if file_format is None:
+        file_format = "json" if str(getattr(file, "name", "")).lower().endswith(".json") else "csv"
+
+    try:
+        operations, invalid = user_manager.parse_user_operations(file, file_format)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    console.print(f"👥 Applying {len(operations)} user operation(s)...", style="blue")
+    result = asyncio.run(user_manager.apply_user_operations(operations, max_concurrent=max_concurrent, dry_run=dry_run))
+    if result["status"] != "success":
+        console.print(f"❌ {result['message']}", style="red")
+        raise click.ClickException(result["message"])
+
+    data = result["data"]
+    results = sorted(invalid + data["results"], key=lambda row: row["row"])
+    verb = "Would apply" if dry_run else "Applied"
+    console.print(f"✅ {verb} {data['succeeded']} of {len(results)} operation(s)", style="green")
+    if report_path:
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            user_manager.write_operation_results(f, results)
+        console.print(f"Results saved to: {report_path}", style="yellow")
+    failed = len(results) - data["succeeded"]
+    if failed:
+        console.print(f"❌ {failed} operation(s) failed", style="red")
+        user_manager.display_operation_errors(results)
+        ctx.exit(1)
+
+
 @users.command()
 @click.argument("user_id")
 @click.option(
@@ -0,0 +1,168 @@
+"""Resolution of endpoint fallback chains, remembering which candidate works per server."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from .json_cache import cache_key, config_path, read_json, write_json
+from .logging import get_logger
+
+__all__ = ["EndpointResolver", "get_endpoint_resolver"]
+
+logger = get_logger(__name__)
+
+#: Coroutine trying one candidate URL; returns a result, or None if the candidate does not work on this server.
+Attempt = Callable[[str], Awaitable[Any]]
+
+
+def _patterns_from_json(data: Any) -> dict[str, str]:
+    return {str(key): str(value) for key, value in data.items()}
+
+
+class EndpointResolver:
+    """Pick the working endpoint out of several candidate URL patterns.
+
+    Different YouTrack versions and deployments serve the same resource
+    under different URLs, so several call sites try a list of candidates.
+    Each candidate has a pattern name that is the same on every call (for
+    example ``"api_files"``) and a concrete URL. Once a pattern has worked,
+    it is remembered per server, in memory and under
+    ``~/.config/youtrack-cli/endpoints``, and tried first and alone next
+    time; a remembered pattern that stops working is forgotten.
+
+    Without a remembered pattern the candidates are either raced, with all
+    requests in flight at once and the earliest candidate in preference
+    order that works winning, or tried one by one for requests too large to
+    duplicate, such as file downloads.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """Initialize the resolver.
+
+        Args:
+            cache_dir: Directory for remembered patterns; defaults to the CLI config directory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else config_path("endpoints")
+        self._patterns: dict[Any, dict[str, str]] = {}
+
+    def _path(self, base_url: Any) -> Path | None:
+        if not isinstance(base_url, str):
+            return None
+        return self.cache_dir / f"{cache_key(base_url.rstrip('/'))}.json"
+
+    def _server_patterns(self, base_url: Any) -> dict[str, str]:
+        if base_url in self._patterns:
+            return self._patterns[base_url]
+        path = self._path(base_url)
+        stored = read_json(path, "endpoint patterns", _patterns_from_json) if path is not None else None
+        patterns = stored or {}
+        self._patterns[base_url] = patterns
+        return patterns
+
+    def _save(self, base_url: Any) -> None:
+        path = self._path(base_url)
+        if path is not None:
+            write_json(path, self._patterns.get(base_url, {}), "endpoint patterns")
+
+    def remembered(self, base_url: Any, key: str) -> str | None:
+        """The pattern that last worked for ``key`` on this server, if any."""
+        return self._server_patterns(base_url).get(key)
+
+    def remember(self, base_url: Any, key: str, pattern: str) -> None:
+        """Record the pattern that worked for ``key`` on this server."""
+        patterns = self._server_patterns(base_url)
+        if patterns.get(key) != pattern:
+            patterns[key] = pattern
+            self._save(base_url)
+
+    def forget(self, base_url: Any, key: str) -> None:
+        """Drop the remembered pattern for ``key`` on this server."""
+        if self._server_patterns(base_url).pop(key, None) is not None:
+            self._save(base_url)
+
+    async def resolve(
+        self,
+        base_url: Any,
+        key: str,
+        candidates: Sequence[tuple[str, str]],
+        attempt: Attempt,
+        race: bool = True,
+    ) -> tuple[str, Any] | None:
+        """Find the first candidate, in preference order, that works on this server.
+
+        Args:
+            base_url: Base URL of the YouTrack instance
+            key: Name of the fallback chain, e.g. ``"system_health"``
+            candidates: ``(pattern, url)`` pairs in order of preference
+            attempt: Coroutine trying one URL
+            race: Request all candidates at once instead of one by one
+
+        Returns:
+            ``(pattern, result)`` of the working candidate, or None if none works
+
+        Raises:
+            The exception of the most preferred candidate that raised, if none worked
+        """
+        candidates = list(candidates)
+        remembered = self.remembered(base_url, key)
+        for index, (pattern, url) in enumerate(candidates):
+            if pattern != remembered:
+                continue
+            result = await attempt(url)
+            if result is not None:
+                return pattern, result
+            logger.debug("Remembered endpoint no longer works", key=key, pattern=pattern)
+            self.forget(base_url, key)
+            del candidates[index]
+            break
+
+        if race:
+            resolved = await self._race(candidates, attempt)
+        else:
+            resolved = await self._in_order(candidates, attempt)
+        if resolved is not None:
+            self.remember(base_url, key, resolved[0])
+        return resolved
+
+    @staticmethod
+    async def _in_order(candidates: list[tuple[str, str]], attempt: Attempt) -> tuple[str, Any] | None:
+        for pattern, url in candidates:
+            result = await attempt(url)
+            if result is not None:
+                return pattern, result
+        return None
+
+    @staticmethod
+    async def _race(candidates: list[tuple[str, str]], attempt: Attempt) -> tuple[str, Any] | None:
+        tasks = [asyncio.ensure_future(attempt(url)) for _, url in candidates]
+        first_error: BaseException | None = None
+        try:
+            for (pattern, _), task in zip(candidates, tasks, strict=True):
+                try:
+                    result = await task
+                except Exception as e:
+                    if first_error is None:
+                        first_error = e
+                    continue
+                if result is not None:
+                    return pattern, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Also collects failures of candidates behind the winner
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if first_error is not None:
+            raise first_error
+        return None
+
+
+_resolver: EndpointResolver | None = None
+
+
+def get_endpoint_resolver() -> EndpointResolver:
+    """Get the process-wide endpoint resolver."""
+    global _resolver
+    if _resolver is None:
+        _resolver = EndpointResolver()
+    return _resolver
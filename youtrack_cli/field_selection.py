@@ -6,13 +6,19 @@ by only requesting needed fields based on the command context and user preferenc
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from .logging import get_logger
 
 __all__ = [
     "FieldProfile",
+    "FieldProjection",
     "FieldSelector",
     "get_field_selector",
     "FIELD_PROFILES",
+    "ISSUE_COLUMN_FIELDS",
+    "ISSUE_OUTPUT_COLUMNS",
+    "ISSUE_STATE_FIELD_NAMES",
 ]
 
 logger = get_logger(__name__)
@@ -200,6 +206,47 @@ FIELD_PROFILES: dict[str, dict[str, list[str]]] = {
 }
 
 
+# Custom field names tried, in order, when rendering an issue's state column.
+ISSUE_STATE_FIELD_NAMES: tuple[str, ...] = ("State", "Status", "Stage", "Workflow State")
+
+# Issue attributes and custom fields each display column reads. Used to project
+# a fetch down to exactly what the chosen output renders.
+ISSUE_COLUMN_FIELDS: dict[str, dict[str, tuple[str, ...]]] = {
+    "ID": {"fields": ("idReadable",), "custom_fields": ()},
+    "Summary": {"fields": ("summary",), "custom_fields": ()},
+    "State": {"fields": (), "custom_fields": ISSUE_STATE_FIELD_NAMES},
+    "Priority": {"fields": (), "custom_fields": ("Priority",)},
+    "Type": {"fields": (), "custom_fields": ("Type",)},
+    "Assignee": {"fields": (), "custom_fields": ("Assignee",)},
+    "Project": {"fields": ("project(name,shortName)",), "custom_fields": ()},
+}
+
+# Columns rendered by each issue output format. Formats not listed here (json,
+# ndjson) emit the raw issue and cannot be projected.
+ISSUE_OUTPUT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "table": ("ID", "Summary", "State", "Priority", "Assignee"),
+    "csv": ("ID", "Summary", "State", "Priority", "Type", "Assignee", "Project"),
+}
+
+# Sub-selection for projected custom field values; matches what the issue
+# formatters read via CustomFieldManager.
+_PROJECTED_CUSTOM_FIELD_VALUE = "customFields(name,value(name,login,fullName))"
+
+
+@dataclass(frozen=True)
+class FieldProjection:
+    """Minimal field selection derived from the columns an output renders.
+
+    Attributes:
+        fields: Value for the REST ``fields=`` parameter
+        custom_fields: Custom field names to request via the ``customFields``
+            parameter, so only the shown custom fields are expanded
+    """
+
+    fields: str
+    custom_fields: tuple[str, ...] = ()
+
+
 class FieldProfile:
     """Represents a field selection profile for a specific entity type."""
 
@@ -369,6 +416,46 @@ class FieldSelector:
 
         return result
 
+    def project_issue_fields(
+        self, output_format: str, columns: list[str] | tuple[str, ...] | None = None
+    ) -> FieldProjection | None:
+        """Derive the minimal issue field selection for an output format.
+
+        Args:
+            output_format: Output format the issues will be rendered in (table, csv, ...)
+            columns: Columns to render; defaults to the format's standard columns
+
+        Returns:
+            FieldProjection for the rendered columns, or None when the format emits
+            raw issues (e.g. json) or a column is unknown and projection is unsafe
+        """
+        if columns is None:
+            columns = ISSUE_OUTPUT_COLUMNS.get(output_format)
+        if not columns:
+            return None
+
+        fields: list[str] = ["id"]
+        custom_fields: list[str] = []
+        for column in columns:
+            spec = ISSUE_COLUMN_FIELDS.get(column)
+            if spec is None:
+                logger.debug("Unknown issue column, skipping projection", column=column)
+                return None
+            fields.extend(f for f in spec["fields"] if f not in fields)
+            custom_fields.extend(f for f in spec["custom_fields"] if f not in custom_fields)
+
+        if custom_fields:
+            fields.append(_PROJECTED_CUSTOM_FIELD_VALUE)
+
+        projection = FieldProjection(fields=",".join(fields), custom_fields=tuple(custom_fields))
+        logger.debug(
+            "Projected issue fields for output",
+            output_format=output_format,
+            fields=projection.fields,
+            custom_fields=list(projection.custom_fields),
+        )
+        return projection
+
     def get_available_profiles(self, entity_type: str) -> list[str]:
         """Get available profiles for an entity type."""
         return list(self._profiles.get(entity_type, {}).keys())
@@ -0,0 +1,57 @@
+"""On-disk cache of name lookup indexes (tags, link types) shared between commands."""
+
+import time
+from typing import Any
+
+from .json_cache import JsonFileCache
+
+__all__ = ["IndexCache", "get_index_cache"]
+
+
+def _entry(data: Any) -> tuple[float, dict[str, Any]]:
+    return float(data["fetched_at"]), dict(data["index"])
+
+
+class IndexCache(JsonFileCache):
+    """Persist name -> definition indexes between CLI invocations.
+
+    Each index is stored in its own file per scope (server and index name)
+    together with the time it was fetched, under
+    ``~/.config/youtrack-cli/indexes`` by default. An index older than the
+    lifetime given to ``get`` is treated as missing, as is an unreadable file.
+    """
+
+    directory = "indexes"
+    description = "lookup index"
+
+    def get(self, scope: str, ttl: float) -> dict[str, Any] | None:
+        """Return a scope's index if it was fetched within ``ttl`` seconds."""
+        entry = self._read(self._path(scope), _entry)
+        if entry is None:
+            return None
+        fetched_at, index = entry
+        if time.time() - fetched_at >= ttl:
+            return None
+        return index
+
+    def set(self, scope: str, index: dict[str, Any]) -> None:
+        """Write a scope's index, replacing the previous file atomically."""
+        self._write(self._path(scope), {"fetched_at": time.time(), "index": index})
+
+    def delete(self, scope: str) -> None:
+        """Forget a scope's index."""
+        try:
+            self._path(scope).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+_cache: IndexCache | None = None
+
+
+def get_index_cache() -> IndexCache:
+    """Get the process-wide index cache."""
+    global _cache
+    if _cache is None:
+        _cache = IndexCache()
+    return _cache
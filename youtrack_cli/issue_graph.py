@@ -0,0 +1,355 @@
+"""Breadth-first crawler for YouTrack issue link graphs."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from .issue_view import IssueView
+from .logging import get_logger
+
+__all__ = [
+    "IssueGraph",
+    "IssueGraphCrawler",
+    "IssueGraphEdge",
+    "IssueGraphNode",
+    "find_cycles",
+]
+
+logger = get_logger(__name__)
+
+_STATE_FIELD_NAMES = ("State", "Status", "Stage")
+
+
+@dataclass
+class IssueGraphNode:
+    """An issue reached while crawling, with the BFS depth it was first seen at."""
+
+    id: str
+    summary: str = ""
+    state: str | None = None
+    depth: int = 0
+    parent: str | None = None
+    expanded: bool = False
+
+
+@dataclass(frozen=True)
+class IssueGraphEdge:
+    """A link between two issues.
+
+    Directed links always point from the outward side to the inward side
+    (e.g. ``A depends on B`` is ``A -> B``); undirected links keep the order
+    in which they were discovered.
+    """
+
+    source: str
+    target: str
+    link_type: str
+    directed: bool = True
+
+
+@dataclass
+class IssueGraph:
+    """Result of an issue link crawl."""
+
+    roots: list[str]
+    max_depth: int
+    nodes: dict[str, IssueGraphNode] = field(default_factory=dict)
+    edges: list[IssueGraphEdge] = field(default_factory=list)
+    cycles: list[list[str]] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    truncated: bool = False
+    requests: int = 0
+    _adjacency: dict[str, list[tuple[IssueGraphEdge, str]]] = field(default_factory=dict, init=False, repr=False)
+    _adjacency_size: int = field(default=-1, init=False, repr=False)
+
+    def children(self, issue_id: str) -> list[tuple[IssueGraphEdge, str]]:
+        """Return ``(edge, neighbour)`` pairs for every edge touching ``issue_id``."""
+        if self._adjacency_size != len(self.edges):
+            # Built once per edge set so walking the whole graph stays linear
+            adjacency: dict[str, list[tuple[IssueGraphEdge, str]]] = {}
+            for edge in self.edges:
+                adjacency.setdefault(edge.source, []).append((edge, edge.target))
+                adjacency.setdefault(edge.target, []).append((edge, edge.source))
+            self._adjacency = adjacency
+            self._adjacency_size = len(self.edges)
+        return list(self._adjacency.get(issue_id, []))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the graph."""
+        return {
+            "roots": self.roots,
+            "max_depth": self.max_depth,
+            "nodes": [
+                {
+                    "id": node.id,
+                    "summary": node.summary,
+                    "state": node.state,
+                    "depth": node.depth,
+                    "expanded": node.expanded,
+                }
+                for node in self.nodes.values()
+            ],
+            "edges": [
+                {
+                    "source": edge.source,
+                    "target": edge.target,
+                    "type": edge.link_type,
+                    "directed": edge.directed,
+                }
+                for edge in self.edges
+            ],
+            "cycles": self.cycles,
+            "missing": self.missing,
+            "truncated": self.truncated,
+        }
+
+    def to_json(self) -> str:
+        """Serialize the graph as indented JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_dot(self) -> str:
+        """Serialize the graph in Graphviz DOT format."""
+        cycle_edges = self.cycle_edges()
+        lines = ["digraph issues {", "  rankdir=LR;", "  node [shape=box];"]
+        for node in self.nodes.values():
+            label = node.id if not node.summary else f"{node.id}\\n{node.summary}"
+            attrs = [f"label={_dot_quote(label)}"]
+            if node.id in self.roots:
+                attrs.append("style=bold")
+            lines.append(f"  {_dot_quote(node.id)} [{', '.join(attrs)}];")
+        for edge in self.edges:
+            attrs = [f"label={_dot_quote(edge.link_type)}"]
+            if not edge.directed:
+                attrs.append("dir=none")
+            if (edge.source, edge.target) in cycle_edges:
+                attrs.append("color=red")
+            lines.append(f"  {_dot_quote(edge.source)} -> {_dot_quote(edge.target)} [{', '.join(attrs)}];")
+        lines.append("}")
+        return "\n".join(lines)
+
+    def cycle_edges(self) -> set[tuple[str, str]]:
+        """Return the ``(source, target)`` pairs of edges that lie on a cycle."""
+        keys = set()
+        for cycle in self.cycles:
+            for source, target in zip(cycle, cycle[1:], strict=False):
+                keys.add((source, target))
+        return keys
+
+
+def _dot_quote(value: str) -> str:
+    escaped = value.replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _issue_state(issue: dict[str, Any]) -> str | None:
+    view = IssueView(issue)
+    for field_name in _STATE_FIELD_NAMES:
+        value = view.raw(field_name)
+        if isinstance(value, dict):
+            return value.get("name")
+        if isinstance(value, str):
+            return value
+    return None
+
+
+def find_cycles(nodes: list[str], edges: list[IssueGraphEdge], limit: int = 50) -> list[list[str]]:
+    """Find cycles among directed edges with an iterative three-colour DFS.
+
+    Each cycle is reported once, as a closed path (first id repeated at the
+    end). Undirected edges are ignored since every one of them would
+    trivially form a two-node cycle.
+    """
+    adjacency: dict[str, list[str]] = {node: [] for node in nodes}
+    for edge in edges:
+        if edge.directed:
+            adjacency.setdefault(edge.source, []).append(edge.target)
+            adjacency.setdefault(edge.target, [])
+
+    white, grey, black = 0, 1, 2
+    colour = dict.fromkeys(adjacency, white)
+    cycles: list[list[str]] = []
+    seen: set[frozenset[str]] = set()
+
+    for start in adjacency:
+        if colour[start] != white:
+            continue
+        path = [start]
+        stack = [(start, iter(adjacency[start]))]
+        colour[start] = grey
+        while stack:
+            node, neighbours = stack[-1]
+            advanced = False
+            for neighbour in neighbours:
+                if colour[neighbour] == white:
+                    colour[neighbour] = grey
+                    path.append(neighbour)
+                    stack.append((neighbour, iter(adjacency[neighbour])))
+                    advanced = True
+                    break
+                if colour[neighbour] == grey:
+                    cycle = path[path.index(neighbour) :] + [neighbour]
+                    key = frozenset(cycle)
+                    if key not in seen:
+                        seen.add(key)
+                        cycles.append(cycle)
+                        if len(cycles) >= limit:
+                            return cycles
+            if not advanced:
+                colour[node] = black
+                stack.pop()
+                path.pop()
+    return cycles
+
+
+class IssueGraphCrawler:
+    """Walk issue links breadth-first, one batched request set per depth level.
+
+    Every issue is fetched at most once: the frontier of each level is
+    deduplicated against everything already visited and handed to
+    ``IssueManager.get_issues_with_links``, which chunks the IDs into
+    ``issue id:`` queries and runs them with bounded concurrency. Issues on
+    the last level are not fetched at all; their summary and state come
+    from the link payload of the level above.
+    """
+
+    def __init__(
+        self,
+        issue_manager: Any,
+        max_depth: int = 2,
+        link_types: list[str] | tuple[str, ...] | None = None,
+        max_issues: int = 1000,
+        max_concurrent: int = 10,
+        chunk_size: int = 100,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            issue_manager: IssueManager used to fetch issues with their links
+            max_depth: Number of link hops to follow from the root issues
+            link_types: Only follow links of these types (case-insensitive)
+            max_issues: Stop expanding once this many issues have been seen
+            max_concurrent: Maximum concurrent requests per level
+            chunk_size: Issue IDs per batched request
+        """
+        self.issue_manager = issue_manager
+        self.max_depth = max(0, max_depth)
+        self.link_types = {name.lower() for name in link_types} if link_types else None
+        self.max_issues = max_issues
+        self.max_concurrent = max_concurrent
+        self.chunk_size = chunk_size
+
+    async def crawl(self, root_ids: list[str]) -> IssueGraph:
+        """Crawl the link graph starting from ``root_ids``."""
+        roots = list(dict.fromkeys(issue_id.strip().upper() for issue_id in root_ids if issue_id.strip()))
+        graph = IssueGraph(roots=roots, max_depth=self.max_depth)
+        edge_keys: set[tuple[str, str, str]] = set()
+
+        for root in roots:
+            graph.nodes[root] = IssueGraphNode(id=root, depth=0)
+
+        frontier = list(roots)
+        depth = 0
+        while frontier:
+            result = await self.issue_manager.get_issues_with_links(
+                frontier, chunk_size=self.chunk_size, max_concurrent=self.max_concurrent
+            )
+            graph.requests += result.get("requests", 0)
+            if result["status"] != "success" and not result.get("data"):
+                if depth == 0:
+                    raise ValueError(result.get("message", "Failed to fetch issues"))
+                graph.missing.extend(frontier)
+                break
+            graph.missing.extend(result.get("missing", []))
+            if depth == 0:
+                self._resolve_roots(graph, result.get("data", []))
+
+            next_frontier: list[str] = []
+            for issue in result.get("data", []):
+                issue_id = (issue.get("idReadable") or issue.get("id") or "").upper()
+                node = graph.nodes.get(issue_id)
+                if node is None:
+                    continue
+                node.summary = issue.get("summary") or node.summary
+                node.state = _issue_state(issue) or node.state
+                if depth >= self.max_depth:
+                    continue
+                node.expanded = True
+
+                for link in issue.get("links") or []:
+                    link_type = (link.get("linkType") or {}).get("name", "Related")
+                    if self.link_types is not None and link_type.lower() not in self.link_types:
+                        continue
+                    direction = (link.get("direction") or "BOTH").upper()
+                    for linked in link.get("issues") or []:
+                        linked_id = (linked.get("idReadable") or "").upper()
+                        if not linked_id or linked_id == issue_id:
+                            continue
+                        if linked_id not in graph.nodes:
+                            if len(graph.nodes) >= self.max_issues:
+                                # Leave the link out too, so every edge ends at a known node
+                                graph.truncated = True
+                                continue
+                            graph.nodes[linked_id] = IssueGraphNode(
+                                id=linked_id,
+                                summary=linked.get("summary", ""),
+                                state=_issue_state(linked),
+                                depth=depth + 1,
+                                parent=issue_id,
+                            )
+                            next_frontier.append(linked_id)
+                        self._add_edge(graph, edge_keys, issue_id, linked_id, link_type, direction)
+
+            depth += 1
+            if depth >= self.max_depth:
+                break
+            frontier = next_frontier
+
+        graph.cycles = find_cycles(list(graph.nodes), graph.edges)
+        logger.debug(
+            "Crawled issue graph",
+            roots=roots,
+            nodes=len(graph.nodes),
+            edges=len(graph.edges),
+            cycles=len(graph.cycles),
+            requests=graph.requests,
+        )
+        return graph
+
+    @staticmethod
+    def _resolve_roots(graph: IssueGraph, issues: list[dict[str, Any]]) -> None:
+        """Re-key roots given as internal IDs (``2-123``) by the readable ID of the fetched issue."""
+        for issue in issues:
+            readable_id = (issue.get("idReadable") or "").upper()
+            internal_id = (issue.get("id") or "").upper()
+            if not readable_id or readable_id in graph.nodes or internal_id not in graph.nodes:
+                continue
+            node = graph.nodes.pop(internal_id)
+            node.id = readable_id
+            graph.nodes[readable_id] = node
+            graph.roots = [readable_id if root == internal_id else root for root in graph.roots]
+
+    @staticmethod
+    def _add_edge(
+        graph: IssueGraph,
+        edge_keys: set[tuple[str, str, str]],
+        issue_id: str,
+        linked_id: str,
+        link_type: str,
+        direction: str,
+    ) -> None:
+        if direction == "INWARD":
+            source, target, directed = linked_id, issue_id, True
+        elif direction == "OUTWARD":
+            source, target, directed = issue_id, linked_id, True
+        else:
+            source, target, directed = issue_id, linked_id, False
+
+        if directed:
+            key = (source, target, link_type)
+        else:
+            first, second = sorted((source, target))
+            key = (first, second, link_type)
+        if key in edge_keys:
+            return
+        edge_keys.add(key)
+        graph.edges.append(IssueGraphEdge(source=source, target=target, link_type=link_type, directed=directed))
@@ -0,0 +1,123 @@
+"""Compact read-only view over YouTrack issue payloads."""
+
+from typing import Any
+
+from .custom_field_manager import CustomFieldManager
+from .field_selection import ISSUE_STATE_FIELD_NAMES
+
+__all__ = ["IssueView"]
+
+
+class IssueView:
+    """Read-only wrapper around an issue dict with an indexed ``customFields``.
+
+    Formatting an issue asks for several custom fields (state under up to
+    four names, priority, type, assignee), and each lookup used to scan the
+    ``customFields`` list again. The view builds a name -> raw value map on
+    the first lookup and memoizes every extracted display value, so an issue
+    is scanned once no matter how many columns are rendered.
+
+    ``get`` and item access fall through to the wrapped dict, so a view can be
+    passed anywhere that only reads top-level issue keys.
+    """
+
+    __slots__ = ("issue", "_fields", "_values")
+
+    def __init__(self, issue: dict[str, Any]):
+        """Wrap an issue dict.
+
+        Args:
+            issue: Issue payload as returned by the API
+        """
+        self.issue = issue
+        self._fields: dict[str, Any] | None = None
+        self._values: dict[str, str | None] | None = None
+
+    @classmethod
+    def of(cls, issue: "dict[str, Any] | IssueView") -> "IssueView":
+        """Return ``issue`` if it already is a view, otherwise wrap it."""
+        return issue if isinstance(issue, IssueView) else cls(issue)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a top-level key of the wrapped issue."""
+        return self.issue.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.issue[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.issue
+
+    def _index(self) -> dict[str, Any]:
+        if self._fields is None:
+            custom_fields = self.issue.get("customFields") or []
+            try:
+                # Built back to front so the first occurrence of a name wins,
+                # matching CustomFieldManager.extract_field_value
+                self._fields = {field["name"]: field.get("value") for field in reversed(custom_fields)}
+            except (AttributeError, KeyError, TypeError):
+                fields: dict[str, Any] = {}
+                for custom_field in custom_fields if isinstance(custom_fields, list) else []:
+                    if isinstance(custom_field, dict) and custom_field.get("name") is not None:
+                        fields.setdefault(custom_field["name"], custom_field.get("value"))
+                self._fields = fields
+        return self._fields
+
+    def raw(self, field_name: str) -> Any:
+        """Return the raw ``value`` of a custom field, or None if absent."""
+        return self._index().get(field_name)
+
+    def field(self, field_name: str) -> str | None:
+        """Return the display value of a custom field.
+
+        Values are extracted the same way as
+        ``CustomFieldManager.extract_field_value`` and converted to ``str``.
+        """
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        elif field_name in values:
+            return values[field_name]
+
+        fields = self._fields if self._fields is not None else self._index()
+        raw = fields.get(field_name)
+        value = None
+        if raw is not None:
+            extracted = CustomFieldManager._extract_dict_value(raw)
+            if extracted is not None:
+                value = str(extracted)
+        values[field_name] = value
+        return value
+
+    def first_field(self, field_names: tuple[str, ...] | list[str]) -> str | None:
+        """Return the first non-empty display value among ``field_names``."""
+        fields = self._fields if self._fields is not None else self._index()
+        for field_name in field_names:
+            if fields.get(field_name) is not None:
+                value = self.field(field_name)
+                if value:
+                    return value
+        return None
+
+    @property
+    def id(self) -> str:
+        """Readable issue ID, falling back to the internal ID."""
+        return self.issue.get("idReadable", self.issue.get("id", ""))
+
+    @property
+    def summary(self) -> str:
+        """Issue summary."""
+        return self.issue.get("summary", "")
+
+    @property
+    def state(self) -> str:
+        """State value, trying the common state field names in order."""
+        return self.first_field(ISSUE_STATE_FIELD_NAMES) or ""
+
+    @property
+    def project_name(self) -> str:
+        """Project name, falling back to the short name."""
+        project = self.issue.get("project")
+        if isinstance(project, dict):
+            return project.get("name", project.get("shortName", ""))
+        return ""
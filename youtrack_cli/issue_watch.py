@@ -0,0 +1,250 @@
+"""Poll an issue query and report what changed since the previous poll."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any
+
+from .exceptions import YouTrackError
+from .logging import get_logger
+
+__all__ = [
+    "WATCH_EVENT_LEFT_QUERY",
+    "WATCH_EVENT_NEW",
+    "WATCH_EVENT_UPDATED",
+    "WATCH_ISSUE_FIELDS",
+    "IssueChangeEvent",
+    "IssueWatcher",
+]
+
+logger = get_logger(__name__)
+
+WATCH_EVENT_NEW = "new"
+WATCH_EVENT_UPDATED = "updated"
+WATCH_EVENT_LEFT_QUERY = "left-query"
+
+#: Fields included with ``new`` and ``updated`` events unless overridden.
+WATCH_ISSUE_FIELDS = (
+    "id,idReadable,summary,created,updated,resolved,project(shortName),customFields(name,value(name,login,fullName))"
+)
+
+# Only the ID and timestamp are needed to track membership and detect issues
+# that stopped matching the query.
+_KEY_FIELDS = "idReadable,updated"
+_SORT_BY_UPDATED = "sort by: updated desc"
+
+
+@dataclass(frozen=True)
+class IssueChangeEvent:
+    """A change to the result set of a watched query."""
+
+    event: str
+    id: str
+    updated: int | None
+    issue: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the event."""
+        return {"event": self.event, "id": self.id, "updated": self.updated, "issue": self.issue}
+
+    def to_json(self) -> str:
+        """Serialize the event as a single NDJSON line (without the newline)."""
+        return json.dumps(self.to_dict())
+
+
+def _issue_key(issue: dict[str, Any]) -> str | None:
+    return issue.get("idReadable") or issue.get("id")
+
+
+def _updated(issue: dict[str, Any]) -> int:
+    updated = issue.get("updated")
+    return updated if isinstance(updated, int) else 0
+
+
+class IssueWatcher:
+    """Track the issues matching a query with delta fetches.
+
+    The first poll records the ID and ``updated`` timestamp of every issue
+    that matches. Later polls fetch the query sorted by ``updated``
+    (newest first) and stop paging at the first issue not newer than the
+    ``updated`` watermark, so each poll transfers only what changed. Issues
+    that were known but no longer match are found from a second stream of
+    all recently updated issues, stopped at its own watermark and carrying
+    only IDs and timestamps, so its cost follows what changed on the server
+    rather than the size of the result set.
+
+    The poll interval starts at ``interval``, grows by ``backoff`` after
+    every poll that found nothing, up to ``max_interval``, and drops back to
+    ``interval`` as soon as a change is seen. Deleted issues are not
+    reported: they disappear from every query without leaving an update.
+    """
+
+    def __init__(
+        self,
+        issue_service: Any,
+        query: str,
+        fields: str | None = None,
+        interval: float = 30.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        page_size: int = 100,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            issue_service: IssueService used for the searches
+            query: YouTrack query to watch; it should not contain ``sort by``
+            fields: Fields for issues in events; ``idReadable`` and ``updated`` are always added
+            interval: Seconds between polls while changes keep arriving
+            max_interval: Upper bound for the interval when idle
+            backoff: Factor applied to the interval after an idle poll
+            page_size: Issues per request
+        """
+        self.issue_service = issue_service
+        self.query = query.strip()
+        self.fields = self._with_key_fields(fields or WATCH_ISSUE_FIELDS)
+        self.base_interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.backoff = max(1.0, backoff)
+        self.page_size = page_size
+        self.interval = interval
+        self.known: dict[str, int] = {}
+        self.watermark: int | None = None
+        self.left_watermark: int | None = None
+        self.requests = 0
+
+    @staticmethod
+    def _with_key_fields(fields: str) -> str:
+        names = {name.strip() for name in fields.split(",")}
+        missing = [name for name in ("idReadable", "updated") if name not in names]
+        return ",".join([fields, *missing]) if missing else fields
+
+    async def _fetch_page(self, query: str, fields: str, skip: int) -> list[dict[str, Any]]:
+        result = await self.issue_service.search_issues(query=query, fields=fields, top=self.page_size, skip=skip)
+        self.requests += 1
+        if result.get("status") != "success":
+            raise YouTrackError(result.get("message", "Failed to search issues"))
+        data = result.get("data") or []
+        return data if isinstance(data, list) else []
+
+    async def _fetch_all(self, query: str, fields: str) -> list[dict[str, Any]]:
+        issues: list[dict[str, Any]] = []
+        while True:
+            page = await self._fetch_page(query, fields, len(issues))
+            issues.extend(page)
+            if len(page) < self.page_size:
+                return issues
+
+    async def _fetch_since(self, query: str, fields: str, watermark: int | None) -> list[dict[str, Any]]:
+        """Fetch issues updated at or after ``watermark``, newest first.
+
+        Issues updated exactly at the watermark are fetched again; callers
+        drop the ones they have already seen.
+        """
+        sorted_query = f"{query} {_SORT_BY_UPDATED}".strip()
+        issues: list[dict[str, Any]] = []
+        while True:
+            page = await self._fetch_page(sorted_query, fields, len(issues))
+            for issue in page:
+                if watermark is not None and _updated(issue) < watermark:
+                    return issues
+                issues.append(issue)
+            if len(page) < self.page_size:
+                return issues
+
+    async def start(self, emit_existing: bool = False) -> list[IssueChangeEvent]:
+        """Record the current result set and set the watermarks.
+
+        Args:
+            emit_existing: Return a ``new`` event for every issue that already matches
+
+        Returns:
+            Events for the existing issues, or an empty list
+        """
+        issues = await self._fetch_all(self.query, self.fields if emit_existing else _KEY_FIELDS)
+        events = []
+        for issue in issues:
+            key = _issue_key(issue)
+            if key is None:
+                continue
+            self.known[key] = _updated(issue)
+            if emit_existing:
+                events.append(IssueChangeEvent(WATCH_EVENT_NEW, key, issue.get("updated"), issue))
+        if self.known:
+            self.watermark = self.left_watermark = max(self.known.values())
+        return events
+
+    async def poll(self) -> list[IssueChangeEvent]:
+        """Fetch what changed since the previous poll and return it as events."""
+        # Candidates for leaving the query are read first: an issue changed
+        # between the two requests then shows up in the matching stream and
+        # is not mistaken for one that left.
+        candidates = await self._fetch_since("", _KEY_FIELDS, self.left_watermark)
+        matching = await self._fetch_since(self.query, self.fields, self.watermark)
+
+        events: list[IssueChangeEvent] = []
+        matched_keys = set()
+        for issue in reversed(matching):
+            key = _issue_key(issue)
+            if key is None:
+                continue
+            matched_keys.add(key)
+            updated = _updated(issue)
+            previous = self.known.get(key)
+            if previous is None:
+                events.append(IssueChangeEvent(WATCH_EVENT_NEW, key, issue.get("updated"), issue))
+            elif updated > previous:
+                events.append(IssueChangeEvent(WATCH_EVENT_UPDATED, key, issue.get("updated"), issue))
+            else:
+                continue
+            self.known[key] = updated
+
+        for issue in reversed(candidates):
+            key = _issue_key(issue)
+            if key is None or key in matched_keys or key not in self.known:
+                continue
+            if _updated(issue) > self.known[key]:
+                del self.known[key]
+                events.append(IssueChangeEvent(WATCH_EVENT_LEFT_QUERY, key, issue.get("updated"), issue))
+
+        if matching:
+            self.watermark = max(self.watermark or 0, max(_updated(issue) for issue in matching))
+        if candidates:
+            self.left_watermark = max(self.left_watermark or 0, max(_updated(issue) for issue in candidates))
+        elif self.left_watermark is None:
+            self.left_watermark = self.watermark
+        return events
+
+    def adjust_interval(self, changed: bool) -> float:
+        """Reset the interval after a change, or back off after an idle poll."""
+        if changed:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return self.interval
+
+    async def watch(
+        self, emit_existing: bool = False, max_polls: int | None = None
+    ) -> AsyncGenerator[IssueChangeEvent, None]:
+        """Yield change events until cancelled or ``max_polls`` polls have run.
+
+        A failure during the initial fetch is raised; a failed poll later on
+        is logged and treated as idle, so a long-running watch survives
+        transient server or network errors.
+        """
+        for event in await self.start(emit_existing):
+            yield event
+
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            await asyncio.sleep(self.interval)
+            polls += 1
+            try:
+                events = await self.poll()
+            except Exception as e:
+                logger.warning("Issue watch poll failed", query=self.query, error=str(e))
+                events = []
+            for event in events:
+                yield event
+            self.adjust_interval(bool(events))
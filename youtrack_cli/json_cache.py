@@ -0,0 +1,128 @@
+"""Small JSON files kept under ``~/.config/youtrack-cli`` between commands.
+
+Every on-disk cache of the CLI follows the same rules: files are named by a
+short hash of what they depend on, written atomically through a temporary
+file, and a file that cannot be read or parsed is treated as missing.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .logging import get_logger
+
+__all__ = ["JsonFileCache", "cache_key", "config_path", "read_json", "write_json"]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def config_path(*parts: str) -> Path:
+    """Return a path inside the CLI config directory."""
+    return Path.home().joinpath(".config", "youtrack-cli", *parts)
+
+
+def cache_key(*parts: str) -> str:
+    """Return a short stable file name for the values a cached file depends on."""
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def read_json(path: Path, description: str, parse: Callable[[Any], T] = _identity) -> T | None:
+    """Read ``path`` and convert it with ``parse``.
+
+    Args:
+        path: File to read
+        description: What the file holds, for the log message
+        parse: Converts the decoded JSON; may raise on unexpected content
+
+    Returns:
+        The parsed content, or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return parse(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError, AttributeError, KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable {description}", path=str(path), error=str(e))
+        return None
+
+
+def write_json(path: Path, data: Any, description: str, private: bool = False) -> None:
+    """Write ``data`` to ``path``, replacing the previous file atomically.
+
+    Args:
+        path: File to write; missing parent directories are created
+        data: JSON-serializable content
+        description: What the file holds, for the log message
+        private: Make the file readable by the owner only
+    """
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        if private:
+            os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write {description}", path=str(path), error=str(e))
+
+
+class JsonFileCache:
+    """Base for caches keeping one JSON file per scope in a config subdirectory.
+
+    Subclasses set ``directory`` (the subdirectory of the CLI config
+    directory used by default) and ``description`` (used in log messages),
+    and read and write their entries with ``_read`` and ``_write``. Caches
+    holding personal data set ``private`` so their files are owner-only.
+    """
+
+    directory: str = ""
+    description: str = "cache entry"
+    private: bool = False
+    #: Files removed by ``clear``, relative to ``cache_dir``.
+    file_pattern: str = "*.json"
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files; defaults to the CLI config directory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else config_path(self.directory)
+
+    @staticmethod
+    def scope(*parts: str) -> str:
+        """Return a short stable key for what an entry depends on."""
+        return cache_key(*parts)
+
+    def _path(self, scope: str) -> Path:
+        return self.cache_dir / f"{scope}.json"
+
+    def _read(self, path: Path, parse: Callable[[Any], T] = _identity) -> T | None:
+        return read_json(path, self.description, parse)
+
+    def _write(self, path: Path, data: Any) -> None:
+        write_json(path, data, self.description, private=self.private)
+
+    def clear(self) -> int:
+        """Delete every cached file and return how many were removed."""
+        removed = 0
+        if not self.cache_dir.exists():
+            return removed
+        for path in self.cache_dir.glob(self.file_pattern):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
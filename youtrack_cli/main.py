@@ -20,6 +20,7 @@ from .logging import setup_logging
 from .progress import set_progress_enabled
 from .reports import ReportManager
 from .security import AuditLogger, SecurityConfig
+from .user_directory import complete_user_logins
 
 __all__ = [
     "main",
@@ -225,11 +226,74 @@ main.add_alias("login", "auth")
 # These provide easier-to-use alternatives to deeply nested commands
 
 
+def _run_burndown(
+    ctx: click.Context,
+    project_id: str,
+    sprint: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    daily: bool,
+    output_format: str,
+) -> None:
+    """Generate and print a burndown report; shared by 'yt burndown' and 'yt reports burndown'."""
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    report_manager = ReportManager(auth_manager)
+    console = get_console()
+
+    if output_format != "table":
+        set_progress_enabled(False)
+
+    async def run_burndown() -> None:
+        result = await report_manager.generate_burndown_report(
+            project_id=project_id,
+            sprint_id=sprint,
+            start_date=start_date,
+            end_date=end_date,
+            include_series=daily or output_format == "csv",
+        )
+
+        if result["status"] == "error":
+            console.print(f"[red]Error:[/red] {result['message']}")
+            return
+
+        if output_format == "json":
+            import json
+
+            click.echo(json.dumps(result["data"], indent=2))
+        elif output_format == "csv":
+            import sys
+
+            report_manager.write_burndown_csv(sys.stdout, result["data"])
+        else:
+            report_manager.display_burndown_report(result["data"])
+
+    asyncio.run(run_burndown())
+
+
+_BURNDOWN_OPTIONS = (
+    click.option("--sprint", "-s", help="Sprint ID or name to filter by"),
+    click.option("--start-date", help="Start date in YYYY-MM-DD format"),
+    click.option("--end-date", help="End date in YYYY-MM-DD format"),
+    click.option("--daily", is_flag=True, help="Include a daily burnup/burndown series (implied by --format csv)"),
+    click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["table", "json", "csv"]),
+        default="table",
+        help="Output format",
+    ),
+)
+
+
+def _burndown_options(func):
+    for option in reversed(_BURNDOWN_OPTIONS):
+        func = option(func)
+    return func
+
+
 @main.command()
 @click.argument("project_id")
-@click.option("--sprint", "-s", help="Sprint ID or name to filter by")
-@click.option("--start-date", help="Start date in YYYY-MM-DD format")
-@click.option("--end-date", help="End date in YYYY-MM-DD format")
+@_burndown_options
 @click.pass_context
 def burndown(
     ctx: click.Context,
@@ -237,6 +301,8 @@ def burndown(
     sprint: str | None,
     start_date: str | None,
     end_date: str | None,
+    daily: bool,
+    output_format: str,
 ) -> None:
     """Generate a burndown report for a project or sprint.
 
@@ -255,25 +321,7 @@ def burndown(
 
     Note: You can also use 'yt reports burndown' for the same functionality.
     """
-    auth_manager = AuthManager(ctx.obj.get("config"))
-    report_manager = ReportManager(auth_manager)
-    console = get_console()
-
-    async def run_burndown() -> None:
-        result = await report_manager.generate_burndown_report(
-            project_id=project_id,
-            sprint_id=sprint,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        if result["status"] == "error":
-            console.print(f"[red]Error:[/red] {result['message']}")
-            return
-
-        report_manager.display_burndown_report(result["data"])
-
-    asyncio.run(run_burndown())
+    _run_burndown(ctx, project_id, sprint, start_date, end_date, daily, output_format)
 
 
 @main.command()
@@ -285,11 +333,13 @@ def burndown(
     default=5,
     help="Number of recent sprints to analyze (default: 5)",
 )
+@click.option("--no-cache", is_flag=True, help="Recompute released sprints instead of reusing the local cache")
 @click.pass_context
 def velocity(
     ctx: click.Context,
     project_id: str,
     sprints: int,
+    no_cache: bool,
 ) -> None:
     """Generate a velocity report for recent sprints.
 
@@ -312,6 +362,7 @@ def velocity(
         result = await report_manager.generate_velocity_report(
             project_id=project_id,
             sprints=sprints,
+            use_cache=not no_cache,
         )
 
         if result["status"] == "error":
@@ -907,7 +958,9 @@ def setup(ctx: click.Context, skip_validation: bool) -> None:
 
 
 @main.command()
-@click.option("--assignee", "-a", help="Filter by assignee (use 'me' for current user)")
+@click.option(
+    "--assignee", "-a", shell_complete=complete_user_logins, help="Filter by assignee (use 'me' for current user)"
+)
 @click.option("--project", "-p", help="Filter by project")
 @click.option("--state", "-s", help="Filter by state")
 @click.option("--type", "-t", help="Filter by issue type")
@@ -995,7 +1048,7 @@ def ls(
 @click.option("--description", "-d", help="Issue description")
 @click.option("--type", "-t", help="Issue type (Bug, Feature, Task, etc.)")
 @click.option("--priority", "-p", help="Issue priority")
-@click.option("--assignee", "-a", help="Assign to user")
+@click.option("--assignee", "-a", shell_complete=complete_user_logins, help="Assign to user")
 @click.option("--tag", help="Add tags (comma-separated)")
 @click.pass_context
 def new(
@@ -1048,9 +1101,7 @@ def reports() -> None:
 
 @reports.command(name="burndown")
 @click.argument("project_id")
-@click.option("--sprint", "-s", help="Sprint ID or name to filter by")
-@click.option("--start-date", help="Start date in YYYY-MM-DD format")
-@click.option("--end-date", help="End date in YYYY-MM-DD format")
+@_burndown_options
 @click.pass_context
 def reports_burndown(
     ctx: click.Context,
@@ -1058,6 +1109,8 @@ def reports_burndown(
     sprint: str | None,
     start_date: str | None,
     end_date: str | None,
+    daily: bool,
+    output_format: str,
 ) -> None:
     """Generate a burndown report for a project or sprint.
 
@@ -1076,25 +1129,7 @@ def reports_burndown(
 
     Note: Use project ID as a positional argument, not --project flag.
     """
-    auth_manager = AuthManager(ctx.obj.get("config"))
-    report_manager = ReportManager(auth_manager)
-    console = get_console()
-
-    async def run_burndown() -> None:
-        result = await report_manager.generate_burndown_report(
-            project_id=project_id,
-            sprint_id=sprint,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        if result["status"] == "error":
-            console.print(f"[red]Error:[/red] {result['message']}")
-            return
-
-        report_manager.display_burndown_report(result["data"])
-
-    asyncio.run(run_burndown())
+    _run_burndown(ctx, project_id, sprint, start_date, end_date, daily, output_format)
 
 
 @reports.command(name="velocity")
@@ -1106,11 +1141,13 @@ def reports_burndown(
     default=5,
     help="Number of recent sprints to analyze (default: 5)",
 )
+@click.option("--no-cache", is_flag=True, help="Recompute released sprints instead of reusing the local cache")
 @click.pass_context
 def reports_velocity(
     ctx: click.Context,
     project_id: str,
     sprints: int,
+    no_cache: bool,
 ) -> None:
     """Generate a velocity report for recent sprints."""
     auth_manager = AuthManager(ctx.obj.get("config"))
@@ -1121,6 +1158,7 @@ def reports_velocity(
         result = await report_manager.generate_velocity_report(
             project_id=project_id,
             sprints=sprints,
+            use_cache=not no_cache,
         )
 
         if result["status"] == "error":
@@ -1132,6 +1170,93 @@ def reports_velocity(
     asyncio.run(run_velocity())
 
 
+def _validate_iso_date(ctx: click.Context, param: click.Parameter, value: str | None) -> str | None:
+    from datetime import date
+
+    if value is None:
+        return value
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f"'{value}' is not a valid date; expected YYYY-MM-DD") from None
+    return value
+
+
+@reports.command(name="cycle-time")
+@click.argument("project_id")
+@click.option(
+    "--start-date",
+    callback=_validate_iso_date,
+    help="Start of the resolution period in YYYY-MM-DD format (default: 90 days ago)",
+)
+@click.option(
+    "--end-date", callback=_validate_iso_date, help="End of the resolution period in YYYY-MM-DD format (default: today)"
+)
+@click.option(
+    "--start-state",
+    "start_states",
+    multiple=True,
+    help="State that marks the start of work (repeatable; default: first state change)",
+)
+@click.option("--query", "-q", help="Additional query terms to narrow the issues")
+@click.option("--no-cache", is_flag=True, help="Fetch all history instead of reusing the local activity cache")
+@click.option("--max-concurrent", type=click.IntRange(min=1), default=8, help="Issues whose history is read at once")
+@click.option("--format", type=click.Choice(["table", "json"]), default="table", help="Output format")
+@click.pass_context
+def reports_cycle_time(
+    ctx: click.Context,
+    project_id: str,
+    start_date: str | None,
+    end_date: str | None,
+    start_states: tuple[str, ...],
+    query: str | None,
+    no_cache: bool,
+    max_concurrent: int,
+    format: str,
+) -> None:
+    """Report lead time, cycle time and time in state for resolved issues.
+
+    Metrics come from each issue's state change history, which is cached
+    locally so later runs only fetch new activity.
+
+    Examples:
+        # Last 90 days
+        yt reports cycle-time DEMO
+
+        # A year of bugs, with work starting at "In Progress"
+        yt reports cycle-time WEB --start-date 2025-01-01 --start-state "In Progress" -q "type: Bug"
+    """
+    import json
+
+    auth_manager = AuthManager(ctx.obj.get("config"))
+    report_manager = ReportManager(auth_manager)
+    console = get_console()
+
+    if format == "json":
+        set_progress_enabled(False)
+
+    result = asyncio.run(
+        report_manager.generate_cycle_time_report(
+            project_id=project_id,
+            start_date=start_date,
+            end_date=end_date,
+            start_states=list(start_states) or None,
+            query=query,
+            use_cache=not no_cache,
+            max_concurrent=max_concurrent,
+        )
+    )
+
+    if result["status"] == "error":
+        console.print(f"[red]Error:[/red] {result['message']}")
+        raise click.ClickException("Failed to generate cycle time report")
+
+    if format == "json":
+        click.echo(json.dumps(result["data"], indent=2))
+    else:
+        report_manager.display_cycle_time_report(result["data"])
+
+
 @main.group()
 @click.pass_context
 def auth(ctx: click.Context) -> None:
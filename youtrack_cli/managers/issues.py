@@ -1,30 +1,46 @@
 """Issue manager for YouTrack CLI business logic."""
 
+import asyncio
+import json
+import re
+import time
 from collections.abc import AsyncGenerator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from rich.table import Table
 
 from ..auth import AuthManager
 from ..console import get_console
-from ..custom_field_manager import CustomFieldManager
 from ..exceptions import YouTrackError
+from ..issue_view import IssueView
 from ..logging import get_logger
-from ..pagination import create_paginated_display
+from ..pagination import LazyPageSource, PageSource, create_paginated_display
 from ..panels import (
     PanelGroup,
     create_custom_fields_panel,
     create_issue_details_panel,
     create_issue_overview_panel,
 )
-from ..services.issues import IssueService
+from ..plain_table import print_table
+from ..services.issues import DEFAULT_ISSUE_FIELDS, IssueService
+from ..services.project_schema import ProjectSchema
 from ..services.projects import ProjectService
+from ..stream_writers import CSVStreamWriter, JSONArrayWriter, write_stream
 
-__all__ = ["IssueManager"]
+__all__ = ["ISSUE_CSV_HEADERS", "IssueManager"]
 
 logger = get_logger(__name__)
 
+# Readable issue IDs (PROJ-123) can be batched into one `issue id:` query;
+# anything else (internal IDs like 2-123) is fetched individually.
+_READABLE_ISSUE_ID_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*-\d+$")
+
+ISSUE_CSV_HEADERS = ("ID", "Summary", "State", "Priority", "Type", "Assignee", "Project")
+
+_LINKED_ISSUE_FIELDS = "id,idReadable,summary,customFields(name,value(name,login,fullName))"
+ISSUE_WITH_LINKS_FIELDS = f"{_LINKED_ISSUE_FIELDS},links(id,direction,linkType(id,name),issues({_LINKED_ISSUE_FIELDS}))"
+
 
 class IssueManager:
     """Manages YouTrack issues business logic and presentation.
@@ -40,7 +56,7 @@ class IssueManager:
         self.issue_service = IssueService(auth_manager)
         self.project_service = ProjectService(auth_manager)
 
-    def _get_custom_field_value(self, issue: dict[str, Any], field_name: str) -> str | None:
+    def _get_custom_field_value(self, issue: dict[str, Any] | IssueView, field_name: str) -> str | None:
         """Extract value from custom fields by field name using CustomFieldManager.
 
         Supports all YouTrack custom field types including:
@@ -48,11 +64,9 @@ class IssueManager:
         - localizedName, minutes, presentation, text
         - Complex nested field structures
         """
-        custom_fields = issue.get("customFields", [])
-        result = CustomFieldManager.extract_field_value(custom_fields, field_name)
-        return str(result) if result is not None else None
+        return IssueView.of(issue).field(field_name)
 
-    def _get_assignee_name(self, issue: dict[str, Any]) -> str:
+    def _get_assignee_name(self, issue: dict[str, Any] | IssueView) -> str:
         """Get assignee name from either regular field or custom field."""
         # First try the regular assignee field
         assignee = issue.get("assignee")
@@ -81,17 +95,9 @@ class IssueManager:
 
         return "Unassigned"
 
-    def _get_state_field_value(self, issue: dict[str, Any]) -> str:
+    def _get_state_field_value(self, issue: dict[str, Any] | IssueView) -> str:
         """Get state field value, trying common field names."""
-        # Try common state field names in order of preference
-        state_field_names = ["State", "Status", "Stage", "Workflow State"]
-
-        for field_name in state_field_names:
-            state = self._get_custom_field_value(issue, field_name)
-            if state:
-                return state
-
-        return ""
+        return IssueView.of(issue).state
 
     async def create_issue(
         self,
@@ -162,6 +168,196 @@ class IssueManager:
         """Get issue details with enhanced presentation data."""
         return await self.issue_service.get_issue(issue_id)
 
+    async def get_issues(
+        self,
+        issue_ids: list[str],
+        fields: str | None = None,
+        chunk_size: int = 100,
+        max_concurrent: int = 10,
+    ) -> dict[str, Any]:
+        """Get several issues with as few requests as possible.
+
+        Readable IDs are resolved in chunks of ``chunk_size`` with a single
+        ``issue id: A-1, A-2, ...`` search each. IDs a chunk did not return
+        (internal IDs, moved or missing issues) fall back to individual GETs,
+        run concurrently up to ``max_concurrent`` at a time.
+
+        Args:
+            issue_ids: Issue IDs to fetch (duplicates are fetched once)
+            fields: Field selection; defaults to the ``get_issue`` field set
+            chunk_size: Maximum number of IDs per search request
+            max_concurrent: Maximum concurrent requests
+
+        Returns:
+            Response with ``data`` in input order, plus ``missing`` IDs,
+            per-ID ``errors`` for issues that could not be fetched and the
+            number of ``requests`` made
+        """
+        ordered_ids = list(dict.fromkeys(i.strip() for i in issue_ids if i and i.strip()))
+        if not ordered_ids:
+            return {"status": "success", "data": [], "count": 0, "missing": [], "errors": {}, "requests": 0}
+
+        fields = fields or DEFAULT_ISSUE_FIELDS
+        if "idReadable" not in fields:
+            # Needed to match search results back to the requested IDs.
+            fields = f"idReadable,{fields}"
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        found: dict[str, dict[str, Any]] = {}
+        errors: dict[str, str] = {}
+
+        readable = [i for i in ordered_ids if _READABLE_ISSUE_ID_RE.match(i)]
+        chunk_size = max(1, chunk_size)
+        chunks = [readable[i : i + chunk_size] for i in range(0, len(readable), chunk_size)]
+
+        async def _fetch_chunk(chunk: list[str]) -> None:
+            async with semaphore:
+                result = await self.issue_service.search_issues(
+                    query=f"issue id: {', '.join(chunk)}", fields=fields, top=len(chunk)
+                )
+            if result.get("status") != "success":
+                logger.warning("Batched issue lookup failed, falling back to single GETs", size=len(chunk))
+                return
+            for issue in result.get("data") or []:
+                readable_id = issue.get("idReadable") if isinstance(issue, dict) else None
+                if readable_id:
+                    found[readable_id.upper()] = issue
+
+        await asyncio.gather(*(_fetch_chunk(chunk) for chunk in chunks))
+
+        misses = [i for i in ordered_ids if i.upper() not in found]
+
+        async def _fetch_single(issue_id: str) -> None:
+            async with semaphore:
+                result = await self.issue_service.get_issue(issue_id, fields=fields)
+            if result.get("status") == "success" and result.get("data"):
+                found[issue_id.upper()] = result["data"]
+            else:
+                errors[issue_id] = result.get("message", "Issue not found")
+
+        await asyncio.gather(*(_fetch_single(issue_id) for issue_id in misses))
+
+        data = [found[i.upper()] for i in ordered_ids if i.upper() in found]
+        missing = [i for i in ordered_ids if i.upper() not in found]
+        logger.debug(
+            "Fetched issues in bulk",
+            requested=len(ordered_ids),
+            batched_requests=len(chunks),
+            single_requests=len(misses),
+            missing=len(missing),
+        )
+
+        requests = len(chunks) + len(misses)
+        if not data:
+            first_error = next(iter(errors.values()), "No issues found")
+            return {
+                "status": "error",
+                "message": first_error,
+                "missing": missing,
+                "errors": errors,
+                "requests": requests,
+            }
+
+        return {
+            "status": "success",
+            "data": data,
+            "count": len(data),
+            "missing": missing,
+            "errors": errors,
+            "requests": requests,
+        }
+
+    async def get_issues_with_links(self, issue_ids: list[str], **kwargs: Any) -> dict[str, Any]:
+        """Get several issues together with their links, batched like ``get_issues``.
+
+        Each returned issue carries a ``links`` list shaped like ``list_links``
+        output, so relationship views need no per-issue links request.
+        """
+        return await self.get_issues(issue_ids, fields=ISSUE_WITH_LINKS_FIELDS, **kwargs)
+
+    async def apply_command(
+        self,
+        query: str,
+        issue_ids: list[str],
+        chunk_size: int = 100,
+        max_concurrent: int = 4,
+        comment: str | None = None,
+        silent: bool = False,
+    ) -> dict[str, Any]:
+        """Apply one YouTrack command to many issues in chunked requests.
+
+        Each chunk of ``chunk_size`` issues is sent as a single command
+        request. When a chunk is rejected (YouTrack fails the whole command if
+        any issue in it cannot take it), the command is retried per issue so
+        the failures can be attributed to individual issues.
+
+        Args:
+            query: Command text, e.g. ``State Fixed``
+            issue_ids: Issues to apply the command to (duplicates applied once)
+            chunk_size: Maximum number of issues per command request
+            max_concurrent: Maximum concurrent requests
+            comment: Optional comment added alongside the command
+            silent: Suppress notifications for the change
+
+        Returns:
+            Response with ``applied`` issue IDs, per-ID ``errors`` and the
+            number of ``requests`` made
+        """
+        ordered_ids = list(dict.fromkeys(i.strip() for i in issue_ids if i and i.strip()))
+        if not query.strip():
+            return {"status": "error", "message": "Command cannot be empty"}
+        if not ordered_ids:
+            return {"status": "success", "message": "No issues to update", "applied": [], "errors": {}, "requests": 0}
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        chunk_size = max(1, chunk_size)
+        chunks = [ordered_ids[i : i + chunk_size] for i in range(0, len(ordered_ids), chunk_size)]
+        applied: set[str] = set()
+        errors: dict[str, str] = {}
+        requests = 0
+
+        async def _apply(ids: list[str]) -> dict[str, Any]:
+            nonlocal requests
+            async with semaphore:
+                requests += 1
+                return await self.issue_service.apply_command(query, ids, comment=comment, silent=silent)
+
+        async def _apply_single(issue_id: str) -> None:
+            result = await _apply([issue_id])
+            if result["status"] == "success":
+                applied.add(issue_id)
+            else:
+                errors[issue_id] = result.get("message", "Command failed")
+
+        async def _apply_chunk(chunk: list[str]) -> None:
+            result = await _apply(chunk)
+            if result["status"] == "success":
+                applied.update(chunk)
+                return
+            if len(chunk) == 1:
+                errors[chunk[0]] = result.get("message", "Command failed")
+                return
+            logger.warning("Bulk command rejected, retrying per issue", command=query, size=len(chunk))
+            await asyncio.gather(*(_apply_single(issue_id) for issue_id in chunk))
+
+        await asyncio.gather(*(_apply_chunk(chunk) for chunk in chunks))
+
+        logger.debug(
+            "Applied bulk command",
+            command=query,
+            issues=len(ordered_ids),
+            failed=len(errors),
+            requests=requests,
+        )
+        status = "success" if not errors else ("partial" if applied else "error")
+        return {
+            "status": status,
+            "message": f"Applied '{query}' to {len(applied)} of {len(ordered_ids)} issue(s)",
+            "applied": [i for i in ordered_ids if i in applied],
+            "errors": errors,
+            "requests": requests,
+        }
+
     async def update_issue(
         self,
         issue_id: str,
@@ -205,15 +401,14 @@ class IssueManager:
         before_cursor: str | None = None,
         use_pagination: bool = False,
         max_results: int | None = None,
+        columns: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Search issues with enhanced formatting and pagination."""
-        # Resolve a field profile name (minimal/standard/full) to its actual field
-        # list. Passing the profile name straight to the REST `fields=` param made
-        # YouTrack treat it as an unknown field and return near-empty issues (#726).
-        if field_profile and not fields:
-            from ..field_selection import get_field_selector
+        """Search issues with enhanced formatting and pagination.
 
-            fields = get_field_selector().get_fields("issues", field_profile)
+        When neither ``fields`` nor ``field_profile`` is given, the fetch is
+        projected down to what ``format_output`` (and ``columns``) will render.
+        """
+        fields, custom_fields = self._resolve_issue_fields(fields, field_profile, format_output, columns)
 
         # Build the query with project filter if specified
         full_query = query
@@ -235,6 +430,7 @@ class IssueManager:
                 fields=fields,
                 top=this_page,
                 skip=offset,
+                custom_fields=custom_fields,
             )
             if page_result.get("status") != "success":
                 # Nothing collected yet → surface the error. Otherwise keep the
@@ -259,6 +455,34 @@ class IssueManager:
 
         return result
 
+    def _resolve_issue_fields(
+        self,
+        fields: str | None,
+        field_profile: str | None,
+        format_output: str | None,
+        columns: list[str] | None = None,
+    ) -> tuple[str | None, tuple[str, ...] | None]:
+        """Work out the ``fields=`` expression and custom field filter for a fetch.
+
+        Explicit fields win, then a named profile. Otherwise the selection is
+        projected from the output format so table/CSV listings only download the
+        attributes and custom fields they actually show.
+        """
+        from ..field_selection import get_field_selector
+
+        if fields:
+            return fields, None
+        # Resolve a field profile name (minimal/standard/full) to its actual field
+        # list. Passing the profile name straight to the REST `fields=` param made
+        # YouTrack treat it as an unknown field and return near-empty issues (#726).
+        if field_profile:
+            return get_field_selector().get_fields("issues", field_profile), None
+        if format_output:
+            projection = get_field_selector().project_issue_fields(format_output, columns)
+            if projection is not None:
+                return projection.fields, projection.custom_fields or None
+        return None, None
+
     async def assign_issue(self, issue_id: str, assignee: str) -> dict[str, Any]:
         """Assign an issue to a user."""
         return await self.issue_service.assign_issue(issue_id, assignee)
@@ -344,16 +568,23 @@ class IssueManager:
         return await self.issue_service.create_tag(tag_name)
 
     def _format_issues_for_display(
-        self, issues: list[dict[str, Any]], format_type: str, no_pagination: bool = False
+        self, issues: list[dict[str, Any]], format_type: str, no_pagination: bool = False, page_size: int = 50
     ) -> str:
-        """Format issues for CLI display."""
+        """Format issues for CLI display.
+
+        Unless ``no_pagination`` is set, a table only renders the first
+        ``page_size`` issues; the rest are left to the paginated display.
+        """
         if not issues:
             return "No issues found."
 
         if format_type == "csv":
             return self._format_issues_as_csv(issues)
         elif format_type == "table":
-            return self._format_issues_as_table(issues, no_pagination)
+            if no_pagination or len(issues) <= page_size:
+                return self._format_issues_as_table(issues, no_pagination)
+            shown = self._format_issues_as_table(issues[:page_size], no_pagination)
+            return f"{shown}Showing 1-{page_size} of {len(issues)} issues\n"
         else:
             return str(issues)
 
@@ -363,47 +594,42 @@ class IssueManager:
         import io
 
         if not issues:
-            return "ID,Summary,State,Priority,Type,Assignee,Project\n"
+            return ",".join(ISSUE_CSV_HEADERS) + "\n"
 
         # Create CSV in memory
         output = io.StringIO()
         writer = csv.writer(output)
-
-        # Write header
-        headers = ["ID", "Summary", "State", "Priority", "Type", "Assignee", "Project"]
-        writer.writerow(headers)
-
-        # Write data rows
-        for issue in issues:
-            # Extract project info
-            project_name = ""
-            if isinstance(issue.get("project"), dict):
-                project_name = issue["project"].get("name", issue["project"].get("shortName", ""))
-
-            # Extract assignee info
-            assignee_name = self._get_assignee_name(issue)
-
-            # Extract other fields
-            state = self._get_state_field_value(issue)
-            priority = self._get_custom_field_value(issue, "Priority") or ""
-            issue_type = self._get_custom_field_value(issue, "Type") or ""
-
-            writer.writerow(
-                [
-                    issue.get("idReadable", issue.get("id", "")),
-                    issue.get("summary", ""),
-                    state,
-                    priority,
-                    issue_type,
-                    assignee_name,
-                    project_name,
-                ]
-            )
+        writer.writerow(ISSUE_CSV_HEADERS)
+        for issue in map(IssueView, issues):
+            writer.writerow(self._issue_csv_row(issue))
 
         return output.getvalue()
 
+    def _issue_csv_row(self, issue: dict[str, Any] | IssueView) -> list[str]:
+        """Return the CSV cells for one issue, in ``ISSUE_CSV_HEADERS`` order."""
+        issue = IssueView.of(issue)
+        return [
+            issue.id,
+            issue.summary,
+            issue.state,
+            issue.field("Priority") or "",
+            issue.field("Type") or "",
+            self._get_assignee_name(issue),
+            issue.project_name,
+        ]
+
     def _format_issues_as_table(self, issues: list[dict[str, Any]], no_pagination: bool = False) -> str:
         """Format issues as a Rich table."""
+        table = self._build_issues_table(issues)
+
+        # Convert table to string for return
+        with self.console.capture() as capture:
+            self.console.print(table)
+
+        return capture.get()
+
+    def _build_issues_table(self, issues: list[dict[str, Any]]) -> Table:
+        """Build the ID/Summary/State/Priority/Assignee table for ``issues``."""
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Summary", style="green")
@@ -411,24 +637,16 @@ class IssueManager:
         table.add_column("Priority", style="red")
         table.add_column("Assignee", style="blue")
 
-        for issue in issues:
-            assignee_name = self._get_assignee_name(issue)
-            state = self._get_state_field_value(issue)
-            priority = self._get_custom_field_value(issue, "Priority") or ""
-
+        for issue in map(IssueView, issues):
             table.add_row(
-                issue.get("idReadable", issue.get("id", "")),
-                issue.get("summary", ""),
-                state,
-                priority,
-                assignee_name,
+                issue.id,
+                issue.summary,
+                issue.state,
+                issue.field("Priority") or "",
+                self._get_assignee_name(issue),
             )
 
-        # Convert table to string for return
-        with self.console.capture() as capture:
-            self.console.print(table)
-
-        return capture.get()
+        return table
 
     async def _resolve_project_id(self, project_id_or_short_name: str) -> str | None:
         """Resolve a project ID or short name to internal project ID.
@@ -466,80 +684,86 @@ class IssueManager:
             Dictionary with 'valid' boolean and 'message' string
         """
         try:
-            # Get project custom fields to find the field
-            fields_result = await self.project_service.get_project_custom_fields(
-                project_id, fields="id,name,fieldType,bundle(values(name))"
-            )
+            requested_at = time.time()
+            schema_result = await self.project_service.get_project_schema(project_id)
 
-            if fields_result["status"] != "success":
+            if schema_result["status"] != "success":
                 # If we can't get custom fields, allow the value (fail open)
                 logger.warning(f"Could not validate custom field '{field_name}' - allowing value '{value}'")
                 return {"valid": True, "message": ""}
 
-            custom_fields = fields_result["data"]
-            if not isinstance(custom_fields, list):
-                return {"valid": True, "message": ""}
+            result = await self._check_custom_field_value(schema_result["data"], field_name, value)
+            if not result["valid"] and schema_result["data"].fetched_at < requested_at:
+                # The snapshot may predate a field or value added since; check once against a fresh one
+                schema_result = await self.project_service.get_project_schema(project_id, force_refresh=True)
+                if schema_result["status"] == "success":
+                    result = await self._check_custom_field_value(schema_result["data"], field_name, value)
+            return result
 
-            # Find the specified field by name if available
-            target_field = None
-            for field in custom_fields:
-                if field.get("name") == field_name:
-                    target_field = field
-                    break
-
-            # If field name matching failed (names might be None), try heuristic matching
-            if not target_field:
-                target_field = await self._find_field_by_heuristics(custom_fields, field_name, value)
-
-            if not target_field:
-                # Field doesn't exist in project, provide helpful message
-                available_fields = [f.get("name", "") for f in custom_fields if f.get("name")]
-                if not available_fields:
-                    # If no field names are available due to API limitations,
-                    # fail closed for critical fields like Type and Priority to prevent
-                    # validation from passing when creation will fail
-                    critical_fields = {"Type", "Priority", "State", "Status"}
-                    if field_name in critical_fields:
-                        return {
-                            "valid": False,
-                            "message": f"Cannot validate '{field_name}' field - field information not available from project API. "
-                            + "This field may not exist in the project configuration. "
-                            + "Please verify the field exists or remove it from your data.",
-                        }
-                    # For other fields, log warning but fail open (backwards compatibility)
-                    logger.warning(
-                        f"Field names not available from project API - allowing '{field_name}' with value '{value}'"
-                    )
-                    return {"valid": True, "message": ""}
-                return {
-                    "valid": False,
-                    "message": f"Field '{field_name}' is not available in this project. Available fields: {', '.join(available_fields)}",
-                }
-
-            # Get valid values for the field
-            bundle = target_field.get("bundle", {})
-            valid_values = bundle.get("values", [])
-
-            if not valid_values:
-                # If no bundle values, allow any value (might be a text field)
-                return {"valid": True, "message": ""}
+        except Exception as e:
+            logger.error(f"Error validating custom field '{field_name}' value '{value}': {e}")
+            # Fail open - allow the value if validation fails
+            return {"valid": True, "message": ""}
 
-            # Check if the provided value is in the valid values
-            valid_value_names = [v.get("name", "") for v in valid_values if isinstance(v, dict)]
+    async def _check_custom_field_value(self, schema: ProjectSchema, field_name: str, value: str) -> dict[str, Any]:
+        """Check a custom field value against a project schema snapshot.
 
-            if value not in valid_value_names:
-                return {
-                    "valid": False,
-                    "message": f"'{value}' is not a valid {field_name}. Valid values: {', '.join(valid_value_names)}",
-                }
+        Returns:
+            Dictionary with 'valid' boolean and 'message' string
+        """
+        custom_fields = schema.fields
+
+        # Find the specified field by name if available
+        target_field = schema.get(field_name)
+
+        # If field name matching failed (names might be None), try heuristic matching
+        if not target_field:
+            target_field = await self._find_field_by_heuristics(custom_fields, field_name, value)
+
+        if not target_field:
+            # Field doesn't exist in project, provide helpful message
+            available_fields = [f.get("name", "") for f in custom_fields if f.get("name")]
+            if not available_fields:
+                # If no field names are available due to API limitations,
+                # fail closed for critical fields like Type and Priority to prevent
+                # validation from passing when creation will fail
+                critical_fields = {"Type", "Priority", "State", "Status"}
+                if field_name in critical_fields:
+                    return {
+                        "valid": False,
+                        "message": f"Cannot validate '{field_name}' field - field information not available from project API. "
+                        + "This field may not exist in the project configuration. "
+                        + "Please verify the field exists or remove it from your data.",
+                    }
+                # For other fields, log warning but fail open (backwards compatibility)
+                logger.warning(
+                    f"Field names not available from project API - allowing '{field_name}' with value '{value}'"
+                )
+                return {"valid": True, "message": ""}
+            return {
+                "valid": False,
+                "message": f"Field '{field_name}' is not available in this project. Available fields: {', '.join(available_fields)}",
+            }
 
-            return {"valid": True, "message": ""}
+        # Get valid values for the field
+        bundle = target_field.get("bundle") or {}
+        valid_values = bundle.get("values", [])
 
-        except Exception as e:
-            logger.error(f"Error validating custom field '{field_name}' value '{value}': {e}")
-            # Fail open - allow the value if validation fails
+        if not valid_values:
+            # If no bundle values, allow any value (might be a text field)
             return {"valid": True, "message": ""}
 
+        # Check if the provided value is in the valid values
+        valid_value_names = [v.get("name", "") for v in valid_values if isinstance(v, dict)]
+
+        if value not in valid_value_names:
+            return {
+                "valid": False,
+                "message": f"'{value}' is not a valid {field_name}. Valid values: {', '.join(valid_value_names)}",
+            }
+
+        return {"valid": True, "message": ""}
+
     async def _find_field_by_heuristics(
         self, custom_fields: list, field_name: str, value: str
     ) -> dict[str, Any] | None:
@@ -658,16 +882,9 @@ class IssueManager:
         display_page_size: int = 50,
         state: str | None = None,
         assignee: str | None = None,
+        columns: list[str] | None = None,
     ) -> dict[str, Any]:
         """List issues with enhanced filtering and pagination."""
-        # Resolve a field profile name (minimal/standard/full) to its actual field
-        # list rather than passing the name straight to the REST `fields=` param,
-        # which returned near-empty issues for every profile (#726).
-        if field_profile and not fields:
-            from ..field_selection import get_field_selector
-
-            fields = get_field_selector().get_fields("issues", field_profile)
-
         # Build query from parameters
         query, client_side_state = await self._apply_state_and_assignee_filters(
             query, state=state, assignee=assignee, project_id=project_id
@@ -677,6 +894,7 @@ class IssueManager:
             query=query,
             project_id=project_id,
             fields=fields,
+            field_profile=field_profile,
             top=top,
             skip=skip,
             format_output=format_output,
@@ -684,6 +902,7 @@ class IssueManager:
             use_cached_fields=use_cached_fields,
             page_size=page_size,
             max_results=max_results,
+            columns=columns,
         )
 
         if client_side_state and result.get("status") == "success" and isinstance(result.get("data"), list):
@@ -753,6 +972,8 @@ class IssueManager:
         query: str | None = None,
         state: str | None = None,
         assignee: str | None = None,
+        format_output: str | None = None,
+        columns: list[str] | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Yield issues one at a time, fetched in bounded pages, for streaming
         (NDJSON) output.
@@ -761,12 +982,10 @@ class IssueManager:
         holds the whole result set in memory — each page is emitted as it arrives,
         so a whole-project fetch streams rather than buffering (#727). Raises
         YouTrackError if the very first page fails; a later page failure ends the
-        stream after logging (issues already yielded are kept).
+        stream after logging (issues already yielded are kept). Pass
+        ``format_output`` to project the fetch to the columns that format renders.
         """
-        if field_profile and not fields:
-            from ..field_selection import get_field_selector
-
-            fields = get_field_selector().get_fields("issues", field_profile)
+        fields, custom_fields = self._resolve_issue_fields(fields, field_profile, format_output, columns)
 
         query, client_side_state = await self._apply_state_and_assignee_filters(
             query, state=state, assignee=assignee, project_id=project_id
@@ -780,7 +999,7 @@ class IssueManager:
         while overall_limit is None or fetched < overall_limit:
             this_page = per_page if overall_limit is None else min(per_page, overall_limit - fetched)
             page_result = await self.issue_service.search_issues(
-                query=full_query, fields=fields, top=this_page, skip=offset
+                query=full_query, fields=fields, top=this_page, skip=offset, custom_fields=custom_fields
             )
             if page_result.get("status") != "success":
                 if fetched == 0:
@@ -800,6 +1019,80 @@ class IssueManager:
             if len(page_data) < this_page:
                 return
 
+    async def write_issues(self, stream: IO[str], format_output: str, **filters: Any) -> int:
+        """Stream issues straight into ``stream`` as CSV, a JSON array or NDJSON.
+
+        Issues are pulled from ``stream_list_issues`` and written as each page
+        arrives, so memory stays bounded by the page size however many issues
+        the query matches. A JSON array is always closed, even when a later
+        page fails. Returns the number of issues written.
+
+        Args:
+            stream: Text stream to write to
+            format_output: ``csv``, ``json`` or ``ndjson``
+            **filters: Keyword arguments forwarded to ``stream_list_issues``
+        """
+        issues = self.stream_list_issues(format_output=format_output, **filters)
+
+        if format_output == "csv":
+            with CSVStreamWriter(stream, ISSUE_CSV_HEADERS) as csv_writer:
+                return await write_stream(issues, lambda issue: csv_writer.write(self._issue_csv_row(issue)))
+        if format_output == "json":
+            with JSONArrayWriter(stream) as json_writer:
+                return await write_stream(issues, json_writer.write)
+        if format_output == "ndjson":
+
+            def write_line(issue: dict[str, Any]) -> None:
+                stream.write(json.dumps(issue) + "\n")
+
+            count = await write_stream(issues, write_line)
+            stream.flush()
+            return count
+        raise ValueError(f"Unsupported streaming format: {format_output}")
+
+    async def count_issues(
+        self,
+        project_id: str | None = None,
+        query: str | None = None,
+        state: str | None = None,
+        assignee: str | None = None,
+    ) -> dict[str, Any]:
+        """Count the issues matching the same filters as list_issues.
+
+        The count comes from YouTrack's count endpoint, so no issues are
+        transferred. Only when the state has to be matched client-side (see
+        ``_apply_state_and_assignee_filters``) are matching issues streamed
+        with a minimal field set and counted locally.
+
+        Returns:
+            Response dict whose ``data`` is ``{"count": N, "query": str}``
+        """
+        server_query, client_side_state = await self._apply_state_and_assignee_filters(
+            query, state=state, assignee=assignee, project_id=project_id
+        )
+        full_query = f"project: {project_id} {server_query}".strip() if project_id else server_query
+
+        if client_side_state:
+            count = 0
+            try:
+                async for _issue in self.stream_list_issues(
+                    project_id=project_id,
+                    query=query,
+                    state=state,
+                    assignee=assignee,
+                    fields="id,customFields(name,value(name))",
+                    page_size=500,
+                ):
+                    count += 1
+            except YouTrackError as e:
+                return {"status": "error", "message": str(e)}
+            return {"status": "success", "data": {"count": count, "query": full_query}}
+
+        result = await self.issue_service.count_issues(full_query)
+        if result["status"] != "success":
+            return result
+        return {"status": "success", "data": {"count": result["data"]["count"], "query": full_query}}
+
     async def _discover_state_field_name(self, project_id: str | None) -> str | None:
         """Resolve the project's actual state field name (State/Status/Stage/...)
         for building a server-side state filter. Returns None when it cannot be
@@ -821,73 +1114,95 @@ class IssueManager:
             self.console.print("[yellow]No issues found.[/yellow]")
             return
 
-        from rich.table import Table
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Summary", style="green")
-        table.add_column("State", style="yellow")
-        table.add_column("Priority", style="red")
-        table.add_column("Assignee", style="blue")
-
-        for issue in issues:
-            assignee_name = self._get_assignee_name(issue)
-            state = self._get_state_field_value(issue)
-            priority = self._get_custom_field_value(issue, "Priority") or ""
-
-            table.add_row(
-                issue.get("idReadable", issue.get("id", "")),
-                issue.get("summary", ""),
-                state,
-                priority,
-                assignee_name,
-            )
-
-        self.console.print(table)
+        print_table(self.console, self._build_issues_table(issues))
 
     def display_issues_table_paginated(
         self,
-        issues: list[dict[str, Any]],
+        issues: list[dict[str, Any]] | PageSource,
         page_size: int = 50,
         show_all: bool = False,
         start_page: int = 1,
     ) -> None:
-        """Display issues in a paginated table format."""
+        """Display issues in a paginated table format.
+
+        ``issues`` may be a list already in memory or a ``PageSource`` such as
+        the one returned by ``issue_page_source``, in which case pages are
+        fetched as the user navigates and ``page_size`` is taken from the source.
+        """
+        paginated_display = create_paginated_display(self.console, page_size)
+        if isinstance(issues, PageSource):
+            paginated_display.display_page_source(
+                issues, self._build_issues_table, "Issues", show_all=show_all, start_page=start_page
+            )
+            return
+
         if not issues:
             self.console.print("[yellow]No issues found.[/yellow]")
             return
 
-        def build_issues_table(issue_subset: list[dict[str, Any]]) -> Any:
-            """Build a Rich table for the given subset of issues."""
-            from rich.table import Table
-
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Summary", style="green")
-            table.add_column("State", style="yellow")
-            table.add_column("Priority", style="red")
-            table.add_column("Assignee", style="blue")
-
-            for issue in issue_subset:
-                assignee_name = self._get_assignee_name(issue)
-                state = self._get_custom_field_value(issue, "State") or ""
-                priority = self._get_custom_field_value(issue, "Priority") or ""
-
-                table.add_row(
-                    issue.get("idReadable", issue.get("id", "")),
-                    issue.get("summary", ""),
-                    state,
-                    priority,
-                    assignee_name,
+        paginated_display.display_paginated_table(
+            issues, self._build_issues_table, "Issues", show_all=show_all, start_page=start_page
+        )
+
+    def issue_page_source(
+        self,
+        *,
+        project_id: str | None = None,
+        fields: str | None = None,
+        field_profile: str | None = None,
+        query: str | None = None,
+        state: str | None = None,
+        assignee: str | None = None,
+        page_size: int = 50,
+        max_results: int | None = None,
+        format_output: str | None = "table",
+    ) -> LazyPageSource:
+        """Return a page source that fetches one display page of issues per request.
+
+        Filters are resolved the same way as ``list_issues``, once, on the first
+        fetch. Each page is a single ``skip``/``top`` search, so the first page
+        of a large project is shown without downloading the rest. When the
+        state filter has to be applied client-side a page may show fewer rows
+        than ``page_size``.
+
+        The caller owns the returned source and should ``close()`` it.
+        """
+        prepared: dict[str, Any] = {}
+
+        async def fetch(offset: int, limit: int) -> tuple[list[dict[str, Any]], bool]:
+            if not prepared:
+                resolved_fields, custom_fields = self._resolve_issue_fields(fields, field_profile, format_output)
+                full_query, client_side_state = await self._apply_state_and_assignee_filters(
+                    query, state=state, assignee=assignee, project_id=project_id
+                )
+                if project_id:
+                    full_query = f"project: {project_id} {full_query}".strip()
+                prepared.update(
+                    fields=resolved_fields,
+                    custom_fields=custom_fields,
+                    query=full_query,
+                    client_side_state=client_side_state,
                 )
 
-            return table
+            result = await self.issue_service.search_issues(
+                query=prepared["query"],
+                fields=prepared["fields"],
+                top=limit,
+                skip=offset,
+                custom_fields=prepared["custom_fields"],
+            )
+            if result.get("status") != "success":
+                raise YouTrackError(result.get("message", "Failed to list issues"))
+            page = result.get("data") or []
+            if not isinstance(page, list):
+                page = []
+            has_more = len(page) == limit
+            client_side_state = prepared["client_side_state"]
+            if client_side_state:
+                page = [i for i in page if self._get_state_field_value(i).casefold() == client_side_state]
+            return page, has_more
 
-        # Use pagination display
-        paginated_display = create_paginated_display(self.console, page_size)
-        paginated_display.display_paginated_table(
-            issues, build_issues_table, "Issues", show_all=show_all, start_page=start_page
-        )
+        return LazyPageSource(fetch, page_size=page_size, max_items=max_results)
 
     async def list_links(self, issue_id: str) -> dict[str, Any]:
         """List links for an issue."""
@@ -1157,10 +1472,11 @@ class IssueManager:
             self.console.print("[yellow]No issues found.[/yellow]")
             return
 
-        formatted_output = self._format_issues_for_display(issues, format_output, no_pagination)
-
-        if format_output == "table" and not no_pagination:
-            # Use paginated display for tables
-            create_paginated_display(formatted_output, self.console)
+        if format_output == "table":
+            if no_pagination:
+                self.display_issues_table(issues)
+            else:
+                # Only the visible page is rendered
+                self.display_issues_table_paginated(issues)
         else:
-            self.console.print(formatted_output)
+            self.console.print(self._format_issues_for_display(issues, format_output, no_pagination))
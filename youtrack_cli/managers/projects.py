@@ -6,7 +6,10 @@ from rich.table import Table
 
 from ..auth import AuthManager
 from ..console import get_console
+from ..exceptions import YouTrackError
+from ..plain_table import print_table
 from ..services.projects import ProjectService
+from ..utils import PaginationConfig, fetch_offset_pages
 from .users import UserManager
 
 __all__ = ["ProjectManager"]
@@ -40,43 +43,18 @@ class ProjectManager:
         Returns:
             Tuple of (user_id, error_message). If successful, error_message is None.
         """
-        # Better user ID detection: YouTrack user IDs typically follow patterns like:
-        # "2-1", "guest", or other specific formats. If it contains only digits and dashes,
-        # or is a known system user, treat as user ID. Otherwise, try username resolution.
-
-        # Check if it looks like a user ID pattern (digits with dashes, or known system users)
-        if (
-            username_or_id.replace("-", "").isdigit()
-            or username_or_id in ["guest", "root"]
-            or (len(username_or_id) >= 3 and "-" in username_or_id and any(c.isdigit() for c in username_or_id))
-        ):
-            # Validate that this user ID actually exists
-            try:
-                result = await self.user_manager.get_user(username_or_id, fields="id,login")
-                if result["status"] == "success":
-                    user_data = result["data"]
-                    user_id = user_data.get("id")
-                    if user_id:
-                        return user_id, None
-                    return username_or_id, f"User ID '{username_or_id}' found but missing ID field"
-                # If the presumed user ID doesn't exist, fall through to username resolution
-            except Exception:
-                # If validation fails, fall through to username resolution
-                pass
-
-        # Try to resolve as username
+        # Logins, emails and IDs share one cached directory, so repeated and
+        # bulk references cost no extra round trips once a user is known.
         try:
-            result = await self.user_manager.get_user(username_or_id, fields="id,login")
-            if result["status"] == "success":
-                user_data = result["data"]
-                user_id = user_data.get("id")
-                if user_id:
-                    return user_id, None
-                return username_or_id, f"User '{username_or_id}' found but missing ID field"
-            # If user not found, return error instead of original input
-            return username_or_id, f"User '{username_or_id}' not found"
+            user = await self.user_manager.resolve_user(username_or_id)
         except Exception as e:
             return username_or_id, f"Error resolving username '{username_or_id}': {e}"
+        if user is None:
+            return username_or_id, f"User '{username_or_id}' not found"
+        user_id = user.get("id")
+        if user_id:
+            return user_id, None
+        return username_or_id, f"User '{username_or_id}' found but missing ID field"
 
     async def list_projects(
         self,
@@ -110,31 +88,37 @@ class ProjectManager:
             use_pagination = False
 
         if use_pagination:
-            # Enhanced pagination logic would go here
-            # For now, use simple service call
-            result = await self.project_service.list_projects(
-                fields=fields,
-                top=page_size,
-                skip=0,
-                show_archived=show_archived,
-            )
 
-            if result["status"] == "success":
-                projects = result["data"]
-                return {
-                    "status": "success",
-                    "data": projects,
-                    "count": len(projects) if isinstance(projects, list) else 0,
-                    "pagination": {
-                        "total_results": len(projects) if isinstance(projects, list) else 0,
-                        "has_after": False,
-                        "has_before": False,
-                        "after_cursor": None,
-                        "before_cursor": None,
-                        "pagination_type": "offset",
-                    },
-                }
-            return result
+            async def fetch_page(skip: int, top: int) -> list[Any]:
+                # Archived projects are dropped after paging so every page keeps its full length
+                page = await self.project_service.list_projects(fields=fields, top=top, skip=skip, show_archived=True)
+                if page["status"] != "success":
+                    raise YouTrackError(page.get("message", "Failed to list projects"))
+                return page["data"] if isinstance(page["data"], list) else []
+
+            try:
+                projects = await fetch_offset_pages(
+                    fetch_page, page_size, max_results, prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES
+                )
+            except YouTrackError as e:
+                return {"status": "error", "message": str(e)}
+
+            total_results = len(projects)
+            if not show_archived:
+                projects = [p for p in projects if p is not None and not p.get("archived", False)]
+            return {
+                "status": "success",
+                "data": projects,
+                "count": len(projects),
+                "pagination": {
+                    "total_results": total_results,
+                    "has_after": max_results is not None and total_results >= max_results,
+                    "has_before": False,
+                    "after_cursor": None,
+                    "before_cursor": None,
+                    "pagination_type": "offset",
+                },
+            }
         else:
             # Legacy single request approach
             result = await self.project_service.list_projects(
@@ -321,8 +305,7 @@ class ProjectManager:
             Dictionary with operation result
         """
         # Validate user exists
-        user_result = await self.user_manager.get_user(user_login, fields="id,login")
-        if user_result["status"] != "success":
+        if await self.user_manager.resolve_user(user_login) is None:
             return {"status": "error", "message": f"User '{user_login}' not found"}
 
         result = await self.project_service.add_team_member(project_id, user_login)
@@ -535,7 +518,7 @@ class ProjectManager:
                     f"[{status_style}]{status}[/{status_style}]",
                 )
 
-            self.console.print(table)
+            print_table(self.console, table)
         else:
             # For other formats, just print the data
             self.console.print(projects)
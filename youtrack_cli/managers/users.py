@@ -1,16 +1,61 @@
 """User manager for YouTrack CLI business logic."""
 
-from typing import Any
+import asyncio
+from dataclasses import dataclass
+from typing import IO, Any
 
 from rich.table import Table
 from rich.text import Text
 
 from ..auth import AuthManager
 from ..console import get_console
+from ..exceptions import YouTrackError
 from ..pagination import create_paginated_display
-from ..services.users import UserService
+from ..plain_table import print_table
+from ..progress import get_progress_manager
+from ..services.users import USER_PROFILE_FIELDS, UserService, build_user_profile
+from ..stream_writers import CSVStreamWriter
+from ..user_directory import UserDirectory
+from ..utils import PaginationConfig, fetch_offset_pages, read_import_records
 
-__all__ = ["UserManager"]
+__all__ = ["UserManager", "UserOperation"]
+
+#: Profiles fetched at once when building profiles for many users.
+USER_PROFILE_MAX_CONCURRENT = 8
+
+USER_PROFILE_PAGE_SIZE = 500
+
+#: Columns of ``yt users profile --format csv``.
+USER_PROFILE_CSV_HEADERS = ["login", "full_name", "email", "banned", "guest", "groups", "roles", "teams"]
+
+USER_OPERATION_COLUMNS = ("user", "action", "target")
+
+#: Bulk operations and whether they need a ``target`` (group, role or team ID).
+USER_OPERATION_ACTIONS = {
+    "ban": False,
+    "unban": False,
+    "add-to-group": True,
+    "remove-from-group": True,
+    "assign-role": True,
+    "remove-role": True,
+    "add-to-team": True,
+    "remove-from-team": True,
+}
+
+USER_OPERATION_REPORT_HEADERS = ("row", "user", "action", "target", "status", "error")
+
+#: Operations executed at once by a bulk run.
+BULK_USER_MAX_CONCURRENT = 8
+
+
+@dataclass
+class UserOperation:
+    """A validated operation from a bulk user administration file."""
+
+    row: int
+    user: str
+    action: str
+    target: str | None = None
 
 
 class UserManager:
@@ -30,6 +75,8 @@ class UserManager:
         self.auth_manager = auth_manager
         self.console = get_console()
         self.user_service = UserService(auth_manager)
+        # Single lookups go through get_user so they share its error handling
+        self.directory = UserDirectory(auth_manager, fetch_user=lambda ref, fields: self.get_user(ref, fields=fields))
 
     async def list_users(
         self,
@@ -65,37 +112,38 @@ class UserManager:
             use_pagination = False
 
         if use_pagination:
-            # Enhanced pagination logic would go here
-            # For now, use simple service call
-            result = await self.user_service.list_users(
-                fields=fields,
-                top=page_size,
-                skip=0,
-                query=query,
-            )
 
-            if result["status"] == "success":
-                users = result["data"]
+            async def fetch_page(skip: int, top: int) -> list[Any]:
+                page = await self.user_service.list_users(fields=fields, top=top, skip=skip, query=query)
+                if page["status"] != "success":
+                    raise YouTrackError(page.get("message", "Failed to list users"))
+                return page["data"] if isinstance(page["data"], list) else []
 
-                # Apply active_only filter client-side
-                if active_only and isinstance(users, list):
-                    users = [user for user in users if not user.get("banned", False)]
-                    result["data"] = users
+            try:
+                users = await fetch_offset_pages(
+                    fetch_page, page_size, max_results, prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES
+                )
+            except YouTrackError as e:
+                return {"status": "error", "message": str(e)}
 
-                return {
-                    "status": "success",
-                    "data": users,
-                    "count": len(users) if isinstance(users, list) else 0,
-                    "pagination": {
-                        "total_results": len(users) if isinstance(users, list) else 0,
-                        "has_after": False,
-                        "has_before": False,
-                        "after_cursor": None,
-                        "before_cursor": None,
-                        "pagination_type": "offset",
-                    },
-                }
-            return result
+            total_results = len(users)
+            # Apply active_only filter client-side
+            if active_only:
+                users = [user for user in users if not user.get("banned", False)]
+
+            return {
+                "status": "success",
+                "data": users,
+                "count": len(users),
+                "pagination": {
+                    "total_results": total_results,
+                    "has_after": max_results is not None and total_results >= max_results,
+                    "has_before": False,
+                    "after_cursor": None,
+                    "before_cursor": None,
+                    "pagination_type": "offset",
+                },
+            }
         else:
             # Legacy single request approach
             result = await self.user_service.list_users(
@@ -130,6 +178,302 @@ class UserManager:
         """
         return await self.user_service.get_user(user_id, fields)
 
+    async def resolve_user(self, reference: str) -> dict[str, Any] | None:
+        """Resolve a login, email, user ID or ringId through the cached user directory.
+
+        Args:
+            reference: Login, email, database ID or Hub ringId
+
+        Returns:
+            The user's directory entry, or None if no such user exists
+        """
+        return await self.directory.resolve(reference)
+
+    async def resolve_users(self, references: list[str]) -> dict[str, dict[str, Any] | None]:
+        """Resolve several user references, loading the whole directory when that is cheaper.
+
+        Args:
+            references: Logins, emails, database IDs or Hub ringIds
+
+        Returns:
+            Mapping of each reference to its directory entry, or None if no such user exists
+        """
+        return await self.directory.resolve_many(references)
+
+    async def get_user_profile(self, user_id: str, include_permissions: bool = False) -> dict[str, Any]:
+        """Get a user's profile: details, groups, roles, teams and optionally permissions.
+
+        Args:
+            user_id: User ID or login
+            include_permissions: Also fetch the user's permissions
+
+        Returns:
+            Dictionary with operation result
+        """
+        return await self.user_service.get_user_profile(user_id, include_permissions=include_permissions)
+
+    async def get_user_profiles(
+        self,
+        user_ids: list[str] | None = None,
+        include_permissions: bool = False,
+        max_concurrent: int = USER_PROFILE_MAX_CONCURRENT,
+        query: str | None = None,
+    ) -> dict[str, Any]:
+        """Build profiles for many users with bounded concurrency.
+
+        Without ``user_ids``, every user matching ``query`` is read with
+        paginated ``list_users`` calls that expand groups, roles and teams
+        inline, so only permissions (when requested) cost a request per user.
+        With ``user_ids``, each profile is fetched separately, at most
+        ``max_concurrent`` at a time. Failures are collected per user instead
+        of stopping the run.
+
+        Args:
+            user_ids: Logins or IDs to profile; None for all users
+            include_permissions: Also fetch each user's permissions
+            max_concurrent: Requests in flight at once
+            query: Search query restricting which users are profiled when ``user_ids`` is None
+
+        Returns:
+            Dictionary with ``profiles`` (in input or listing order) and per-user ``errors``
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        if user_ids is None:
+
+            async def fetch_page(skip: int, top: int) -> list[Any]:
+                page = await self.user_service.list_users(fields=USER_PROFILE_FIELDS, top=top, skip=skip, query=query)
+                if page["status"] != "success":
+                    raise YouTrackError(page.get("message", "Failed to list users"))
+                return page["data"] if isinstance(page["data"], list) else []
+
+            try:
+                users: list[dict[str, Any]] = await fetch_offset_pages(
+                    fetch_page, USER_PROFILE_PAGE_SIZE, prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES
+                )
+            except YouTrackError as e:
+                return {"status": "error", "message": str(e)}
+            if not include_permissions:
+                return {
+                    "status": "success",
+                    "data": {"profiles": [build_user_profile(user) for user in users], "errors": []},
+                }
+            # Users without a login or ID cannot be asked for their permissions
+            users = [user for user in users if user.get("login") or user.get("id")]
+            targets: list[str] = [user.get("login") or user["id"] for user in users]
+        else:
+            users = []
+            targets = list(user_ids)
+
+        profiles: list[dict[str, Any] | None] = [None] * len(targets)
+        failures: list[dict[str, Any] | None] = [None] * len(targets)
+        progress_manager = get_progress_manager()
+        with progress_manager.progress_bar("Building user profiles...", total=len(targets)) as tracker:
+
+            async def build(index: int, user_id: str) -> None:
+                profile: dict[str, Any] | None = None
+                async with semaphore:
+                    try:
+                        if user_ids is None:
+                            result = await self.user_service.get_user_permissions(user_id)
+                            if result["status"] == "success":
+                                profile = build_user_profile(users[index], result["data"] or [])
+                        else:
+                            result = await self.user_service.get_user_profile(user_id, include_permissions)
+                            if result["status"] == "success":
+                                profile = result["data"]
+                    except Exception as e:
+                        result = {"status": "error", "message": f"Error getting user profile: {str(e)}"}
+                if profile is not None:
+                    profiles[index] = profile
+                else:
+                    failures[index] = {"user": user_id, "error": result["message"]}
+                tracker.advance()
+
+            await asyncio.gather(*(build(index, user_id) for index, user_id in enumerate(targets)))
+
+        return {
+            "status": "success",
+            "data": {
+                "profiles": [profile for profile in profiles if profile is not None],
+                "errors": [failure for failure in failures if failure is not None],
+            },
+        }
+
+    def parse_user_operations(
+        self, stream: IO[str], file_format: str = "csv"
+    ) -> tuple[list[UserOperation], list[dict[str, Any]]]:
+        """Read and validate operations for a bulk user administration run.
+
+        CSV input needs a header row; JSON input is an array of objects.
+        Both use the ``USER_OPERATION_COLUMNS`` names. ``action`` is one of
+        ``USER_OPERATION_ACTIONS``; ``target`` is the group, role or team ID
+        and is required by every action except ``ban`` and ``unban``. Rows are
+        numbered as in the file: CSV data starts at row 2, JSON objects at 1.
+
+        Args:
+            stream: Text stream with the operations (a file or stdin)
+            file_format: ``csv`` or ``json``
+
+        Returns:
+            Valid operations and a result with ``status`` ``invalid`` for each invalid row
+
+        Raises:
+            ValueError: If the input cannot be read as the given format
+        """
+        records = read_import_records(stream, file_format)
+
+        operations: list[UserOperation] = []
+        errors: list[dict[str, Any]] = []
+        for row_number, record in records:
+            if not isinstance(record, dict):
+                record, error = {}, "Entry is not an object"
+            else:
+                error = None
+            values = {key: str(record.get(key) or "").strip() for key in USER_OPERATION_COLUMNS}
+            values["action"] = values["action"].lower()
+            if error is None:
+                if not values["user"]:
+                    error = "Missing user"
+                elif values["action"] not in USER_OPERATION_ACTIONS:
+                    error = f"Unknown action '{values['action']}'" if values["action"] else "Missing action"
+                elif USER_OPERATION_ACTIONS[values["action"]] and not values["target"]:
+                    error = f"Action '{values['action']}' needs a target"
+
+            if error:
+                errors.append({"row": row_number, **values, "status": "invalid", "error": error})
+                continue
+            operations.append(
+                UserOperation(
+                    row=row_number, user=values["user"], action=values["action"], target=values["target"] or None
+                )
+            )
+        return operations, errors
+
+    async def _apply_user_operation(self, operation: UserOperation, user: dict[str, Any]) -> dict[str, Any]:
+        user_id = user["id"]
+        target = operation.target or ""
+        if operation.action == "ban":
+            return await self.user_service.ban_user(user_id, ring_id=user.get("ringId"))
+        if operation.action == "unban":
+            return await self.user_service.unban_user(user_id, ring_id=user.get("ringId"))
+        if operation.action == "add-to-group":
+            return await self.user_service.add_user_to_group(user_id, target)
+        if operation.action == "remove-from-group":
+            return await self.user_service.remove_user_from_group(user_id, target)
+        if operation.action == "assign-role":
+            return await self.user_service.assign_user_role(user_id, target)
+        if operation.action == "remove-role":
+            return await self.user_service.remove_user_role(user_id, target)
+        if operation.action == "add-to-team":
+            return await self.user_service.add_user_to_team(user_id, target)
+        return await self.user_service.remove_user_from_team(user_id, target)
+
+    async def apply_user_operations(
+        self,
+        operations: list[UserOperation],
+        max_concurrent: int = BULK_USER_MAX_CONCURRENT,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """Execute bulk user operations with bounded concurrency.
+
+        Every referenced user is resolved through the user directory, which
+        loads all users (with their Hub ``ringId``) in one paginated listing
+        when there are many, so bans and unbans go straight to the Hub API
+        instead of looking each user up first. Operations on the same user
+        run in file order; different users are processed concurrently. Every
+        operation is attempted and gets its own result.
+
+        Args:
+            operations: Validated operations from ``parse_user_operations``
+            max_concurrent: Operations executed at once
+            dry_run: Resolve users and report what would be done without changing anything
+
+        Returns:
+            Dictionary with ``total``, ``succeeded``, ``failed`` and per-operation ``results``
+        """
+        try:
+            users = await self.resolve_users([operation.user for operation in operations])
+        except Exception as e:
+            return {"status": "error", "message": f"Error resolving users: {str(e)}"}
+
+        # A user may be referenced by login, email or ID; key by the resolved ID so
+        # all of a user's operations run in order instead of racing each other.
+        by_user: dict[str, list[UserOperation]] = {}
+        for operation in operations:
+            user = users.get(operation.user)
+            key = user["id"] if user and user.get("id") else operation.user
+            by_user.setdefault(key, []).append(operation)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        results: list[dict[str, Any]] = []
+        progress_manager = get_progress_manager()
+        description = f"{'[DRY RUN] ' if dry_run else ''}Applying user operations..."
+        with progress_manager.progress_bar(description, total=len(operations)) as tracker:
+
+            async def run(user_operations: list[UserOperation]) -> None:
+                for operation in user_operations:
+                    user = users.get(operation.user)
+                    error = None
+                    if user is None:
+                        error = f"User '{operation.user}' not found"
+                    elif not dry_run:
+                        async with semaphore:
+                            try:
+                                result = await self._apply_user_operation(operation, user)
+                                if result["status"] != "success":
+                                    error = result["message"]
+                            except Exception as e:
+                                error = f"Error applying {operation.action}: {str(e)}"
+                    results.append(
+                        {
+                            "row": operation.row,
+                            "user": operation.user,
+                            "action": operation.action,
+                            "target": operation.target or "",
+                            "status": "failed" if error else "ok",
+                            "error": error or "",
+                        }
+                    )
+                    tracker.advance()
+
+            await asyncio.gather(*(run(user_operations) for user_operations in by_user.values()))
+
+        if not dry_run and any(operation.action in ("ban", "unban") for operation in operations):
+            self.directory.invalidate()
+
+        results.sort(key=lambda result: result["row"])
+        failed = sum(1 for result in results if result["status"] == "failed")
+        return {
+            "status": "success",
+            "data": {"total": len(results), "succeeded": len(results) - failed, "failed": failed, "results": results},
+        }
+
+    def write_operation_results(self, stream: IO[str], results: list[dict[str, Any]]) -> int:
+        """Write a per-operation result report as CSV and return the number of rows."""
+        with CSVStreamWriter(stream, USER_OPERATION_REPORT_HEADERS) as writer:
+            for result in results:
+                writer.write([result.get(header, "") for header in USER_OPERATION_REPORT_HEADERS])
+            return writer.count
+
+    def display_operation_errors(self, results: list[dict[str, Any]], limit: int = 20) -> None:
+        """Display the first ``limit`` failed or invalid operations of a bulk run."""
+        errors = [result for result in results if result["status"] != "ok"]
+        if not errors:
+            return
+
+        table = Table(title="Failed Operations", show_header=True, header_style="bold red")
+        table.add_column("Row", style="cyan")
+        table.add_column("User", style="green")
+        table.add_column("Action", style="blue")
+        table.add_column("Target", style="magenta")
+        table.add_column("Error", style="red")
+        for error in errors[:limit]:
+            table.add_row(str(error["row"]), error["user"], error["action"], error["target"], error["error"])
+        self.console.print(table)
+        if len(errors) > limit:
+            self.console.print(f"... and {len(errors) - limit} more failed operations", style="yellow")
+
     async def create_user(
         self,
         login: str,
@@ -170,6 +514,7 @@ class UserManager:
 
         # Add success message enhancement
         if result["status"] == "success":
+            self.directory.invalidate()
             result["message"] = f"User '{login}' created successfully"
 
         return result
@@ -215,6 +560,7 @@ class UserManager:
 
         # Add success message enhancement
         if result["status"] == "success":
+            self.directory.invalidate()
             result["message"] = f"User '{user_id}' updated successfully"
 
         return result
@@ -232,6 +578,7 @@ class UserManager:
 
         # Add success message enhancement
         if result["status"] == "success":
+            self.directory.invalidate()
             result["message"] = f"User '{user_id}' deleted successfully"
 
         return result
@@ -249,6 +596,7 @@ class UserManager:
 
         # Add success message enhancement
         if result["status"] == "success":
+            self.directory.invalidate()
             result["message"] = f"User '{user_id}' banned successfully"
 
         return result
@@ -266,6 +614,7 @@ class UserManager:
 
         # Add success message enhancement
         if result["status"] == "success":
+            self.directory.invalidate()
             result["message"] = f"User '{user_id}' unbanned successfully"
 
         return result
@@ -514,7 +863,7 @@ class UserManager:
                 user_type,
             )
 
-        self.console.print(table)
+        print_table(self.console, table)
 
     def display_users_table_paginated(
         self, users: list[dict[str, Any]], page_size: int = 50, show_all: bool = False, start_page: int = 1
@@ -632,8 +981,55 @@ class UserManager:
                     else:
                         self.console.print(f"  • {group_name}")
 
+        # Roles information if available
+        roles = user.get("roles")
+        if isinstance(roles, list) and roles:
+            self.console.print(f"\n[bold]Roles ({len(roles)}):[/bold]")
+            for role in roles:
+                self.console.print(f"  • {role.get('name', 'Unknown')}")
+
+        # Permissions are only present on profiles fetched with them
+        permissions = user.get("permissions")
+        if isinstance(permissions, list):
+            self.console.print(f"\n[bold]Permissions ({len(permissions)}):[/bold]")
+            for permission in permissions:
+                if isinstance(permission, dict):
+                    self.console.print(f"  • {permission.get('name') or permission.get('key') or 'Unknown'}")
+
         self.console.print()  # Add spacing
 
+    def write_profiles_csv(self, stream: IO[str], profiles: list[dict[str, Any]]) -> int:
+        """Write user profiles as CSV, one row per user, for access reviews.
+
+        Groups, roles and teams are joined with ``"; "``.
+
+        Args:
+            stream: Text stream to write to
+            profiles: Profiles from ``get_user_profiles``
+
+        Returns:
+            Number of rows written
+        """
+
+        def names(items: Any) -> str:
+            return "; ".join(item.get("name", "") for item in items or [] if isinstance(item, dict))
+
+        with CSVStreamWriter(stream, USER_PROFILE_CSV_HEADERS) as writer:
+            for profile in profiles:
+                writer.write(
+                    [
+                        profile.get("login", ""),
+                        profile.get("fullName", ""),
+                        profile.get("email") or "",
+                        profile.get("banned", False),
+                        profile.get("guest", False),
+                        names(profile.get("groups")),
+                        names(profile.get("roles")),
+                        names(profile.get("teams")),
+                    ]
+                )
+            return writer.count
+
     def display_user_groups(self, groups: list[dict[str, Any]], user_id: str) -> None:
         """Display user groups in a table format.
 
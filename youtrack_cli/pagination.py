@@ -4,17 +4,243 @@ This module provides pagination functionality for large data sets displayed
 in tables, with interactive navigation controls and configurable page sizes.
 
 Supports both automatic pagination for large result sets and user-controlled
-navigation through multiple pages of data.
+navigation through multiple pages of data. Pages come from a ``PageSource``:
+either an in-memory list or a server-backed source that fetches each page on
+demand.
 """
 
+import asyncio
 import math
-from collections.abc import Callable
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
 from typing import Any
 
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+from .client import get_client_manager
+from .logging import get_logger
+
+__all__ = [
+    "LazyPageSource",
+    "ListPageSource",
+    "PageSource",
+    "PaginatedTableDisplay",
+    "create_paginated_display",
+]
+
+logger = get_logger(__name__)
+
+PageFetcher = Callable[[int, int], Coroutine[Any, Any, tuple[list[Any], bool]]]
+
+
+class PageSource(ABC):
+    """Supplies pages of items to ``PaginatedTableDisplay``.
+
+    Pages are numbered from 1. ``total_items`` is None while the size of the
+    result set is unknown; ``has_page`` may then answer optimistically and
+    ``get_page`` returns an empty list for a page past the end.
+    """
+
+    page_size: int
+
+    @property
+    @abstractmethod
+    def total_items(self) -> int | None:
+        """Number of items, or None if not known yet."""
+        pass
+
+    @abstractmethod
+    def get_page(self, page: int) -> list[Any]:
+        """Return the items on ``page``."""
+        pass
+
+    def has_page(self, page: int) -> bool:
+        """Return whether ``page`` may hold items."""
+        total = self.total_items
+        if page < 1:
+            return False
+        return total is None or page <= max(1, math.ceil(total / self.page_size))
+
+    @property
+    def total_pages(self) -> int | None:
+        """Number of pages, or None if not known yet."""
+        total = self.total_items
+        return None if total is None else max(1, math.ceil(total / self.page_size))
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the source; sources holding none keep this no-op."""
+
+
+class ListPageSource(PageSource):
+    """Pages sliced from a list that is already in memory."""
+
+    def __init__(self, data: list[Any], page_size: int):
+        self.data = data
+        self.page_size = page_size
+
+    @property
+    def total_items(self) -> int:
+        return len(self.data)
+
+    def get_page(self, page: int) -> list[Any]:
+        start = (page - 1) * self.page_size
+        return self.data[start : start + self.page_size]
+
+
+class LazyPageSource(PageSource):
+    """Pages fetched from the server on demand.
+
+    ``fetch(offset, limit)`` is a coroutine function returning the items at
+    ``offset`` plus whether more may follow. Every fetch runs on one
+    background event loop, so the HTTP client stays bound to a single loop
+    while the foreground thread waits for keyboard input. After a page is
+    served the next one is requested in the background, and the most
+    recently visited ``cache_pages`` pages are kept in an LRU so moving back
+    and forth does not refetch them.
+    """
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        page_size: int = 50,
+        cache_pages: int = 8,
+        prefetch: bool = True,
+        max_items: int | None = None,
+    ):
+        """Initialize the page source.
+
+        Args:
+            fetch: Coroutine function ``(offset, limit) -> (items, has_more)``
+            page_size: Number of items per page
+            cache_pages: Number of visited pages kept in memory
+            prefetch: Request the following page in the background
+            max_items: Stop after this many items in total
+        """
+        self.fetch = fetch
+        self.page_size = page_size
+        self.cache_pages = max(1, cache_pages)
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self.fetch_count = 0
+        self._pages: OrderedDict[int, list[Any]] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._full_pages: set[int] = set()
+        self._end_page: int | None = None
+        self._total_items: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def total_items(self) -> int | None:
+        return self._total_items
+
+    def has_page(self, page: int) -> bool:
+        self._harvest()
+        return page >= 1 and (self._end_page is None or page < self._end_page)
+
+    def get_page(self, page: int) -> list[Any]:
+        """Return ``page``, fetching it (and prefetching the next) if needed."""
+        if not self.has_page(page):
+            return []
+        if page in self._pages:
+            self._pages.move_to_end(page)
+            items = self._pages[page]
+        else:
+            future = self._pending.get(page) or self._submit(page)
+            try:
+                items, has_more = future.result()
+            finally:
+                self._pending.pop(page, None)
+            self._store(page, items, has_more)
+        following = page + 1
+        if self.prefetch and self.has_page(following) and following not in self._pages:
+            if following not in self._pending:
+                self._pending[following] = self._submit(following)
+        return items
+
+    def close(self) -> None:
+        """Cancel outstanding prefetches, close the loop's HTTP client and stop the loop."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+            except Exception as e:
+                logger.debug("Page source shutdown did not finish cleanly", error=str(e))
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    async def _shutdown(self) -> None:
+        """Cancel the tasks still running on the background loop and close its client."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await get_client_manager().close_loop_client()
+
+    def __enter__(self) -> "LazyPageSource":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _submit(self, page: int) -> Future:
+        offset = (page - 1) * self.page_size
+        limit = self.page_size
+        if self.max_items is not None:
+            limit = min(limit, self.max_items - offset)
+        if limit <= 0:
+            done: Future = Future()
+            done.set_result(([], False))
+            return done
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="page-source", daemon=True)
+            self._thread.start()
+        self.fetch_count += 1
+        return asyncio.run_coroutine_threadsafe(self.fetch(offset, limit), self._loop)
+
+    def _harvest(self) -> None:
+        """Move finished prefetches into the cache so the end of data is known early."""
+        for page, future in list(self._pending.items()):
+            if future.done() and not future.cancelled() and future.exception() is None:
+                del self._pending[page]
+                self._store(page, *future.result())
+
+    def _store(self, page: int, items: list[Any], has_more: bool) -> None:
+        if items:
+            self._pages[page] = items
+            self._pages.move_to_end(page)
+            while len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+        if has_more and len(items) == self.page_size:
+            self._full_pages.add(page)
+            return
+
+        # A short or empty page: nothing exists past it
+        if items:
+            end_page, total = page + 1, (page - 1) * self.page_size + len(items)
+        elif page == 1:
+            end_page, total = 2, 0
+        else:
+            end_page = page
+            total = (page - 1) * self.page_size if page - 1 in self._full_pages else None
+        if self._end_page is None or end_page < self._end_page:
+            self._end_page = end_page
+            self._total_items = total
+            logger.debug("Reached end of paged data", end_page=end_page, total_items=total)
+
 
 class PaginatedTableDisplay:
     """Handle paginated display of table data with user navigation controls.
@@ -62,39 +288,79 @@ class PaginatedTableDisplay:
             self.console.print(table)
             return
 
-        total_pages = math.ceil(len(data) / self.page_size)
-        self.current_page = max(1, min(start_page, total_pages))
+        self._navigate(ListPageSource(data, self.page_size), table_builder, start_page)
 
+    def display_page_source(
+        self,
+        source: PageSource,
+        table_builder: Callable[[list[Any]], Table],
+        title: str = "Results",
+        show_all: bool = False,
+        start_page: int = 1,
+    ) -> None:
+        """Display pages pulled from ``source`` one at a time.
+
+        Only the visible page is fetched and rendered, so the first page
+        appears as soon as it arrives no matter how large the result set is.
+        The page size of the source takes precedence over ``self.page_size``.
+
+        Args:
+            source: Source to pull pages from
+            table_builder: Function that takes a list of items and returns a Rich Table
+            title: Title for the table display
+            show_all: If True, print every page without prompting
+            start_page: Page number to start displaying from
+        """
+        self.page_size = source.page_size
+        first_page = source.get_page(1)
+        if not first_page:
+            self.console.print(f"No {title.lower()} found.", style="yellow")
+            return
+        if show_all or not source.has_page(2):
+            self._print_all(source, table_builder)
+            return
+        self._navigate(source, table_builder, start_page)
+
+    def _navigate(self, source: PageSource, table_builder: Callable[[list[Any]], Table], start_page: int) -> None:
+        """Run the interactive page loop over ``source``."""
+        total_pages = source.total_pages
+        self.current_page = max(1, start_page if total_pages is None else min(start_page, total_pages))
+
+        shown_page = 1
         while True:
-            # Calculate page boundaries
-            start_idx = (self.current_page - 1) * self.page_size
-            end_idx = min(start_idx + self.page_size, len(data))
-            page_data = data[start_idx:end_idx]
+            page_data = source.get_page(self.current_page)
+            if not page_data and self.current_page > 1:
+                # Jumped or stepped past the end of a source of unknown size
+                self.console.print("[yellow]No more results.[/yellow]")
+                self.current_page = min(shown_page, source.total_pages or shown_page)
+                continue
+            shown_page = self.current_page
 
             # Display the table for current page
             table = table_builder(page_data)
             self.console.print(table)
 
             # Display pagination info
-            self._display_pagination_info(self.current_page, total_pages, len(data))
+            total_pages = source.total_pages
+            self._display_pagination_info(self.current_page, total_pages, source.total_items, len(page_data))
 
             # Show navigation options
-            action = self._get_user_action(total_pages)
+            has_next = source.has_page(self.current_page + 1)
+            action = self._get_user_action(total_pages, has_next=has_next)
 
             if action == "quit":
                 break
-            if action == "next" and self.current_page < total_pages:
+            if action == "next" and has_next:
                 self.current_page += 1
             elif action == "previous" and self.current_page > 1:
                 self.current_page -= 1
             elif action == "show_all":
-                table = table_builder(data)
-                self.console.print(table)
+                self._print_all(source, table_builder)
                 break
             elif action.startswith("jump_"):
                 try:
                     page_num = int(action.split("_")[1])
-                    if 1 <= page_num <= total_pages:
+                    if page_num >= 1 and (total_pages is None or page_num <= total_pages):
                         self.current_page = page_num
                     else:
                         self.console.print(
@@ -103,27 +369,60 @@ class PaginatedTableDisplay:
                 except (ValueError, IndexError):
                     self.console.print("[red]Invalid page number format.[/red]")
 
-    def _display_pagination_info(self, current_page: int, total_pages: int, total_items: int) -> None:
+    def _print_all(self, source: PageSource, table_builder: Callable[[list[Any]], Table]) -> None:
+        """Print every item of ``source``; server-backed sources are printed page by page."""
+        if isinstance(source, ListPageSource):
+            self.console.print(table_builder(source.data))
+            return
+        page = 1
+        while source.has_page(page):
+            page_data = source.get_page(page)
+            if not page_data:
+                break
+            self.console.print(table_builder(page_data))
+            page += 1
+
+    def _display_pagination_info(
+        self, current_page: int, total_pages: int | None, total_items: int | None, page_items: int | None = None
+    ) -> None:
         """Display pagination information."""
         start_item = (current_page - 1) * self.page_size + 1
-        end_item = min(current_page * self.page_size, total_items)
+        if total_items is not None:
+            end_item = min(current_page * self.page_size, total_items)
+        else:
+            end_item = start_item + (page_items if page_items is not None else self.page_size) - 1
 
         info_text = Text()
-        info_text.append(f"Page {current_page} of {total_pages} ", style="cyan")
-        info_text.append(f"(showing items {start_item}-{end_item} of {total_items})", style="dim")
+        if total_pages is not None and total_items is not None:
+            info_text.append(f"Page {current_page} of {total_pages} ", style="cyan")
+            info_text.append(f"(showing items {start_item}-{end_item} of {total_items})", style="dim")
+        else:
+            info_text.append(f"Page {current_page} ", style="cyan")
+            info_text.append(f"(showing items {start_item}-{end_item}, more available)", style="dim")
 
         self.console.print(info_text)
 
-    def _get_user_action(self, total_pages: int) -> str:
+    def _get_user_action(self, total_pages: int | None, has_next: bool | None = None) -> str:
         """Get user action for navigation.
 
+        Args:
+            total_pages: Number of pages, or None when the source size is unknown
+            has_next: Whether a next page exists; derived from ``total_pages`` if None
+
         Returns:
             Action string: 'next', 'previous', 'jump_N', 'show_all', or 'quit'
         """
+        if has_next is None:
+            has_next = total_pages is None or self.current_page < total_pages
+        page_range = f"1-{total_pages}" if total_pages is not None else "1 or higher"
+
+        def in_range(page_num: int) -> bool:
+            return page_num >= 1 and (total_pages is None or page_num <= total_pages)
+
         options = []
         if self.current_page > 1:
             options.append("[bold]p[/bold]revious")
-        if self.current_page < total_pages:
+        if has_next:
             options.append("[bold]n[/bold]ext")
         options.extend(["[bold]j[/bold]ump to page", "[bold]a[/bold]ll (show all results)", "[bold]q[/bold]uit"])
 
@@ -135,17 +434,17 @@ class PaginatedTableDisplay:
 
                 if user_input in ["q", "quit", ""]:
                     return "quit"
-                if user_input in ["n", "next"] and self.current_page < total_pages:
+                if user_input in ["n", "next"] and has_next:
                     return "next"
                 if user_input in ["p", "previous", "prev"] and self.current_page > 1:
                     return "previous"
                 if user_input in ["a", "all"]:
                     return "show_all"
                 if user_input in ["j", "jump"]:
-                    page_input = input(f"Enter page number (1-{total_pages}): ").strip()
+                    page_input = input(f"Enter page number ({page_range}): ").strip()
                     try:
                         page_num = int(page_input)
-                        if 1 <= page_num <= total_pages:
+                        if in_range(page_num):
                             return f"jump_{page_num}"
                         self.console.print(f"[red]Please enter a number between 1 and {total_pages}.[/red]")
                     except ValueError:
@@ -154,7 +453,7 @@ class PaginatedTableDisplay:
                     # Try to parse as direct page number
                     try:
                         page_num = int(user_input)
-                        if 1 <= page_num <= total_pages:
+                        if in_range(page_num):
                             return f"jump_{page_num}"
                         self.console.print(f"[red]Please enter a number between 1 and {total_pages}.[/red]")
                     except ValueError:
@@ -1,13 +1,25 @@
 """Performance benchmarking utilities for field selection optimization."""
 
+import io
 import time
+from typing import Any
+
+from rich.console import Console
 
 from .auth import AuthManager
-from .field_selection import get_field_selector
+from .custom_field_manager import CustomFieldManager
+from .field_selection import ISSUE_STATE_FIELD_NAMES, get_field_selector
+from .issue_view import IssueView
 from .logging import get_logger
 from .managers.issues import IssueManager
+from .plain_table import table_rows, write_plain_table
 
-__all__ = ["FieldSelectionBenchmark"]
+__all__ = [
+    "FieldSelectionBenchmark",
+    "benchmark_issue_formatting",
+    "benchmark_table_rendering",
+    "make_synthetic_issues",
+]
 
 logger = get_logger(__name__)
 
@@ -196,3 +208,163 @@ async def run_benchmark(auth_manager: AuthManager, project_id: str | None = None
         logger.error("Benchmark failed", error=str(e))
         print(f"❌ Benchmark failed: {e}")
         raise
+
+
+def make_synthetic_issues(count: int, extra_fields: int = 15) -> list[dict[str, Any]]:
+    """Build synthetic issues shaped like API payloads for offline benchmarks.
+
+    Each issue carries ``extra_fields`` unrelated custom fields ahead of the
+    ones tables render, and stores its state under ``Stage`` so state lookups
+    have to get past ``State`` and ``Status`` first.
+    """
+    states = ("Open", "In Progress", "Fixed", "Verified")
+    priorities = ("Critical", "Major", "Normal", "Minor")
+    issues = []
+    for i in range(count):
+        custom_fields: list[dict[str, Any]] = [
+            {"name": f"Custom {n}", "value": {"name": f"value-{n}"}} for n in range(extra_fields)
+        ]
+        custom_fields += [
+            {"name": "Priority", "value": {"name": priorities[i % len(priorities)]}},
+            {"name": "Type", "value": {"name": "Bug" if i % 3 else "Task"}},
+            {"name": "Stage", "value": {"name": states[i % len(states)]}},
+            {"name": "Assignee", "value": {"login": f"user{i % 50}", "fullName": f"User {i % 50}"}},
+        ]
+        issues.append(
+            {
+                "id": f"2-{i}",
+                "idReadable": f"BENCH-{i}",
+                "summary": f"Synthetic issue {i}",
+                "project": {"name": "Bench", "shortName": "BENCH"},
+                "customFields": custom_fields,
+            }
+        )
+    return issues
+
+
+def benchmark_issue_formatting(issue_count: int = 20000, iterations: int = 3) -> dict[str, float]:
+    """Time table/CSV column extraction with per-column scans vs ``IssueView``.
+
+    The scan variant reproduces the previous lookup pattern: up to four
+    ``extract_field_value`` scans for the state plus one per column. The view
+    variant indexes each issue's custom fields once.
+
+    Args:
+        issue_count: Number of synthetic issues to format
+        iterations: Runs per variant; the fastest run is reported
+
+    Returns:
+        Dictionary with the best ``scan_seconds`` and ``view_seconds``, the
+        ``speedup`` factor and the ``issues`` count
+    """
+    issues = make_synthetic_issues(issue_count)
+    columns = ("Priority", "Type", "Assignee")
+
+    def scan_rows() -> list[tuple[Any, ...]]:
+        rows = []
+        for issue in issues:
+            custom_fields = issue.get("customFields", [])
+            state = ""
+            for field_name in ISSUE_STATE_FIELD_NAMES:
+                value = CustomFieldManager.extract_field_value(custom_fields, field_name)
+                if value:
+                    state = str(value)
+                    break
+            values = [CustomFieldManager.extract_field_value(custom_fields, column) for column in columns]
+            rows.append((issue["idReadable"], state, *(str(v) if v is not None else None for v in values)))
+        return rows
+
+    def view_rows() -> list[tuple[Any, ...]]:
+        rows = []
+        for view in map(IssueView, issues):
+            rows.append((view.id, view.state, *(view.field(column) for column in columns)))
+        return rows
+
+    def best_of(func: Any) -> tuple[float, list[tuple[Any, ...]]]:
+        best = float("inf")
+        rows: list[tuple[Any, ...]] = []
+        for _ in range(max(1, iterations)):
+            start = time.perf_counter()
+            rows = func()
+            best = min(best, time.perf_counter() - start)
+        return best, rows
+
+    scan_seconds, scan_result = best_of(scan_rows)
+    view_seconds, view_result = best_of(view_rows)
+    if scan_result != view_result:
+        raise AssertionError("IssueView produced different values than per-column scans")
+
+    return {
+        "issues": float(issue_count),
+        "scan_seconds": scan_seconds,
+        "view_seconds": view_seconds,
+        "speedup": scan_seconds / view_seconds if view_seconds else 0.0,
+    }
+
+
+def print_formatting_report(results: dict[str, float]) -> None:
+    """Print the result of ``benchmark_issue_formatting``."""
+    print("\n" + "=" * 60)
+    print("ISSUE FORMATTING MICRO-BENCHMARK")
+    print("=" * 60)
+    print(f"Synthetic issues:        {int(results['issues'])}")
+    print(f"Per-column scans:        {results['scan_seconds']:.3f}s")
+    print(f"Indexed IssueView:       {results['view_seconds']:.3f}s")
+    print(f"Speedup:                 {results['speedup']:.1f}x")
+    print("=" * 60)
+
+
+def benchmark_table_rendering(row_count: int = 10000, iterations: int = 1) -> dict[str, float]:
+    """Time printing an issues table through Rich layout vs the plain renderer.
+
+    Both variants start from the same Rich ``Table`` built by
+    ``IssueManager._build_issues_table`` and write to an in-memory buffer,
+    so only the layout and output cost is measured.
+
+    Args:
+        row_count: Number of synthetic issues in the table
+        iterations: Runs per variant; the fastest run is reported
+
+    Returns:
+        Dictionary with the best ``rich_seconds`` and ``plain_seconds``, the
+        ``speedup`` factor and the ``rows`` count
+    """
+    issues = make_synthetic_issues(row_count)
+    manager = IssueManager(AuthManager())
+    table = manager._build_issues_table(issues)
+    headers = [str(column.header) for column in table.columns]
+
+    def rich_render() -> None:
+        Console(file=io.StringIO(), width=160, force_terminal=False, color_system=None).print(table)
+
+    def plain_render() -> None:
+        write_plain_table(io.StringIO(), headers, table_rows(table))
+
+    def best_of(func: Any) -> float:
+        best = float("inf")
+        for _ in range(max(1, iterations)):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    rich_seconds = best_of(rich_render)
+    plain_seconds = best_of(plain_render)
+    return {
+        "rows": float(row_count),
+        "rich_seconds": rich_seconds,
+        "plain_seconds": plain_seconds,
+        "speedup": rich_seconds / plain_seconds if plain_seconds else 0.0,
+    }
+
+
+def print_rendering_report(results: dict[str, float]) -> None:
+    """Print the result of ``benchmark_table_rendering``."""
+    print("\n" + "=" * 60)
+    print("TABLE RENDERING MICRO-BENCHMARK")
+    print("=" * 60)
+    print(f"Table rows:              {int(results['rows'])}")
+    print(f"Rich table layout:       {results['rich_seconds']:.3f}s")
+    print(f"Plain aligned output:    {results['plain_seconds']:.3f}s")
+    print(f"Speedup:                 {results['speedup']:.1f}x")
+    print("=" * 60)
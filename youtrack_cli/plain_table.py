@@ -0,0 +1,140 @@
+"""Plain column-aligned table output for pipes and very large tables.
+
+Rich measures every cell of a ``Table`` before printing the first line, which
+for thousands of rows costs far more than fetching the data. When stdout is not
+a terminal (redirected to a file, piped to ``less`` or ``grep``), or a table has
+more than ``PLAIN_TABLE_ROW_THRESHOLD`` rows, ``print_table`` writes plain text
+instead: column widths come from a bounded sample of rows and the remaining
+rows are streamed without further measuring.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, islice
+from typing import IO, Any
+
+from rich.cells import cell_len, set_cell_size
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+__all__ = [
+    "PLAIN_TABLE_MAX_COLUMN_WIDTH",
+    "PLAIN_TABLE_ROW_THRESHOLD",
+    "PLAIN_TABLE_SAMPLE_SIZE",
+    "print_table",
+    "should_render_plain",
+    "table_rows",
+    "write_plain_table",
+]
+
+#: Tables with more rows than this are rendered plain even on a terminal.
+PLAIN_TABLE_ROW_THRESHOLD = 1000
+
+#: Number of rows (after the header) used to size the columns.
+PLAIN_TABLE_SAMPLE_SIZE = 200
+
+#: Widest a column may grow; longer cells are cut with an ellipsis.
+PLAIN_TABLE_MAX_COLUMN_WIDTH = 60
+
+_COLUMN_GAP = "  "
+_WRITE_BATCH = 500
+
+
+def should_render_plain(console: Console, row_count: int) -> bool:
+    """Return whether a table of ``row_count`` rows should skip Rich layout."""
+    return console.is_terminal is False or row_count > PLAIN_TABLE_ROW_THRESHOLD
+
+
+def _cell_text(cell: Any) -> str:
+    if isinstance(cell, Text):
+        return cell.plain
+    if cell is None:
+        return ""
+    text = str(cell)
+    # Markup written by our own display code always closes its tags; anything
+    # else (e.g. a "[bug] ..." summary) is shown verbatim.
+    if "[/" in text:
+        return Text.from_markup(text).plain
+    return text.replace("\n", " ")
+
+
+def table_rows(table: Table) -> Iterator[list[str]]:
+    """Yield the rows of a Rich ``Table`` as lists of plain strings."""
+    columns = [list(column.cells) for column in table.columns]
+    for row in zip(*columns, strict=False):
+        yield [_cell_text(cell) for cell in row]
+
+
+def write_plain_table(
+    stream: IO[str],
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    title: str | None = None,
+    sample_size: int = PLAIN_TABLE_SAMPLE_SIZE,
+    max_column_width: int = PLAIN_TABLE_MAX_COLUMN_WIDTH,
+) -> int:
+    """Write ``rows`` under ``headers`` as whitespace-aligned plain text.
+
+    Column widths are computed in one pass over the header and the first
+    ``sample_size`` rows, capped at ``max_column_width``. Later rows are
+    formatted to those widths and written in batches as they are consumed.
+    Cells wider than their column are cut with an ellipsis, except in the
+    last column, which is never padded or cut.
+
+    Returns:
+        Number of data rows written
+    """
+    row_iter = iter(rows)
+    sample = [list(row) for row in islice(row_iter, sample_size)]
+    widths = [cell_len(header) for header in headers]
+    for row in sample:
+        for index, cell in enumerate(row[: len(widths)]):
+            length = cell_len(cell)
+            if length > widths[index]:
+                widths[index] = length
+    widths = [min(width, max_column_width) for width in widths]
+    last = len(widths) - 1
+
+    def format_row(row: Sequence[str]) -> str:
+        cells = []
+        for index, width in enumerate(widths):
+            cell = row[index] if index < len(row) else ""
+            if index == last:
+                cells.append(cell)
+                continue
+            length = cell_len(cell)
+            if length > width:
+                cell = set_cell_size(cell, width - 1) + "…"
+            elif length < width:
+                cell += " " * (width - length)
+            cells.append(cell)
+        return _COLUMN_GAP.join(cells).rstrip()
+
+    if title:
+        stream.write(f"{title}\n")
+    stream.write(format_row(list(headers)) + "\n")
+    stream.write(_COLUMN_GAP.join("-" * width for width in widths) + "\n")
+
+    count = 0
+    batch: list[str] = []
+    for row in chain(sample, row_iter):
+        batch.append(format_row(row))
+        count += 1
+        if len(batch) >= _WRITE_BATCH:
+            stream.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        stream.write("\n".join(batch) + "\n")
+    stream.flush()
+    return count
+
+
+def print_table(console: Console, table: Table) -> None:
+    """Print ``table`` through Rich, or as plain text when Rich layout is not worth it."""
+    if not isinstance(table, Table) or not should_render_plain(console, table.row_count):
+        console.print(table)
+        return
+
+    headers = [_cell_text(column.header) for column in table.columns]
+    title = _cell_text(table.title) if table.title else None
+    write_plain_table(console.file, headers, table_rows(table), title=title)
@@ -11,6 +11,7 @@ from .client import get_client_manager
 from .console import get_console
 from .custom_field_manager import CustomFieldManager
 from .pagination import create_paginated_display
+from .plain_table import print_table
 from .users import UserManager
 
 __all__ = ["ProjectManager"]
@@ -63,16 +64,14 @@ class ProjectManager:
 
         # Try to resolve as username
         try:
-            result = await self.user_manager.get_user(username_or_id, fields="id,login")
-            if result["status"] == "success":
-                user_data = result["data"]
-                user_id = user_data.get("id")
-                if user_id:
-                    return user_id, None
-                return username_or_id, f"User '{username_or_id}' found but missing ID"
-            return username_or_id, f"User '{username_or_id}' not found"
+            user = await self.user_manager.resolve_user(username_or_id)
         except Exception as e:
             return username_or_id, f"Error resolving username '{username_or_id}': {e}"
+        if user is None:
+            return username_or_id, f"User '{username_or_id}' not found"
+        if user.get("id"):
+            return user["id"], None
+        return username_or_id, f"User '{username_or_id}' found but missing ID"
 
     async def list_projects(
         self,
@@ -100,7 +99,7 @@ class ProjectManager:
         Returns:
             Dictionary with operation result including pagination metadata
         """
-        from .utils import paginate_results  # Import here to avoid circular imports
+        from .utils import PaginationConfig, paginate_results  # Import here to avoid circular imports
 
         credentials = self.auth_manager.load_credentials()
         if not credentials:
@@ -138,6 +137,7 @@ class ProjectManager:
                     after_cursor=after_cursor,
                     before_cursor=before_cursor,
                     use_cursor_pagination=False,  # Projects use offset pagination
+                    prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES,
                 )
                 projects = result["results"]
 
@@ -506,7 +506,7 @@ class ProjectManager:
                 description,
             )
 
-        self.console.print(table)
+        print_table(self.console, table)
 
     def display_projects_table_paginated(
         self, projects: list[dict[str, Any]], page_size: int = 50, show_all: bool = False, start_page: int = 1
@@ -1,15 +1,33 @@
 """Report generation for YouTrack CLI."""
 
-from typing import Any
+import asyncio
+from array import array
+from datetime import date, timedelta
+from typing import IO, Any
 
 from rich.table import Table
 
+from .activity_cache import ActivityCache
 from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
+from .exceptions import YouTrackError
+from .flow_metrics import FLOW_ACTIVITY_FIELDS, TransitionTable, daily_burn_series
+from .plain_table import print_table
 from .progress import get_progress_manager
+from .services.issues import IssueService
+from .stream_writers import CSVStreamWriter
+from .velocity_cache import VelocityCache
 
-__all__ = ["ReportManager"]
+__all__ = ["BURNDOWN_SERIES_HEADERS", "ReportManager"]
+
+BURNDOWN_SERIES_HEADERS = ("date", "scope", "completed", "remaining", "ideal")
+
+# Velocity buckets issues by their fix versions and sums the spent time field.
+VELOCITY_VERSION_FIELD = "Fix versions"
+VELOCITY_SPENT_FIELD = "Spent time"
+VELOCITY_ISSUE_FIELDS = "id,resolved,customFields(name,value(name,minutes))"
+VELOCITY_PAGE_SIZE = 500
 
 
 class ReportManager:
@@ -30,14 +48,22 @@ class ReportManager:
         sprint_id: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        include_series: bool = False,
     ) -> dict[str, Any]:
         """Generate a burndown report for a project or sprint.
 
+        Totals come from two issue counts. With ``include_series``, every
+        matching issue is also streamed page by page (only its ``created``
+        and ``resolved`` timestamps are kept) to build a daily burnup /
+        burndown series from ``start_date`` (default: 30 days before the
+        end) to ``end_date`` (default: today).
+
         Args:
             project_id: Project ID or short name
             sprint_id: Sprint ID (optional)
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            include_series: Add a daily ``series`` to the report
 
         Returns:
             Dictionary with operation result
@@ -51,7 +77,13 @@ class ReportManager:
                 "message": "Not authenticated. Run 'yt auth login' first.",
             }
 
-        with progress_manager.progress_bar("Generating burndown report...", total=3) as tracker:
+        try:
+            series_end = date.fromisoformat(end_date) if end_date else date.today()
+            series_start = date.fromisoformat(start_date) if start_date else series_end - timedelta(days=29)
+        except ValueError as e:
+            return {"status": "error", "message": f"Invalid date: {e}"}
+
+        with progress_manager.progress_bar("Generating burndown report...", total=4) as tracker:
             # Step 1: Build query for issues
             tracker.update(description="Building query...")
             query_parts = [f"project: {project_id}"]
@@ -65,41 +97,25 @@ class ReportManager:
             query = " ".join(query_parts)
             tracker.advance()
 
-            headers = {
-                "Authorization": f"Bearer {credentials.token}",
-                "Accept": "application/json",
-            }
-
-            params = {
-                "query": query,
-                "fields": ("id,summary,resolved,created,updated,state(name),spent(value)"),
-                "$top": "1000",
-            }
-
-            client_manager = get_client_manager()
+            issue_service = IssueService(self.auth_manager)
             try:
-                # Step 2: Fetch issues from API
-                tracker.update(description="Fetching issues from YouTrack...")
-                response = await client_manager.make_request(
-                    "GET",
-                    f"{credentials.base_url.rstrip('/')}/api/issues",
-                    headers=headers,
-                    params=params,
-                    timeout=30.0,
+                # Step 2: Count all and resolved issues; no issue bodies are transferred
+                tracker.update(description="Counting issues in YouTrack...")
+                total_result, resolved_result = await asyncio.gather(
+                    issue_service.count_issues(query),
+                    issue_service.count_issues(f"{query} #Resolved"),
                 )
-
-                issues = response.json()
+                for count_result in (total_result, resolved_result):
+                    if count_result["status"] != "success":
+                        return {"status": "error", "message": count_result["message"]}
                 tracker.advance()
 
                 # Step 3: Calculate burndown metrics
                 tracker.update(description="Calculating burndown metrics...")
-                total_issues = len(issues)
-                resolved_issues = len([i for i in issues if i.get("resolved")])
+                total_issues = total_result["data"]["count"]
+                resolved_issues = resolved_result["data"]["count"]
                 remaining_issues = total_issues - resolved_issues
 
-                # Calculate total effort if story points available
-                total_effort = sum(issue.get("spent", {}).get("value", 0) for issue in issues)
-
                 burndown_data = {
                     "project": project_id,
                     "sprint": sprint_id,
@@ -108,22 +124,47 @@ class ReportManager:
                     "resolved_issues": resolved_issues,
                     "remaining_issues": remaining_issues,
                     "completion_rate": (round((resolved_issues / total_issues * 100), 2) if total_issues > 0 else 0),
-                    "total_effort_hours": (total_effort / 60 if total_effort > 0 else 0),  # Convert minutes to hours
-                    "issues": issues,
                 }
                 tracker.advance()
 
+                # Step 4: Build the daily series from issue timestamps
+                if include_series:
+                    tracker.update(description="Building daily series...")
+                    burndown_data["series"] = await self._burn_series(query, series_start, series_end)
+                tracker.advance()
+
                 return {"status": "success", "data": burndown_data}
 
             except Exception as e:
                 return {"status": "error", "message": f"Unexpected error: {e}"}
 
-    async def generate_velocity_report(self, project_id: str, sprints: int = 5) -> dict[str, Any]:
+    async def _burn_series(self, query: str, start: date, end: date) -> list[dict[str, Any]]:
+        """Stream the issues matching ``query`` and return their daily burn series."""
+        from .managers.issues import IssueManager
+
+        created = array("q")
+        resolved = array("q")
+        async for issue in IssueManager(self.auth_manager).stream_list_issues(
+            query=query, fields="created,resolved", page_size=500
+        ):
+            created.append(issue.get("created") or 0)
+            resolved.append(issue.get("resolved") or 0)
+        return daily_burn_series(created, resolved, start, end)
+
+    async def generate_velocity_report(
+        self, project_id: str, sprints: int = 5, use_cache: bool = True
+    ) -> dict[str, Any]:
         """Generate a velocity report for recent sprints.
 
+        The issues of every sprint that is not cached are fetched with a
+        single paged query over all of their ``Fix versions`` and bucketed
+        client-side. Figures for released sprints are cached on disk, since
+        their issues no longer change.
+
         Args:
             project_id: Project ID or short name
             sprints: Number of recent sprints to analyze
+            use_cache: Reuse and update the on-disk cache of released sprints
 
         Returns:
             Dictionary with operation result
@@ -145,8 +186,8 @@ class ReportManager:
         # Get project versions (sprints)
         client_manager = get_client_manager()
         try:
-            with progress_manager.progress_bar("Generating velocity report...", total=None) as tracker:
-                # First get the project to find versions
+            with progress_manager.progress_bar("Generating velocity report...", total=3) as tracker:
+                # Step 1: Get the project to find versions
                 tracker.update(description="Fetching project versions...")
                 project_response = await client_manager.make_request(
                     "GET",
@@ -158,57 +199,38 @@ class ReportManager:
                 project_data = project_response.json()
 
                 versions = project_data.get("versions", [])
-                recent_versions = sorted(versions, key=lambda v: v.get("releaseDate", ""), reverse=True)[:sprints]
+                recent_versions = sorted(versions, key=lambda v: v.get("releaseDate") or 0, reverse=True)[:sprints]
+                tracker.advance()
+
+                # Step 2: Reuse released sprints from the cache, fetch the rest in one query
+                cache = VelocityCache() if use_cache else None
+                scope = VelocityCache.scope(credentials.base_url, project_id)
+                cached = cache.load(scope) if cache else {}
+                pending = [version for version in recent_versions if version.get("id") not in cached]
+
+                tracker.update(description=f"Fetching issues for {len(pending)} sprint(s)...")
+                fetched = await self._velocity_sprint_stats(project_id, [version["name"] for version in pending])
+                tracker.advance()
 
+                # Step 3: Assemble per-sprint figures and averages
+                tracker.update(description="Calculating velocity averages...")
                 velocity_data: dict[str, Any] = {
                     "project": project_id,
                     "sprints_analyzed": len(recent_versions),
                     "sprints": [],
                 }
-
-                # Update progress bar with known total
-                tracker.update(
-                    total=len(recent_versions) + 1,
-                    completed=1,
-                    description="Analyzing sprint data...",
-                )
-
-                for i, version in enumerate(recent_versions):
-                    tracker.update(description=f"Processing sprint: {version['name']}")
-
-                    # Get issues for this sprint/version
-                    query = f"project: {project_id} Fix versions: {version['name']}"
-
-                    # Use direct API call for sprint issues to maintain test compatibility
-                    endpoint = f"{credentials.base_url.rstrip('/')}/api/issues"
-                    client_manager = get_client_manager()
-                    response = await client_manager.make_request(
-                        "GET",
-                        endpoint,
-                        headers=headers,
-                        params={
-                            "query": query,
-                            "fields": "id,resolved,spent(value)",
-                            "$top": "1000",  # Reasonable limit for sprint analysis
-                        },
+                updated_cache = False
+                for version in recent_versions:
+                    stats = cached.get(version.get("id")) or fetched[version["name"]]
+                    velocity_data["sprints"].append(
+                        {"name": version["name"], "release_date": version.get("releaseDate"), **stats}
                     )
-                    sprint_issues = response.json()
-
-                    resolved_count = len([i for i in sprint_issues if i.get("resolved")])
-                    total_effort = sum(issue.get("spent", {}).get("value", 0) for issue in sprint_issues)
-
-                    sprint_data = {
-                        "name": version["name"],
-                        "release_date": version.get("releaseDate"),
-                        "total_issues": len(sprint_issues),
-                        "resolved_issues": resolved_count,
-                        "total_effort_hours": (total_effort / 60 if total_effort > 0 else 0),
-                    }
-                    velocity_data["sprints"].append(sprint_data)
-                    tracker.advance()
-
-                # Calculate average velocity
-                tracker.update(description="Calculating velocity averages...")
+                    if cache and version.get("released") and version.get("id") not in cached:
+                        cached[version["id"]] = stats
+                        updated_cache = True
+                if cache and updated_cache:
+                    cache.save(scope, cached)
+
                 if velocity_data["sprints"]:
                     avg_resolved = sum(s["resolved_issues"] for s in velocity_data["sprints"]) / len(
                         velocity_data["sprints"]
@@ -219,12 +241,147 @@ class ReportManager:
 
                     velocity_data["average_issues_per_sprint"] = round(avg_resolved, 2)
                     velocity_data["average_effort_per_sprint"] = round(avg_effort, 2)
+                tracker.advance()
 
                 return {"status": "success", "data": velocity_data}
 
         except Exception as e:
             return {"status": "error", "message": f"Unexpected error: {e}"}
 
+    async def _velocity_sprint_stats(self, project_id: str, version_names: list[str]) -> dict[str, dict[str, Any]]:
+        """Page through the issues of all ``version_names`` once and bucket them by version.
+
+        An issue in several of the versions counts towards each of them.
+        """
+        stats = {name: {"total_issues": 0, "resolved_issues": 0, "total_effort_hours": 0.0} for name in version_names}
+        if not version_names:
+            return stats
+
+        values = ", ".join(f"{{{name}}}" for name in version_names)
+        query = f"project: {project_id} {VELOCITY_VERSION_FIELD}: {values}"
+        issue_service = IssueService(self.auth_manager)
+        skip = 0
+        while True:
+            result = await issue_service.search_issues(
+                query=query,
+                fields=VELOCITY_ISSUE_FIELDS,
+                top=VELOCITY_PAGE_SIZE,
+                skip=skip,
+                custom_fields=(VELOCITY_VERSION_FIELD, VELOCITY_SPENT_FIELD),
+            )
+            if result["status"] != "success":
+                raise YouTrackError(result.get("message", "Failed to search issues"))
+            page = result["data"] or []
+
+            for issue in page:
+                fields = {field.get("name"): field.get("value") for field in issue.get("customFields") or []}
+                spent = fields.get(VELOCITY_SPENT_FIELD)
+                spent_hours = (spent.get("minutes") or 0) / 60 if isinstance(spent, dict) else 0.0
+                issue_versions = fields.get(VELOCITY_VERSION_FIELD) or []
+                if isinstance(issue_versions, dict):
+                    issue_versions = [issue_versions]
+                for name in {version.get("name") for version in issue_versions if isinstance(version, dict)}:
+                    bucket = stats.get(name)
+                    if bucket is None:
+                        continue
+                    bucket["total_issues"] += 1
+                    bucket["resolved_issues"] += 1 if issue.get("resolved") else 0
+                    bucket["total_effort_hours"] += spent_hours
+
+            if len(page) < VELOCITY_PAGE_SIZE:
+                return stats
+            skip += len(page)
+
+    async def generate_cycle_time_report(
+        self,
+        project_id: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        start_states: list[str] | None = None,
+        query: str | None = None,
+        use_cache: bool = True,
+        max_concurrent: int = 8,
+    ) -> dict[str, Any]:
+        """Generate lead time, cycle time and time-in-state metrics from state history.
+
+        Issues resolved in the period are read with their creation and
+        resolution times, then their state changes are streamed from the
+        activity history (cached on disk between runs unless ``use_cache`` is
+        False) into a ``TransitionTable`` for aggregation.
+
+        Args:
+            project_id: Project ID or short name
+            start_date: Start of the resolution period, YYYY-MM-DD (default: 90 days before end)
+            end_date: End of the resolution period, YYYY-MM-DD (default: today)
+            start_states: States that mark the start of work for cycle time
+            query: Additional query terms
+            use_cache: Reuse and update the on-disk activity cache
+            max_concurrent: Maximum issues whose history is fetched concurrently
+
+        Returns:
+            Dictionary with operation result
+        """
+        from .managers.issues import IssueManager
+
+        if not self.auth_manager.load_credentials():
+            return {
+                "status": "error",
+                "message": "Not authenticated. Run 'yt auth login' first.",
+            }
+
+        end = end_date or date.today().isoformat()
+        try:
+            start = start_date or (date.fromisoformat(end) - timedelta(days=90)).isoformat()
+        except ValueError:
+            return {"status": "error", "message": f"Invalid end date '{end}', expected YYYY-MM-DD"}
+        try:
+            date.fromisoformat(start)
+        except ValueError:
+            return {"status": "error", "message": f"Invalid start date '{start}', expected YYYY-MM-DD"}
+        full_query = f"project: {project_id} #Resolved resolved date: {start} .. {end} {query or ''}".strip()
+
+        issue_manager = IssueManager(self.auth_manager)
+        table = TransitionTable()
+        errors: dict[str, str] = {}
+        progress_manager = get_progress_manager()
+        try:
+            with progress_manager.progress_bar("Generating cycle time report...", total=3) as tracker:
+                tracker.update(description="Fetching resolved issues...")
+                async for issue in issue_manager.stream_list_issues(
+                    query=full_query, fields="idReadable,created,resolved", page_size=500
+                ):
+                    issue_id = issue.get("idReadable")
+                    if issue_id:
+                        table.add_issue(issue_id, issue.get("created"), issue.get("resolved"))
+                tracker.advance()
+
+                tracker.update(description=f"Reading state history of {len(table.issue_ids)} issues...")
+                async for issue_id, activity in issue_manager.issue_service.stream_activities(
+                    table.issue_ids,
+                    categories=["CustomFieldCategory"],
+                    fields=FLOW_ACTIVITY_FIELDS,
+                    max_concurrent=max_concurrent,
+                    cache=ActivityCache() if use_cache else None,
+                    errors=errors,
+                ):
+                    table.add_activity(issue_id, activity)
+                tracker.advance()
+
+                tracker.update(description="Calculating flow metrics...")
+                metrics = table.compute(start_states)
+                tracker.advance()
+        except Exception as e:
+            return {"status": "error", "message": f"Unexpected error: {e}"}
+
+        data = {
+            "project": project_id,
+            "period": f"{start} to {end}",
+            "start_states": start_states or [],
+            **metrics,
+            "failed_issues": sorted(errors),
+        }
+        return {"status": "success", "data": data}
+
     def display_burndown_report(self, burndown_data: dict[str, Any]) -> None:
         """Display burndown report in a formatted table.
 
@@ -246,9 +403,6 @@ class ReportManager:
         table.add_row("Remaining Issues", str(burndown_data["remaining_issues"]))
         table.add_row("Completion Rate", f"{burndown_data['completion_rate']}%")
 
-        if burndown_data["total_effort_hours"] > 0:
-            table.add_row("Total Effort", f"{burndown_data['total_effort_hours']:.1f} hours")
-
         self.console.print(table)
 
         # Keep progress bar separate as requested in the issue
@@ -259,6 +413,30 @@ class ReportManager:
 
         self.console.print(f"\n[cyan]Progress:[/cyan] [{bar}] {completion_rate}%")
 
+        series = burndown_data.get("series")
+        if series:
+            series_table = Table(title="Daily Burndown")
+            series_table.add_column("Date", style="cyan", no_wrap=True)
+            for header in BURNDOWN_SERIES_HEADERS[1:]:
+                series_table.add_column(header.capitalize(), justify="right")
+            for row in series:
+                series_table.add_row(
+                    row["date"], str(row["scope"]), str(row["completed"]), str(row["remaining"]), f"{row['ideal']:g}"
+                )
+            print_table(self.console, series_table)
+
+    def write_burndown_csv(self, stream: IO[str], burndown_data: dict[str, Any]) -> int:
+        """Write the daily burndown series as CSV and return the number of rows.
+
+        Args:
+            stream: Text stream to write to
+            burndown_data: Burndown report data with a ``series``
+        """
+        with CSVStreamWriter(stream, BURNDOWN_SERIES_HEADERS) as writer:
+            for row in burndown_data.get("series", []):
+                writer.write([row[header] for header in BURNDOWN_SERIES_HEADERS])
+            return writer.count
+
     def display_velocity_report(self, velocity_data: dict[str, Any]) -> None:
         """Display velocity report in a formatted table.
 
@@ -297,3 +475,72 @@ class ReportManager:
             self.console.print(
                 f"[cyan]Average Effort per Sprint:[/cyan] {velocity_data['average_effort_per_sprint']:.1f} hours"
             )
+
+    def display_cycle_time_report(self, report: dict[str, Any]) -> None:
+        """Display cycle time report tables and histograms.
+
+        Args:
+            report: Cycle time report data
+        """
+        self.console.print(f"\n[bold blue]Cycle Time Report - {report['project']}[/bold blue]")
+        self.console.print(
+            f"[dim]{report['period']} · {report['resolved_issues']} resolved issues · "
+            f"{report['transitions']} state transitions[/dim]"
+        )
+
+        summary = Table(title="Lead and Cycle Time (days)")
+        summary.add_column("Metric", style="cyan", no_wrap=True)
+        for header in ("Issues", "Mean", "P50", "P85", "P95", "Max"):
+            summary.add_column(header, justify="right")
+        for label, key in (("Lead time", "lead_time"), ("Cycle time", "cycle_time")):
+            stats = report[key]
+            summary.add_row(
+                label,
+                str(stats["count"]),
+                *(f"{stats[field]:.1f}" for field in ("mean_days", "p50_days", "p85_days", "p95_days", "max_days")),
+            )
+        self.console.print(summary)
+
+        buckets = report["cycle_time_histogram"]
+        peak = max((bucket["count"] for bucket in buckets), default=0)
+        if peak:
+            self.console.print("\n[cyan]Cycle time distribution:[/cyan]")
+            for bucket in buckets:
+                bar = "█" * round(30 * bucket["count"] / peak)
+                self.console.print(f"  {bucket['bucket']:>8} {bar} {bucket['count']}")
+
+        if report["time_in_state"]:
+            states = Table(title="Time in State (days)")
+            states.add_column("State", style="cyan", no_wrap=True)
+            for header in ("Stays", "P50", "P85", "Total"):
+                states.add_column(header, justify="right")
+            for row in report["time_in_state"]:
+                states.add_row(
+                    row["state"],
+                    str(row["count"]),
+                    f"{row['p50_days']:.1f}",
+                    f"{row['p85_days']:.1f}",
+                    f"{row['total_days']:.1f}",
+                )
+            self.console.print(states)
+
+        if report["weekly"]:
+            weekly = Table(title="Weekly Trend")
+            weekly.add_column("Week of", style="cyan", no_wrap=True)
+            for header in ("Resolved", "Lead P50", "Cycle P50"):
+                weekly.add_column(header, justify="right")
+            for row in report["weekly"]:
+                weekly.add_row(
+                    row["week"],
+                    str(row["resolved"]),
+                    f"{row['lead_time_p50_days']:.1f}",
+                    f"{row['cycle_time_p50_days']:.1f}",
+                )
+            self.console.print(weekly)
+
+        if report["failed_issues"]:
+            self.console.print(
+                f"⚠️  History unavailable for {len(report['failed_issues'])} issue(s): "
+                f"{', '.join(report['failed_issues'][:10])}",
+                style="yellow",
+            )
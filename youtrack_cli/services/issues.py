@@ -1,13 +1,53 @@
 """Issue service for YouTrack API operations."""
 
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any
 
+from ..activity_cache import ActivityCache, CachedActivities
+from ..cache import get_cache
 from ..custom_field_manager import CustomFieldManager
+from ..endpoint_resolver import get_endpoint_resolver
+from ..exceptions import YouTrackError
+from ..index_cache import IndexCache, get_index_cache
 from ..logging import get_logger
 from .base import BaseService
 
 logger = get_logger(__name__)
 
+# Field selection used by get_issue when the caller does not pass one.
+DEFAULT_ISSUE_FIELDS = (
+    "id,summary,description,state,priority,type,"
+    "assignee(login,fullName),project(id,name),created,updated,"
+    "tags(name),links(linkType,direction,issues(id,summary)),"
+    "customFields(id,name,value(login,fullName,name))"
+)
+
+# Lifetimes of the shared name -> id indexes. Link types are instance
+# configuration and rarely change; tags are created by users far more often.
+LINK_TYPE_INDEX_TTL = 3600.0
+TAG_INDEX_TTL = 600.0
+
+# YouTrack answers issue count requests with -1 until the count is computed;
+# poll with exponential backoff between these bounds, up to the timeout.
+ISSUE_COUNT_POLL_INTERVAL = 0.25
+ISSUE_COUNT_MAX_POLL_INTERVAL = 2.0
+ISSUE_COUNT_TIMEOUT = 30.0
+
+DEFAULT_ACTIVITY_FIELDS = (
+    "id,timestamp,author(login,fullName),category(id),field(name,presentation),targetMember,"
+    "added(id,name,login,presentation,text),removed(id,name,login,presentation,text)"
+)
+ACTIVITY_PAGE_SIZE = 100
+
+_ACTIVITY_ISSUE_DONE = object()
+
+
+def _is_internal_issue_id(issue_id: str) -> bool:
+    """Check whether an ID is an internal entity ID such as ``3-21``."""
+    return issue_id.count("-") == 1 and all(part.isdigit() for part in issue_id.split("-"))
+
 
 class IssueService(BaseService):
     """Service for YouTrack issue API operations.
@@ -137,12 +177,7 @@ class IssueService(BaseService):
             if fields:
                 params["fields"] = fields
             else:
-                params["fields"] = (
-                    "id,summary,description,state,priority,type,"
-                    "assignee(login,fullName),project(id,name),created,updated,"
-                    "tags(name),links(linkType,direction,issues(id,summary)),"
-                    "customFields(id,name,value(login,fullName,name))"
-                )
+                params["fields"] = DEFAULT_ISSUE_FIELDS
 
             response = await self._make_request("GET", f"issues/{issue_id}", params=params)
             return await self._handle_response(response)
@@ -208,20 +243,7 @@ class IssueService(BaseService):
                             state_field_added = True
                         else:
                             # Field discovery failed - get available fields for error message
-                            from .projects import ProjectService
-
-                            project_service = ProjectService(self.auth_manager)
-                            fields_result = await project_service.get_project_custom_fields(
-                                project_id, "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)"
-                            )
-
-                            available_fields = []
-                            if fields_result["status"] == "success":
-                                available_fields = [
-                                    f.get("field", {}).get("name", "")
-                                    for f in fields_result["data"]
-                                    if f.get("field", {}).get("name")
-                                ]
+                            available_fields = await self._available_custom_fields(project_id)
 
                             return self._create_error_response(
                                 f"No state field found for project '{project_id}'. "
@@ -337,16 +359,7 @@ class IssueService(BaseService):
                                 )
                             else:
                                 # Get available fields
-                                fields_result = await project_service.get_project_custom_fields(
-                                    project_id, "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)"
-                                )
-                                available_fields = []
-                                if fields_result["status"] == "success":
-                                    available_fields = [
-                                        f.get("field", {}).get("name", "")
-                                        for f in fields_result["data"]
-                                        if f.get("field", {}).get("name")
-                                    ]
+                                available_fields = state_field_result.get("available_fields", [])
 
                                 return self._create_error_response(
                                     f"State update failed. No state field found in project '{project_id}'. "
@@ -401,6 +414,15 @@ class IssueService(BaseService):
         except Exception:
             return None
 
+    async def _available_custom_fields(self, project_id: str) -> list[str]:
+        """Names of a project's custom fields from its schema snapshot, for error messages."""
+        from .projects import ProjectService
+
+        result = await ProjectService(self.auth_manager).get_project_schema(project_id)
+        if result["status"] != "success":
+            return []
+        return result["data"].field_names()
+
     async def _resolve_project_database_id(self, project_id_or_short_name: str) -> str | None:
         """Resolve a project short name to database ID for move operations.
 
@@ -500,12 +522,57 @@ class IssueService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error deleting issue: {str(e)}")
 
+    async def apply_command(
+        self,
+        query: str,
+        issue_ids: list[str],
+        comment: str | None = None,
+        silent: bool = False,
+    ) -> dict[str, Any]:
+        """Apply a YouTrack command to several issues in one request via API.
+
+        Args:
+            query: Command text, e.g. ``State Fixed`` or ``tag release``
+            issue_ids: Issues to apply the command to (readable or internal IDs)
+            comment: Optional comment added alongside the command
+            silent: Suppress notifications for the change
+
+        Returns:
+            API response
+        """
+        try:
+            issues = [
+                {"id": issue_id} if _is_internal_issue_id(issue_id) else {"idReadable": issue_id}
+                for issue_id in issue_ids
+            ]
+            command_data: dict[str, Any] = {"query": query, "issues": issues}
+            if comment:
+                command_data["comment"] = comment
+            if silent:
+                command_data["silent"] = True
+
+            response = await self._make_request("POST", "commands", json_data=command_data)
+
+            if response.status_code == 200:
+                return {
+                    "status": "success",
+                    "message": f"Applied '{query}' to {len(issues)} issue(s)",
+                    "data": {},
+                }
+            return await self._handle_response(response)
+
+        except ValueError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            return self._create_error_response(f"Error applying command: {str(e)}")
+
     async def search_issues(
         self,
         query: str,
         fields: str | None = None,
         top: int | None = None,
         skip: int | None = None,
+        custom_fields: list[str] | tuple[str, ...] | None = None,
     ) -> dict[str, Any]:
         """Search issues via API.
 
@@ -514,12 +581,13 @@ class IssueService(BaseService):
             fields: Comma-separated list of fields to return
             top: Maximum number of results
             skip: Number of results to skip
+            custom_fields: Restrict the returned customFields to these names
 
         Returns:
             API response with issue list
         """
         try:
-            params = {"query": query}
+            params: dict[str, Any] = {"query": query}
 
             if fields:
                 params["fields"] = fields
@@ -535,6 +603,10 @@ class IssueService(BaseService):
                 params["$top"] = str(top)
             if skip is not None:
                 params["$skip"] = str(skip)
+            if custom_fields:
+                # Repeated `customFields=<name>` params limit which custom fields
+                # YouTrack expands, instead of returning every field on the issue.
+                params["customFields"] = list(custom_fields)
 
             response = await self._make_request("GET", "issues", params=params)
             return await self._handle_response(response)
@@ -544,6 +616,199 @@ class IssueService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error searching issues: {str(e)}")
 
+    async def count_issues(self, query: str, timeout: float = ISSUE_COUNT_TIMEOUT) -> dict[str, Any]:
+        """Count the issues matching a query without fetching them via API.
+
+        Uses the ``issuesGetter/count`` endpoint. While the server is still
+        computing the count it reports ``-1``; the request is then repeated
+        with exponential backoff until a count arrives or ``timeout`` passes.
+
+        Args:
+            query: YouTrack query string
+            timeout: Seconds to keep polling for a count that is not ready
+
+        Returns:
+            API response with ``data`` of ``{"count": N}``
+        """
+        try:
+            deadline = time.monotonic() + timeout
+            delay = ISSUE_COUNT_POLL_INTERVAL
+            while True:
+                response = await self._make_request(
+                    "POST", "issuesGetter/count", params={"fields": "count"}, json_data={"query": query}
+                )
+                result = await self._handle_response(response)
+                if result["status"] != "success":
+                    return result
+
+                data = result.get("data")
+                count = data.get("count") if isinstance(data, dict) else None
+                if isinstance(count, int) and count >= 0:
+                    return self._create_success_response({"count": count})
+                if time.monotonic() + delay > deadline:
+                    return self._create_error_response(
+                        f"Timed out after {timeout:g}s waiting for YouTrack to count issues"
+                    )
+                logger.debug("Issue count not ready, polling again", query=query, delay=delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, ISSUE_COUNT_MAX_POLL_INTERVAL)
+
+        except ValueError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            return self._create_error_response(f"Error counting issues: {str(e)}")
+
+    async def get_activities_page(
+        self,
+        issue_id: str,
+        categories: Iterable[str] | None = None,
+        fields: str | None = None,
+        cursor: str | None = None,
+        top: int = ACTIVITY_PAGE_SIZE,
+    ) -> dict[str, Any]:
+        """Get one page of an issue's activity stream via API.
+
+        Args:
+            issue_id: Issue ID
+            categories: Activity categories to return (e.g. ``CustomFieldCategory``),
+                filtered by the server; None for all
+            fields: Fields of each activity item
+            cursor: ``afterCursor`` of the previous page
+            top: Maximum number of activities in the page
+
+        Returns:
+            API response whose ``data`` has ``activities``, ``afterCursor`` and ``hasAfter``
+        """
+        try:
+            params: dict[str, Any] = {
+                "fields": f"afterCursor,hasAfter,activities({fields or DEFAULT_ACTIVITY_FIELDS})",
+                "$top": str(top),
+            }
+            if categories:
+                params["categories"] = ",".join(categories)
+            if cursor:
+                params["cursor"] = cursor
+
+            response = await self._make_request("GET", f"issues/{issue_id}/activitiesPage", params=params)
+            return await self._handle_response(response)
+
+        except ValueError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            return self._create_error_response(f"Error getting activities: {str(e)}")
+
+    async def iter_activity_pages(
+        self,
+        issue_id: str,
+        categories: Iterable[str] | None = None,
+        fields: str | None = None,
+        cursor: str | None = None,
+        page_size: int = ACTIVITY_PAGE_SIZE,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield an issue's activity pages oldest first, following ``afterCursor``.
+
+        Starting from ``cursor`` resumes after the activities a previous
+        pass already saw. Raises YouTrackError when a page fails.
+        """
+        categories = list(categories) if categories else None
+        while True:
+            result = await self.get_activities_page(issue_id, categories, fields, cursor=cursor, top=page_size)
+            if result["status"] != "success":
+                raise YouTrackError(result.get("message", f"Failed to get activities for {issue_id}"))
+            page = result.get("data") or {}
+            yield page
+            next_cursor = page.get("afterCursor")
+            if not page.get("hasAfter") or not page.get("activities") or not next_cursor:
+                return
+            cursor = next_cursor
+
+    async def stream_activities(
+        self,
+        issue_ids: Iterable[str],
+        categories: Iterable[str] | None = None,
+        fields: str | None = None,
+        max_concurrent: int = 8,
+        cache: ActivityCache | None = None,
+        page_size: int = ACTIVITY_PAGE_SIZE,
+        errors: dict[str, str] | None = None,
+    ) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
+        """Stream ``(issue_id, activity)`` pairs for many issues.
+
+        ``max_concurrent`` workers take issues one after another and their
+        pages are yielded as they arrive; each issue's activities come oldest
+        first, but issues interleave. With a ``cache``, an issue's stored
+        activities are yielded first and only activities after its stored
+        cursor are requested, then the entry is updated; entries unused for
+        the cache's ``max_age`` are pruned first. An issue whose
+        fetch fails is skipped (keeping whatever pages did arrive) and its
+        error is recorded in ``errors`` when given.
+
+        Args:
+            issue_ids: Issues to read (duplicates are read once)
+            categories: Activity categories to return, filtered server-side
+            fields: Fields of each activity item
+            max_concurrent: Number of issues fetched concurrently
+            cache: Incremental cache of previously fetched activities
+            page_size: Activities per request
+            errors: Receives ``issue_id -> message`` for failed issues
+        """
+        categories = sorted(set(categories)) if categories else None
+        unique_ids = list(dict.fromkeys(issue_ids))
+        scope = ""
+        if cache is not None:
+            scope = ActivityCache.scope(self._get_base_url(), ",".join(categories or []), fields or "")
+            cache.prune()
+
+        # A bounded queue holds back fetchers while the consumer is busy.
+        max_concurrent = max(1, max_concurrent)
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_concurrent * 2)
+        pending = iter(unique_ids)
+
+        async def fetch(issue_id: str) -> None:
+            entry = cache.load(scope, issue_id) if cache is not None else CachedActivities()
+            if entry.activities:
+                await queue.put((issue_id, entry.activities))
+            cursor = entry.cursor
+            fetched: list[dict[str, Any]] = []
+            try:
+                async for page in self.iter_activity_pages(
+                    issue_id, categories, fields, cursor=entry.cursor, page_size=page_size
+                ):
+                    activities = page.get("activities") or []
+                    if activities:
+                        if cache is not None:
+                            fetched.extend(activities)
+                        await queue.put((issue_id, activities))
+                    cursor = page.get("afterCursor") or cursor
+            except Exception as e:
+                logger.warning("Failed to stream issue activities", issue_id=issue_id, error=str(e))
+                if errors is not None:
+                    errors[issue_id] = str(e)
+            if cache is not None and (fetched or cursor != entry.cursor):
+                cache.save(scope, issue_id, CachedActivities(cursor, entry.activities + fetched))
+            await queue.put(_ACTIVITY_ISSUE_DONE)
+
+        async def worker() -> None:
+            # Workers share one iterator, so each issue is taken by exactly one of them
+            for issue_id in pending:
+                await fetch(issue_id)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(max_concurrent, len(unique_ids)))]
+        try:
+            remaining = len(unique_ids)
+            while remaining:
+                item = await queue.get()
+                if item is _ACTIVITY_ISSUE_DONE:
+                    remaining -= 1
+                    continue
+                issue_id, activities = item
+                for activity in activities:
+                    yield issue_id, activity
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def assign_issue(self, issue_id: str, assignee: str) -> dict[str, Any]:
         """Assign an issue to a user via API.
 
@@ -613,21 +878,7 @@ class IssueService(BaseService):
                         state_field_added = True
                     else:
                         # Field discovery failed - get available fields for error message
-                        from .projects import ProjectService
-
-                        project_service = ProjectService(self.auth_manager)
-                        fields_result = await project_service.get_project_custom_fields(
-                            project_id_from_issue,
-                            "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)",
-                        )
-
-                        available_fields = []
-                        if fields_result["status"] == "success":
-                            available_fields = [
-                                f.get("field", {}).get("name", "")
-                                for f in fields_result["data"]
-                                if f.get("field", {}).get("name")
-                            ]
+                        available_fields = await self._available_custom_fields(project_id_from_issue)
 
                         return self._create_error_response(
                             f"No state field found for project '{project_id_from_issue}'. "
@@ -680,17 +931,7 @@ class IssueService(BaseService):
                                 )
                             else:
                                 # Get available fields
-                                fields_result = await project_service.get_project_custom_fields(
-                                    project_id_from_issue,
-                                    "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)",
-                                )
-                                available_fields = []
-                                if fields_result["status"] == "success":
-                                    available_fields = [
-                                        f.get("field", {}).get("name", "")
-                                        for f in fields_result["data"]
-                                        if f.get("field", {}).get("name")
-                                    ]
+                                available_fields = state_field_result.get("available_fields", [])
 
                                 return self._create_error_response(
                                     f"State move failed. No state field found in project '{project_id_from_issue}'. "
@@ -958,46 +1199,51 @@ class IssueService(BaseService):
 
                 metadata = metadata_response.json()
 
-                # Try to get URL from metadata first
-                possible_urls = []
-
-                # Check if metadata provides URL fields
+                # Candidate download URLs in order of preference, starting with the one from metadata
+                candidates = []
                 if "url" in metadata:
                     url_from_meta = metadata["url"]
                     if url_from_meta.startswith("/"):
-                        possible_urls.append(f"{base_url}{url_from_meta}")
+                        candidates.append(("metadata_url", f"{base_url}{url_from_meta}"))
                     else:
-                        possible_urls.append(url_from_meta)
+                        candidates.append(("metadata_url", url_from_meta))
 
                 # Add standard URL patterns
-                possible_urls.extend(
+                candidates.extend(
                     [
-                        f"{base_url}/api/files/{attachment_id}",
-                        f"{base_url}/files/{attachment_id}",
-                        f"{base_url}/api/issues/{issue_id}/attachments/{attachment_id}/download",
-                        f"{base_url}/api/issues/{issue_id}/attachments/{attachment_id}/content",
+                        ("api_files", f"{base_url}/api/files/{attachment_id}"),
+                        ("files", f"{base_url}/files/{attachment_id}"),
+                        ("download", f"{base_url}/api/issues/{issue_id}/attachments/{attachment_id}/download"),
+                        ("content", f"{base_url}/api/issues/{issue_id}/attachments/{attachment_id}/content"),
                     ]
                 )
+                possible_urls = [url for _, url in candidates]
 
-                for url_to_try in possible_urls:
+                async def fetch_content(url_to_try: str) -> Any:
                     content_response = await client.get(url=url_to_try, headers=headers, timeout=60.0)
-
-                    if content_response.status_code == 200:
-                        # Check if we got HTML instead of actual file content
-                        content_type = content_response.headers.get("content-type", "")
-                        if "text/html" in content_type:
-                            # This is likely the login page, try next URL
-                            continue
-
-                        return {
-                            "status": "success",
-                            "message": f"Attachment downloaded successfully using {url_to_try}",
-                            "data": {
-                                "metadata": metadata,
-                                "content": content_response.content,
-                                "filename": metadata.get("name", f"attachment_{attachment_id}"),
-                            },
-                        }
+                    if content_response.status_code != 200:
+                        return None
+                    # Check if we got HTML instead of actual file content
+                    if "text/html" in content_response.headers.get("content-type", ""):
+                        # This is likely the login page, try next URL
+                        return None
+                    return url_to_try, content_response
+
+                # Downloads are tried one at a time; the pattern that works is remembered for this server
+                resolved = await get_endpoint_resolver().resolve(
+                    base_url, "issue_attachment_content", candidates, fetch_content, race=False
+                )
+                if resolved is not None:
+                    url_to_try, content_response = resolved[1]
+                    return {
+                        "status": "success",
+                        "message": f"Attachment downloaded successfully using {url_to_try}",
+                        "data": {
+                            "metadata": metadata,
+                            "content": content_response.content,
+                            "filename": metadata.get("name", f"attachment_{attachment_id}"),
+                        },
+                    }
 
                 # If none worked, return error
                 return self._create_error_response(
@@ -1071,8 +1317,71 @@ class IssueService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error getting custom field: {str(e)}")
 
+    def _index_base_url(self) -> str:
+        credentials = self.auth_manager.load_credentials()
+        return credentials.base_url.rstrip("/") if credentials else ""
+
+    async def _load_index(self, name: str, ttl: float) -> dict[str, Any] | None:
+        """Return a name index from the process cache, falling back to the on-disk copy."""
+        base_url = self._index_base_url()
+        cache = get_cache()
+        cache_key = f"issues:index:{name}:{base_url}"
+        index = await cache.get(cache_key)
+        if index is None and base_url:
+            index = get_index_cache().get(IndexCache.scope(base_url, name), ttl)
+            if index is not None:
+                await cache.set(cache_key, index, ttl, tags={name, "api"})
+        return index
+
+    async def _store_index(self, name: str, index: dict[str, Any], ttl: float, tags: set[str]) -> None:
+        """Keep a freshly built name index in the process cache and on disk."""
+        base_url = self._index_base_url()
+        await get_cache().set(f"issues:index:{name}:{base_url}", index, ttl, tags=tags)
+        if base_url:
+            get_index_cache().set(IndexCache.scope(base_url, name), index)
+
+    async def _drop_index(self, name: str) -> None:
+        """Forget a name index in the process cache and on disk."""
+        base_url = self._index_base_url()
+        await get_cache().delete(f"issues:index:{name}:{base_url}")
+        if base_url:
+            get_index_cache().delete(IndexCache.scope(base_url, name))
+
+    async def _get_tag_index(self, refresh: bool = False) -> dict[str, Any]:
+        """Get the tag name -> tag index, shared by every call and invocation.
+
+        The index is built from a single tag listing and cached in the process
+        and on disk for ``TAG_INDEX_TTL`` seconds. The response carries
+        ``cached: True`` when it was served from a cache.
+        """
+        if not refresh:
+            index = await self._load_index("tags", TAG_INDEX_TTL)
+            if index is not None:
+                return {"status": "success", "data": index, "cached": True}
+
+        params = {"fields": "id,name"}
+        response = await self._make_request("GET", "tags", params=params)
+        result = await self._handle_response(response)
+
+        if result["status"] == "success":
+            index: dict[str, dict[str, Any]] = {}
+            for tag in result["data"] or []:
+                if tag.get("name"):
+                    index.setdefault(tag["name"], tag)
+            await self._store_index("tags", index, TAG_INDEX_TTL, tags={"tags", "api"})
+            result["data"] = index
+
+        return result
+
+    async def invalidate_tag_index(self) -> None:
+        """Drop the cached tag index so the next lookup re-reads the tag list."""
+        await self._drop_index("tags")
+
     async def find_tag_by_name(self, tag_name: str) -> dict[str, Any]:
-        """Find a tag by name via API.
+        """Find a tag by name via the cached tag index.
+
+        A name missing from a cached index triggers one refresh, since the tag
+        may have been created since the index was built.
 
         Args:
             tag_name: Tag name to search for
@@ -1081,15 +1390,13 @@ class IssueService(BaseService):
             API response with tag data
         """
         try:
-            params = {"fields": "id,name"}
-            response = await self._make_request("GET", "tags", params=params)
-            result = await self._handle_response(response)
+            result = await self._get_tag_index()
+            if result["status"] == "success" and tag_name not in result["data"] and result.get("cached"):
+                result = await self._get_tag_index(refresh=True)
 
             if result["status"] == "success":
-                # Filter tags by name since API doesn't support name-based queries
-                tags = result["data"]
-                matching_tags = [tag for tag in tags if tag.get("name") == tag_name]
-                result["data"] = matching_tags[0] if matching_tags else None
+                result.pop("cached", None)
+                result["data"] = result["data"].get(tag_name)
 
             return result
 
@@ -1110,7 +1417,10 @@ class IssueService(BaseService):
         try:
             tag_data = {"name": tag_name}
             response = await self._make_request("POST", "tags", json_data=tag_data)
-            return await self._handle_response(response, success_codes=[200, 201])
+            result = await self._handle_response(response, success_codes=[200, 201])
+            if result["status"] == "success":
+                await self.invalidate_tag_index()
+            return result
 
         except ValueError as e:
             return self._create_error_response(str(e))
@@ -1152,7 +1462,7 @@ class IssueService(BaseService):
             Internal issue ID
         """
         # If it looks like an internal ID already, return as-is
-        if issue_id.count("-") == 1 and all(part.isdigit() for part in issue_id.split("-")):
+        if _is_internal_issue_id(issue_id):
             return issue_id
 
         # Otherwise, fetch the issue to get the internal ID
@@ -1178,41 +1488,10 @@ class IssueService(BaseService):
             # Resolve issue IDs to internal format
             source_issue_id = await self._resolve_issue_id(source_issue_id)
             target_issue_id = await self._resolve_issue_id(target_issue_id)
-            # If link_type_id looks like a name (not an ID), we need to get the actual ID first
-            if not (link_type_id.replace("-", "").replace("s", "").replace("t", "").isdigit()):
-                # Get all link types to find the ID by name
-                link_types_result = await self.list_link_types()
-                if link_types_result["status"] != "success":
-                    return link_types_result
-
-                link_types = link_types_result["data"]
-                matching_type = None
-                for link_type in link_types:
-                    if (
-                        link_type.get("name", "").lower() == link_type_id.lower()
-                        or link_type.get("sourceToTarget", "").lower() == link_type_id.lower()
-                        or link_type.get("targetToSource", "").lower() == link_type_id.lower()
-                    ):
-                        matching_type = link_type
-                        break
-
-                if not matching_type:
-                    return self._create_error_response(f"Link type '{link_type_id}' not found")
-
-                # For directed links, determine direction
-                base_link_id = matching_type["id"]
-                if matching_type.get("directed", False):
-                    # If user specified a directional name, use appropriate suffix
-                    if link_type_id.lower() == matching_type.get("sourceToTarget", "").lower():
-                        link_type_id = f"{base_link_id}s"  # outward link
-                    elif link_type_id.lower() == matching_type.get("targetToSource", "").lower():
-                        link_type_id = f"{base_link_id}t"  # inward link
-                    else:
-                        # Default to outward for directed links when just name is given
-                        link_type_id = f"{base_link_id}s"
-                else:
-                    # Undirected link, use base ID
-                    link_type_id = base_link_id
+            link_type_result = await self._resolve_link_type_id(link_type_id)
+            if link_type_result["status"] != "success":
+                return link_type_result
+            link_type_id = link_type_result["data"]
 
             # Create the link by posting to the source issue's links endpoint
             data = {"id": target_issue_id}
@@ -1251,42 +1530,10 @@ class IssueService(BaseService):
             target_issue_id = await self._resolve_issue_id(target_issue_id)
 
             # Resolve link type to ID format
-            if not (link_type.replace("-", "").replace("s", "").replace("t", "").isdigit()):
-                # Get all link types to find the ID by name
-                link_types_result = await self.list_link_types()
-                if link_types_result["status"] != "success":
-                    return link_types_result
-
-                link_types = link_types_result["data"]
-                matching_type = None
-                for link_type_data in link_types:
-                    if (
-                        link_type_data.get("name", "").lower() == link_type.lower()
-                        or link_type_data.get("sourceToTarget", "").lower() == link_type.lower()
-                        or link_type_data.get("targetToSource", "").lower() == link_type.lower()
-                    ):
-                        matching_type = link_type_data
-                        break
-
-                if not matching_type:
-                    return self._create_error_response(f"Link type '{link_type}' not found")
-
-                # For directed links, determine direction
-                base_link_id = matching_type["id"]
-                if matching_type.get("directed", False):
-                    # If user specified a directional name, use appropriate suffix
-                    if link_type.lower() == matching_type.get("sourceToTarget", "").lower():
-                        link_type_id = f"{base_link_id}s"  # outward link
-                    elif link_type.lower() == matching_type.get("targetToSource", "").lower():
-                        link_type_id = f"{base_link_id}t"  # inward link
-                    else:
-                        # Default to outward for directed links when just name is given
-                        link_type_id = f"{base_link_id}s"
-                else:
-                    # Undirected link, use base ID
-                    link_type_id = base_link_id
-            else:
-                link_type_id = link_type
+            link_type_result = await self._resolve_link_type_id(link_type)
+            if link_type_result["status"] != "success":
+                return link_type_result
+            link_type_id = link_type_result["data"]
 
             # Delete the link using the specific endpoint
             response = await self._make_request(
@@ -1307,6 +1554,71 @@ class IssueService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error deleting link: {str(e)}")
 
+    async def _get_link_type_index(self, refresh: bool = False) -> dict[str, Any]:
+        """Get the link type lookup index, shared by every call and invocation.
+
+        Maps the lowercased name, outward name (``sourceToTarget``) and inward
+        name (``targetToSource``) of each link type to its definition. Built
+        from one ``list_link_types`` call and cached in the process and on disk
+        for ``LINK_TYPE_INDEX_TTL`` seconds; the response carries
+        ``cached: True`` when it was served from a cache.
+        """
+        if not refresh:
+            index = await self._load_index("link_types", LINK_TYPE_INDEX_TTL)
+            if index is not None:
+                return {"status": "success", "data": index, "cached": True}
+
+        result = await self.list_link_types()
+        if result["status"] != "success":
+            return result
+
+        index: dict[str, dict[str, Any]] = {}
+        link_types = result["data"] or []
+        # Plain names win over directional names of another type
+        for key in ("name", "sourceToTarget", "targetToSource"):
+            for link_type in link_types:
+                value = link_type.get(key)
+                if value:
+                    index.setdefault(value.lower(), link_type)
+        await self._store_index("link_types", index, LINK_TYPE_INDEX_TTL, tags={"link_types", "api", "metadata"})
+        return {"status": "success", "data": index}
+
+    async def _resolve_link_type_id(self, link_type: str) -> dict[str, Any]:
+        """Resolve a link type name to the ID used by the links endpoints.
+
+        Directed link types get an ``s`` (outward) or ``t`` (inward) suffix
+        depending on which of their names was given; values that already look
+        like IDs are passed through unchanged.
+        """
+        if link_type.replace("-", "").replace("s", "").replace("t", "").isdigit():
+            return {"status": "success", "data": link_type}
+
+        index_result = await self._get_link_type_index()
+        if index_result["status"] != "success":
+            return index_result
+
+        matching_type = index_result["data"].get(link_type.lower())
+        if matching_type is None and index_result.get("cached"):
+            index_result = await self._get_link_type_index(refresh=True)
+            if index_result["status"] != "success":
+                return index_result
+            matching_type = index_result["data"].get(link_type.lower())
+
+        if not matching_type:
+            return self._create_error_response(f"Link type '{link_type}' not found")
+
+        # For directed links, determine direction
+        base_link_id = matching_type["id"]
+        if not matching_type.get("directed", False):
+            # Undirected link, use base ID
+            return {"status": "success", "data": base_link_id}
+        if link_type.lower() == (matching_type.get("sourceToTarget") or "").lower():
+            return {"status": "success", "data": f"{base_link_id}s"}  # outward link
+        if link_type.lower() == (matching_type.get("targetToSource") or "").lower():
+            return {"status": "success", "data": f"{base_link_id}t"}  # inward link
+        # Default to outward for directed links when just name is given
+        return {"status": "success", "data": f"{base_link_id}s"}
+
     async def list_link_types(self, fields: str | None = None) -> dict[str, Any]:
         """List available issue link types via API.
 
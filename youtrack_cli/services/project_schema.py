@@ -0,0 +1,204 @@
+"""Versioned snapshots of a project's custom field schema."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from ..json_cache import cache_key, config_path, read_json, write_json
+from ..logging import get_logger
+
+__all__ = [
+    "PROJECT_SCHEMA_FIELDS",
+    "STATE_FIELD_NAMES",
+    "ProjectSchema",
+    "ProjectSchemaStore",
+    "get_project_schema_store",
+]
+
+logger = get_logger(__name__)
+
+#: Everything discovery and validation read about a project's fields, in one request.
+PROJECT_SCHEMA_FIELDS = (
+    "id,$type,canBeEmpty,emptyFieldText,isPublic,ordinal,"
+    "field(id,name,localizedName,$type,fieldType(id,$type)),"
+    "bundle(id,$type,values(id,name,description,archived,$type))"
+)
+
+#: Seconds a snapshot is used before the project's fields are fetched again.
+PROJECT_SCHEMA_TTL = 3600.0
+
+#: Names tried, in order, when looking for a project's state field.
+STATE_FIELD_NAMES: tuple[str, ...] = (
+    "State",
+    "Status",
+    "Kanban State",
+    "Workflow State",
+    "Stage",
+    "Issue State",
+    "Current State",
+    "Work State",
+)
+
+
+def _content_hash(fields: list[dict[str, Any]]) -> str:
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class ProjectSchema:
+    """All custom fields of one project with their types and bundle values.
+
+    Fields keep the shape of YouTrack's ``ProjectCustomField`` with the
+    field name copied to a top-level ``name`` key. ``version`` is a hash of
+    the field content, so two snapshots with the same version describe the
+    same schema.
+    """
+
+    def __init__(self, project_id: str, fields: list[dict[str, Any]], fetched_at: float | None = None):
+        """Initialize the snapshot.
+
+        Args:
+            project_id: Project ID or short name the fields belong to
+            fields: Project custom fields as returned for ``PROJECT_SCHEMA_FIELDS``
+            fetched_at: When the fields were read; defaults to now
+        """
+        self.project_id = project_id
+        self.fields = [self._normalize(field) for field in fields if isinstance(field, dict)]
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self.version = _content_hash(self.fields)
+        self._by_id = {field["id"]: field for field in self.fields if field.get("id")}
+        self._by_name: dict[str, dict[str, Any]] = {}
+        for field in self.fields:
+            if field["name"]:
+                self._by_name.setdefault(field["name"].lower(), field)
+
+    @staticmethod
+    def _normalize(field: dict[str, Any]) -> dict[str, Any]:
+        field = dict(field)
+        field["name"] = (field.get("field") or {}).get("name") or field.get("name")
+        return field
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def get(self, reference: str) -> dict[str, Any] | None:
+        """Find a field by project field ID or by name (case-insensitive)."""
+        return self._by_id.get(reference) or self._by_name.get(reference.lower())
+
+    def field_names(self) -> list[str]:
+        """Names of all fields, in project order."""
+        return [field["name"] for field in self.fields if field["name"]]
+
+    def state_field(self) -> dict[str, Any] | None:
+        """The field holding issue state, by well-known name or a name containing state/status."""
+        for name in STATE_FIELD_NAMES:
+            field = self._by_name.get(name.lower())
+            if field is not None:
+                return field
+        for field in self.fields:
+            name = (field["name"] or "").lower()
+            if "state" in name or "status" in name:
+                return field
+        return None
+
+    def is_fresh(self, ttl: float = PROJECT_SCHEMA_TTL) -> bool:
+        """Whether the snapshot was fetched within ``ttl`` seconds."""
+        return time.time() - self.fetched_at < ttl
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form, as persisted on disk."""
+        return {
+            "project_id": self.project_id,
+            "fetched_at": self.fetched_at,
+            "version": self.version,
+            "fields": self.fields,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProjectSchema":
+        """Rebuild a snapshot from ``to_dict`` output.
+
+        Raises:
+            ValueError: If the stored version does not match the field content
+        """
+        schema = cls(data["project_id"], data["fields"], fetched_at=float(data["fetched_at"]))
+        if schema.version != data.get("version"):
+            raise ValueError("Schema content does not match its version")
+        return schema
+
+
+class ProjectSchemaStore:
+    """Project schema snapshots kept in memory and under ``~/.config/youtrack-cli/schemas``.
+
+    Snapshots are keyed by YouTrack instance and project. Only snapshots of
+    instances with a known base URL are written to disk; every other
+    snapshot lives for the rest of the process.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, ttl: float = PROJECT_SCHEMA_TTL):
+        """Initialize the store.
+
+        Args:
+            cache_dir: Directory for persisted snapshots; defaults to the CLI config directory
+            ttl: Seconds a snapshot stays fresh
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else config_path("schemas")
+        self.ttl = ttl
+        self._memory: dict[tuple[Any, str], ProjectSchema] = {}
+
+    def _path(self, base_url: Any, project_id: str) -> Path | None:
+        if not isinstance(base_url, str):
+            return None
+        return self.cache_dir / f"{cache_key(base_url.rstrip('/'), project_id)}.json"
+
+    def _read(self, base_url: Any, project_id: str) -> ProjectSchema | None:
+        path = self._path(base_url, project_id)
+        if path is None:
+            return None
+        return read_json(path, "project schema", ProjectSchema.from_dict)
+
+    def get(self, base_url: Any, project_id: str) -> ProjectSchema | None:
+        """Return the snapshot of a project, or None if there is no fresh one.
+
+        Args:
+            base_url: Base URL of the YouTrack instance
+            project_id: Project ID or short name
+        """
+        schema = self._memory.get((base_url, project_id))
+        if schema is None:
+            schema = self._read(base_url, project_id)
+            if schema is not None:
+                self._memory[(base_url, project_id)] = schema
+        if schema is None or not schema.is_fresh(self.ttl):
+            return None
+        return schema
+
+    def set(self, base_url: Any, schema: ProjectSchema) -> None:
+        """Remember a snapshot and persist it when the instance is known."""
+        self._memory[(base_url, schema.project_id)] = schema
+        path = self._path(base_url, schema.project_id)
+        if path is None:
+            return
+        write_json(path, schema.to_dict(), "project schema")
+
+    def invalidate(self, base_url: Any, project_id: str) -> None:
+        """Forget a project's snapshot and delete its persisted copy."""
+        self._memory.pop((base_url, project_id), None)
+        path = self._path(base_url, project_id)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug("Failed to delete project schema", path=str(path), error=str(e))
+
+
+_store: ProjectSchemaStore | None = None
+
+
+def get_project_schema_store() -> ProjectSchemaStore:
+    """Get the process-wide project schema store."""
+    global _store
+    if _store is None:
+        _store = ProjectSchemaStore()
+    return _store
@@ -1,9 +1,23 @@
 """Project service for YouTrack API operations."""
 
+import time
 from typing import Any
 
+from ..logging import get_logger
 from .base import BaseService
-from .field_cache import get_field_cache
+from .project_schema import PROJECT_SCHEMA_FIELDS, ProjectSchema, get_project_schema_store
+
+logger = get_logger(__name__)
+
+# Properties of the default ``customFields`` listing, served from the schema snapshot.
+_CUSTOM_FIELD_KEYS = ("id", "$type", "canBeEmpty", "isPublic", "ordinal")
+
+
+def _default_custom_field_view(field: dict[str, Any]) -> dict[str, Any]:
+    source = field.get("field") or {}
+    view = {key: field[key] for key in _CUSTOM_FIELD_KEYS if key in field}
+    view["field"] = {key: source[key] for key in ("name", "fieldType") if key in source}
+    return view
 
 
 class ProjectService(BaseService):
@@ -294,6 +308,9 @@ class ProjectService(BaseService):
     async def get_project_custom_fields(self, project_id: str, fields: str | None = None) -> dict[str, Any]:
         """Get project custom fields via API.
 
+        Without ``fields`` the list is served from the project schema
+        snapshot, so it costs no request while the snapshot is fresh.
+
         Args:
             project_id: Project ID
             fields: Comma-separated list of field properties to return
@@ -301,24 +318,28 @@ class ProjectService(BaseService):
         Returns:
             API response with custom field list
         """
-        try:
-            params = {}
-            if fields:
-                # Always include field(name) for table display when custom fields are specified
-                # This ensures the name is available even when users specify their own fields
-                fields_list = [f.strip() for f in fields.split(",")]
+        if not fields:
+            schema_result = await self.get_project_schema(project_id)
+            if schema_result["status"] != "success":
+                return schema_result
+            return {
+                "status": "success",
+                "data": [_default_custom_field_view(field) for field in schema_result["data"].fields],
+            }
 
-                # Check if field(name) is already included in some form
-                has_field_name = any("field(" in f and "name" in f for f in fields_list)
+        try:
+            # Always include field(name) for table display when custom fields are specified
+            # This ensures the name is available even when users specify their own fields
+            fields_list = [f.strip() for f in fields.split(",")]
 
-                if not has_field_name:
-                    # Add field(name) to ensure name is always available for display
-                    fields_list.append("field(name)")
+            # Check if field(name) is already included in some form
+            has_field_name = any("field(" in f and "name" in f for f in fields_list)
 
-                params["fields"] = ",".join(fields_list)
-            else:
-                params["fields"] = "id,field(name,fieldType),canBeEmpty,isPublic,ordinal"
+            if not has_field_name:
+                # Add field(name) to ensure name is always available for display
+                fields_list.append("field(name)")
 
+            params = {"fields": ",".join(fields_list)}
             response = await self._make_request("GET", f"admin/projects/{project_id}/customFields", params=params)
             return await self._handle_response(response)
 
@@ -349,7 +370,10 @@ class ProjectService(BaseService):
             response = await self._make_request(
                 "POST", f"admin/projects/{project_id}/customFields", json_data=field_data
             )
-            return await self._handle_response(response, success_codes=[200, 201])
+            result = await self._handle_response(response, success_codes=[200, 201])
+            if result["status"] == "success":
+                self.invalidate_project_schema(project_id)
+            return result
 
         except ValueError as e:
             return self._create_error_response(str(e))
@@ -368,7 +392,10 @@ class ProjectService(BaseService):
         """
         try:
             response = await self._make_request("DELETE", f"admin/projects/{project_id}/customFields/{field_id}")
-            return await self._handle_response(response)
+            result = await self._handle_response(response)
+            if result["status"] == "success":
+                self.invalidate_project_schema(project_id)
+            return result
 
         except ValueError as e:
             return self._create_error_response(str(e))
@@ -438,6 +465,54 @@ class ProjectService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error creating project version: {str(e)}")
 
+    def _schema_base_url(self) -> Any:
+        credentials = self.auth_manager.load_credentials()
+        return getattr(credentials, "base_url", None) if credentials else None
+
+    async def get_project_schema(self, project_id: str, force_refresh: bool = False) -> dict[str, Any]:
+        """Get a snapshot of all project custom fields, their types and bundle values.
+
+        The snapshot is read in a single request and reused from memory or
+        ``~/.config/youtrack-cli/schemas`` until it goes stale, so field
+        discovery and validation cost no requests on a warm cache.
+
+        Args:
+            project_id: Project ID or short name
+            force_refresh: Fetch the fields even if a fresh snapshot exists
+
+        Returns:
+            Response whose ``data`` is a ``ProjectSchema``
+        """
+        try:
+            store = get_project_schema_store()
+            base_url = self._schema_base_url()
+            if not force_refresh:
+                schema = store.get(base_url, project_id)
+                if schema is not None:
+                    return {"status": "success", "data": schema}
+
+            response = await self._make_request(
+                "GET", f"admin/projects/{project_id}/customFields", params={"fields": PROJECT_SCHEMA_FIELDS}
+            )
+            result = await self._handle_response(response)
+            if result["status"] != "success":
+                return result
+            if not isinstance(result["data"], list):
+                return self._create_error_response("Invalid custom fields response format")
+
+            schema = ProjectSchema(project_id, result["data"])
+            store.set(base_url, schema)
+            return {"status": "success", "data": schema}
+
+        except ValueError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            return self._create_error_response(f"Error getting project schema: {str(e)}")
+
+    def invalidate_project_schema(self, project_id: str) -> None:
+        """Drop the cached schema snapshot of a project after its fields change."""
+        get_project_schema_store().invalidate(self._schema_base_url(), project_id)
+
     async def get_custom_field_details(
         self, project_id: str, field_id: str, include_bundle: bool = True
     ) -> dict[str, Any]:
@@ -452,33 +527,18 @@ class ProjectService(BaseService):
             API response with detailed field information
         """
         try:
-            # First get the field details
-            field_response = await self._make_request(
-                "GET",
-                f"admin/projects/{project_id}/customFields/{field_id}",
-                params={"fields": "id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)"},
-            )
-            field_result = await self._handle_response(field_response)
+            schema_result = await self.get_project_schema(project_id)
+            if schema_result["status"] != "success":
+                return schema_result
 
-            if field_result["status"] != "success" or not include_bundle:
-                return field_result
+            field = schema_result["data"].get(field_id)
+            if field is None:
+                return self._create_error_response(f"Custom field '{field_id}' not found in project '{project_id}'")
 
-            # Try to get bundle information if available
-            try:
-                bundle_response = await self._make_request(
-                    "GET",
-                    f"admin/projects/{project_id}/customFields/{field_id}/bundle",
-                    params={"fields": "id,values(id,name,description,$type)"},
-                )
-                bundle_result = await self._handle_response(bundle_response)
-
-                if bundle_result["status"] == "success":
-                    field_result["data"]["bundle"] = bundle_result["data"]
-            except Exception:
-                # Bundle might not exist for all field types, that's ok
-                pass
-
-            return field_result
+            field_data = dict(field)
+            if not include_bundle:
+                field_data.pop("bundle", None)
+            return {"status": "success", "data": field_data}
 
         except ValueError as e:
             return self._create_error_response(str(e))
@@ -495,98 +555,43 @@ class ProjectService(BaseService):
             Dict containing field discovery results with field name, type, and bundle info
         """
         try:
-            # Check cache first
-            cache = get_field_cache()
-            cached_result = cache.get(project_id, "state")
-            if cached_result is not None:
-                return {"status": "success", "data": cached_result}
-            # Get all custom fields for the project
-            fields_response = await self.get_project_custom_fields(
-                project_id, fields="id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name)"
-            )
-
-            if fields_response["status"] != "success":
-                return fields_response
+            schema_result = await self.get_project_schema(project_id)
+            if schema_result["status"] != "success":
+                return schema_result
 
-            custom_fields = fields_response["data"]
-            if not isinstance(custom_fields, list):
-                return self._create_error_response("Invalid custom fields response format")
-
-            # Common state field names in order of priority
-            state_field_names = [
-                "State",
-                "Status",
-                "Kanban State",
-                "Workflow State",
-                "Stage",
-                "Issue State",
-                "Current State",
-                "Work State",
-            ]
-
-            discovered_field = None
-            for field_name in state_field_names:
-                for field in custom_fields:
-                    # Field name is in field.name, not directly in name
-                    actual_field_name = field.get("field", {}).get("name", "")
-                    if actual_field_name.lower() == field_name.lower():
-                        discovered_field = field
-                        break
-                if discovered_field:
-                    break
-
-            if not discovered_field:
-                # Look for any field containing "state" in the name
-                for field in custom_fields:
-                    actual_field_name = field.get("field", {}).get("name", "").lower()
-                    if "state" in actual_field_name or "status" in actual_field_name:
-                        discovered_field = field
-                        break
-
-            if not discovered_field:
+            schema = schema_result["data"]
+            field_data = schema.state_field()
+            if field_data is None:
                 return {
                     "status": "error",
                     "message": "No state field found in project",
-                    "available_fields": [f.get("field", {}).get("name", "") for f in custom_fields],
+                    "available_fields": schema.field_names(),
                 }
 
-            # Get detailed information about the discovered field
-            field_details = await self.get_custom_field_details(project_id, discovered_field["id"], include_bundle=True)
-
-            if field_details["status"] != "success":
-                return field_details
-
             # Extract bundle type information for proper API formatting
             bundle_type = "EnumBundleElement"  # Default fallback
-            field_data = field_details["data"]
 
             # Try to determine the bundle type from the field information
-            if "bundle" in field_data and "values" in field_data["bundle"]:
-                bundle_values = field_data["bundle"]["values"]
-                if isinstance(bundle_values, list) and len(bundle_values) > 0:
-                    first_value = bundle_values[0]
-                    if "$type" in first_value:
-                        bundle_type = first_value["$type"]
+            bundle_values = (field_data.get("bundle") or {}).get("values")
+            if isinstance(bundle_values, list) and len(bundle_values) > 0:
+                first_value = bundle_values[0]
+                if "$type" in first_value:
+                    bundle_type = first_value["$type"]
 
             # Alternative: Check field type information
-            if "field" in field_data and "fieldType" in field_data["field"]:
-                field_type = field_data["field"]["fieldType"]
-                # field_type is a dict like {'$type': 'FieldType'}, get the $type value
-                if isinstance(field_type, dict) and "$type" in field_type:
-                    field_type_name = field_type["$type"]
-                    if isinstance(field_type_name, str) and "state" in field_type_name.lower():
-                        bundle_type = "StateBundleElement"
+            field_type = (field_data.get("field") or {}).get("fieldType")
+            # field_type is a dict like {'$type': 'FieldType'}, get the $type value
+            if isinstance(field_type, dict) and "$type" in field_type:
+                field_type_name = field_type["$type"]
+                if isinstance(field_type_name, str) and "state" in field_type_name.lower():
+                    bundle_type = "StateBundleElement"
 
             result_data = {
-                "field_name": discovered_field.get("field", {}).get("name", ""),
-                "field_id": discovered_field["id"],
+                "field_name": field_data["name"],
+                "field_id": field_data["id"],
                 "bundle_type": bundle_type,
                 "field_details": field_data,
             }
-
-            # Cache the result for future use
-            cache.set(project_id, result_data, "state")
-
             return {"status": "success", "data": result_data}
 
         except ValueError as e:
@@ -597,6 +602,9 @@ class ProjectService(BaseService):
     async def discover_custom_field(self, project_id: str, field_name: str) -> dict[str, Any]:
         """Discover custom field type information for a specific field.
 
+        A field missing from a cached snapshot triggers one refresh, in case
+        it was attached to the project since the snapshot was taken.
+
         Args:
             project_id: Project ID or short name
             field_name: Name of the custom field to discover
@@ -605,75 +613,46 @@ class ProjectService(BaseService):
             Dict with field information including type, bundle info, etc.
         """
         try:
-            # Check cache first
-            cache = get_field_cache()
-            cache_key = f"custom_field:{field_name}"
-            cached_result = cache.get(project_id, cache_key)
-            if cached_result is not None:
-                return {"status": "success", "data": cached_result}
-
-            # Get all custom fields for the project
-            fields_response = await self.get_project_custom_fields(
-                project_id,
-                fields="id,name,fieldType,localizedName,isPublic,ordinal,field(fieldType,name,$type)",
-            )
-
-            if fields_response["status"] != "success":
-                return fields_response
-
-            custom_fields = fields_response["data"]
-            if not isinstance(custom_fields, list):
-                return self._create_error_response("Invalid custom fields response format")
-
-            # Find the field by name (case-insensitive)
-            discovered_field = None
-            for field in custom_fields:
-                actual_field_name = field.get("field", {}).get("name", "")
-                if actual_field_name.lower() == field_name.lower():
-                    discovered_field = field
-                    break
-
-            if not discovered_field:
+            requested_at = time.time()
+            schema_result = await self.get_project_schema(project_id)
+            if schema_result["status"] != "success":
+                return schema_result
+
+            schema = schema_result["data"]
+            field_data = schema.get(field_name)
+            if field_data is None and schema.fetched_at < requested_at:
+                schema_result = await self.get_project_schema(project_id, force_refresh=True)
+                if schema_result["status"] != "success":
+                    return schema_result
+                schema = schema_result["data"]
+                field_data = schema.get(field_name)
+
+            if field_data is None:
                 return {
                     "status": "error",
                     "message": f"Custom field '{field_name}' not found in project '{project_id}'",
-                    "available_fields": [
-                        f.get("field", {}).get("name", "") for f in custom_fields if f.get("field", {}).get("name")
-                    ],
+                    "available_fields": schema.field_names(),
                 }
 
-            # Get detailed information about the field
-            field_details = await self.get_custom_field_details(project_id, discovered_field["id"], include_bundle=True)
-
-            if field_details["status"] != "success":
-                return field_details
-
-            field_data = field_details["data"]
-
             # Determine the issue field type from project field type
             project_field_type = field_data.get("$type", "")
             issue_field_type = self._project_to_issue_field_type(project_field_type)
 
             # Determine bundle element type if applicable
             bundle_element_type = None
-            if "bundle" in field_data and "values" in field_data["bundle"]:
-                bundle_values = field_data["bundle"]["values"]
-                if isinstance(bundle_values, list) and len(bundle_values) > 0:
-                    bundle_element_type = bundle_values[0].get("$type")
+            bundle_values = (field_data.get("bundle") or {}).get("values")
+            if isinstance(bundle_values, list) and len(bundle_values) > 0:
+                bundle_element_type = bundle_values[0].get("$type")
 
             result_data = {
                 "field_name": field_name,
-                "field_id": discovered_field["id"],
+                "field_id": field_data["id"],
                 "project_field_type": project_field_type,
                 "issue_field_type": issue_field_type,
                 "bundle_element_type": bundle_element_type,
                 "is_multi_value": "Multi" in project_field_type,
                 "field_details": field_data,
             }
-
-            # Cache the result
-            cache.set(project_id, result_data, cache_key)
-
             return {"status": "success", "data": result_data}
 
         except ValueError as e:
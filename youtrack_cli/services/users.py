@@ -1,5 +1,6 @@
 """User service for YouTrack API operations."""
 
+import asyncio
 from typing import Any
 
 from ..logging import get_logger
@@ -7,6 +8,30 @@ from .base import BaseService
 
 logger = get_logger(__name__)
 
+_TEAM_FIELDS = "id,name,description,project(id,name,shortName)"
+
+#: User fields for a full profile: groups, roles and teams are expanded in the same request.
+USER_PROFILE_FIELDS = (
+    "id,login,fullName,email,banned,online,guest,ringId,"
+    "groups(id,name,description),roles(id,name,description),"
+    f"teams({_TEAM_FIELDS}),projectTeams({_TEAM_FIELDS})"
+)
+
+
+def build_user_profile(user: dict[str, Any], permissions: list[Any] | None = None) -> dict[str, Any]:
+    """Shape a user fetched with ``USER_PROFILE_FIELDS`` into a profile.
+
+    Groups, roles and teams are always lists (teams fall back to
+    ``projectTeams``); ``permissions`` is only included when given.
+    """
+    profile = {key: value for key, value in user.items() if key not in ("groups", "roles", "teams", "projectTeams")}
+    profile["groups"] = user.get("groups") or []
+    profile["roles"] = user.get("roles") or []
+    profile["teams"] = user.get("teams") or user.get("projectTeams") or []
+    if permissions is not None:
+        profile["permissions"] = permissions
+    return profile
+
 
 class UserService(BaseService):
     """Service for YouTrack user API operations.
@@ -269,24 +294,32 @@ class UserService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error deleting user: {str(e)}")
 
-    async def ban_user(self, user_id: str) -> dict[str, Any]:
+    async def _resolve_ring_id(self, user_id: str, ring_id: str | None) -> tuple[str | None, dict[str, Any] | None]:
+        """Return the user's Hub ID (ringId) and no error, looking it up unless ``ring_id`` is given."""
+        if ring_id:
+            return ring_id, None
+        user_data = await self.get_user(user_id, fields="id,login,ringId")
+        if user_data["status"] != "success":
+            return None, user_data
+        ring_id = user_data["data"].get("ringId")
+        if not ring_id:
+            return None, self._create_error_response("Unable to find Hub user ID (ringId) for this user")
+        return ring_id, None
+
+    async def ban_user(self, user_id: str, ring_id: str | None = None) -> dict[str, Any]:
         """Ban a user via API.
 
         Args:
             user_id: User ID to ban
+            ring_id: The user's Hub ID, if already known; saves looking it up
 
         Returns:
             API response
         """
         try:
-            # First, get the user to obtain their ringId (Hub user ID)
-            user_data = await self.get_user(user_id, fields="id,login,ringId")
-            if user_data["status"] != "success":
-                return user_data
-
-            ring_id = user_data["data"].get("ringId")
-            if not ring_id:
-                return self._create_error_response("Unable to find Hub user ID (ringId) for this user")
+            ring_id, error = await self._resolve_ring_id(user_id, ring_id)
+            if error:
+                return error
 
             update_data = {"banned": True}
             # Use Hub API for updating banned status as it's read-only in YouTrack API
@@ -298,24 +331,20 @@ class UserService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error banning user: {str(e)}")
 
-    async def unban_user(self, user_id: str) -> dict[str, Any]:
+    async def unban_user(self, user_id: str, ring_id: str | None = None) -> dict[str, Any]:
         """Unban a user via API.
 
         Args:
             user_id: User ID to unban
+            ring_id: The user's Hub ID, if already known; saves looking it up
 
         Returns:
             API response
         """
         try:
-            # First, get the user to obtain their ringId (Hub user ID)
-            user_data = await self.get_user(user_id, fields="id,login,ringId")
-            if user_data["status"] != "success":
-                return user_data
-
-            ring_id = user_data["data"].get("ringId")
-            if not ring_id:
-                return self._create_error_response("Unable to find Hub user ID (ringId) for this user")
+            ring_id, error = await self._resolve_ring_id(user_id, ring_id)
+            if error:
+                return error
 
             update_data = {"banned": False}
             # Use Hub API for updating banned status as it's read-only in YouTrack API
@@ -327,6 +356,42 @@ class UserService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error unbanning user: {str(e)}")
 
+    async def get_user_profile(
+        self, user_id: str, include_permissions: bool = False, project_id: str | None = None
+    ) -> dict[str, Any]:
+        """Get a user with groups, roles, teams and optionally permissions via API.
+
+        Groups, roles and teams come from one request with nested fields;
+        permissions live on a separate endpoint and are fetched concurrently.
+
+        Args:
+            user_id: User ID or login
+            include_permissions: Also fetch the user's permissions
+            project_id: Optional project ID to restrict permissions to
+
+        Returns:
+            API response with the profile built by ``build_user_profile``
+        """
+        try:
+            requests = [self.get_user(user_id, fields=USER_PROFILE_FIELDS)]
+            if include_permissions:
+                requests.append(self.get_user_permissions(user_id, project_id))
+            user_result, *permission_results = await asyncio.gather(*requests)
+
+            if user_result["status"] != "success":
+                return user_result
+            permissions = None
+            if permission_results:
+                if permission_results[0]["status"] != "success":
+                    return permission_results[0]
+                permissions = permission_results[0]["data"] or []
+            return self._create_success_response(build_user_profile(user_result["data"], permissions))
+
+        except ValueError as e:
+            return self._create_error_response(str(e))
+        except Exception as e:
+            return self._create_error_response(f"Error getting user profile: {str(e)}")
+
     async def get_user_groups(self, user_id: str, fields: str | None = None) -> dict[str, Any]:
         """Get user's groups via API.
 
@@ -569,26 +634,24 @@ class UserService(BaseService):
         except Exception as e:
             return self._create_error_response(f"Error removing user from team: {str(e)}")
 
-    async def change_user_password(self, user_id: str, new_password: str, force_change: bool = False) -> dict[str, Any]:
+    async def change_user_password(
+        self, user_id: str, new_password: str, force_change: bool = False, ring_id: str | None = None
+    ) -> dict[str, Any]:
         """Change user password via API.
 
         Args:
             user_id: User ID or login
             new_password: New password
             force_change: Force password change on next login
+            ring_id: The user's Hub ID, if already known; saves looking it up
 
         Returns:
             API response
         """
         try:
-            # First, get the user to obtain their ringId (Hub user ID)
-            user_data = await self.get_user(user_id, fields="id,login,ringId")
-            if user_data["status"] != "success":
-                return user_data
-
-            ring_id = user_data["data"].get("ringId")
-            if not ring_id:
-                return self._create_error_response("Unable to find Hub user ID (ringId) for this user")
+            ring_id, error = await self._resolve_ring_id(user_id, ring_id)
+            if error:
+                return error
 
             password_data = {
                 "password": new_password,
@@ -0,0 +1,133 @@
+"""Record of recently verified credentials, so commands can skip re-verifying them."""
+
+import hashlib
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .json_cache import config_path, read_json, write_json
+from .logging import get_logger
+
+__all__ = ["SESSION_TTL", "SessionStore", "VerifiedSession", "get_session_store", "token_fingerprint"]
+
+logger = get_logger(__name__)
+
+#: Seconds a successful verification is trusted; ``YOUTRACK_SESSION_TTL`` overrides it and 0 disables the record.
+SESSION_TTL = 900.0
+
+
+def token_fingerprint(base_url: str, token: str) -> str:
+    """Identify a token on a server without storing the token itself."""
+    return hashlib.sha256(f"{base_url.rstrip('/')}\0{token}".encode()).hexdigest()[:16]
+
+
+def _configured_ttl() -> float:
+    value = os.getenv("YOUTRACK_SESSION_TTL")
+    if value is None:
+        return SESSION_TTL
+    try:
+        ttl = float(value)
+    except ValueError:
+        logger.warning("Invalid session TTL in environment, using default", value=value, default=SESSION_TTL)
+        return SESSION_TTL
+    return max(ttl, 0.0)
+
+
+@dataclass
+class VerifiedSession:
+    """A token the server accepted, with the user it belongs to."""
+
+    fingerprint: str
+    verified_at: float
+    username: str | None = None
+    full_name: str | None = None
+    email: str | None = None
+
+
+def _sessions_from_json(data: Any) -> dict[str, VerifiedSession]:
+    sessions = [VerifiedSession(**record) for record in data.values()]
+    return {session.fingerprint: session for session in sessions}
+
+
+class SessionStore:
+    """Verified sessions by token fingerprint, in memory and under ``~/.config/youtrack-cli``.
+
+    A session is valid for ``ttl`` seconds after verification. Any 401
+    response discards every record, so a revoked token is verified again
+    by the next command that asks.
+    """
+
+    def __init__(self, path: str | Path | None = None, ttl: float | None = None):
+        """Initialize the store.
+
+        Args:
+            path: File holding the records; defaults to ``session.json`` in the CLI config directory
+            ttl: Seconds a verification stays valid; defaults to ``YOUTRACK_SESSION_TTL`` or ``SESSION_TTL``
+        """
+        self.path = Path(path) if path else config_path("session.json")
+        self._ttl = ttl
+        self._sessions: dict[str, VerifiedSession] | None = None
+
+    @property
+    def ttl(self) -> float:
+        """Seconds a verification stays valid."""
+        return self._ttl if self._ttl is not None else _configured_ttl()
+
+    def _load(self) -> dict[str, VerifiedSession]:
+        if self._sessions is None:
+            self._sessions = read_json(self.path, "session record", _sessions_from_json) or {}
+        return self._sessions
+
+    def _save(self) -> None:
+        data = {key: asdict(session) for key, session in self._load().items()}
+        write_json(self.path, data, "session record", private=True)
+
+    def get(self, base_url: str, token: str) -> VerifiedSession | None:
+        """The session for this token if it was verified within ``ttl``."""
+        session = self._load().get(token_fingerprint(base_url, token))
+        if session is None or time.time() - session.verified_at >= self.ttl:
+            return None
+        return session
+
+    def record(
+        self,
+        base_url: str,
+        token: str,
+        username: str | None = None,
+        full_name: str | None = None,
+        email: str | None = None,
+    ) -> VerifiedSession | None:
+        """Record that the server just accepted this token."""
+        if self.ttl <= 0:
+            return None
+        now = time.time()
+        sessions = self._load()
+        # Expired records are dropped whenever a new one is written
+        for key in [key for key, session in sessions.items() if now - session.verified_at >= self.ttl]:
+            del sessions[key]
+        session = VerifiedSession(token_fingerprint(base_url, token), now, username, full_name, email)
+        sessions[session.fingerprint] = session
+        self._save()
+        return session
+
+    def invalidate(self) -> None:
+        """Discard every recorded session."""
+        if self._load() or self.path.exists():
+            self._sessions = {}
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Failed to remove session record", path=str(self.path), error=str(e))
+
+
+_store: SessionStore | None = None
+
+
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store."""
+    global _store
+    if _store is None:
+        _store = SessionStore()
+    return _store
@@ -0,0 +1,38 @@
+"""On-disk cache of board snapshots of closed sprints."""
+
+from typing import Any
+
+from .json_cache import JsonFileCache
+
+__all__ = ["SprintSnapshotCache"]
+
+
+def _entries(data: Any) -> dict[str, dict[str, Any]]:
+    return {str(key): value for key, value in data.items() if isinstance(value, dict)}
+
+
+class SprintSnapshotCache(JsonFileCache):
+    """Persist the board contents of archived sprints.
+
+    An archived sprint is closed, so its columns and issues are fetched once
+    and read back by later snapshots instead of querying every column again.
+    Entries are keyed by sprint ID and grouped by scope (server and board),
+    one JSON file per scope, under ``~/.config/youtrack-cli/sprints`` by
+    default. Unreadable files are treated as missing.
+    """
+
+    directory = "sprints"
+    description = "sprint cache entry"
+
+    def _load(self, scope: str) -> dict[str, dict[str, Any]]:
+        return self._read(self._path(scope), _entries) or {}
+
+    def get(self, scope: str, sprint_id: str) -> dict[str, Any] | None:
+        """Return the cached snapshot of a sprint, if any."""
+        return self._load(scope).get(sprint_id)
+
+    def set(self, scope: str, sprint_id: str, snapshot: dict[str, Any]) -> None:
+        """Add a sprint's snapshot to its scope, replacing the file atomically."""
+        entries = self._load(scope)
+        entries[sprint_id] = snapshot
+        self._write(self._path(scope), entries)
@@ -0,0 +1,104 @@
+"""Incremental CSV and JSON writers for streamed command output."""
+
+import csv
+import json
+import textwrap
+from collections.abc import AsyncIterable, Callable, Sequence
+from typing import IO, Any, TypeVar
+
+__all__ = ["CSVStreamWriter", "JSONArrayWriter", "write_stream"]
+
+T = TypeVar("T")
+
+
+class JSONArrayWriter:
+    """Write a JSON array one element at a time.
+
+    The output is byte-for-byte what ``json.dumps(items, indent=indent)``
+    would produce for the same items, but only the element being written is
+    ever held in memory. The opening bracket is written with the first
+    element and ``close`` always terminates the array, so a stream that ends
+    early (or is empty) still leaves well-formed JSON behind.
+    """
+
+    def __init__(self, stream: IO[str], indent: int | None = 2):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to
+            indent: Indentation passed to ``json.dumps``; None for compact output
+        """
+        self.stream = stream
+        self.indent = indent
+        self.count = 0
+        self._closed = False
+
+    def write(self, item: Any) -> None:
+        """Append one element to the array."""
+        if self.indent is None:
+            self.stream.write(("[" if self.count == 0 else ", ") + json.dumps(item))
+        else:
+            prefix = " " * self.indent
+            encoded = textwrap.indent(json.dumps(item, indent=self.indent), prefix, lambda _line: True)
+            self.stream.write(("[\n" if self.count == 0 else ",\n") + encoded)
+        self.count += 1
+
+    def close(self) -> None:
+        """Terminate the array. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.count == 0:
+            self.stream.write("[]")
+        elif self.indent is None:
+            self.stream.write("]")
+        else:
+            self.stream.write("\n]")
+        self.stream.write("\n")
+        self.stream.flush()
+
+    def __enter__(self) -> "JSONArrayWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class CSVStreamWriter:
+    """Write CSV rows as they are produced, header first."""
+
+    def __init__(self, stream: IO[str], headers: Sequence[str]):
+        """Initialize the writer and emit the header row.
+
+        Args:
+            stream: Text stream to write to (files should be opened with ``newline=""``)
+            headers: Column headers
+        """
+        self.stream = stream
+        self.count = 0
+        self._writer = csv.writer(stream)
+        self._writer.writerow(headers)
+
+    def write(self, row: Sequence[Any]) -> None:
+        """Write one data row."""
+        self._writer.writerow(row)
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush the underlying stream."""
+        self.stream.flush()
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+async def write_stream(items: AsyncIterable[T], write: Callable[[T], None]) -> int:
+    """Pass every item of an async iterable to ``write`` and return the count."""
+    count = 0
+    async for item in items:
+        write(item)
+        count += 1
+    return count
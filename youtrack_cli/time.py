@@ -1,15 +1,183 @@
 """Time tracking management for YouTrack CLI."""
 
-from datetime import datetime, timedelta
-from typing import Any
+import asyncio
+import re
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any
 
 from rich.table import Table
 
 from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
+from .exceptions import YouTrackError
+from .progress import get_progress_manager
+from .stream_writers import CSVStreamWriter
+from .utils import iter_offset_pages, read_import_records
 
-__all__ = ["TimeManager"]
+__all__ = ["TIME_GROUP_KEYS", "TIME_IMPORT_COLUMNS", "TimeAggregator", "TimeImportRow", "TimeManager"]
+
+#: Work items requested per page.
+WORK_ITEM_PAGE_SIZE = 500
+
+#: Pages requested ahead of the one being consumed once a result spans several pages.
+WORK_ITEM_PREFETCH = 4
+
+#: Columns of a bulk time import; only ``issue_id`` and ``duration`` are required.
+TIME_IMPORT_COLUMNS = ("issue_id", "duration", "date", "description", "work_type")
+
+TIME_IMPORT_ERROR_HEADERS = ("row", "issue_id", "duration", "error")
+
+#: Work items submitted at once by a bulk import.
+BULK_LOG_MAX_CONCURRENT = 8
+
+_READABLE_ISSUE_ID = re.compile(r"^(?P<project>[A-Za-z][A-Za-z0-9_]*)-\d+$")
+
+#: Fields needed by every summary grouping.
+TIME_SUMMARY_FIELDS = (
+    "id,duration(minutes),date,author(id,fullName),issue(id,idReadable,summary,project(shortName)),type(name)"
+)
+
+
+def _entry_day(entry: dict[str, Any]) -> datetime | None:
+    value = entry.get("date")
+    if not isinstance(value, int):
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def _group_user(entry: dict[str, Any]) -> str:
+    author = entry.get("author")
+    return (author.get("fullName") if isinstance(author, dict) else None) or "Unknown"
+
+
+def _group_issue(entry: dict[str, Any]) -> str:
+    issue = entry.get("issue")
+    if not isinstance(issue, dict):
+        issue = {}
+    return f"{issue.get('id', 'Unknown')} - {issue.get('summary', 'No summary')}"
+
+
+def _group_project(entry: dict[str, Any]) -> str:
+    issue = entry.get("issue")
+    project = issue.get("project") if isinstance(issue, dict) else None
+    return (project.get("shortName") if isinstance(project, dict) else None) or "Unknown"
+
+
+def _group_type(entry: dict[str, Any]) -> str:
+    work_type = entry.get("type")
+    if isinstance(work_type, dict) and work_type.get("name"):
+        return work_type["name"]
+    return "No type"
+
+
+def _group_day(entry: dict[str, Any]) -> str:
+    day = _entry_day(entry)
+    return day.date().isoformat() if day else "No date"
+
+
+def _group_week(entry: dict[str, Any]) -> str:
+    day = _entry_day(entry)
+    if not day:
+        return "No date"
+    return (day.date() - timedelta(days=day.weekday())).isoformat()
+
+
+def _group_month(entry: dict[str, Any]) -> str:
+    day = _entry_day(entry)
+    return day.strftime("%Y-%m") if day else "No date"
+
+
+#: Dimensions a time summary can be grouped by; weeks are labelled by their Monday (UTC).
+TIME_GROUP_KEYS = {
+    "user": _group_user,
+    "issue": _group_issue,
+    "project": _group_project,
+    "type": _group_type,
+    "day": _group_day,
+    "week": _group_week,
+    "month": _group_month,
+}
+
+
+def _issue_project(issue_id: str) -> str | None:
+    """Project short name of a readable issue ID such as ``WEB-12``."""
+    match = _READABLE_ISSUE_ID.match(issue_id)
+    return match.group("project") if match else None
+
+
+@dataclass
+class TimeImportRow:
+    """A validated work item from a bulk import file."""
+
+    row: int
+    issue_id: str
+    duration: str
+    minutes: int
+    date: int | None = None
+    description: str | None = None
+    work_type: str | None = None
+
+
+class TimeAggregator:
+    """Fold work items into per-group totals one entry at a time.
+
+    Only one accumulator per distinct group is kept, so memory depends on
+    the number of groups (users, weeks, ...) rather than on the number of
+    work items. Grouping by several keys, such as ``("user", "week")``,
+    produces one group per combination, labelled ``"Jane Doe / 2024-01-01"``.
+    Unknown keys put every entry into a single ``All`` group.
+    """
+
+    def __init__(self, group_by: str | Iterable[str] = "user"):
+        """Initialize the aggregator.
+
+        Args:
+            group_by: A key from ``TIME_GROUP_KEYS``, a comma-separated list or a sequence of keys
+        """
+        if isinstance(group_by, str):
+            group_by = group_by.split(",")
+        self.group_by = [key.strip() for key in group_by if key.strip()]
+        self._key_funcs = [TIME_GROUP_KEYS[key] for key in self.group_by if key in TIME_GROUP_KEYS]
+        self._groups: dict[tuple[str, ...], list[int]] = {}
+        self.total_minutes = 0
+        self.entries = 0
+
+    def add(self, entry: dict[str, Any]) -> None:
+        """Add one work item to its group."""
+        duration = entry.get("duration")
+        minutes = duration.get("minutes", 0) if isinstance(duration, dict) else 0
+        minutes = minutes or 0
+        key = tuple(func(entry) for func in self._key_funcs) if self._key_funcs else ("All",)
+
+        accumulator = self._groups.get(key)
+        if accumulator is None:
+            accumulator = self._groups[key] = [0, 0]
+        accumulator[0] += minutes
+        accumulator[1] += 1
+        self.total_minutes += minutes
+        self.entries += 1
+
+    def add_many(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Add several work items."""
+        for entry in entries:
+            self.add(entry)
+
+    def result(self) -> dict[str, Any]:
+        """Return the totals in the summary format used by ``display_time_summary``."""
+        groups = {}
+        for key, (minutes, entries) in self._groups.items():
+            group: dict[str, Any] = {"minutes": minutes, "entries": entries, "hours": round(minutes / 60, 2)}
+            if len(key) > 1:
+                group["keys"] = dict(zip(self.group_by, key, strict=False))
+            groups[" / ".join(key)] = group
+        return {
+            "groups": groups,
+            "total_minutes": self.total_minutes,
+            "total_hours": round(self.total_minutes / 60, 2),
+        }
 
 
 class TimeManager:
@@ -78,6 +246,16 @@ class TimeManager:
                 return {"status": "error", "message": f"Invalid work type: {work_type}"}
             work_item_data["type"] = {"id": work_type_id}
 
+        try:
+            result = await self._post_work_item(credentials, issue_id, work_item_data)
+            if result["status"] == "success":
+                result["message"] = f"Logged {duration} to issue {issue_id}"
+            return result
+        except Exception as e:
+            return {"status": "error", "message": f"Error logging time: {str(e)}"}
+
+    async def _post_work_item(self, credentials: Any, issue_id: str, work_item_data: dict[str, Any]) -> dict[str, Any]:
+        """Create one work item on an issue; transport errors are raised."""
         url = f"{credentials.base_url.rstrip('/')}/api/issues/{issue_id}/timeTracking/workItems"
         headers = {
             "Authorization": f"Bearer {credentials.token}",
@@ -85,41 +263,263 @@ class TimeManager:
             "Accept": "application/json",
         }
 
-        try:
-            client_manager = get_client_manager()
-            response = await client_manager.make_request(
-                method="POST", url=url, json_data=work_item_data, headers=headers
+        client_manager = get_client_manager()
+        response = await client_manager.make_request(method="POST", url=url, json_data=work_item_data, headers=headers)
+
+        if response.status_code in [200, 201]:
+            return {"status": "success", "data": response.json()}
+        error_text = response.text
+        return {
+            "status": "error",
+            "message": f"Failed to log time (HTTP {response.status_code}): {error_text}",
+        }
+
+    def parse_time_import(self, stream: IO[str], file_format: str = "csv") -> tuple[list[TimeImportRow], list[dict]]:
+        """Read and validate work items for a bulk import.
+
+        CSV input needs a header row; JSON input is an array of objects.
+        Both use the ``TIME_IMPORT_COLUMNS`` names, of which ``issue_id`` and
+        ``duration`` are required. Rows are numbered as in the file: CSV data
+        starts at row 2, JSON objects at 1.
+
+        Args:
+            stream: Text stream with the entries (a file or stdin)
+            file_format: ``csv`` or ``json``
+
+        Returns:
+            Valid rows and a list of ``{"row", "issue_id", "duration", "error"}`` for invalid ones
+
+        Raises:
+            ValueError: If the input cannot be read as the given format
+        """
+        records = read_import_records(stream, file_format)
+
+        rows: list[TimeImportRow] = []
+        errors: list[dict[str, Any]] = []
+        for row_number, record in records:
+            if not isinstance(record, dict):
+                errors.append({"row": row_number, "issue_id": "", "duration": "", "error": "Entry is not an object"})
+                continue
+            values = {key: str(record.get(key) or "").strip() for key in TIME_IMPORT_COLUMNS}
+            error = None
+            minutes = self._parse_duration(values["duration"]) if values["duration"] else None
+            work_date = self._parse_date_strict(values["date"]) if values["date"] else None
+            if not values["issue_id"]:
+                error = "Missing issue_id"
+            elif not values["duration"]:
+                error = "Missing duration"
+            elif minutes is None:
+                error = f"Invalid duration format: {values['duration']}"
+            elif values["date"] and work_date is None:
+                error = f"Invalid date: {values['date']}"
+
+            if error:
+                errors.append(
+                    {"row": row_number, "issue_id": values["issue_id"], "duration": values["duration"], "error": error}
+                )
+                continue
+            rows.append(
+                TimeImportRow(
+                    row=row_number,
+                    issue_id=values["issue_id"],
+                    duration=values["duration"],
+                    minutes=minutes or 0,
+                    date=work_date,
+                    description=values["description"] or None,
+                    work_type=values["work_type"] or None,
+                )
             )
+        return rows, errors
 
-            if response.status_code in [200, 201]:
+    async def _project_work_types(self, credentials: Any, project_key: str) -> dict[str, str]:
+        """Return a lower-cased name to ID index of a project's work types, or the global ones."""
+        headers = {
+            "Authorization": f"Bearer {credentials.token}",
+            "Accept": "application/json",
+        }
+        base_url = credentials.base_url.rstrip("/")
+        client_manager = get_client_manager()
+        for url in (
+            f"{base_url}/api/admin/projects/{project_key}/timeTrackingSettings/workItemTypes",
+            f"{base_url}/api/admin/timeTrackingSettings/workItemTypes",
+        ):
+            try:
+                response = await client_manager.make_request(
+                    method="GET", url=url, params={"fields": "id,name"}, headers=headers
+                )
+            except Exception:
+                continue
+            if response.status_code == 200:
                 data = response.json()
+                work_types = data if isinstance(data, list) else [data]
                 return {
-                    "status": "success",
-                    "message": f"Logged {duration} to issue {issue_id}",
-                    "data": data,
+                    work_type["name"].lower(): work_type["id"]
+                    for work_type in work_types
+                    if isinstance(work_type, dict) and work_type.get("name") and work_type.get("id")
                 }
-            error_text = response.text
-            return {
-                "status": "error",
-                "message": f"Failed to log time (HTTP {response.status_code}): {error_text}",
-            }
-        except Exception as e:
-            return {"status": "error", "message": f"Error logging time: {str(e)}"}
+        return {}
 
-    async def get_time_entries(
+    async def log_time_bulk(
+        self,
+        rows: list[TimeImportRow],
+        max_concurrent: int = BULK_LOG_MAX_CONCURRENT,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """Log many work items with bounded concurrency.
+
+        Work type names are resolved once per project (taken from the issue
+        ID prefix) into a cached index instead of once per row. Every row is
+        attempted; failures are collected per row rather than stopping the
+        import.
+
+        Args:
+            rows: Validated rows from ``parse_time_import``
+            max_concurrent: Work items submitted at once
+            dry_run: Resolve work types and report what would be logged without posting
+
+        Returns:
+            Dictionary with ``total``, ``logged``, ``failed`` and per-row ``errors``
+        """
+        credentials = self.auth_manager.load_credentials()
+        if not credentials:
+            return {"status": "error", "message": "Not authenticated"}
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        # Work types are looked up per project; issues given by database ID
+        # do not name their project, so those are looked up through the issue.
+        lookups = {_issue_project(row.issue_id) or row.issue_id: row.issue_id for row in rows if row.work_type}
+
+        async def load_index(key: str, issue_id: str) -> tuple[str, dict[str, str]]:
+            async with semaphore:
+                if key != issue_id:
+                    return key, await self._project_work_types(credentials, key)
+                result = await self.get_work_types(issue_id)
+                work_types = result["data"] if result["status"] == "success" else []
+                return key, {
+                    work_type["name"].lower(): work_type["id"]
+                    for work_type in work_types
+                    if isinstance(work_type, dict) and work_type.get("name") and work_type.get("id")
+                }
+
+        work_type_index = dict(await asyncio.gather(*(load_index(key, issue_id) for key, issue_id in lookups.items())))
+
+        errors: list[dict[str, Any]] = []
+        logged = 0
+        progress_manager = get_progress_manager()
+        description = f"{'[DRY RUN] ' if dry_run else ''}Logging time..."
+        with progress_manager.progress_bar(description, total=len(rows)) as tracker:
+
+            async def submit(row: TimeImportRow) -> None:
+                nonlocal logged
+                error = None
+                work_item_data: dict[str, Any] = {
+                    "duration": {"minutes": row.minutes},
+                    "date": row.date if row.date is not None else int(datetime.now().timestamp() * 1000),
+                }
+                if row.description:
+                    work_item_data["text"] = row.description
+                if row.work_type:
+                    project_types = work_type_index.get(_issue_project(row.issue_id) or row.issue_id, {})
+                    work_type_id = project_types.get(row.work_type.lower())
+                    if work_type_id:
+                        work_item_data["type"] = {"id": work_type_id}
+                    else:
+                        error = f"Invalid work type '{row.work_type}'"
+
+                if error is None and not dry_run:
+                    async with semaphore:
+                        try:
+                            result = await self._post_work_item(credentials, row.issue_id, work_item_data)
+                            if result["status"] != "success":
+                                error = result["message"]
+                        except Exception as e:
+                            error = f"Error logging time: {str(e)}"
+
+                if error is None:
+                    logged += 1
+                else:
+                    errors.append({"row": row.row, "issue_id": row.issue_id, "duration": row.duration, "error": error})
+                tracker.advance()
+
+            await asyncio.gather(*(submit(row) for row in rows))
+
+        errors.sort(key=lambda error: error["row"])
+        return {
+            "status": "success",
+            "data": {
+                "total": len(rows),
+                "logged": logged,
+                "failed": len(errors),
+                "errors": errors,
+                "dry_run": dry_run,
+            },
+        }
+
+    def write_import_errors(self, stream: IO[str], errors: list[dict[str, Any]]) -> int:
+        """Write a per-row error report as CSV and return the number of rows."""
+        with CSVStreamWriter(stream, TIME_IMPORT_ERROR_HEADERS) as writer:
+            for error in errors:
+                writer.write([error.get(header, "") for header in TIME_IMPORT_ERROR_HEADERS])
+            return writer.count
+
+    def display_import_errors(self, errors: list[dict[str, Any]], limit: int = 20) -> None:
+        """Display the first ``limit`` failed rows of an import."""
+        if not errors:
+            return
+
+        table = Table(title="Failed Rows", show_header=True, header_style="bold red")
+        table.add_column("Row", style="cyan")
+        table.add_column("Issue", style="green")
+        table.add_column("Duration", style="blue")
+        table.add_column("Error", style="red")
+        for error in errors[:limit]:
+            table.add_row(str(error["row"]), error["issue_id"], error["duration"], error["error"])
+        self.console.print(table)
+        if len(errors) > limit:
+            self.console.print(f"... and {len(errors) - limit} more failed rows", style="yellow")
+
+    async def _fetch_work_items_page(
+        self, url: str, params: dict[str, Any], headers: dict[str, str], skip: int, top: int
+    ) -> list[dict[str, Any]]:
+        client_manager = get_client_manager()
+        page_params = {**params, "$skip": str(skip), "$top": str(top)}
+        response = await client_manager.make_request(method="GET", url=url, params=page_params, headers=headers)
+        if response.status_code != 200:
+            raise YouTrackError(f"Failed to get time entries: {response.text}")
+        data = self._parse_json_response(response)
+        # Handle empty response or None data
+        if data is None:
+            return []
+        if not isinstance(data, list):
+            return [data] if data else []
+        return data
+
+    async def iter_time_entries(
         self,
         issue_id: str | None = None,
         user_id: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
         fields: str | None = None,
-    ) -> dict[str, Any]:
-        """Get time entries with optional filtering."""
+        page_size: int = WORK_ITEM_PAGE_SIZE,
+        prefetch: int = WORK_ITEM_PREFETCH,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield every matching work item, fetched in ``$skip``/``$top`` pages.
+
+        The first page is requested on its own. If it is full, up to
+        ``prefetch`` following pages are kept in flight while the current
+        one is consumed, so large exports are not bound by one round trip
+        per page. Work items are yielded in server order.
+
+        Raises:
+            YouTrackError: If not authenticated or a page request fails
+            ValueError: If a page cannot be parsed
+        """
         credentials = self.auth_manager.load_credentials()
         if not credentials:
-            return {"status": "error", "message": "Not authenticated"}
+            raise YouTrackError("Not authenticated")
 
-        params = {}
+        params: dict[str, Any] = {}
         if fields:
             params["fields"] = fields
         if user_id:
@@ -141,26 +541,40 @@ class TimeManager:
             "Accept": "application/json",
         }
 
+        async def fetch_page(skip: int, top: int) -> list[dict[str, Any]]:
+            return await self._fetch_work_items_page(url, params, headers, skip, top)
+
+        async for page in iter_offset_pages(fetch_page, page_size, prefetch_pages=prefetch):
+            for entry in page:
+                yield entry
+
+    async def get_time_entries(
+        self,
+        issue_id: str | None = None,
+        user_id: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        fields: str | None = None,
+    ) -> dict[str, Any]:
+        """Get all time entries with optional filtering, following every page."""
+        credentials = self.auth_manager.load_credentials()
+        if not credentials:
+            return {"status": "error", "message": "Not authenticated"}
+
         try:
-            client_manager = get_client_manager()
-            response = await client_manager.make_request(method="GET", url=url, params=params, headers=headers)
-            if response.status_code == 200:
-                data = self._parse_json_response(response)
-                # Handle empty response or None data
-                if data is None:
-                    data = []
-                elif not isinstance(data, list):
-                    data = [data] if data else []
-                return {
-                    "status": "success",
-                    "data": data,
-                    "count": len(data),
-                }
-            error_text = response.text
+            data = [
+                entry
+                async for entry in self.iter_time_entries(
+                    issue_id=issue_id, user_id=user_id, start_date=start_date, end_date=end_date, fields=fields
+                )
+            ]
             return {
-                "status": "error",
-                "message": f"Failed to get time entries: {error_text}",
+                "status": "success",
+                "data": data,
+                "count": len(data),
             }
+        except YouTrackError as e:
+            return {"status": "error", "message": str(e)}
         except ValueError as e:
             # Handle JSON parsing errors specifically
             return {
@@ -178,35 +592,41 @@ class TimeManager:
         user_id: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-        group_by: str = "user",
+        group_by: str | Iterable[str] = "user",
     ) -> dict[str, Any]:
-        """Get time tracking summary with aggregation."""
+        """Get time tracking summary with aggregation.
+
+        Work items are folded into group totals as pages arrive, so the
+        summary of hundreds of thousands of entries needs memory only for
+        the groups.
+
+        Args:
+            user_id: Only count work items by this user
+            start_date: First day to include (YYYY-MM-DD)
+            end_date: Last day to include (YYYY-MM-DD)
+            group_by: Key or keys from ``TIME_GROUP_KEYS``, e.g. ``"user,week"``
+        """
         credentials = self.auth_manager.load_credentials()
         if not credentials:
             return {"status": "error", "message": "Not authenticated"}
 
-        # First get all time entries
-        time_entries_result = await self.get_time_entries(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
-            fields="id,duration(minutes),date,description,author(id,fullName),issue(id,summary),type(name)",
-        )
-
-        if time_entries_result["status"] != "success":
-            return time_entries_result
-
-        time_entries = time_entries_result["data"]
-        if not isinstance(time_entries, list):
-            time_entries = [time_entries]
-
-        # Aggregate data
-        summary = self._aggregate_time_data(time_entries, group_by)
+        aggregator = TimeAggregator(group_by)
+        try:
+            async for entry in self.iter_time_entries(
+                user_id=user_id, start_date=start_date, end_date=end_date, fields=TIME_SUMMARY_FIELDS
+            ):
+                aggregator.add(entry)
+        except YouTrackError as e:
+            return {"status": "error", "message": str(e)}
+        except ValueError as e:
+            return {"status": "error", "message": f"Response parsing error: {str(e)}"}
+        except Exception as e:
+            return {"status": "error", "message": f"Error getting time entries: {str(e)}"}
 
         return {
             "status": "success",
-            "data": summary,
-            "total_entries": len(time_entries),
+            "data": aggregator.result(),
+            "total_entries": aggregator.entries,
         }
 
     def _parse_duration(self, duration: str) -> int | None:
@@ -244,72 +664,45 @@ class TimeManager:
 
         return total_minutes if total_minutes > 0 else None
 
-    def _parse_date(self, date_str: str) -> int:
-        """Parse date string to timestamp in milliseconds."""
+    def _parse_date_strict(self, date_str: str) -> int | None:
+        """Parse date string to timestamp in milliseconds, or None if it is not a date."""
+        # Try different date formats
+        formats = ["%Y-%m-%d", "%m/%d/%Y", "%d.%m.%Y", "%Y-%m-%d %H:%M:%S"]
+
+        for fmt in formats:
+            try:
+                parsed_date = datetime.strptime(date_str, fmt)
+                return int(parsed_date.timestamp() * 1000)
+            except ValueError:
+                continue
+
+        # If no format matches, try relative dates
+        if date_str.lower() == "today":
+            return int(datetime.now().timestamp() * 1000)
+        if date_str.lower() == "yesterday":
+            return int((datetime.now() - timedelta(days=1)).timestamp() * 1000)
+
+        # If all else fails, try to parse as ISO format
         try:
-            # Try different date formats
-            formats = ["%Y-%m-%d", "%m/%d/%Y", "%d.%m.%Y", "%Y-%m-%d %H:%M:%S"]
-
-            for fmt in formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return int(parsed_date.timestamp() * 1000)
-                except ValueError:
-                    continue
-
-            # If no format matches, try relative dates
-            if date_str.lower() == "today":
-                return int(datetime.now().timestamp() * 1000)
-            if date_str.lower() == "yesterday":
-                return int((datetime.now() - timedelta(days=1)).timestamp() * 1000)
-
-            # If all else fails, try to parse as ISO format
             parsed_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
             return int(parsed_date.timestamp() * 1000)
+        except ValueError:
+            return None
+
+    def _parse_date(self, date_str: str) -> int:
+        """Parse date string to timestamp in milliseconds."""
+        try:
+            parsed = self._parse_date_strict(date_str)
         except Exception:
-            # Default to current timestamp if parsing fails
-            return int(datetime.now().timestamp() * 1000)
+            parsed = None
+        # Default to current timestamp if parsing fails
+        return parsed if parsed is not None else int(datetime.now().timestamp() * 1000)
 
     def _aggregate_time_data(self, time_entries: list[dict[str, Any]], group_by: str) -> dict[str, Any]:
         """Aggregate time data by specified grouping."""
-        summary = {}
-        total_minutes = 0
-
-        for entry in time_entries:
-            duration = entry.get("duration", {})
-            minutes = duration.get("minutes", 0) if isinstance(duration, dict) else 0
-            total_minutes += minutes
-
-            # Group by user, issue, or type
-            if group_by == "user":
-                key = entry.get("author", {}).get("fullName", "Unknown")
-            elif group_by == "issue":
-                issue = entry.get("issue", {})
-                key = f"{issue.get('id', 'Unknown')} - {issue.get('summary', 'No summary')}"
-            elif group_by == "type":
-                work_type = entry.get("type")
-                if isinstance(work_type, dict) and work_type.get("name"):
-                    key = work_type.get("name")
-                else:
-                    key = "No type"
-            else:
-                key = "All"
-
-            if key not in summary:
-                summary[key] = {"minutes": 0, "entries": 0, "hours": 0.0}
-
-            summary[key]["minutes"] += minutes
-            summary[key]["entries"] += 1
-
-        # Convert minutes to hours for display
-        for key in summary:
-            summary[key]["hours"] = round(summary[key]["minutes"] / 60, 2)
-
-        return {
-            "groups": summary,
-            "total_minutes": total_minutes,
-            "total_hours": round(total_minutes / 60, 2),
-        }
+        aggregator = TimeAggregator(group_by)
+        aggregator.add_many(time_entries)
+        return aggregator.result()
 
     def display_time_entries(self, time_entries: list[dict[str, Any]]) -> None:
         """Display time entries in a table format."""
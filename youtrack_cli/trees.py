@@ -6,9 +6,13 @@ from typing import Any
 from rich.tree import Tree
 
 from .console import get_console
+from .issue_view import IssueView
 
+#: Project fields ``create_project_hierarchy_tree`` reads; request only these when listing for the tree.
+PROJECT_HIERARCHY_FIELDS = "id,name,shortName,archived,leader(fullName),parent(id)"
 
-def _get_assignee_name_from_issue(issue: dict[str, Any]) -> str:
+
+def _get_assignee_name_from_issue(issue: dict[str, Any] | IssueView) -> str:
     """Get assignee name from either regular field or custom field."""
     # First try the regular assignee field
     assignee = issue.get("assignee")
@@ -21,18 +25,14 @@ def _get_assignee_name_from_issue(issue: dict[str, Any]) -> str:
             return assignee["login"]
 
     # If not found, try the Assignee custom field
-    custom_fields = issue.get("customFields", [])
-    if isinstance(custom_fields, list):
-        for field in custom_fields:
-            if isinstance(field, dict) and field.get("name") == "Assignee":
-                value = field.get("value")
-                if value and isinstance(value, dict):
-                    if value.get("fullName"):
-                        return value["fullName"]
-                    if value.get("name"):
-                        return value["name"]
-                    if value.get("login"):
-                        return value["login"]
+    value = IssueView.of(issue).raw("Assignee")
+    if value and isinstance(value, dict):
+        if value.get("fullName"):
+            return value["fullName"]
+        if value.get("name"):
+            return value["name"]
+        if value.get("login"):
+            return value["login"]
 
     return "Unassigned"
 
@@ -303,7 +303,7 @@ def create_issue_relationships_tree(
 
                 if show_status:
                     # Try to get status from the linked issue
-                    linked_issue_data = rel_issue["issue_data"]
+                    linked_issue_data = IssueView.of(rel_issue["issue_data"])
                     status = _extract_status_from_issue(linked_issue_data)
                     if status:
                         issue_metadata["Status"] = status
@@ -328,7 +328,7 @@ def create_issue_relationships_tree(
 
                 if show_status:
                     # Try to get status from the linked issue
-                    linked_issue_data = rel_issue["issue_data"]
+                    linked_issue_data = IssueView.of(rel_issue["issue_data"])
                     status = _extract_status_from_issue(linked_issue_data)
                     if status:
                         issue_metadata["Status"] = status
@@ -348,22 +348,20 @@ def create_issue_relationships_tree(
     return builder.get_tree()
 
 
-def _extract_status_from_issue(issue: dict[str, Any]) -> str | None:
+def _extract_status_from_issue(issue: dict[str, Any] | IssueView) -> str | None:
     """Extract status from issue data, checking multiple possible locations."""
     # Try state field first
     if "state" in issue and isinstance(issue["state"], dict):
         return issue["state"].get("name")
 
     # Try custom fields
-    custom_fields = issue.get("customFields", [])
-    if isinstance(custom_fields, list):
-        for field in custom_fields:
-            if isinstance(field, dict) and field.get("name") in ["State", "Status", "Stage"]:
-                value = field.get("value")
-                if value and isinstance(value, dict):
-                    return value.get("name")
-                elif isinstance(value, str):
-                    return value
+    view = IssueView.of(issue)
+    for field_name in ("State", "Status", "Stage"):
+        value = view.raw(field_name)
+        if value and isinstance(value, dict):
+            return value.get("name")
+        elif isinstance(value, str):
+            return value
 
     return None
 
@@ -379,13 +377,14 @@ def create_project_hierarchy_tree(projects: list[dict[str, Any]]) -> Tree:
     """
     builder = EnhancedTreeBuilder("🏗️ Project Hierarchy")
 
-    # Group projects by parent
+    # Group projects by parent; projects whose parent was not listed are shown at the root
+    listed_ids = {project.get("id") for project in projects}
     root_projects = []
     child_projects: dict[str, list[dict[str, Any]]] = {}
 
     for project in projects:
-        parent_id = project.get("parent", {}).get("id")
-        if parent_id:
+        parent_id = (project.get("parent") or {}).get("id")
+        if parent_id and parent_id in listed_ids:
             if parent_id not in child_projects:
                 child_projects[parent_id] = []
             child_projects[parent_id].append(project)
@@ -397,8 +396,8 @@ def create_project_hierarchy_tree(projects: list[dict[str, Any]]) -> Tree:
         project_name = project.get("name", "Unnamed Project")
 
         metadata = {
-            "Lead": project.get("leader", {}).get("fullName"),
-            "Issues": project.get("issuesCount", 0),
+            "Lead": (project.get("leader") or {}).get("fullName"),
+            "Issues": project.get("issuesCount"),
         }
 
         # Determine project status
@@ -418,9 +417,8 @@ def create_project_hierarchy_tree(projects: list[dict[str, Any]]) -> Tree:
         )
 
         # Add children if any
-        if project_id in child_projects:
-            for child in child_projects[project_id]:
-                add_project_to_tree(child_node, child)
+        for child in child_projects.get(project.get("id"), []):
+            add_project_to_tree(child_node, child)
 
     # Add root projects
     for project in root_projects:
@@ -585,3 +583,56 @@ def _get_status_color(status: str) -> str:
     if any(word in status_lower for word in ["blocked", "waiting", "on hold"]):
         return "red"
     return "white"
+
+
+def create_issue_graph_tree(graph: Any, show_status: bool = True) -> Tree:
+    """Create a tree view of a crawled issue link graph.
+
+    Each issue is expanded once, under the issue it was discovered from;
+    later references to it are shown as dimmed back-references, and
+    references that close a dependency cycle are flagged in red.
+
+    Args:
+        graph: IssueGraph returned by IssueGraphCrawler.crawl
+        show_status: Whether to show status indicators
+
+    Returns:
+        Rich Tree object
+    """
+    title = ", ".join(graph.roots)
+    builder = EnhancedTreeBuilder(f"[bold blue]🕸️  Link graph: {title}[/bold blue] [dim](depth {graph.max_depth})[/dim]")
+    cycle_edges = graph.cycle_edges()
+    rendered: set[str] = set()
+
+    def label_for(issue_id: str) -> str:
+        node = graph.nodes.get(issue_id)
+        summary = node.summary if node else ""
+        label = f"[bold]{issue_id}[/bold]" + (f": {summary}" if summary else "")
+        if show_status and node and node.state:
+            color = _get_status_color(node.state)
+            label += f" [{color}]●[/{color}] {node.state}"
+        return label
+
+    def render(parent_node: Any, issue_id: str) -> None:
+        rendered.add(issue_id)
+        own_parent = graph.nodes[issue_id].parent if issue_id in graph.nodes else None
+        for edge, neighbour in graph.children(issue_id):
+            node = graph.nodes.get(neighbour)
+            arrow = "↔" if not edge.directed else ("→" if edge.source == issue_id else "←")
+            relation = f"[cyan]{arrow} {edge.link_type}[/cyan]"
+            if node is not None and node.parent == issue_id and neighbour not in rendered:
+                render(parent_node.add(f"{relation} {label_for(neighbour)}"), neighbour)
+            elif edge.source == issue_id and (edge.source, edge.target) in cycle_edges:
+                parent_node.add(f"{relation} {label_for(neighbour)} [red]↺ cycle[/red]")
+            elif neighbour != own_parent:
+                parent_node.add(f"[dim]{arrow} {edge.link_type} {neighbour} (see above)[/dim]")
+
+    for root in graph.roots:
+        if root in rendered:
+            continue
+        render(builder.tree.add(label_for(root)), root)
+
+    if graph.truncated:
+        builder.tree.add("[yellow]… more issues not shown (limit reached)[/yellow]")
+
+    return builder.get_tree()
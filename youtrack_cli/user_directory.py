@@ -0,0 +1,269 @@
+"""Cached directory of YouTrack users with lookups by login, email, ID and ringId."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from .exceptions import YouTrackError
+from .json_cache import JsonFileCache
+from .logging import get_logger
+from .services.users import UserService
+from .utils import PaginationConfig, fetch_offset_pages
+
+__all__ = ["USER_DIRECTORY_FIELDS", "UserDirectory", "complete_user_logins"]
+
+logger = get_logger(__name__)
+
+#: Fields kept for every user; enough to resolve references and show names.
+USER_DIRECTORY_FIELDS = "id,login,fullName,email,ringId,banned"
+
+#: Seconds before a loaded directory is considered stale (matches ``cache_users``).
+USER_DIRECTORY_TTL = 1800.0
+
+USER_DIRECTORY_PAGE_SIZE = 500
+
+#: Unresolved references at which loading the whole directory beats single lookups.
+USER_DIRECTORY_BULK_THRESHOLD = 5
+
+# Single lookups of references missing from the directory run this many at a time.
+_MAX_CONCURRENT_LOOKUPS = 8
+
+FetchUser = Callable[[str, str], Awaitable[dict[str, Any]]]
+
+
+class UserDirectory(JsonFileCache):
+    """All users of a YouTrack instance, indexed for reference resolution.
+
+    The directory is read with paginated ``list_users`` calls that request
+    only ``USER_DIRECTORY_FIELDS`` and is kept in memory with indexes by
+    ID, ringId, login and email (the last two case-insensitively). A loaded
+    directory is written to ``~/.config/youtrack-cli/users``, readable by
+    the owner only, and reused by later commands until ``ttl`` expires.
+
+    Resolving a single reference does not page through every user: on a
+    cold directory it falls back to one ``get_user`` call and remembers the
+    answer. Bulk resolution loads the whole directory once enough
+    references are unknown, so administering many users costs a few list
+    pages instead of a request per user.
+    """
+
+    directory = "users"
+    description = "user directory"
+    private = True
+
+    def __init__(
+        self,
+        auth_manager: Any,
+        fetch_user: FetchUser | None = None,
+        cache_dir: str | Path | None = None,
+        ttl: float = USER_DIRECTORY_TTL,
+    ):
+        """Initialize the directory.
+
+        Args:
+            auth_manager: AuthManager used for the user API
+            fetch_user: ``(reference, fields)`` coroutine for single lookups; defaults to ``UserService.get_user``
+            cache_dir: Directory for the persisted directory; defaults to the CLI config directory
+            ttl: Seconds a loaded directory stays fresh
+        """
+        super().__init__(cache_dir)
+        self.auth_manager = auth_manager
+        self.user_service = UserService(auth_manager)
+        self._fetch_user = fetch_user or (lambda ref, fields: self.user_service.get_user(ref, fields=fields))
+        self.ttl = ttl
+        self.loaded_at: float | None = None
+        self._disk_checked = False
+        self._users: list[dict[str, Any]] = []
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_ring_id: dict[str, dict[str, Any]] = {}
+        self._by_login: dict[str, dict[str, Any]] = {}
+        self._by_email: dict[str, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the full directory was loaded within ``ttl``."""
+        return self.loaded_at is not None and time.time() - self.loaded_at < self.ttl
+
+    def _directory_path(self) -> Path | None:
+        credentials = self.auth_manager.load_credentials()
+        base_url = getattr(credentials, "base_url", None) if credentials else None
+        if not isinstance(base_url, str):
+            return None
+        return self._path(self.scope(base_url.rstrip("/")))
+
+    def add(self, user: dict[str, Any]) -> None:
+        """Add or replace a user in the indexes."""
+        previous = self._by_id.get(user.get("id") or "")
+        if previous is not None:
+            self._users.remove(previous)
+        self._users.append(user)
+        if user.get("id"):
+            self._by_id[user["id"]] = user
+        if user.get("ringId"):
+            self._by_ring_id[user["ringId"]] = user
+        if user.get("login"):
+            self._by_login[user["login"].lower()] = user
+        if user.get("email"):
+            self._by_email[user["email"].lower()] = user
+
+    def _replace(self, users: Iterable[dict[str, Any]]) -> None:
+        self._users = []
+        self._by_id, self._by_ring_id, self._by_login, self._by_email = {}, {}, {}, {}
+        for user in users:
+            if isinstance(user, dict):
+                self.add(user)
+
+    def lookup(self, reference: str) -> dict[str, Any] | None:
+        """Find a user by ID, ringId, login or email in memory, without any request."""
+        return (
+            self._by_id.get(reference)
+            or self._by_ring_id.get(reference)
+            or self._by_login.get(reference.lower())
+            or self._by_email.get(reference.lower())
+        )
+
+    def _load_from_disk(self) -> bool:
+        self._disk_checked = True
+        path = self._directory_path()
+        if path is None:
+            return False
+        stored = self._read(path, lambda data: (float(data["loaded_at"]), list(data["users"])))
+        if stored is None:
+            return False
+        loaded_at, users = stored
+        if time.time() - loaded_at >= self.ttl:
+            return False
+        self._replace(users)
+        self.loaded_at = loaded_at
+        return True
+
+    def _save(self) -> None:
+        path = self._directory_path()
+        if path is None:
+            return
+        self._write(path, {"loaded_at": self.loaded_at, "users": self._users})
+
+    async def load(self, force: bool = False) -> bool:
+        """Make sure the full directory is loaded and fresh.
+
+        Args:
+            force: Page through the users again even if the directory is fresh
+
+        Returns:
+            True if the directory is loaded; False if listing users failed
+        """
+        if not force:
+            if self.is_fresh:
+                return True
+            if not self._disk_checked and self._load_from_disk():
+                return True
+
+        async def fetch_page(skip: int, top: int) -> list[Any]:
+            result = await self.user_service.list_users(fields=USER_DIRECTORY_FIELDS, top=top, skip=skip)
+            if result["status"] != "success":
+                raise YouTrackError(result.get("message", "Failed to list users"))
+            return result["data"] if isinstance(result["data"], list) else []
+
+        try:
+            users = await fetch_offset_pages(
+                fetch_page, USER_DIRECTORY_PAGE_SIZE, prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES
+            )
+        except YouTrackError as e:
+            logger.debug("Could not load user directory", error=str(e))
+            return False
+
+        self._replace(users)
+        self.loaded_at = time.time()
+        self._disk_checked = True
+        self._save()
+        return True
+
+    async def _fetch(self, reference: str) -> dict[str, Any] | None:
+        result = await self._fetch_user(reference, USER_DIRECTORY_FIELDS)
+        if result.get("status") != "success" or not isinstance(result.get("data"), dict):
+            return None
+        user = result["data"]
+        self.add(user)
+        return user
+
+    async def resolve(self, reference: str) -> dict[str, Any] | None:
+        """Return the user a login, email, ID or ringId refers to, or None if there is none.
+
+        Exceptions raised by the single-user lookup propagate.
+        """
+        if not self._disk_checked:
+            self._load_from_disk()
+        return self.lookup(reference) or await self._fetch(reference)
+
+    async def resolve_many(self, references: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+        """Resolve several references, loading the whole directory when that is cheaper.
+
+        Returns:
+            Mapping of each reference to its user, or None if it does not exist
+        """
+        references = list(dict.fromkeys(references))
+        if not self._disk_checked:
+            self._load_from_disk()
+        missing = [reference for reference in references if self.lookup(reference) is None]
+        if len(missing) >= USER_DIRECTORY_BULK_THRESHOLD and not self.is_fresh:
+            await self.load()
+            missing = [reference for reference in missing if self.lookup(reference) is None]
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS)
+
+        async def fetch(reference: str) -> None:
+            async with semaphore:
+                await self._fetch(reference)
+
+        await asyncio.gather(*(fetch(reference) for reference in missing))
+        return {reference: self.lookup(reference) for reference in references}
+
+    def complete(self, prefix: str, limit: int = 50) -> list[dict[str, Any]]:
+        """Users whose login starts with ``prefix`` (case-insensitive), sorted by login."""
+        prefix = prefix.lower()
+        matches = sorted(
+            (user for login, user in self._by_login.items() if login.startswith(prefix) and not user.get("banned")),
+            key=lambda user: user["login"].lower(),
+        )
+        return matches[:limit]
+
+    def invalidate(self) -> None:
+        """Forget the loaded directory and delete its persisted copy."""
+        self._replace([])
+        self.loaded_at = None
+        self._disk_checked = True
+        path = self._directory_path()
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug("Failed to delete user directory", path=str(path), error=str(e))
+
+
+def complete_user_logins(ctx: Any, param: Any, incomplete: str) -> list[Any]:
+    """Click ``shell_complete`` callback offering user logins from the directory.
+
+    Uses the persisted directory and loads it once if there is none; any
+    failure yields no suggestions rather than an error in the shell. The
+    root callback does not run during completion, so ``--config`` is read
+    from the parsed parameters instead of ``ctx.obj``.
+    """
+    from click.shell_completion import CompletionItem
+
+    from .auth import AuthManager
+
+    try:
+        directory = UserDirectory(AuthManager(ctx.find_root().params.get("config")))
+        if not directory._load_from_disk():
+            asyncio.run(directory.load())
+        return [
+            CompletionItem(user["login"], help=user.get("fullName") or None) for user in directory.complete(incomplete)
+        ]
+    except Exception as e:
+        logger.debug("User completion failed", error=str(e))
+        return []
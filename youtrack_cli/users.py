@@ -9,6 +9,7 @@ from .auth import AuthManager
 from .client import get_client_manager
 from .console import get_console
 from .pagination import create_paginated_display
+from .user_directory import UserDirectory
 
 __all__ = ["UserManager"]
 
@@ -24,6 +25,18 @@ class UserManager:
         """
         self.auth_manager = auth_manager
         self.console = get_console()
+        self.directory = UserDirectory(auth_manager, fetch_user=lambda ref, fields: self.get_user(ref, fields=fields))
+
+    async def resolve_user(self, reference: str) -> dict[str, Any] | None:
+        """Resolve a login, email, user ID or ringId through the cached user directory.
+
+        Args:
+            reference: Login, email, database ID or Hub ringId
+
+        Returns:
+            The user's directory entry, or None if no such user exists
+        """
+        return await self.directory.resolve(reference)
 
     async def list_users(
         self,
@@ -53,7 +66,7 @@ class UserManager:
         Returns:
             Dictionary with operation result including pagination metadata
         """
-        from .utils import paginate_results  # Import here to avoid circular imports
+        from .utils import PaginationConfig, paginate_results  # Import here to avoid circular imports
 
         credentials = self.auth_manager.load_credentials()
         if not credentials:
@@ -97,6 +110,7 @@ class UserManager:
                     after_cursor=after_cursor,
                     before_cursor=before_cursor,
                     use_cursor_pagination=False,  # Users use offset pagination
+                    prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES,
                 )
                 users = result["results"]
 
@@ -7,12 +7,15 @@ The utilities provide consistent interfaces for API interactions, response
 handling, and user feedback with proper error handling and logging.
 """
 
+import asyncio
+import csv
 import json
 import re
-from collections.abc import AsyncGenerator
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import IO, Any
 
 import httpx
 
@@ -38,11 +41,14 @@ __all__ = [
     "paginate_projects",
     "paginate_users",
     "paginate_articles",
+    "fetch_offset_pages",
+    "iter_offset_pages",
     "batch_requests",
     "batch_get_resources",
     "optimize_fields",
     "stream_large_response",
     "format_timestamp",
+    "read_import_records",
     "PaginationType",
     "PaginationConfig",
 ]
@@ -83,6 +89,36 @@ def loads_lenient(text: str) -> Any:
     return json.loads(repaired, strict=False)
 
 
+def read_import_records(stream: IO[str], file_format: str = "csv") -> Iterator[tuple[int, Any]]:
+    """Read the records of a bulk import file, numbered as in the file.
+
+    CSV input needs a header row and yields one dict per data row, starting
+    at row 2; JSON input must be an array and yields its elements, starting
+    at 1. Elements are not checked, so callers reject anything but objects.
+
+    Args:
+        stream: Text stream with the records (a file or stdin)
+        file_format: ``csv`` or ``json``
+
+    Returns:
+        Iterator of ``(row_number, record)`` pairs
+
+    Raises:
+        ValueError: If the input cannot be read as the given format
+    """
+    if file_format == "json":
+        try:
+            data = json.load(stream)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format: {e}") from e
+        if not isinstance(data, list):
+            raise ValueError("JSON input must contain an array of objects")
+        return enumerate(data, start=1)
+    if file_format == "csv":
+        return enumerate(csv.DictReader(stream), start=2)
+    raise ValueError(f"Unsupported import format: {file_format}")
+
+
 class PaginationType(Enum):
     """Supported pagination types in YouTrack API."""
 
@@ -104,6 +140,9 @@ class PaginationConfig:
         "reports": 1000,
     }
 
+    # Offset pages requested ahead of the one being read once the first page is full
+    DEFAULT_PREFETCH_PAGES = 4
+
     # Endpoint-specific pagination support
     PAGINATION_SUPPORT = {
         "/api/issues": PaginationType.CURSOR,
@@ -194,6 +233,88 @@ async def make_request(
     )
 
 
+async def iter_offset_pages(
+    fetch_page: Callable[[int, int], Awaitable[list[Any]]],
+    page_size: int,
+    max_results: int | None = None,
+    prefetch_pages: int = 1,
+) -> AsyncGenerator[list[Any], None]:
+    """Yield the pages of an offset-paginated listing in order, optionally reading ahead.
+
+    The first page is read on its own. If it comes back full, up to
+    ``prefetch_pages`` following pages are requested concurrently and
+    yielded in order; the first short page ends the listing and any
+    speculative requests beyond it are cancelled, as they are when the
+    consumer stops early.
+
+    Args:
+        fetch_page: ``(skip, top)`` coroutine returning one page of items
+        page_size: Number of items per page
+        max_results: Stop requesting pages at this many results (None for all)
+        prefetch_pages: Pages kept in flight at once; 1 reads pages one by one
+
+    Raises:
+        Any exception raised by ``fetch_page``
+    """
+
+    def page_top(skip: int) -> int:
+        return page_size if max_results is None else min(page_size, max_results - skip)
+
+    page = await fetch_page(0, page_top(0))
+    yield page
+    if len(page) < page_size:
+        return
+
+    next_skip = page_size
+    pending: deque[asyncio.Future[list[Any]]] = deque()
+    try:
+        while True:
+            while len(pending) < max(prefetch_pages, 1) and (max_results is None or next_skip < max_results):
+                pending.append(asyncio.ensure_future(fetch_page(next_skip, page_top(next_skip))))
+                next_skip += page_size
+            if not pending:
+                return
+
+            page = await pending.popleft()
+            logger.debug("Page fetched", page_size=len(page), in_flight=len(pending))
+            yield page
+            if len(page) < page_size:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def fetch_offset_pages(
+    fetch_page: Callable[[int, int], Awaitable[list[Any]]],
+    page_size: int,
+    max_results: int | None = None,
+    prefetch_pages: int = 1,
+) -> list[Any]:
+    """Read every page of an offset-paginated listing with ``iter_offset_pages``.
+
+    Args:
+        fetch_page: ``(skip, top)`` coroutine returning one page of items
+        page_size: Number of items per page
+        max_results: Maximum number of results to fetch (None for all)
+        prefetch_pages: Pages kept in flight at once; 1 reads pages one by one
+
+    Returns:
+        Items of all pages in order, trimmed to ``max_results``
+
+    Raises:
+        Any exception raised by ``fetch_page``
+    """
+    results: list[Any] = []
+    async for page in iter_offset_pages(fetch_page, page_size, max_results, prefetch_pages):
+        results.extend(page)
+    if max_results is not None:
+        results = results[:max_results]
+    return results
+
+
 async def paginate_results(
     endpoint: str,
     headers: dict[str, str] | None = None,
@@ -203,6 +324,7 @@ async def paginate_results(
     after_cursor: str | None = None,
     before_cursor: str | None = None,
     use_cursor_pagination: bool | None = None,
+    prefetch_pages: int = 1,
 ) -> dict[str, Any]:
     """Efficiently paginate through large result sets with automatic pagination type detection.
 
@@ -219,6 +341,8 @@ async def paginate_results(
         after_cursor: Start pagination after this cursor (for cursor-based pagination)
         before_cursor: Start pagination before this cursor (for cursor-based pagination)
         use_cursor_pagination: Override automatic detection of pagination type (None for auto-detect)
+        prefetch_pages: Offset pages to request concurrently once the first page is full
+            (see ``fetch_offset_pages``); cursor pagination is always sequential
 
     Returns:
         Dictionary with 'results' list and pagination metadata including:
@@ -251,7 +375,6 @@ async def paginate_results(
 
     # Initialize pagination state
     all_results = []
-    skip = 0
     params = params or {}
     current_after_cursor = after_cursor
     current_before_cursor = before_cursor
@@ -270,22 +393,53 @@ async def paginate_results(
         pagination_type=pagination_type,
         after_cursor=after_cursor,
         before_cursor=before_cursor,
+        prefetch_pages=prefetch_pages if not use_cursor_pagination else None,
     )
 
+    if not use_cursor_pagination:
+        pages_fetched = 0
+
+        async def fetch_page(skip: int, top: int) -> list[Any]:
+            nonlocal pages_fetched
+            page_params = params.copy()
+            page_params["$top"] = str(top)
+            page_params["$skip"] = str(skip)
+
+            logger.debug("Fetching page", skip=skip, top=top)
+            response = await make_request(method="GET", url=endpoint, headers=headers, params=page_params)
+            pages_fetched += 1
+
+            try:
+                response_data = response.json()
+            except Exception as e:
+                logger.error("Failed to parse JSON response", error=str(e))
+                raise YouTrackError(f"Failed to parse response: {str(e)}") from e
+            if isinstance(response_data, list):
+                return response_data
+            # Handle single object responses
+            return [response_data] if response_data else []
+
+        all_results = await fetch_offset_pages(fetch_page, page_size, max_results, prefetch_pages)
+        logger.debug("Pagination complete", total_results=len(all_results), use_cursor_pagination=False)
+        return {
+            "results": all_results,
+            "total_results": len(all_results),
+            "has_after": len(all_results) >= (max_results or float("inf")),
+            "has_before": pages_fetched > 1,
+            "after_cursor": None,
+            "before_cursor": None,
+            "pagination_type": pagination_type,
+        }
+
     while True:
         # Set pagination parameters
         page_params = params.copy()
         page_params["$top"] = str(page_size)
 
-        if use_cursor_pagination:
-            # Use cursor-based pagination
-            if current_after_cursor:
-                page_params["$after"] = current_after_cursor
-            if current_before_cursor:
-                page_params["$before"] = current_before_cursor
-        else:
-            # Use offset-based pagination (legacy)
-            page_params["$skip"] = str(skip)
+        if current_after_cursor:
+            page_params["$after"] = current_after_cursor
+        if current_before_cursor:
+            page_params["$before"] = current_before_cursor
 
         # Check if we need to limit the current page size
         if max_results and (len(all_results) + page_size) > max_results:
@@ -293,9 +447,8 @@ async def paginate_results(
 
         logger.debug(
             "Fetching page",
-            skip=skip if not use_cursor_pagination else None,
-            after_cursor=current_after_cursor if use_cursor_pagination else None,
-            before_cursor=current_before_cursor if use_cursor_pagination else None,
+            after_cursor=current_after_cursor,
+            before_cursor=current_before_cursor,
             top=page_params["$top"],
             total_fetched=len(all_results),
         )
@@ -311,7 +464,7 @@ async def paginate_results(
         # Parse response
         try:
             response_data = response.json()
-            if use_cursor_pagination and isinstance(response_data, dict):
+            if isinstance(response_data, dict):
                 # Handle YouTrackSearchResult format
                 page_results = response_data.get("results", [])
                 has_after = response_data.get("hasAfter", False)
@@ -335,24 +488,14 @@ async def paginate_results(
             "Page fetched",
             page_size=len(page_results),
             total_fetched=len(all_results),
-            has_after=has_after if use_cursor_pagination else None,
-            has_before=has_before if use_cursor_pagination else None,
+            has_after=has_after,
+            has_before=has_before,
         )
 
-        # Check if we should continue
-        if use_cursor_pagination:
-            # For cursor pagination, check if there are more results
-            if not has_after or len(page_results) == 0:
-                break
-            current_after_cursor = final_after_cursor
-        else:
-            # For offset pagination, check traditional conditions
-            if (
-                len(page_results) < page_size  # Less than a full page means we're done
-                or len(page_results) == 0  # No more results
-            ):
-                break
-            skip += page_size
+        # Check if there are more results
+        if not has_after or len(page_results) == 0:
+            break
+        current_after_cursor = final_after_cursor
 
         # Check if we hit our limit
         if max_results and len(all_results) >= max_results:
@@ -372,10 +515,10 @@ async def paginate_results(
     return {
         "results": all_results,
         "total_results": len(all_results),
-        "has_after": has_after if use_cursor_pagination else len(all_results) >= (max_results or float("inf")),
-        "has_before": has_before if use_cursor_pagination else skip > 0,
-        "after_cursor": final_after_cursor if use_cursor_pagination else None,
-        "before_cursor": final_before_cursor if use_cursor_pagination else None,
+        "has_after": has_after,
+        "has_before": has_before,
+        "after_cursor": final_after_cursor,
+        "before_cursor": final_before_cursor,
         "pagination_type": pagination_type,
     }
 
@@ -430,7 +573,8 @@ async def paginate_projects(
     """Paginate through projects using offset-based pagination.
 
     This is a convenience wrapper around paginate_results specifically for projects,
-    which use offset-based pagination.
+    which use offset-based pagination. Pages after the first are prefetched
+    concurrently.
 
     Args:
         endpoint: Projects API endpoint URL
@@ -451,6 +595,7 @@ async def paginate_projects(
         page_size=page_size,
         max_results=effective_max_results,
         use_cursor_pagination=False,
+        prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES,
     )
 
 
@@ -464,7 +609,8 @@ async def paginate_users(
     """Paginate through users using offset-based pagination.
 
     This is a convenience wrapper around paginate_results specifically for users,
-    which use offset-based pagination.
+    which use offset-based pagination. Pages after the first are prefetched
+    concurrently.
 
     Args:
         endpoint: Users API endpoint URL
@@ -485,6 +631,7 @@ async def paginate_users(
         page_size=page_size,
         max_results=effective_max_results,
         use_cursor_pagination=False,
+        prefetch_pages=PaginationConfig.DEFAULT_PREFETCH_PAGES,
     )
 
 
@@ -0,0 +1,34 @@
+"""On-disk cache of per-sprint velocity figures for released versions."""
+
+from typing import Any
+
+from .json_cache import JsonFileCache
+
+__all__ = ["VelocityCache"]
+
+
+def _entries(data: Any) -> dict[str, dict[str, Any]]:
+    return {str(key): value for key, value in data.items() if isinstance(value, dict)}
+
+
+class VelocityCache(JsonFileCache):
+    """Persist the velocity figures of released sprints.
+
+    A released version no longer receives work, so its issue counts and
+    effort are computed once and read back on later runs instead of paging
+    through its issues again. Entries are keyed by version ID and grouped by
+    scope (server and project), one JSON file per scope, under
+    ``~/.config/youtrack-cli/velocity`` by default. Unreadable files are
+    treated as missing.
+    """
+
+    directory = "velocity"
+    description = "velocity cache entry"
+
+    def load(self, scope: str) -> dict[str, dict[str, Any]]:
+        """Return the cached sprint figures of a scope, keyed by version ID."""
+        return self._read(self._path(scope), _entries) or {}
+
+    def save(self, scope: str, sprints: dict[str, dict[str, Any]]) -> None:
+        """Write a scope's sprint figures, replacing the previous file atomically."""
+        self._write(self._path(scope), sprints)